@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Benchmark the end-to-end data generator at several scales and write the results as JSON, to compare commits.
+
+Every scale runs generate_banking_data in a fresh interpreter, against a disposable database created for the run
+(or writing to a temporary directory with a file loader), and records per table rows/second, the time spent in
+generator functions vs. loader flushes vs. primary key capture, peak RSS, and the number of database queries,
+catalog queries (information_schema, pg_catalog) counted separately.
+
+Usage:
+    python benchmark.py [--scales 0.1 1 10] [--loader copy] [--output results.json] [--compare baseline.json]
+
+The connection settings come from the environment (DB_HOST, DB_USER, ...), like generate_banking_data. Queries
+run by process shards (PROCESSES > 1) happen in forked processes and aren't counted.
+"""
+from dotenv import load_dotenv
+
+import argparse
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+load_dotenv()
+
+CATALOG_QUERY = re.compile(r'\b(information_schema|pg_catalog|pg_[a-z_]+\s*\()', re.IGNORECASE)
+
+# Queries executed in this process, see _query_counting_connection
+QUERY_COUNTS = {'total': 0, 'catalog': 0, 'by_kind': {}}
+
+
+def _query_counting_connection():
+    """A psycopg2 connection class counting the queries executed by all its cursors, see QUERY_COUNTS."""
+    import psycopg2.extensions
+
+    lock = threading.Lock()
+
+    def count(query):
+        text = query.decode() if isinstance(query, bytes) else str(query)
+        kind = text.lstrip().split(None, 1)[0].upper() if text.strip() else ''
+        with lock:
+            QUERY_COUNTS['total'] += 1
+            QUERY_COUNTS['catalog'] += 1 if CATALOG_QUERY.search(text) else 0
+            QUERY_COUNTS['by_kind'][kind] = QUERY_COUNTS['by_kind'].get(kind, 0) + 1
+
+    cursor_classes = {}
+
+    def counting_cursor(cursor_factory):
+        if cursor_factory not in cursor_classes:
+            class CountingCursor(cursor_factory):
+                def execute(self, query, params=None):
+                    count(query)
+                    return super().execute(query, params)
+
+                def executemany(self, query, params_list):
+                    count(query)
+                    return super().executemany(query, params_list)
+
+                def copy_expert(self, sql, file, size=8192):
+                    count(sql)
+                    return super().copy_expert(sql, file, size)
+
+            cursor_classes[cursor_factory] = CountingCursor
+        return cursor_classes[cursor_factory]
+
+    class QueryCountingConnection(psycopg2.extensions.connection):
+        def cursor(self, *args, **kwargs):
+            kwargs['cursor_factory'] = counting_cursor(kwargs.get('cursor_factory') or self.cursor_factory or
+                                                       psycopg2.extensions.cursor)
+            return super().cursor(*args, **kwargs)
+
+    return QueryCountingConnection
+
+
+def _peak_rss():
+    """Peak resident set size in bytes of this process, and of its largest finished child (process shards)."""
+    import resource
+
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    unit = 1 if sys.platform == 'darwin' else 1024
+    return (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * unit,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * unit)
+
+
+def run_scale(scale, loader, database, output_dir):
+    """
+    Generate the data at one scale in this process and collect the statistics of the run.
+
+    Returns:
+        dict: The result of the run, see main
+    """
+    from fsi_data_generator import generate_banking_data
+
+    conn_params = {'connection_factory': _query_counting_connection()}
+    if database:
+        conn_params['database'] = database
+    start = time.time()
+    generator = generate_banking_data(loader=loader, output_dir=output_dir, scale=scale, conn_params=conn_params)
+    seconds = time.time() - start
+    if generator is None:
+        raise RuntimeError(f"Data generation at scale {scale} failed, see the log")
+
+    tables = {}
+    for table_key, timing in generator.table_timings.items():
+        plan = generator.plan_stats.get(table_key, {})
+        load = generator.load_stats.get(table_key, {})
+        tables[table_key] = {
+            'rows': timing['rows'],
+            'seconds': round(timing['seconds'], 4),
+            'rows_per_second': round(timing['rows'] / timing['seconds'], 1) if timing['seconds'] else None,
+            'compile_seconds': round(plan.get('compile_seconds', 0.0), 4),
+            'generate_seconds': round(plan.get('generate_seconds', 0.0), 4),
+            'flush_seconds': round(load.get('seconds', 0.0), 4),
+            'pk_seconds': round(load.get('pk_seconds', 0.0), 4),
+            'loader': load.get('loader'),
+        }
+
+    rows = sum(table['rows'] for table in tables.values())
+    peak_rss, peak_rss_children = _peak_rss()
+    return {
+        'scale': scale,
+        'rows': rows,
+        'seconds': round(seconds, 3),
+        'rows_per_second': round(rows / seconds, 1) if seconds else None,
+        'time': {name: round(sum(table[f'{name}_seconds'] for table in tables.values()), 3)
+                 for name in ('compile', 'generate', 'flush', 'pk')},
+        'peak_rss_bytes': peak_rss,
+        'peak_rss_children_bytes': peak_rss_children,
+        'queries': QUERY_COUNTS,
+        'row_cache': dict(generator.row_cache.stats),
+        'tables': tables,
+    }
+
+
+def _admin_connection():
+    import psycopg2
+
+    conn = psycopg2.connect(host=os.environ.get("DB_HOST", "localhost"), database="postgres",
+                            user=os.environ.get("DB_USER", "postgres"),
+                            password=os.environ.get("DB_PASSWORD", "password"),
+                            port=os.environ.get("DB_PORT", "5432"))
+    conn.autocommit = True
+    return conn
+
+
+def _recreate_database(database, drop_only=False):
+    conn = _admin_connection()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(f'DROP DATABASE IF EXISTS "{database}"')
+            if not drop_only:
+                cursor.execute(f'CREATE DATABASE "{database}"')
+    finally:
+        conn.close()
+
+
+def _git_revision():
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, cwd=cwd,
+                                check=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], capture_output=True,
+                                    text=True, cwd=cwd).stdout.strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+
+
+def benchmark(scales, loader, database, keep):
+    """Run every scale in a child interpreter, returning their results."""
+    writes_files = loader in ('parquet', 'csv', 'tsv')
+    runs = []
+    for scale in scales:
+        output_dir = tempfile.mkdtemp(prefix='dg-benchmark-') if writes_files else None
+        result_file = tempfile.NamedTemporaryFile(suffix='.json', delete=False)
+        result_file.close()
+        try:
+            _recreate_database(database)
+            env = {**os.environ, 'DOWNLOAD_CVE': 'false', 'SCRIPTED_SCENARIOS': ''}
+            command = [sys.executable, os.path.abspath(__file__), '--run-scale', str(scale), '--loader', loader,
+                       '--database', database, '--result', result_file.name]
+            if output_dir:
+                command += ['--output-dir', output_dir]
+            print(f"Scale {scale}: generating...", flush=True)
+            subprocess.run(command, env=env, check=True)
+            with open(result_file.name) as file:
+                run = json.load(file)
+            if output_dir:
+                run['output_bytes'] = sum(os.path.getsize(os.path.join(root, name))
+                                          for root, _, names in os.walk(output_dir) for name in names)
+            runs.append(run)
+            print(f"Scale {scale}: {run['rows']} rows in {run['seconds']:.2f}s ({run['rows_per_second']} rows/s), "
+                  f"peak RSS {run['peak_rss_bytes'] / 2 ** 20:.0f} MiB, {run['queries']['total']} queries "
+                  f"({run['queries']['catalog']} catalog)")
+        finally:
+            os.unlink(result_file.name)
+            if output_dir and not keep:
+                shutil.rmtree(output_dir, ignore_errors=True)
+            if not keep:
+                _recreate_database(database, drop_only=True)
+    return runs
+
+
+def compare(runs, baseline):
+    """Print the rows/second of every scale and table next to a baseline result."""
+    baseline_runs = {run['scale']: run for run in baseline['runs']}
+    print(f"Compared with {baseline.get('commit') or 'baseline'}:")
+    for run in runs:
+        before = baseline_runs.get(run['scale'])
+        if not before or not before['rows_per_second'] or not run['rows_per_second']:
+            continue
+        print(f"  scale {run['scale']}: {before['rows_per_second']} -> {run['rows_per_second']} rows/s "
+              f"({run['rows_per_second'] / before['rows_per_second'] - 1:+.1%})")
+        changes = []
+        for table_key, table in run['tables'].items():
+            before_table = before['tables'].get(table_key)
+            if before_table and before_table['rows_per_second'] and table['rows_per_second']:
+                changes.append((table['rows_per_second'] / before_table['rows_per_second'] - 1, table_key))
+        for change, table_key in sorted(changes)[:5]:
+            print(f"    {change:+8.1%}  {table_key}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the data generator at several scales')
+    parser.add_argument('--scales', nargs='+', type=float, default=[0.1, 1, 10], help='Row count multipliers')
+    parser.add_argument('--loader', default=os.environ.get('LOADER', 'copy'),
+                        choices=['insert', 'copy', 'parquet', 'csv', 'tsv'],
+                        help='Loader to benchmark (default LOADER or copy)')
+    parser.add_argument('--database', default='data_generator_benchmark',
+                        help='Disposable database created for every run, and dropped after it')
+    parser.add_argument('--output', default='benchmark.json', help='JSON file the results are written to')
+    parser.add_argument('--compare', help='Earlier JSON result to compare with')
+    parser.add_argument('--keep', action='store_true', help='Keep the database and output files of the last run')
+    parser.add_argument('--run-scale', type=float, help=argparse.SUPPRESS)
+    parser.add_argument('--output-dir', help=argparse.SUPPRESS)
+    parser.add_argument('--result', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_scale is not None:
+        # Child interpreter of a single run
+        result = run_scale(args.run_scale, args.loader, args.database, args.output_dir)
+        with open(args.result, 'w') as file:
+            json.dump(result, file)
+        return
+
+    commit, dirty = _git_revision()
+    runs = benchmark(args.scales, args.loader, args.database, args.keep)
+    results = {
+        'commit': commit,
+        'dirty': dirty,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'loader': args.loader,
+        'workers': int(os.getenv('WORKERS', '1')),
+        'processes': int(os.getenv('PROCESSES', '1')),
+        'seed': os.getenv('SEED') or None,
+        'runs': runs,
+    }
+    with open(args.output, 'w') as file:
+        json.dump(results, file, indent=2)
+    print(f"Wrote {args.output}")
+
+    if args.compare:
+        with open(args.compare) as file:
+            compare(runs, json.load(file))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,40 @@
-from anthropic import AnthropicError
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from datetime import datetime, timezone
 from dotenv import load_dotenv
-from faker.exceptions import UniquenessException
 from fsi_data_generator.fsi_generators.helpers.generate_random_interval import \
     generate_random_interval_with_optional_weights
 from fsi_data_generator.fsi_generators.helpers.generate_unique_json_array import (
-    generate_unique_json_array, previous_responses)
+    generate_unique_json_array, get_llm_usage, get_previous_responses, prefetch_unique_json_arrays)
+from fsi_data_generator.fsi_generators.helpers.lazy_import import lazy_import
+from fsi_data_generator.fsi_generators.helpers.random_streams import RandomStreams, StreamRandom, current_random
+from faker_match_cache import FakerMatchCache, HeuristicFakerMatcher, schema_hash
+from loaders import LOADERS, create_loader
+from pk_store import PrimaryKeyStore
+from profiler import Profiler, generator_name
+from row_cache import RowContextCache
+from table_metadata import TableMetadata
+from unique_registry import UniqueRegistry
 from psycopg2 import Error, extensions
-from sentence_transformers import SentenceTransformer, util
 from typing import Dict, List
 
-import faker
 import inspect
+import json
 import logging
-import networkx as nx
+import multiprocessing
+import numpy as np
 import os
 import psycopg2
 import random
 import re
 import sys
+import threading
 import traceback
 
+# Heavy dependencies are only loaded when first used
+anthropic = lazy_import('anthropic')
+faker = lazy_import('faker')
+
 load_dotenv()
 
 # Configure logging based on LOG_LEVEL environment variable
@@ -67,16 +82,179 @@ class SkipRowGenerationError(Exception):
     pass
 
 
+# (DataGenerator, table_key, TablePlan) inherited by forked shard processes, see _generate_rows_in_processes
+_shard_context = None
+
+
+def _is_library_code(code):
+    """Whether a code object belongs to the standard library or an installed package (e.g. Faker)."""
+    return 'site-packages' in code.co_filename or code.co_filename.startswith((sys.prefix, sys.base_prefix))
+
+
+def _generator_functions(func, depth=3):
+    """
+    A custom generator, the functions profiler.wrap or random_record wrap in it, the callables of its closure
+    and the project functions its code calls, up to depth calls away.
+    """
+    seen = set()
+    pending = [(func, depth)]
+    while pending:
+        func, depth = pending.pop()
+        if func is None or id(func) in seen or not callable(func):
+            continue
+        seen.add(id(func))
+        yield func
+        if depth <= 0:
+            continue
+
+        related = [getattr(func, '__wrapped__', None), getattr(func, 'target', None)]
+        for cell in getattr(func, '__closure__', None) or ():
+            try:
+                related.append(cell.cell_contents)
+            except ValueError:
+                pass  # Empty cell
+        for code in _project_code(func):
+            related += [value for value in (func.__globals__.get(name) for name in code.co_names)
+                        if inspect.isfunction(value) and not _is_library_code(value.__code__)]
+        pending += [(other, depth - 1) for other in related]
+
+
+def _project_code(func):
+    """The code of a project function and of the lambdas and functions nested in it, [] for library code."""
+    code = getattr(func, '__code__', None)
+    if code is None or _is_library_code(code):
+        return []
+    codes = [code]
+    for current in codes:
+        codes += [const for const in current.co_consts if inspect.iscode(const)]
+    return codes
+
+
+def _generator_strings(func):
+    """The string constants of a custom generator's code and closures, see _generator_functions."""
+    for other in _generator_functions(func):
+        for code in _project_code(other):
+            yield from (const for const in code.co_consts if isinstance(const, str))
+        for cell in getattr(other, '__closure__', None) or ():
+            try:
+                contents = cell.cell_contents
+            except ValueError:
+                continue
+            if isinstance(contents, str):
+                yield contents
+            elif isinstance(contents, (tuple, list)):
+                yield from (value for value in contents if isinstance(value, str))
+
+
+# Table keys named in a generator's strings: 'schema.table', the regex 'schema\\.table', or SQL, for generators
+# that don't declare their reads, see DataGenerator._scanned_reads
+_TABLE_REFERENCE = re.compile(r'(\w+)\\?\.(\w+)')
+
+_faker_unique_lock = threading.RLock()
+
+
+def _install_faker_unique_lock():
+    """
+    Serialize the draws of every Faker `unique` proxy. Its check and add of the values seen so far would
+    otherwise race between worker threads sharing a Faker instance, letting two threads return the same value.
+    Safe to call more than once.
+    """
+    from faker.proxy import UniqueProxy
+    wrap = UniqueProxy._wrap
+    if getattr(wrap, 'locked', False):
+        return
+
+    def locked_wrap(self, name, function):
+        wrapper = wrap(self, name, function)
+
+        @wraps(wrapper)
+        def locked(*args, **kwargs):
+            with _faker_unique_lock:
+                return wrapper(*args, **kwargs)
+
+        return locked
+
+    locked_wrap.locked = True
+    UniqueProxy._wrap = locked_wrap
+
+
+def _generate_shard(shard):
+    """Pool entry point of a forked shard process."""
+    dg, table_key, plan = _shard_context
+    shard_index, row_count, first_block, seed = shard
+    return dg._run_shard(table_key, plan, shard_index, row_count, first_block, seed)
+
+
+class TablePlan:
+    """
+    Per-table generation plan compiled once by DataGenerator._compile_table_plan.
+
+    Attributes:
+        table_key (str): The table identifier in the format "schema.table"
+        valid_columns (set): All column names of the table
+        auto_gen_cols (set): Columns populated by the database
+        fk_slots (list): (column, data_type, is_nullable, max_length, custom_generator or None, fk_info) tuples
+        custom_slots (list): (column, data_type, is_nullable, max_length, custom_generator) tuples
+        standard_slots (list): (column, value_factory) tuples
+        reads (set): Tables the table's generators read without a foreign key to them, see
+                     DataGenerator._table_reads
+        block_fills (list): (columns, fill, release) of the custom generators that can fill a whole block of rows
+                            at once, fill(n) returning column -> list of n values and release(values), or None,
+                            taking back the values no row kept, see DataGenerator._fill_columns
+    """
+
+    def __init__(self, table_key, valid_columns, auto_gen_cols):
+        self.table_key = table_key
+        self.valid_columns = valid_columns
+        self.auto_gen_cols = auto_gen_cols
+        self.fk_slots = []
+        self.custom_slots = []
+        self.standard_slots = []
+        self.block_fills = []
+        self.reads = set()
+
+
+class WorkerContext:
+    """
+    Database state of one table generation worker thread, see DataGenerator._generate_tables_in_parallel.
+
+    Attributes:
+        index (int): Worker number, starting at 1 (0 is the main thread)
+        conn: The worker's own psycopg2 connection
+        cur: Cursor using the connection's default cursor factory
+        tuple_cursor: Cursor returning plain tuples
+        loaders (dict): Loader name -> BatchLoader instance bound to this worker's connection
+    """
+
+    def __init__(self, index, conn):
+        self.index = index
+        self.conn = conn
+        self.cur = conn.cursor()
+        self.tuple_cursor = conn.cursor(cursor_factory=extensions.cursor)
+        self.loaders = {}
+
+    def close(self):
+        for loader in self.loaders.values():
+            loader.close()
+        self.cur.close()
+        self.tuple_cursor.close()
+        self.conn.close()
+
+
 class DataGenerator:
     """
     A class to generate fake data for a PostgreSQL database, respecting FK constraints
     and using vector search for intelligent Faker provider selection.
     Skips auto-generated columns like SERIAL primary keys.
     """
-    inserted_pks: Dict[str, List] = {}
+    inserted_pks: Dict[str, PrimaryKeyStore] = {}
 
     def __init__(self, conn_params, schemas=None, exclude_schemas=None, exclusions=None, custom_generators=None,
-                 batch_size=100, dbml=''):
+                 batch_size=100, dbml='', loader='insert', table_loaders=None, pk_spill_threshold=None,
+                 model_name='all-MiniLM-L6-v2', cache_dir=None, faker_matcher=None, workers=1,
+                 processes=1, process_tables=None, seed=None, row_cache_size=100000, row_cache_spill=False,
+                 table_generators=None, output_dir=None, profile=False, profile_trace=None, llm_concurrency=None,
+                 unique_backend=None):
         """
         Initialize the DataGenerator with database connection parameters and schema options.
 
@@ -90,11 +268,79 @@ class DataGenerator:
                                               The generator_func should take (row_values, table, column) and return a value.
                                               These are processed after all other columns and can access previously generated values.
             batch_size (int, optional): Number of rows to collect before executing a batch insert. Default is 100.
+            dbml (str, optional): DBML description of the schema, used as context for LLM generated text.
+            loader (str, optional): Default loader used to write batches, 'insert' or 'copy', or a file sink
+                                    ('parquet', 'csv' or 'tsv') writing to output_dir instead of the database.
+                                    Default is 'insert'.
+            table_loaders (list, optional): List of (table_pattern, loader_name) tuples selecting a different
+                                           loader for matching tables, e.g. ('consumer_banking\\.transactions', 'copy').
+            pk_spill_threshold (int, optional): Number of in-memory primary keys per table after which integer and
+                                                UUID keys are spilled to a memory-mapped file. Default is never.
+            model_name (str, optional): Sentence transformer used to match columns to Faker providers.
+            cache_dir (str, optional): Directory for the Faker provider/match cache. Defaults to the
+                                       FAKER_CACHE_DIR environment variable or '.faker_cache'.
+            faker_matcher (str, optional): 'model' to match columns to Faker providers with the sentence transformer,
+                                           or 'heuristic' to never load the model and use cached matches plus a
+                                           deterministic name matcher. Defaults to the FAKER_MATCHER environment
+                                           variable or 'model'.
+            workers (int, optional): Number of tables generated concurrently, each worker on its own connection.
+                                     A table starts once all the tables it references, or its generators read,
+                                     are committed.
+                                     Default is 1 (sequential).
+            processes (int, optional): Number of forked processes the rows of a table matching process_tables are
+                                       sharded across, each with its own seed and connection. Tables with
+                                       generators of unique values are never sharded. Default is 1 (off).
+            process_tables (list, optional): Regex patterns of the tables generated with the process pool,
+                                             e.g. 'consumer_banking\\.transactions'.
+            seed (int or str, optional): Base seed making the generated data reproducible. Every block of
+                                         batch_size rows of a table draws from its own stream derived from the
+                                         seed, the table and the block number, through self.fake,
+                                         current_random() and current_numpy(); generators using the random
+                                         module or their own Faker are not reproducible, see RandomStreams. Runs
+                                         with the same seed, the same processes and one worker produce the same
+                                         rows; with other values, generators keeping state across rows
+                                         (unique_list, Faker unique, module globals) can draw differently, as that
+                                         state is per process and shared by the worker threads. A numeric string
+                                         is the same seed as its int, so SEED=42 matches seed=42. Default is None
+                                         (unseeded).
+            row_cache_size (int, optional): Rows per table kept in memory for `lookup` and `lookup_rows`.
+                                            Default is 100000.
+            row_cache_spill (bool, optional): Spill rows evicted from the row cache to a temporary SQLite file
+                                              instead of reading them back from the database. Default is False.
+            table_generators (list, optional): List of (table_pattern, generator_func) tuples generating whole
+                                               matching tables instead of the row loop. The generator_func takes
+                                               (dg, table_key, num_rows), writes the rows with `load_columns` and
+                                               returns the number of rows generated.
+            output_dir (str, optional): Directory the file sinks write to, one subdirectory per table. Defaults
+                                        to the OUTPUT_DIR environment variable or 'output'.
+            profile (bool, optional): Account wall time and calls to every table, custom generator function, query
+                                      and batch flush, logged as a sorted report at the end of
+                                      generate_vectorized_data. Default is False.
+            profile_trace (str, optional): Also write every span to this Chrome trace format JSON file, which
+                                           chrome://tracing, Perfetto and Speedscope open. Implies profile.
+            llm_concurrency (int, optional): Number of concurrent requests filling the LLM text pools of the text
+                                             columns before generation starts, 0 to fill them one at a time while
+                                             compiling each table. Defaults to the LLM_CONCURRENCY environment
+                                             variable or 4.
+            unique_backend (str, optional): How `unique_values` keeps the values taken per column: 'set', or
+                                            'bloom' for a Bloom filter of a few bits per value. Defaults to the
+                                            UNIQUE_BACKEND environment variable or 'set'.
         """
+        # Connection, cursors and loaders are per worker thread, see the properties below
+        self._local = threading.local()
         self.tuple_cursor = None
         self.column_order = None
+        self.profiler = Profiler(enabled=profile or bool(profile_trace), trace=bool(profile_trace))
+        self.profile_trace = profile_trace
+        self.llm_concurrency = int(llm_concurrency if llm_concurrency is not None
+                                   else os.environ.get('LLM_CONCURRENCY', '4'))
+        if self.profiler.enabled:
+            # Every connection, including the workers' and shards', accounts its queries
+            connection_factory = self.profiler.connection_factory(conn_params.get('connection_factory'))
+            conn_params = {**conn_params, 'connection_factory': connection_factory}
         self.conn_params = conn_params
-        self.fake = faker.Faker()
+        self._fake = None
+        self._fake_lock = threading.Lock()
         self.conn = None
         self.cur = None
         self.batch_size = batch_size
@@ -114,21 +360,65 @@ class DataGenerator:
         self.custom_generators = list(custom_generators) if custom_generators else []
         self.custom_generator_patterns = []
 
+        # Table generators using regex patterns
+        self.table_generators = list(table_generators) if table_generators else []
+        self.table_generator_patterns = []
+
+        # Batch loaders, selected per table using regex patterns
+        self.default_loader = loader
+        if loader.lower() not in LOADERS:
+            raise ValueError(f"Unknown loader '{loader}', expected one of {sorted(LOADERS)}")
+        self.output_dir = output_dir or os.environ.get('OUTPUT_DIR', 'output')
+        self.started_outputs = set()  # Files the file sinks of this run started over, see TsvSink
+        if not LOADERS[loader.lower()].writes_database:
+            # Generated rows can't be selected back, so parent rows must never leave the row cache
+            row_cache_spill = True
+        self.table_loaders = list(table_loaders) if table_loaders else []
+        self.table_loader_patterns = []
+        self.loaders = {}  # loader name -> BatchLoader instance
+        self.load_stats = {}  # table_key -> {'loader', 'rows', 'seconds', 'pk_seconds'}
+        self.workers = max(1, int(workers or 1))
+        self.table_timings = {}  # table_key -> {'seconds', 'rows', 'worker'}
+        self.table_reads = {}  # table_key -> tables its generators read without a foreign key, see _table_reads
+        self.processes = max(1, int(processes or 1))
+        self.process_tables = list(process_tables) if process_tables else []
+        self.process_table_patterns = []
+        self.plan_stats = {}  # table_key -> {'compile_seconds', 'generate_seconds', 'rows'}
+        self.row_counts = None  # Row counts and scale of the current generate_data run, see row_count
+        self.scale = 1
+        # Start of the current generate_data run, the "now" of generators that draw dates up to the present
+        self.run_started = datetime.now(timezone.utc)
+        self.seed = RandomStreams.normalize_seed(seed)
+        self.streams = RandomStreams(self.seed) if self.seed is not None else None
+
         # Data structures to store database metadata
         self.foreign_keys = []
         self.columns = []
         self.auto_generated_columns = {}
         self.table_columns = {}
+        self.table_metadata: Dict[str, TableMetadata] = {}
         self.table_dependencies = {}
         self.ordered_tables = []
         self.inserted_pks = {}
+        self.pk_spill_threshold = pk_spill_threshold
+        self.row_cache = RowContextCache(self, max_rows=row_cache_size, spill=row_cache_spill)
+        # Values taken per "schema.table.column", for generators of unique natural keys and names
+        self.unique_values = UniqueRegistry(self, backend=(unique_backend or
+                                                           os.environ.get('UNIQUE_BACKEND', 'set')).lower())
         self.all_table_column_pairs = []  # Will be populated with all (schema.table, column) pairs
 
         # Vector model components
         self.model = None
+        self.model_name = model_name
+        self.faker_matcher = (faker_matcher or os.environ.get('FAKER_MATCHER', 'model')).lower()
+        if self.faker_matcher not in ('model', 'heuristic'):
+            raise ValueError(f"Unknown faker_matcher '{self.faker_matcher}', expected 'model' or 'heuristic'")
+        self.heuristic_matcher = None
+        self.cache_dir = cache_dir or os.environ.get('FAKER_CACHE_DIR', '.faker_cache')
+        self.match_cache = None
         self.faker_names = []
-        self.faker_embeddings = None
-        self.faker_embedding_map = {}
+        self.faker_embeddings = None  # Normalized provider embeddings, one row per entry in faker_names
+        self.faker_match_report = {}  # "schema.table.column" -> [(provider, score), ...] best candidates first
         self.populated_tables = set()
         self.not_populated_tables = dict()
         self.used_faker_funcs = set()
@@ -136,6 +426,111 @@ class DataGenerator:
         self.text_columns = {}
         self.all_tables = []
 
+    def _local_worker(self):
+        """The WorkerContext of the calling thread, or None on the main thread."""
+        return getattr(self._local, 'worker', None)
+
+    @property
+    def conn(self):
+        """Connection of the calling worker thread, the main connection otherwise."""
+        worker = self._local_worker()
+        return worker.conn if worker else self._conn
+
+    @conn.setter
+    def conn(self, value):
+        self._conn = value
+
+    @property
+    def cur(self):
+        worker = self._local_worker()
+        return worker.cur if worker else self._cur
+
+    @cur.setter
+    def cur(self, value):
+        self._cur = value
+
+    @property
+    def tuple_cursor(self):
+        worker = self._local_worker()
+        return worker.tuple_cursor if worker else self._tuple_cursor
+
+    @tuple_cursor.setter
+    def tuple_cursor(self, value):
+        self._tuple_cursor = value
+
+    @property
+    def loaders(self):
+        """Loader instances of the calling worker thread; loaders hold per-connection state like staging tables."""
+        worker = self._local_worker()
+        return worker.loaders if worker else self._loaders
+
+    @loaders.setter
+    def loaders(self, value):
+        self._loaders = value
+
+    def lookup(self, table_key, pk, columns=None):
+        """
+        Read a row by primary key, from the rows generated in this run or else from the database.
+
+        Args:
+            table_key (str): The table identifier in the format "schema.table"
+            pk: Primary key value, a tuple for composite keys
+            columns (list, optional): Columns the caller needs, see RowContextCache.lookup
+
+        Returns:
+            dict or None: Column name -> value (shared, don't modify it), or None if there is no such row
+        """
+        return self.row_cache.lookup(table_key, pk, columns)
+
+    def lookup_rows(self, table_key, column, value, pending=True):
+        """
+        Read all rows of a table where column = value, e.g. the balances of an account, see lookup.
+
+        Rows generated earlier in the current batch are included (after the flushed ones) unless pending is
+        False, so generators building on the previous rows of their own table are correct at any batch size.
+
+        Returns:
+            list: Rows as dicts, in insertion order
+        """
+        return self.row_cache.lookup_rows(table_key, column, value, pending)
+
+    def sample(self, table_key, k=1, where=None, predicate=None, columns=None):
+        """
+        Pick up to k distinct random rows of a table, optionally matching column values, without sorting the
+        table in the database, see RowContextCache.sample.
+
+        Example:
+            dg.sample('enterprise.associates', where={'status': 'ACTIVE', 'relationship_type': 'EMPLOYEE'})
+
+        Args:
+            table_key (str): The table identifier in the format "schema.table"
+            k (int, optional): Number of rows. Default is 1.
+            where (dict, optional): Column -> required value, or a list of allowed values
+            predicate (callable, optional): Further condition on the row dict, e.g. a date range
+            columns (list, optional): Columns the caller needs, see lookup
+
+        Returns:
+            list: Row dicts (shared, don't modify them), fewer than k if fewer rows match
+        """
+        return self.row_cache.sample(table_key, k, where, predicate, columns)
+
+    def _stream(self, *names):
+        """Context manager drawing from the named random stream when seeded, a no-op otherwise."""
+        return self.streams.activate(*names) if self.streams else nullcontext()
+
+    @property
+    def fake(self):
+        """The shared Faker instance, created on first use."""
+        if self._fake is None:
+            with self._fake_lock:
+                if self._fake is None:
+                    fake = faker.Faker()
+                    if self.streams:
+                        # Draw from the thread's active stream, see RandomStreams
+                        fake.random = StreamRandom()
+                    self._fake = fake
+        return self._fake
+
     def connect_to_db(self):
         """Establish a connection to the database and get available schemas."""
         try:
@@ -179,9 +574,11 @@ class DataGenerator:
                 if table_key not in self.table_columns:
                     self.table_columns[table_key] = []
                     self.column_order[table_key] = []
+                    self.table_metadata[table_key] = TableMetadata(table_key)
 
                 # Add to ordered list first
                 self.column_order[table_key].append(column_name)
+                self.table_metadata[table_key].add_column(column_name, data_type)
 
                 # Add detailed column info
                 self.table_columns[table_key].append((
@@ -197,10 +594,36 @@ class DataGenerator:
             logger.debug(
                 f"Organized columns for schema {schema}, tables count: {len(set(table_name for table_name, _, _, _, _, _, _, _ in ordered_columns))}")
 
+        self._load_primary_keys()
+
         # Log the first few columns for some tables for verification
         for table_key in list(self.table_columns.keys())[:3]:  # Log first 3 tables for brevity
             logger.debug(f"Column order for {table_key}: {self.column_order[table_key][:5]}...")
 
+    def _load_primary_keys(self):
+        """Record the primary key columns of every table in the metadata registry with a single catalog query."""
+        query = """
+            SELECT tc.table_schema, tc.table_name, kcu.column_name
+            FROM information_schema.table_constraints tc
+            JOIN information_schema.key_column_usage kcu
+                ON tc.constraint_name = kcu.constraint_name
+                AND tc.table_schema = kcu.table_schema
+            WHERE tc.constraint_type = 'PRIMARY KEY'
+                AND tc.table_schema = ANY(%s)
+            ORDER BY tc.table_schema, tc.table_name, kcu.ordinal_position
+        """
+        self.tuple_cursor.execute(query, (list(self.schemas),))
+
+        pk_columns = {}
+        for schema, table_name, column_name in self.tuple_cursor.fetchall():
+            pk_columns.setdefault(f"{schema}.{table_name}", []).append(column_name)
+
+        for table_key, columns in pk_columns.items():
+            if table_key in self.table_metadata:
+                self.table_metadata[table_key].set_primary_key(columns)
+
+        logger.debug(f"Loaded primary keys for {len(pk_columns)} tables")
+
     def generate_data(self, row_counts=None, commit_frequency=10, scale=1):
         """
         Generate fake data for all tables in the database, respecting dependencies and column order.
@@ -212,7 +635,8 @@ class DataGenerator:
                                       Defaults to 100 rows for each table if not specified.
                                       Example: {"schema1.table1": 500, "schema2.table2": 1000}
             commit_frequency (int, optional): Number of tables to process before committing.
-                                           Set to 0 to only commit at the end.
+                                           Set to 0 to only commit at the end. Ignored with more than one
+                                           worker, where every table is committed as soon as it is done.
             scale (float, optional): Scale factor to apply to row counts.
         """
         try:
@@ -224,260 +648,306 @@ class DataGenerator:
             if self.custom_generators:
                 self._compile_custom_generator_patterns()
 
+            self._compile_table_generator_patterns()
+            self._compile_table_loader_patterns()
+            self._compile_process_table_patterns()
+            self.row_counts = row_counts
+            self.scale = scale
+            self.run_started = datetime.now(timezone.utc)
+
+            # Tables in excluded schemas are skipped
+            table_keys = [table_key for table_key in self.ordered_tables
+                          if table_key.split('.')[0] not in self.exclude_schemas]
+
+            # Request the LLM text of every text column concurrently instead of one table at a time
+            self.prefetch_llm_text(table_keys, row_counts, scale)
+
+            # Match the remaining standard columns to a Faker provider in one batched similarity pass; text
+            # columns with LLM text don't use one
+            self.plan_faker_matches(table_keys)
+
+            if self.workers > 1:
+                self._generate_tables_in_parallel(table_keys, row_counts, scale)
+                return
+
             # Process all tables according to dependencies
             tables_processed = 0
             total_rows_generated = 0
 
-            for table_key in self.ordered_tables:
-                schema, table = table_key.split('.')
-
-                # Check if the schema is in the excluded list
-                if schema in self.exclude_schemas:
-                    # logger.debug(f"Skipping excluded schema: {schema}")
+            for table_key in table_keys:
+                rows_generated = self._generate_table(table_key, row_counts, scale)
+                if rows_generated is None:
                     continue
+                total_rows_generated += rows_generated
+
+                # Increment processed tables count
+                tables_processed += 1
+
+                # Commit periodically if requested
+                if commit_frequency > 0 and tables_processed % commit_frequency == 0:
+                    self.conn.commit()
+                    logger.debug(
+                        f"Committed after processing {tables_processed} tables ({total_rows_generated} total rows generated)")
+                    total_rows_generated = 0  # Reset counter after commit
 
-                logger.debug(f"Processing table {table_key}...")
+            # Final commit for any remaining data
+            self.conn.commit()
+            logger.debug(
+                f"Vectorized data generation complete. Processed {tables_processed} tables with {total_rows_generated} rows in final batch.")
+
+        except Error as e:
+            logger.debug(f"Error during data generation: {e}")
+            self.conn.rollback()
+
+    def _generate_tables_in_parallel(self, table_keys, row_counts=None, scale=1):
+        """
+        Generate tables concurrently on a pool of `workers` threads, each with its own database connection.
+
+        Tables are scheduled from a ready queue over the FK dependency graph: a table is submitted once every
+        table it references has been generated and committed, so its rows are visible to the worker's
+        connection and the parent PK stores are complete (and only read) while it runs. Ready tables are
+        submitted in topological order. Tables whose generators read other tables without a foreign key (see
+        _table_reads) also wait for those tables, or run alone when they read a table generated after them.
+        These and the tables sharded across processes (see process_tables) are generated on the calling thread
+        once no worker is busy, since forking next to running threads is unsafe. Draws of Faker `unique`
+        proxies, shared by the workers, are serialized.
 
-                # Support both "schema.table" format and "table" format in row_counts
-                num_rows = (row_counts.get(table_key, None) or
-                            row_counts.get(table, 100) if row_counts else 100)  # Defaults to 100 rows
-                num_rows = int(num_rows * scale)
+        Args:
+            table_keys (list): Tables to generate, in topological order
+            row_counts (dict, optional): Row counts by "schema.table" or "table", see generate_data
+            scale (float, optional): Scale factor to apply to row counts
+        """
+        _install_faker_unique_lock()
+        position = {table_key: i for i, table_key in enumerate(table_keys)}
+        waiting_on = {table_key: {parent for parent in self.table_dependencies.get(table_key, [])
+                                  if parent in position and parent != table_key}
+                      for table_key in table_keys}
+
+        # Tables read by generators without a foreign key: wait for the ones generated before, in topological
+        # order, and run alone (as in a sequential run) a table reading one generated after it
+        alone = set()
+        for table_key in table_keys:
+            for read in self._table_reads(table_key):
+                if read not in position:
+                    continue
+                if position[read] < position[table_key]:
+                    waiting_on[table_key].add(read)
+                else:
+                    alone.add(table_key)
+        if alone:
+            logger.info(f"Generating {', '.join(sorted(alone, key=position.get))} alone, their generators read "
+                        f"tables generated after them")
+
+        dependents = {table_key: [] for table_key in table_keys}
+        for table_key, parents in waiting_on.items():
+            for parent in parents:
+                dependents[parent].append(table_key)
+
+        ready = [table_key for table_key in table_keys if not waiting_on[table_key]]
+        # Tables sharded across processes or generated alone, run on the main thread while no worker is busy
+        exclusive = []
+        workers = []
+        worker_lock = threading.Lock()
+        generation_start = time.time()
+
+        def release(finished_table):
+            for dependent in dependents[finished_table]:
+                waiting_on[dependent].discard(finished_table)
+                if not waiting_on[dependent]:
+                    ready.append(dependent)
+            ready.sort(key=position.get)
 
-                # Store the total row count for this table on the class instance
-                # This allows _flush_batch to access it without complex data structures
-                setattr(self, "total_rows_for_" + table_key.replace(".", "_"), num_rows)
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='dg-worker') as executor:
+                running = {}
+                while ready or running or exclusive:
+                    for table_key in ready:
+                        if table_key in alone or \
+                                self._get_process_count(table_key, self._row_count(table_key, row_counts, scale)) > 1:
+                            exclusive.append(table_key)
+                            continue
+                        future = executor.submit(self._generate_table_on_worker, table_key, row_counts, scale,
+                                                 workers, worker_lock)
+                        running[future] = table_key
+                    ready.clear()
+
+                    if not running:
+                        # Forking is only safe while the worker threads are idle
+                        table_key = exclusive.pop(0)
+                        self._generate_table(table_key, row_counts, scale)
+                        # Visible to the workers' connections
+                        self.conn.commit()
+                        release(table_key)
+                        continue
 
-                # Get the auto-generated columns for this table
-                auto_gen_cols = self.auto_generated_columns.get(table_key, [])
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        table_key = running.pop(future)
+                        # Re-raise worker errors like the sequential loop would
+                        future.result()
+                        release(table_key)
+        finally:
+            for worker in workers:
+                try:
+                    worker.close()
+                except Error as e:
+                    logger.debug(f"Error closing connection of worker {worker.index}: {e}")
 
-                # Get all valid columns for this table
-                valid_columns = set(col_info[0] for col_info in self.table_columns[table_key])
-                # logger.debug(f"Valid columns for {table_key}: {valid_columns}")
+        logger.info(f"Generated {len(table_keys)} tables on {len(workers)} workers in "
+                    f"{time.time() - generation_start:.2f} seconds "
+                    f"({sum(timing['seconds'] for timing in self.table_timings.values()):.2f} seconds of table time)")
 
-                # Calculate number of batches for this table
-                num_batches = (num_rows + self.batch_size - 1) // self.batch_size  # Ceiling division
-                # logger.debug(f"Will insert in {num_batches} batches of up to {self.batch_size} rows each")
+    def _generate_table_on_worker(self, table_key, row_counts, scale, workers, worker_lock):
+        """
+        Generate one table on the calling pool thread and commit it, opening the thread's connection on first use.
 
-                # First determine which columns we'll use (not auto-generated or excluded)
-                fk_columns = []  # Columns with foreign key relationships
-                custom_columns = []  # Columns with custom generators
-                standard_columns = []  # Regular columns (no FK, no custom generator)
+        Args:
+            table_key (str): The table identifier in the format "schema.table"
+            row_counts (dict): Row counts, see generate_data
+            scale (float): Scale factor to apply to row counts
+            workers (list): WorkerContexts opened so far, closed by the caller
+            worker_lock (threading.Lock): Guards the numbering of new workers
+        """
+        worker = self._local_worker()
+        if worker is None:
+            with worker_lock:
+                worker = WorkerContext(len(workers) + 1, psycopg2.connect(**self.conn_params))
+                workers.append(worker)
+            self._local.worker = worker
+            logger.debug(f"Opened connection for worker {worker.index}")
 
-                # Track columns that have both FK and custom generator
-                fk_custom_columns = set()
+        try:
+            self._generate_table(table_key, row_counts, scale)
+            worker.conn.commit()
+        except Error as e:
+            logger.debug(f"Error generating {table_key} on worker {worker.index}: {e}")
+            self.not_populated_tables[table_key] = str(e)
+            worker.conn.rollback()
+            self.row_cache.invalidate(table_key)
+            for batch_loader in worker.loaders.values():
+                batch_loader.reset()
 
-                # Get all foreign key columns for this table
-                table_fk_columns = set()
-                for d in self.foreign_keys:
-                    _, fk_schema, fk_table, fk_column, _, _, _ = d.values()
-                    if fk_schema == schema and fk_table == table:
-                        table_fk_columns.add(fk_column)
+    def row_count(self, table_key):
+        """Number of rows to generate for a table in the current generate_data run."""
+        return self._row_count(table_key, self.row_counts, self.scale)
 
-                # Use the ordered column list to maintain original order
-                for column_name in self.column_order.get(table_key, []):
-                    # Find the detailed column info
-                    column_info = next((col_info for col_info in self.table_columns[table_key]
-                                        if col_info[0] == column_name), None)
+    def _row_count(self, table_key, row_counts=None, scale=1):
+        """Number of rows to generate for a table, see generate_data."""
+        table = table_key.split('.')[1]
 
-                    if not column_info:
-                        continue
+        # Support both "schema.table" format and "table" format in row_counts
+        num_rows = (row_counts.get(table_key, None) or
+                    row_counts.get(table, 100) if row_counts else 100)  # Defaults to 100 rows
+        return int(num_rows * scale)
 
-                    # Skip auto-generated columns
-                    if column_name in auto_gen_cols:
-                        continue
+    def _generate_table(self, table_key, row_counts=None, scale=1):
+        """
+        Generate, batch and flush all rows of one table.
 
-                    # Skip excluded columns
-                    if self._is_excluded(table_key, column_name):
-                        # logger.debug(f"Skipping excluded column {table_key}.{column_name}")
-                        continue
+        Args:
+            table_key (str): The table identifier in the format "schema.table"
+            row_counts (dict, optional): Row counts by "schema.table" or "table", see generate_data
+            scale (float, optional): Scale factor to apply to row counts
 
-                    # Check if this column has a custom generator
-                    has_custom_generator = self._get_custom_generator(table_key, column_name) is not None
-
-                    # Check if this column has a foreign key constraint
-                    is_foreign_key = column_name in table_fk_columns
-
-                    # Add to appropriate list based on characteristics
-                    if is_foreign_key:
-                        fk_columns.append(column_info)
-                        # Also track if it has a custom generator
-                        if has_custom_generator:
-                            fk_custom_columns.add(column_name)
-                    elif has_custom_generator:
-                        custom_columns.append(column_info)
-                    else:
-                        standard_columns.append(column_info)
-
-                # If no usable columns, skip this table entirely
-                if not fk_columns and not custom_columns and not standard_columns:
-                    logger.debug(f"Skipping table {table_key} - all columns are either auto-generated or excluded")
-                    continue
+        Returns:
+            int or None: Number of rows generated, or None if the table has no columns to generate
+        """
+        with self.profiler.span('table', table_key):
+            table_start = time.time()
+            logger.debug(f"Processing table {table_key}...")
+            num_rows = self._row_count(table_key, row_counts, scale)
+
+            # Store the total row count for this table on the class instance
+            # This allows _flush_batch to access it without complex data structures
+            setattr(self, "total_rows_for_" + table_key.replace(".", "_"), num_rows)
+
+            table_generator = self._get_table_generator(table_key)
+            if table_generator is not None:
+                return self._generate_table_with_generator(table_key, table_generator, num_rows, table_start)
+
+            # Resolve columns, FK targets, custom generators and value factories once per table
+            compile_start = time.time()
+            with self._stream(table_key, 'plan'):
+                plan = self._compile_table_plan(table_key, num_rows)
+            compile_seconds = time.time() - compile_start
+
+            # If no usable columns, skip this table entirely
+            if plan is None:
+                logger.debug(f"Skipping table {table_key} - all columns are either auto-generated or excluded")
+                return None
 
-                logger.debug(
-                    f"Generating {num_rows} rows for {table_key} with {len(fk_columns)} FK columns, "
-                    f"{len(custom_columns)} custom columns, and {len(standard_columns)} standard columns")
+            logger.debug(
+                f"Generating {num_rows} rows for {table_key} with {len(plan.fk_slots)} FK columns, "
+                f"{len(plan.custom_slots)} custom columns, and {len(plan.standard_slots)} standard columns")
 
-                # Generate data for each row
-                for row_index in range(num_rows):
-                    values = []
-                    column_names = []
-                    row_values = {}  # Dictionary to store column values for custom generators
+            processes = self._get_process_count(table_key, num_rows, plan)
+            if processes > 1:
+                rows_generated, generate_seconds = self._generate_rows_in_processes(table_key, plan, num_rows,
+                                                                                    processes)
+            else:
+                generation_start = time.time()
+                load_seconds_before = self._load_seconds(table_key)
+                rows_generated = self._generate_rows(table_key, plan, num_rows)
 
-                    try:
-                        # STEP 1: Process foreign key columns first
-                        for column, data_type, column_default, is_nullable, character_maximum_length, num_precision, num_scale in fk_columns:
-                            # Skip if this column has already been populated by another process
-                            if column in row_values:
-                                # logger.debug(f"Column {column} already has a value set, skipping FK processing...")
-                                continue
+                # Time spent in the loader and storing primary keys is reported separately by load_stats
+                load_seconds = self._load_seconds(table_key) - load_seconds_before
+                generate_seconds = time.time() - generation_start - load_seconds
 
-                            column_names.append(column)
-
-                            # Check if this FK column also has a custom generator
-                            if column in fk_custom_columns:
-                                # For columns with both FK and custom generator, use the custom generator
-                                generator_func = self._get_custom_generator(table_key, column)
-                                try:
-                                    # Call the custom generator with row_values, table_key, and column
-                                    custom_value = generator_func(row_values, table_key, column)
-                                    if isinstance(custom_value, str) and character_maximum_length and len(
-                                            custom_value) > character_maximum_length:
-                                        custom_value = custom_value[:character_maximum_length]
-
-                                    values.append(custom_value)
-                                    row_values[column] = custom_value
-
-                                    # Check if any newly added columns in row_values are valid columns for this table
-                                    for col, val in list(row_values.items()):
-                                        if col not in column_names and col in valid_columns and col not in auto_gen_cols:
-                                            column_names.append(col)
-                                            values.append(val)
-                                            # logger.debug(f"Added valid extra column {col} from FK custom generator")
-
-                                except SkipRowGenerationError:
-                                    raise
-                                except Exception as e:
-                                    logger.debug(f"Error in custom generator for FK {table_key}.{column}: {e}")
-                                    # Fall back to standard FK handling if the custom generator fails
-                                    fk_info = next(
-                                        (fk for fk in self.foreign_keys
-                                         if fk[1] == schema and fk[2] == table and fk[3] == column), None
-                                    )
-                                    self._handle_foreign_key(fk_info, table_key, column, is_nullable, values)
-                                    row_values[column] = values[-1]
-                            else:
-                                # Standard FK handling for columns without custom generators
-                                fk_info = next(
-                                    (fk for fk in self.foreign_keys
-                                     if fk.get('table_schema') == schema and fk.get('table_name') == table and fk.get(
-                                        'column_name') == column), None
-                                )
-                                if fk_info:
-                                    self._handle_foreign_key(fk_info, table_key, column, is_nullable, values)
-                                else:
-                                    # logger.debug(f"Warning: Column {column} marked as FK but no FK info found")
-                                    self._generate_column_value(table_key,
-                                                                column, data_type, column_default, is_nullable,
-                                                                character_maximum_length, num_precision, num_scale,
-                                                                values)
-
-                                row_values[column] = values[-1]
-
-                        # STEP 2: Process custom columns that are not foreign keys
-                        for column, data_type, column_default, is_nullable, character_maximum_length, num_precision, num_scale in custom_columns:
-                            # Skip if this column has already been populated by another custom generator
-                            if column in row_values:
-                                # logger.debug(f"Column {column} already has a value set, skipping custom generation...")
-                                continue
+            self._record_plan_stats(table_key, compile_seconds, generate_seconds, rows_generated)
 
-                            # Get the custom generator for this column
-                            generator_func = self._get_custom_generator(table_key, column)
+            worker = self._local_worker()
+            self.table_timings[table_key] = {'seconds': time.time() - table_start, 'rows': rows_generated,
+                                             'worker': worker.index if worker else 0}
+            logger.debug(f"Generated {rows_generated} rows for {table_key} in "
+                         f"{self.table_timings[table_key]['seconds']:.2f} seconds")
+            return rows_generated
 
-                            try:
-                                # Call the custom generator with row_values, table_key, and column
-                                custom_value = generator_func(row_values, table_key, column)
-                                if isinstance(custom_value, str) and character_maximum_length and len(
-                                        custom_value) > character_maximum_length:
-                                    custom_value = custom_value[:character_maximum_length]
-
-                                # Add this column's value to both row_values and the column_names/values lists
-                                row_values[column] = custom_value
-                                column_names.append(column)
-                                values.append(custom_value)
-
-                                # Check if any newly added columns in row_values are valid columns for this table
-                                for col, val in list(row_values.items()):
-                                    if col in column_names:
-                                        # Column already exists in column_names, update its value
-                                        # Find the index of the column in column_names
-                                        index = column_names.index(col)
-                                        # Update the value at the same index in values list
-                                        values[index] = val
-                                    elif col not in column_names and col in valid_columns:
-                                        column_names.append(col)
-                                        values.append(val)
-                                        # logger.debug(f"Added valid extra column {col} from custom generator")
-
-                            except AttributeError as e:
-                                stack_trace = traceback.format_exc()
-                                logger.error(e)
-                                logger.error(stack_trace)
-                                if strict:
-                                    sys.exit(-1)
-                                if is_nullable == 'YES':
-                                    row_values[column] = None
-                                    column_names.append(column)
-                                    values.append(None)
-                                else:
-                                    default_value = self._generate_default_value(data_type, character_maximum_length)
-                                    row_values[column] = default_value
-                                    column_names.append(column)
-                                    values.append(default_value)
-                            except SkipRowGenerationError as _e:
-                                raise
-                            except Exception as e:
-                                stack_trace = traceback.format_exc()
-                                logger.debug(f"Error in custom generator for {table_key}.{column}: {e} {stack_trace}")
-                                if strict:
-                                    sys.exit(-1)
-                                # Set to NULL if nullable, otherwise try a generic value
-                                if is_nullable == 'YES':
-                                    row_values[column] = None
-                                    column_names.append(column)
-                                    values.append(None)
-                                else:
-                                    default_value = self._generate_default_value(data_type, character_maximum_length)
-                                    row_values[column] = default_value
-                                    column_names.append(column)
-                                    values.append(default_value)
-
-                        # STEP 3: Process standard columns last
-                        for column, data_type, column_default, is_nullable, character_maximum_length, num_precision, num_scale in standard_columns:
-                            # Skip if this column has already been populated
-                            if column in row_values:
-                                # logger.debug(
-                                #     f"Column {column} already has a value set, skipping standard generation...")
-                                if column not in column_names:
-                                    column_names.append(column)
-                                    values.append(row_values[column])
-                                continue
+    def _generate_table_with_generator(self, table_key, table_generator, num_rows, table_start):
+        """
+        Generate a whole table with a generator from table_generators, recording the same stats as the row loop.
 
-                            column_names.append(column)
+        Returns:
+            int: Number of rows generated
+        """
+        logger.debug(f"Generating {num_rows} rows for {table_key} with a table generator")
+        load_seconds_before = self._load_seconds(table_key)
+        with self._stream(table_key, 'table'), self.profiler.span('generator', generator_name(table_generator)):
+            rows_generated = table_generator(self, table_key, num_rows) or 0
+        load_seconds = self._load_seconds(table_key) - load_seconds_before
+        self._record_plan_stats(table_key, 0.0, time.time() - table_start - load_seconds, rows_generated)
+
+        worker = self._local_worker()
+        self.table_timings[table_key] = {'seconds': time.time() - table_start, 'rows': rows_generated,
+                                         'worker': worker.index if worker else 0}
+        logger.debug(f"Generated {rows_generated} rows for {table_key} in "
+                     f"{self.table_timings[table_key]['seconds']:.2f} seconds")
+        return rows_generated
+
+    def _generate_rows(self, table_key, plan, num_rows, first_block=0):
+        """
+        Run the row loop of a compiled plan, batching and flushing the rows.
 
-                            # Generate data for regular columns
-                            if data_type == 'text':
-                                try:
-                                    generate_unique_json_array(dbml_string=self.dbml,
-                                                               fully_qualified_column_name=f"{table_key}.{column}",
-                                                               count=num_rows)
-                                except (AnthropicError, ValueError):
-                                    pass
-                            self._generate_column_value(table_key,
-                                                        column, data_type, column_default, is_nullable,
-                                                        character_maximum_length, num_precision, num_scale, values)
+        Rows are generated in blocks of batch_size; when seeded, each block draws from the stream of
+        (table_key, block number), numbered from first_block, see _generate_rows_in_processes.
 
-                            # Store the value in the row_values dictionary
-                            row_values[column] = values[-1]
+        Returns:
+            int: Number of rows generated (rows skipped with SkipRowGenerationError are not counted)
+        """
+        # Calculate number of batches for this table
+        num_batches = (num_rows + self.batch_size - 1) // self.batch_size  # Ceiling division
+        rows_generated = 0
+
+        # Generate data for each row
+        for batch_index in range(num_batches):
+            block_end = min((batch_index + 1) * self.batch_size, num_rows)
+            block_start = batch_index * self.batch_size
+            with self._stream(table_key, first_block + batch_index):
+                filled = self._fill_columns(plan, block_end - block_start)
+                taken = [set() for _ in range(block_end - block_start)]
+                for row_index in range(block_start, block_end):
+                    try:
+                        column_names, values = self._generate_row(plan, filled, row_index - block_start,
+                                                                  taken[row_index - block_start])
 
                         # Skip if no columns to insert (shouldn't happen due to earlier check, but just in case)
                         if not column_names:
@@ -485,39 +955,510 @@ class DataGenerator:
 
                         # Add the generated row to the batch
                         self._batch_row(table_key, column_names, values)
-                        total_rows_generated += 1
-
-                        # Display progress for large tables
-                        if (row_index + 1) % self.batch_size == 0 or row_index == num_rows - 1:
-                            current_batch = (row_index + 1) // self.batch_size
-                            if (row_index + 1) % self.batch_size > 0:
-                                current_batch += 1
-                            logger.debug(
-                                f"Generated {row_index + 1}/{num_rows} rows for {table_key} (Batch {current_batch}/{num_batches})")
+                        rows_generated += 1
                     except SkipRowGenerationError:
                         pass
+                self._release_unused(plan, filled, taken)
 
-                # Flush any remaining rows for this table
-                self._flush_batch(table_key)
+            # Display progress for large tables
+            logger.debug(
+                f"Generated {block_end}/{num_rows} rows for {table_key} (Batch {batch_index + 1}/{num_batches})")
 
-                # Increment processed tables count
-                tables_processed += 1
+        # Flush any remaining rows for this table
+        self._flush_batch(table_key)
+        return rows_generated
 
-                # Commit periodically if requested
-                if commit_frequency > 0 and tables_processed % commit_frequency == 0:
-                    self.conn.commit()
-                    logger.debug(
-                        f"Committed after processing {tables_processed} tables ({total_rows_generated} total rows generated)")
-                    total_rows_generated = 0  # Reset counter after commit
+    def _compile_process_table_patterns(self):
+        """Compile the regex patterns of the tables whose rows are generated in a process pool."""
+        self.process_table_patterns = []
 
-            # Final commit for any remaining data
-            self.conn.commit()
-            logger.debug(
-                f"Vectorized data generation complete. Processed {tables_processed} tables with {total_rows_generated} rows in final batch.")
+        for table_pattern in self.process_tables:
+            try:
+                self.process_table_patterns.append(re.compile(table_pattern))
+            except re.error as e:
+                logger.debug(f"Warning: Invalid regex pattern in process tables ({table_pattern}): {e}")
 
-        except Error as e:
-            logger.debug(f"Error during data generation: {e}")
-            self.conn.rollback()
+    def _get_process_count(self, table_key, num_rows, plan=None):
+        """
+        Number of processes to shard a table's rows across, 1 to generate it in this process.
+
+        Only tables matching process_tables are sharded, into at most one shard per full batch of rows. Tables
+        whose plan has custom generators of unique values, marked by a true `unique` attribute (see
+        helpers.unique_generator), are not: every shard would draw from its own copy of their unique_list values,
+        Faker unique sets, unique_values registry and value pools, and could repeat the values of another shard.
+        Neither are tables written to a file sink: the rows of a shard never reach this process's row cache, and
+        without a database to read them back from, child tables couldn't find them.
+        """
+        if self.processes <= 1 or not any(pattern.search(table_key) for pattern in self.process_table_patterns):
+            return 1
+        if not self.writes_database(table_key):
+            logger.info(f"Generating {table_key} in one process, its rows go to a file sink")
+            return 1
+        if self._get_table_generator(table_key) is not None:
+            return 1
+        if plan is not None:
+            unique_columns = [slot[0] for slot in plan.fk_slots + plan.custom_slots
+                              if getattr(slot[4], 'unique', False) is True]
+            if unique_columns:
+                logger.info(f"Generating {table_key} in one process, its generators of "
+                            f"{', '.join(unique_columns)} draw unique values")
+                return 1
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            logger.debug(f"Generating {table_key} in one process, the fork start method is not available")
+            return 1
+        return max(1, min(self.processes, num_rows // self.batch_size))
+
+    def _generate_rows_in_processes(self, table_key, plan, num_rows, processes):
+        """
+        Shard the rows of a table across forked worker processes.
+
+        Each shard process inherits the compiled plan and the parent PK stores, opens its own connection, loads
+        and commits its rows and sends back the primary keys it inserted. The keys are appended to the table's
+        PK store in shard order. Shards are made of whole blocks of batch_size rows, so a seeded run draws every
+        block from the same stream as a single process would; unseeded shards reseed random, NumPy and Faker
+        from a seed drawn here.
+
+        Rows already written on this connection are committed first so that the shard connections can see
+        the parent rows they reference.
+
+        Returns:
+            tuple: (rows generated, generation seconds excluding load time on the slowest shard)
+        """
+        global _shard_context
+
+        self.conn.commit()
+        # Start the run-wide output of the loader (TsvSink's copy.sql) before forking, shards append to it
+        self._get_loader(table_key)
+        num_blocks = (num_rows + self.batch_size - 1) // self.batch_size
+        shard_blocks = [num_blocks // processes + (1 if i < num_blocks % processes else 0) for i in range(processes)]
+        shards = []
+        first_block = 0
+        for i, blocks in enumerate(shard_blocks):
+            row_count = min(num_rows, (first_block + blocks) * self.batch_size) - first_block * self.batch_size
+            shards.append((i, row_count, first_block, random.getrandbits(64)))
+            first_block += blocks
+        logger.info(f"Generating {num_rows} rows for {table_key} in {processes} processes")
+
+        _shard_context = (self, table_key, plan)
+        try:
+            # Fork only now, so the shard processes inherit the plan; one shard per process
+            with multiprocessing.get_context('fork').Pool(processes, maxtasksperchild=1) as pool:
+                results = pool.map(_generate_shard, shards, chunksize=1)
+        finally:
+            _shard_context = None
+
+        rows_generated = 0
+        for result in results:
+            rows_generated += result['rows']
+            if result['pks']:
+                self._store_primary_keys(table_key, result['pks'])
+            if result['rows']:
+                self.populated_tables.add(table_key)
+            if result['error']:
+                self.not_populated_tables[table_key] = result['error']
+            self.profiler.merge(result['profile'])
+            stats = result['load_stats']
+            if stats:
+                # Summed over shards, like the time a single loader would have spent
+                self._record_load_stats(table_key, self._get_loader(table_key), stats['rows'], stats['seconds'],
+                                        stats['pk_seconds'])
+
+        return rows_generated, max(result['generate_seconds'] for result in results)
+
+    def _run_shard(self, table_key, plan, shard_index, row_count, first_block, seed):
+        """
+        Generate one shard of a table inside a forked process, see _generate_rows_in_processes.
+
+        Returns:
+            dict: rows, pks, generate_seconds, load_stats, error (the last batch error, if any) and profile
+        """
+        if not self.streams:
+            # Otherwise every shard would continue the random state inherited from the parent
+            random.seed(seed)
+            np.random.seed(seed % 2 ** 32)
+            faker.Faker.seed(seed)
+            self.fake.seed_instance(seed)
+
+        # Collect this shard's keys in a fresh in-memory store; the inherited stores and their spill files
+        # belong to the parent
+        metadata = self.table_metadata.get(table_key)
+        self.inserted_pks[table_key] = PrimaryKeyStore(
+            table_key, data_types=[metadata.data_types.get(col) for col in metadata.pk_columns] if metadata else None)
+        self.batch_data.pop(table_key, None)
+        self.row_cache.clear_pending(table_key)
+        self.load_stats.pop(table_key, None)
+        self.not_populated_tables.pop(table_key, None)
+        self.row_cache.detach()
+        self.profiler.reset()
+
+        # Never touch the parent's connection: the forked socket is shared with it
+        worker = WorkerContext(shard_index + 1, psycopg2.connect(**self.conn_params))
+        self._local.worker = worker
+        try:
+            self._get_loader(table_key).begin_shard(table_key, first_block * self.batch_size)
+            generation_start = time.time()
+            rows_generated = self._generate_rows(table_key, plan, row_count, first_block)
+            worker.conn.commit()
+            load_stats = self.load_stats.get(table_key)
+            return {
+                'rows': rows_generated,
+                'pks': list(self.inserted_pks[table_key]),
+                'generate_seconds': time.time() - generation_start - self._load_seconds(table_key),
+                'load_stats': {'rows': load_stats['rows'], 'seconds': load_stats['seconds'],
+                               'pk_seconds': load_stats['pk_seconds']} if load_stats else None,
+                'error': self.not_populated_tables.get(table_key),
+                'profile': self.profiler.export()
+            }
+        finally:
+            self._local.worker = None
+            worker.close()
+
+    def _compile_table_plan(self, table_key, num_rows):
+        """
+        Build the generation plan for a table: the ordered column slots with their FK target, custom generator,
+        truncation limit and value factory already resolved, so that the row loop doesn't have to search
+        foreign keys, regex patterns or column lists again.
+
+        Args:
+            table_key (str): The table identifier in the format "schema.table"
+            num_rows (int): Number of rows that will be generated, used to size LLM text pools
+
+        Returns:
+            TablePlan or None: The plan, or None if the table has no columns to generate
+        """
+        schema, table = table_key.split('.')
+
+        # Get the auto-generated columns for this table
+        auto_gen_cols = set(self.auto_generated_columns.get(table_key, []))
+        column_infos = {col_info[0]: col_info for col_info in self.table_columns[table_key]}
+
+        # Resolve the foreign key of each column of this table
+        table_fks = {}
+        for fk in self.foreign_keys:
+            if fk.get('table_schema') == schema and fk.get('table_name') == table:
+                table_fks.setdefault(fk.get('column_name'), fk)
+
+        plan = TablePlan(table_key, valid_columns=set(column_infos), auto_gen_cols=auto_gen_cols)
+        block_fills = {}  # id of the generator -> (columns, fill, release)
+
+        # Use the ordered column list to maintain original order
+        for column_name in self.column_order.get(table_key, []):
+            column_info = column_infos.get(column_name)
+            if not column_info or column_name in auto_gen_cols or self._is_excluded(table_key, column_name):
+                continue
+
+            column, data_type, column_default, is_nullable, character_maximum_length, _, _ = column_info
+            generator_func = self._get_custom_generator(table_key, column)
+            fill = self._compile_block_fill(generator_func, column) if column not in table_fks else None
+            if fill is not None:
+                if id(generator_func) not in block_fills:
+                    block_fills[id(generator_func)] = ([], self.profiler.wrap(
+                        'generator', f"{generator_name(generator_func, table_key, column)} (batch)", fill),
+                        getattr(generator_func, 'release', None))
+                block_fills[id(generator_func)][0].append(column)
+            if generator_func is not None:
+                generator_func = self.profiler.wrap('generator', generator_name(generator_func, table_key, column),
+                                                    generator_func)
+
+            if column in table_fks:
+                plan.fk_slots.append((column, data_type, is_nullable, character_maximum_length, generator_func,
+                                      table_fks[column]))
+            elif generator_func is not None:
+                plan.custom_slots.append((column, data_type, is_nullable, character_maximum_length, generator_func))
+            else:
+                if data_type == 'text':
+                    try:
+                        generate_unique_json_array(dbml_string=self.dbml,
+                                                   fully_qualified_column_name=f"{table_key}.{column}",
+                                                   count=num_rows)
+                    except (anthropic.AnthropicError, ValueError):
+                        pass
+                plan.standard_slots.append((column, self._compile_value_factory(table_key, column_info)))
+
+        if not plan.fk_slots and not plan.custom_slots and not plan.standard_slots:
+            return None
+        plan.block_fills = list(block_fills.values())
+        plan.reads = self._table_reads(table_key)
+        return plan
+
+    @staticmethod
+    def _compile_block_fill(generator_func, column):
+        """
+        The block fill of a custom generator, if it has one: fill(n) -> column -> list of n values, from the
+        fill_column of a text_list or unique_list, or the fill_rows of a random_record whose generator declares
+        generate_batch (see batch_generator). None for generators that can only be called row by row.
+        """
+        fill_rows = getattr(generator_func, 'fill_rows', None)
+        if fill_rows is not None:
+            return fill_rows
+        fill_column = getattr(generator_func, 'fill_column', None)
+        if fill_column is not None:
+            return lambda n: {column: fill_column(n)}
+        return None
+
+    def _compile_value_factory(self, table_key, column_info):
+        """
+        Resolve the type-specific generator for a standard column once.
+
+        Args:
+            table_key (str): The table identifier in the format "schema.table"
+            column_info (tuple): Column details as stored in table_columns
+
+        Returns:
+            function: A function taking the row's values list and appending one generated value
+        """
+        column, data_type, _column_default, is_nullable, character_maximum_length, num_precision, num_scale = column_info
+        data_type = data_type.lower()
+        fully_qualified_column_name = f"{table_key}.{column}"
+        fake = self.fake
+
+        if data_type in ["integer", "smallint", "bigint", "int"]:
+            def produce(values):
+                self._generate_integer_value(data_type, num_precision, values)
+        elif data_type in ["inet"]:
+            def produce(values):
+                values.append(fake.ipv4())
+        elif data_type in ["numeric", "decimal", "real", "double precision"]:
+            def produce(values):
+                self._generate_numeric_value(num_precision, num_scale, values)
+        elif data_type in ["boolean"]:
+            def produce(values):
+                values.append(fake.pybool())
+        elif data_type in ["text"] and get_previous_responses().get(fully_qualified_column_name):
+            pool = get_previous_responses().get(fully_qualified_column_name)
+
+            def produce(values):
+                values.append(current_random().choice(pool))
+        elif data_type in ["uuid"]:
+            def produce(values):
+                values.append(fake.unique.uuid4())
+        elif data_type in ["interval"]:
+            def produce(values):
+                values.append(generate_random_interval_with_optional_weights())
+        elif data_type.startswith("date") or data_type.startswith("timestamp"):
+            def produce(values):
+                values.append(fake.unique.date_time_between(start_date="-30y", end_date="now"))
+        elif data_type in ["json", "jsonb"]:
+            def produce(values):
+                values.append(fake.unique.json())
+        else:
+            # Strings and anything else use the Faker provider matched to the column name
+            try:
+                faker_func = self._resolve_faker_func(table_key, column)
+            except Exception as e:
+                logger.debug(f"Could not resolve a Faker provider for {fully_qualified_column_name}: {e}")
+                faker_func = None
+
+            if faker_func is None:
+                def produce(values):
+                    self._handle_generation_error(is_nullable, character_maximum_length, values)
+            else:
+                def produce(values):
+                    self._generate_by_data_type(
+                        data_type, faker_func, is_nullable, character_maximum_length,
+                        num_precision, num_scale, values, fully_qualified_column_name=fully_qualified_column_name
+                    )
+
+        def factory(values):
+            try:
+                produce(values)
+            except Exception:
+                self._handle_generation_error(is_nullable, character_maximum_length, values)
+
+        return factory
+
+    def _fill_columns(self, plan, n):
+        """
+        Generate a block of n rows at once for the generators of plan.block_fills. The columns of a fill that
+        fails (e.g. a unique_list running out) are left to their generator, called row by row.
+
+        Returns:
+            dict: Column -> the (column -> list of n values) dict filled for it, shared by the columns of a fill
+        """
+        filled = {}
+        for columns, fill, _ in plan.block_fills:
+            try:
+                block = fill(n)
+            except Exception as e:
+                logger.debug(f"Generating {plan.table_key}.{', '.join(columns)} row by row: {e}")
+                continue
+            for column in columns:
+                filled[column] = block
+        return filled
+
+    @staticmethod
+    def _release_unused(plan, filled, taken):
+        """
+        Give the values of a block fill that no row took (its column was set by another generator first) back to
+        generators that declare release, like unique_list, so a pool of unique values isn't drained by them.
+
+        Args:
+            plan (TablePlan): The plan of the block
+            filled (dict): The block's fills, see _fill_columns
+            taken (list): Per row of the block, the columns it took from filled, see _generate_row
+        """
+        for columns, _, release in plan.block_fills:
+            if release is None or columns[0] not in filled:
+                continue
+            for column in columns:
+                unused = [value for value, row_taken in zip(filled[column][column], taken) if column not in row_taken]
+                if unused:
+                    release(unused)
+
+    def _generate_row(self, plan, filled=None, row=0, taken=None):
+        """
+        Generate the column names and values of one row by walking a compiled table plan.
+
+        Args:
+            plan (TablePlan): The plan returned by _compile_table_plan
+            filled (dict, optional): Column -> the columns filled for its block, see _fill_columns
+            row (int, optional): Index of the row in the block
+            taken (set, optional): Collects the columns whose values were taken from filled, see _release_unused
+
+        Returns:
+            tuple: (column_names, values)
+
+        Raises:
+            SkipRowGenerationError: If a generator decides this row can't be produced
+        """
+        table_key = plan.table_key
+        valid_columns = plan.valid_columns
+        auto_gen_cols = plan.auto_gen_cols
+        values = []
+        column_names = []
+        row_values = {}  # Dictionary to store column values for custom generators
+
+        # STEP 1: Process foreign key columns first
+        for column, data_type, is_nullable, character_maximum_length, generator_func, fk_info in plan.fk_slots:
+            # Skip if this column has already been populated by another process
+            if column in row_values:
+                continue
+
+            column_names.append(column)
+
+            # For columns with both FK and custom generator, use the custom generator
+            if generator_func is not None:
+                try:
+                    # Call the custom generator with row_values, table_key, and column
+                    custom_value = generator_func(row_values, table_key, column)
+                    if isinstance(custom_value, str) and character_maximum_length and len(
+                            custom_value) > character_maximum_length:
+                        custom_value = custom_value[:character_maximum_length]
+
+                    values.append(custom_value)
+                    row_values[column] = custom_value
+
+                    # Check if any newly added columns in row_values are valid columns for this table
+                    for col, val in list(row_values.items()):
+                        if col not in column_names and col in valid_columns and col not in auto_gen_cols:
+                            column_names.append(col)
+                            values.append(val)
+
+                except SkipRowGenerationError:
+                    raise
+                except Exception as e:
+                    logger.debug(f"Error in custom generator for FK {table_key}.{column}: {e}")
+                    # Fall back to standard FK handling if the custom generator fails
+                    self._handle_foreign_key(fk_info, table_key, column, is_nullable, values)
+                    row_values[column] = values[-1]
+            else:
+                # Standard FK handling for columns without custom generators
+                self._handle_foreign_key(fk_info, table_key, column, is_nullable, values)
+                row_values[column] = values[-1]
+
+        # STEP 2: Process custom columns that are not foreign keys
+        for column, data_type, is_nullable, character_maximum_length, generator_func in plan.custom_slots:
+            # Skip if this column has already been populated by another custom generator
+            if column in row_values:
+                continue
+
+            try:
+                if filled and column in filled:
+                    # Like random_record, the whole row of the generator lands in row_values
+                    for key, key_values in filled[column].items():
+                        row_values[key] = key_values[row]
+                    if taken is not None:
+                        taken.add(column)
+                    custom_value = row_values.get(column)
+                else:
+                    # Call the custom generator with row_values, table_key, and column
+                    custom_value = generator_func(row_values, table_key, column)
+                if isinstance(custom_value, str) and character_maximum_length and len(
+                        custom_value) > character_maximum_length:
+                    custom_value = custom_value[:character_maximum_length]
+
+                # Add this column's value to both row_values and the column_names/values lists
+                row_values[column] = custom_value
+                column_names.append(column)
+                values.append(custom_value)
+
+                # Check if any newly added columns in row_values are valid columns for this table
+                for col, val in list(row_values.items()):
+                    if col in column_names:
+                        # Column already exists in column_names, update its value
+                        # Find the index of the column in column_names
+                        index = column_names.index(col)
+                        # Update the value at the same index in values list
+                        values[index] = val
+                    elif col not in column_names and col in valid_columns:
+                        column_names.append(col)
+                        values.append(val)
+
+            except AttributeError as e:
+                stack_trace = traceback.format_exc()
+                logger.error(e)
+                logger.error(stack_trace)
+                if strict:
+                    sys.exit(-1)
+                self._append_fallback_value(column, data_type, is_nullable, character_maximum_length,
+                                            row_values, column_names, values)
+            except SkipRowGenerationError as _e:
+                raise
+            except Exception as e:
+                stack_trace = traceback.format_exc()
+                logger.debug(f"Error in custom generator for {table_key}.{column}: {e} {stack_trace}")
+                if strict:
+                    sys.exit(-1)
+                self._append_fallback_value(column, data_type, is_nullable, character_maximum_length,
+                                            row_values, column_names, values)
+
+        # STEP 3: Process standard columns last
+        for column, value_factory in plan.standard_slots:
+            # Skip if this column has already been populated
+            if column in row_values:
+                if column not in column_names:
+                    column_names.append(column)
+                    values.append(row_values[column])
+                continue
+
+            column_names.append(column)
+            value_factory(values)
+
+            # Store the value in the row_values dictionary
+            row_values[column] = values[-1]
+
+        return column_names, values
+
+    def _append_fallback_value(self, column, data_type, is_nullable, character_maximum_length,
+                               row_values, column_names, values):
+        """Set a failed custom column to NULL if nullable, otherwise to a generic value of its type."""
+        if is_nullable == 'YES':
+            value = None
+        else:
+            value = self._generate_default_value(data_type, character_maximum_length)
+        row_values[column] = value
+        column_names.append(column)
+        values.append(value)
+
+    def _record_plan_stats(self, table_key, compile_seconds, generate_seconds, row_count):
+        """Record time spent compiling a table plan and generating its rows (excluding loader time)."""
+        self.plan_stats[table_key] = {
+            'compile_seconds': compile_seconds,
+            'generate_seconds': generate_seconds,
+            'rows': row_count
+        }
+        logger.debug(f"{table_key}: plan compiled in {compile_seconds:.4f} seconds, "
+                     f"{row_count} rows generated in {generate_seconds:.2f} seconds")
 
     def _batch_row(self, table_key, column_names, values):
         """
@@ -560,9 +1501,11 @@ class DataGenerator:
                 'column_names': filtered_columns,
                 'rows': []
             }
+            self.row_cache.clear_pending(table_key)
 
-        # Add row values to batch
+        # Add row values to batch, visible to lookup_rows until it is flushed
         self.batch_data[table_key]['rows'].append(filtered_values)
+        self.row_cache.add_pending(table_key, filtered_columns, filtered_values)
 
         # Flush batch when it reaches the specified size
         if len(self.batch_data[table_key]['rows']) >= self.batch_size:
@@ -579,58 +1522,166 @@ class DataGenerator:
         if table_key not in self.batch_data or not self.batch_data[table_key]['rows']:
             return
 
-        schema, table = table_key.split('.')
         column_names = self.batch_data[table_key]['column_names']
         rows = self.batch_data[table_key]['rows']
+        loader = self._get_loader(table_key)
 
-        columns_str = ", ".join([f'"{col}"' for col in column_names])
+        with self.profiler.span('flush', table_key):
+            try:
+                load_start = time.time()
+                returned_columns, returned_rows = loader.load(table_key, column_names, rows)
+                pk_start = time.time()
+
+                # Process returned rows to store primary keys
+                for row in returned_rows:
+                    self._store_primary_key(table_key, row, returned_columns)
+                self.row_cache.put_batch(table_key, column_names, rows, returned_columns, returned_rows)
+                self._record_load_stats(table_key, loader, len(rows), pk_start - load_start,
+                                        time.time() - pk_start)
+
+                # Get the total rows for this table from the class instance
+                total_rows = getattr(self, "total_rows_for_" + table_key.replace(".", "_"), 0)
+
+                # Properly calculate the number of batches (ceiling division)
+                num_batches = (total_rows + self.batch_size - 1) // self.batch_size if total_rows > 0 else 1
+
+                # For logging purposes only
+                logger.debug(f"Inserted batch for {table_key} via {loader.name}: 1/{num_batches} "
+                             f"({len(rows)} rows)")
+
+                self.populated_tables.add(table_key)
+
+                # Clear the processed batch
+                self.batch_data[table_key]['rows'] = []
+
+            except psycopg2.Error as e:
+                logger.debug(f"Error batch inserting into {table_key}: {e}")
+                self.populated_tables.discard(table_key)
+                self.not_populated_tables[table_key] = str(e)
+                # Continue with the next batch even if this one fails
+                self.conn.rollback()
+                self.row_cache.invalidate(table_key)
+                for batch_loader in self.loaders.values():
+                    batch_loader.reset()
+
+    def load_columns(self, table_key, columns):
+        """
+        Write rows given as columns, e.g. the NumPy arrays of a table generator, through the table's loader in
+        batches of batch_size, storing their primary keys and caching them like generated rows.
 
-        # Construct a multi-row VALUES statement
-        placeholders_list = []
-        all_values = []
+        Args:
+            table_key (str): The table identifier in the format "schema.table"
+            columns (dict): Column name -> sequence of values (list or NumPy array), all of the same length
 
-        for row_values in rows:
-            # Add placeholders for this row
-            placeholders = "(" + ", ".join(["%s"] * len(row_values)) + ")"
-            placeholders_list.append(placeholders)
-            # Add values to flat list
-            all_values.extend(row_values)
+        Returns:
+            list: Primary keys of the written rows, in row order. A batch that fails is rolled back and its
+                  rows have no keys, so callers relating rows by position should check the length.
+        """
+        auto_gen_cols = self.auto_generated_columns.get(table_key, [])
+        column_names = [column for column in columns if column not in auto_gen_cols]
+        values = [columns[column].tolist() if isinstance(columns[column], np.ndarray) else list(columns[column])
+                  for column in column_names]
+        rows = [list(row) for row in zip(*values)]
+        if not rows:
+            return []
+
+        metadata = self.table_metadata.get(table_key)
+        pk_store = self._get_pk_store(table_key, metadata) if metadata and metadata.pk_columns else None
+        keys_before = len(pk_store) if pk_store is not None else 0
+
+        for start in range(0, len(rows), self.batch_size):
+            self.batch_data[table_key] = {'column_names': column_names, 'rows': rows[start:start + self.batch_size]}
+            self.row_cache.clear_pending(table_key)
+            self._flush_batch(table_key)
+        self.batch_data.pop(table_key, None)
+        self.row_cache.clear_pending(table_key)
 
-        placeholders_str = ", ".join(placeholders_list)
-        query = f'INSERT INTO "{schema}"."{table}" ({columns_str}) VALUES {placeholders_str} RETURNING *'
+        return pk_store[keys_before:] if pk_store is not None else []
 
-        try:
-            # logger.debug(f"Executing batch query: {query}")
-            # logger.debug(f"all_values={all_values}")
-            self.tuple_cursor.execute(query, all_values)
+    def _compile_table_generator_patterns(self):
+        """
+        Compile regex patterns for table generators.
+        Each table generator is a (table_pattern, generator_func) tuple.
+        """
+        self.table_generator_patterns = []
 
-            # Process returned rows to store primary keys
-            inserted_rows = self.tuple_cursor.fetchall()
-            for row in inserted_rows:
-                self._store_primary_key(table_key, row)
-            # if inserted_rows:
-            #     logger.debug(f"Stored PKs for {table_key}: {len(inserted_rows)} rows ")
+        for table_pattern, generator_func in self.table_generators:
+            try:
+                self.table_generator_patterns.append((re.compile(table_pattern), generator_func))
+                logger.debug(f"Added table generator: table='{table_pattern}'")
+            except re.error as e:
+                logger.debug(f"Warning: Invalid regex pattern in table generator ({table_pattern}): {e}")
+
+    def _get_table_generator(self, table_key):
+        """
+        Find a matching table generator for the given table.
 
-            # Get the total rows for this table from the class instance
-            total_rows = getattr(self, "total_rows_for_" + table_key.replace(".", "_"), 0)
+        Args:
+            table_key (str): Table name with schema (schema.table)
 
-            # Properly calculate the number of batches (ceiling division)
-            num_batches = (total_rows + self.batch_size - 1) // self.batch_size if total_rows > 0 else 1
+        Returns:
+            function or None: The table generator function if found, None otherwise
+        """
+        for table_regex, generator_func in self.table_generator_patterns:
+            if table_regex.search(table_key):
+                return generator_func
+        return None
 
-            # For logging purposes only
-            logger.debug(f"Inserted batch for {table_key}: 1/{num_batches} ({len(rows)} rows)")
+    def _compile_table_loader_patterns(self):
+        """
+        Compile regex patterns for per-table loader selection.
+        Each entry is a (table_pattern, loader_name) tuple.
+        """
+        self.table_loader_patterns = []
 
-            self.populated_tables.add(table_key)
+        for table_pattern, loader_name in self.table_loaders:
+            try:
+                self.table_loader_patterns.append((re.compile(table_pattern), loader_name))
+                logger.debug(f"Added table loader: table='{table_pattern}', loader='{loader_name}'")
+            except re.error as e:
+                logger.debug(f"Warning: Invalid regex pattern in table loader ({table_pattern}, {loader_name}): {e}")
 
-            # Clear the processed batch
-            self.batch_data[table_key]['rows'] = []
+    def _get_loader(self, table_key):
+        """
+        Find the loader for the given table, falling back to the default loader.
 
-        except psycopg2.Error as e:
-            logger.debug(f"Error batch inserting into {table_key}: {e}")
-            self.populated_tables.discard(table_key)
-            self.not_populated_tables[table_key] = str(e)
-            # Continue with the next batch even if this one fails
-            self.conn.rollback()
+        Args:
+            table_key (str): Table name with schema (schema.table)
+
+        Returns:
+            BatchLoader: The loader used to write batches for this table
+        """
+        loader_name = self._loader_name(table_key)
+        if loader_name not in self.loaders:
+            self.loaders[loader_name] = create_loader(loader_name, self)
+        return self.loaders[loader_name]
+
+    def _loader_name(self, table_key):
+        """Name of the loader of a table, the first matching table_loaders pattern or the default loader."""
+        for table_regex, name in self.table_loader_patterns:
+            if table_regex.search(table_key):
+                return name
+        return self.default_loader
+
+    def writes_database(self, table_key):
+        """Whether the rows of a table go to the database, False for the file sinks."""
+        return LOADERS[self._loader_name(table_key).lower()].writes_database
+
+    def _record_load_stats(self, table_key, loader, row_count, duration, pk_duration=0.0):
+        """
+        Accumulate rows and seconds spent in the loader for a table, and the seconds spent capturing the primary
+        keys it returned (primary key store and row cache).
+        """
+        stats = self.load_stats.setdefault(table_key, {'loader': loader.name, 'rows': 0, 'seconds': 0.0,
+                                                       'pk_seconds': 0.0})
+        stats['rows'] += row_count
+        stats['seconds'] += duration
+        stats['pk_seconds'] += pk_duration
+
+    def _load_seconds(self, table_key):
+        """Seconds spent so far in the loader and capturing primary keys for a table."""
+        stats = self.load_stats.get(table_key)
+        return stats['seconds'] + stats['pk_seconds'] if stats else 0.0
 
     def identify_generated_columns(self):
         """
@@ -705,7 +1756,7 @@ class DataGenerator:
                 logger.debug(f"Flushing remaining {len(self.batch_data[table_key]['rows'])} rows for {table_key}")
                 self._flush_batch(table_key)
 
-    def _log_performance_stats(self, operation, row_count, start_time):
+    def _log_performance_stats(self, operation, row_count, start_time, duration=None):
         """
         Log performance statistics for an operation.
 
@@ -713,8 +1764,10 @@ class DataGenerator:
             operation (str): Description of the operation being measured
             row_count (int): Number of rows processed
             start_time (float): Start time of the operation (from time.time())
+            duration (float, optional): Elapsed seconds, when the operation wasn't one contiguous interval
         """
-        duration = time.time() - start_time
+        if duration is None:
+            duration = time.time() - start_time
         rows_per_second = row_count / duration if duration > 0 else 0
         logger.info(f"{operation}: {row_count} rows in {duration:.2f} seconds ({rows_per_second:.2f} rows/sec)")
 
@@ -774,6 +1827,45 @@ class DataGenerator:
         else:
             logger.debug("No columns matched the custom generator patterns")
 
+    def _table_reads(self, table_key):
+        """
+        Tables the custom and table generators of a table read besides their own table, as declared by their
+        `reads` attribute (see helpers.reads). Foreign keys aren't needed, the scheduler orders tables by both.
+
+        Generators that declare nothing fall back to the table names in their code and closures (see
+        _scanned_reads), with a warning when there are any: names built at run time are missed.
+
+        Args:
+            table_key (str): The table identifier in the format "schema.table"
+
+        Returns:
+            set: Table keys of tables of the schema
+        """
+        reads = self.table_reads.get(table_key)
+        if reads is None:
+            generators = {id(generator): (column, generator) for column, generator in
+                          [(column, self._get_custom_generator(table_key, column))
+                           for column in self.column_order.get(table_key, [])] +
+                          [(None, self._get_table_generator(table_key))] if generator is not None}
+            reads = set()
+            for column, generator in generators.values():
+                declared = getattr(generator, 'reads', None)
+                if declared is None:
+                    declared = self._scanned_reads(table_key, column, generator)
+                reads.update(read for read in declared if read != table_key and read in self.table_columns)
+            self.table_reads[table_key] = reads
+        return reads
+
+    def _scanned_reads(self, table_key, column, generator):
+        """Tables named in the strings of a generator that doesn't declare its reads, see _generator_strings."""
+        found = {f"{schema}.{table}" for string in _generator_strings(generator)
+                 for schema, table in _TABLE_REFERENCE.findall(string)}
+        found = {read for read in found if read != table_key and read in self.table_columns}
+        if found:
+            logger.warning(f"{generator_name(generator, table_key, column)} doesn't declare the tables it reads, "
+                           f"found {', '.join(sorted(found))} in its code; declare them with @reads")
+        return found
+
     def _get_custom_generator(self, table, column):
         """
         Find a matching custom generator for the given table and column.
@@ -1133,6 +2225,8 @@ class DataGenerator:
         # Check if we have a cycle (if we couldn't process all nodes)
         if len(sorted_result) != len(all_entities):
             # Use networkx to find a cycle
+            import networkx as nx
+
             nx_graph = nx.DiGraph(graph)
             try:
                 cycle = nx.find_cycle(nx_graph)
@@ -1160,14 +2254,185 @@ class DataGenerator:
 
     def setup_vector_model(self):
         """
-        Set up the sentence transformer model and prepare Faker embeddings
-        for intelligent provider selection.
+        Prepare Faker provider embeddings for intelligent provider selection.
+
+        Provider names, their embeddings and previously resolved column matches are read from the on-disk
+        FakerMatchCache when available, in which case the sentence transformer model is not loaded at all.
+        With faker_matcher='heuristic' the model is never loaded: cached matches are used read-only and the
+        remaining columns are matched by HeuristicFakerMatcher.
         """
-        # Vectorization using Sentence Transformers
-        self.model = SentenceTransformer('all-MiniLM-L6-v2')
+        heuristic = self.faker_matcher == 'heuristic'
+        self.match_cache = FakerMatchCache(self.cache_dir, self.model_name, schema_hash(self.table_columns),
+                                           read_only=heuristic)
+        self.match_cache.load_matches()
+
+        cached = self.match_cache.load_providers()
+        if heuristic:
+            self.faker_names = cached[0] if cached else self._discover_faker_providers()
+            self.faker_embeddings = None
+            self.heuristic_matcher = HeuristicFakerMatcher(self.faker_names)
+            logger.debug(f"Matching columns to {len(self.faker_names)} Faker providers without the model")
+            return
 
-        # Create Faker name embeddings
-        self.faker_names = []
+        if cached:
+            self.faker_names, self.faker_embeddings = cached
+            logger.debug(f"Loaded {len(self.faker_names)} Faker provider embeddings from {self.match_cache.directory}")
+            return
+
+        self.faker_names = self._discover_faker_providers()
+        self.faker_embeddings = self._get_model().encode(self.faker_names, convert_to_numpy=True,
+                                                         normalize_embeddings=True)
+        self.match_cache.save_providers(self.faker_names, self.faker_embeddings)
+
+    def _standard_columns(self, table_key):
+        """
+        (column, data_type) of the columns of a table generated by type, i.e. that are not auto-generated,
+        foreign keys, excluded or handled by a custom generator.
+        """
+        if table_key not in self.table_columns:
+            return []
+        schema, table = table_key.split('.')
+        auto_gen_cols = self.auto_generated_columns.get(table_key, [])
+        fk_columns = {fk.get('column_name') for fk in self.foreign_keys
+                      if fk.get('table_schema') == schema and fk.get('table_name') == table}
+
+        return [(column, data_type) for column, data_type, *_ in self.table_columns[table_key]
+                if not (column in auto_gen_cols or column in fk_columns or self._is_excluded(table_key, column)
+                        or self._get_custom_generator(table_key, column) is not None)]
+
+    def prefetch_llm_text(self, table_keys, row_counts=None, scale=1):
+        """
+        Fill the LLM text pools of the standard text columns of the given tables up front, with
+        llm_concurrency requests in flight (see prefetch_unique_json_arrays), so that compiling a table plan
+        reads its pools from the cache instead of waiting for one request per column.
+
+        Args:
+            table_keys (list): Tables (schema.table) that are about to be generated
+            row_counts (dict, optional): Row counts by "schema.table" or "table", see generate_data
+            scale (float, optional): Scale factor to apply to row counts
+        """
+        if self.llm_concurrency <= 0:
+            return
+
+        requests = [(f"{table_key}.{column}", self._row_count(table_key, row_counts, scale))
+                    for table_key in table_keys if self._get_table_generator(table_key) is None
+                    for column, data_type in self._standard_columns(table_key) if data_type == 'text']
+        if not requests:
+            return
+
+        prefetch_start = time.time()
+        try:
+            filled = prefetch_unique_json_arrays(self.dbml, requests, concurrency=self.llm_concurrency)
+        except anthropic.AnthropicError as e:
+            logger.warning(f"Prefetching LLM text failed: {e}")
+            return
+        logger.info(f"Prefetched LLM text of {len(filled)} of {len(requests)} text columns in "
+                     f"{time.time() - prefetch_start:.2f} seconds")
+        usage = get_llm_usage()
+        for column, _ in requests:
+            if column in usage:
+                stats = usage[column]
+                logger.info(f"LLM text of {column}: {stats['elements']} elements, {stats['input_tokens']} input and "
+                            f"{stats['output_tokens']} output tokens, {stats['calls']} requests "
+                            f"({stats['failures']} failed) in {stats['seconds']:.2f} seconds")
+
+    def plan_faker_matches(self, table_keys, top_k=5):
+        """
+        Resolve the Faker provider of every standard column of the given tables up front: all column contexts
+        without a cached match are encoded in one batched call and scored against the provider embeddings with
+        a single matrix product (or scored by the heuristic matcher when running without the model).
+
+        The top_k candidates and their cosine scores are kept in faker_match_report for tuning.
+
+        Args:
+            table_keys (list): Tables (schema.table) that are about to be generated
+            top_k (int, optional): Number of candidates to keep per column in the report. Default is 5.
+        """
+        if not len(self.faker_names) or (self.faker_embeddings is None and self.heuristic_matcher is None):
+            return
+
+        pairs = [(table_key, column) for table_key in table_keys
+                 for column, data_type in self._standard_columns(table_key)
+                 if self._uses_faker_provider(table_key, column, data_type)]
+
+        missing = self.match_cache.missing(pairs) if self.match_cache else pairs
+        if not missing:
+            logger.debug(f"All {len(pairs)} Faker provider matches were cached")
+            return
+
+        match_start = time.time()
+        if self.heuristic_matcher is not None:
+            for table_key, column in missing:
+                candidates = self.heuristic_matcher.match(table_key, column, top_k)
+                if candidates:
+                    self.faker_match_report[f"{table_key}.{column}"] = candidates
+                    self.match_cache.set_match(table_key, column, candidates[0][0])
+            logger.info(f"Heuristically matched {len(missing)} columns to Faker providers in "
+                        f"{time.time() - match_start:.2f} seconds ({len(pairs) - len(missing)} cached)")
+            return
+
+        contexts = [f"{column} {table_key.split('.')[1]}" for table_key, column in missing]
+        column_embeddings = self._get_model().encode(contexts, batch_size=256, convert_to_numpy=True,
+                                                     normalize_embeddings=True)
+
+        # (columns x providers) cosine similarity matrix; both sides are normalized
+        scores = column_embeddings @ np.asarray(self.faker_embeddings).T
+        k = min(top_k, scores.shape[1])
+        top_indices = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top_indices, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        top_indices = np.take_along_axis(top_indices, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        for (table_key, column), indices, column_scores in zip(missing, top_indices, top_scores):
+            candidates = [(self.faker_names[i], float(score)) for i, score in zip(indices, column_scores)]
+            self.faker_match_report[f"{table_key}.{column}"] = candidates
+            if self.match_cache:
+                self.match_cache.set_match(table_key, column, candidates[0][0])
+
+        logger.info(f"Matched {len(missing)} columns to Faker providers in {time.time() - match_start:.2f} seconds "
+                    f"({len(pairs) - len(missing)} cached)")
+
+    def write_faker_match_report(self, path):
+        """
+        Write the top-k Faker provider candidates of each column matched in this run as JSON.
+
+        Args:
+            path (str): Output file
+        """
+        report = {
+            column: [{'provider': provider, 'score': round(score, 4)} for provider, score in candidates]
+            for column, candidates in sorted(self.faker_match_report.items())
+        }
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Wrote Faker match report for {len(report)} columns to {path}")
+
+    def _uses_faker_provider(self, table_key, column, data_type):
+        """Whether a standard column of this type is generated with its matched Faker provider."""
+        data_type = data_type.lower()
+        if data_type in ["integer", "smallint", "bigint", "int", "inet", "numeric", "decimal", "real",
+                         "double precision", "boolean", "uuid", "interval", "json", "jsonb"]:
+            return False
+        if data_type.startswith("date") or data_type.startswith("timestamp"):
+            return False
+        if data_type == "text" and get_previous_responses().get(f"{table_key}.{column}"):
+            return False
+        return True
+
+    def _get_model(self):
+        """Load the sentence transformer model on first use."""
+        if self.model is None:
+            from sentence_transformers import SentenceTransformer
+
+            model_start = time.time()
+            self.model = SentenceTransformer(self.model_name)
+            logger.info(f"Loaded sentence transformer {self.model_name} in {time.time() - model_start:.2f} seconds")
+        return self.model
+
+    def _discover_faker_providers(self):
+        """Collect the names of the Faker provider methods that can be called without arguments and return scalars."""
+        faker_names = []
 
         # Dynamically discover and collect methods from all providers
         for provider in self.fake.get_providers():
@@ -1189,20 +2454,14 @@ class DataGenerator:
                                 if not isinstance(test_result, list) and not isinstance(test_result,
                                                                                         tuple) and not isinstance(
                                     test_result, dict):
-                                    self.faker_names.append(name)
+                                    faker_names.append(name)
                             except:
                                 continue
                 except (TypeError, ValueError):
                     # Skip attributes that raise errors
                     continue
 
-        self.faker_embeddings = self.model.encode(self.faker_names, convert_to_tensor=True)
-
-        # Create a dictionary to map embeddings to Faker names
-        self.faker_embedding_map = {
-            tuple(embedding.tolist()): name
-            for embedding, name in zip(self.faker_embeddings, self.faker_names)
-        }
+        return faker_names
 
     def _generate_default_value(self, data_type, max_length=None):
         """
@@ -1243,7 +2502,7 @@ class DataGenerator:
         fk_table_key = f"{fk_schema}.{fk_table}"
 
         if fk_table_key in self.inserted_pks and self.inserted_pks[fk_table_key]:
-            values.append(random.choice(self.inserted_pks[fk_table_key]))
+            values.append(self.inserted_pks[fk_table_key].choice(current_random()))
         else:
             # If no primary keys exist, set value to NULL if allowed, otherwise try to create one
             if is_nullable == 'YES':
@@ -1256,27 +2515,7 @@ class DataGenerator:
                                character_maximum_length, num_precision, num_scale, values):
         """Generate an appropriate value for a database column based on its type."""
         try:
-            cache_key = (table_key, column)
-            if cache_key in self.faker_func_cache:
-                faker_func = self.faker_func_cache[cache_key]
-            else:
-                # Retrieve table and column descriptions from the database
-                schema, table_name = table_key.split('.')
-
-                # Combine table name and column name for context
-                context_name = f"{column} {table_name}"
-
-                column_embedding = self.model.encode(context_name, convert_to_tensor=True)
-                cosine_scores = util.cos_sim(column_embedding, self.faker_embeddings)
-                best_match_index = cosine_scores.argmax()
-                best_match_embedding = tuple(self.faker_embeddings[best_match_index].tolist())
-                faker_func_name = self.faker_embedding_map[best_match_embedding]
-                faker_func = getattr(self.fake.unique, faker_func_name)
-                self.used_faker_funcs.add((table_key, column, faker_func_name))
-
-                # Add this line to store the function in the cache
-                self.faker_func_cache[cache_key] = faker_func
-
+            faker_func = self._resolve_faker_func(table_key, column)
             self._generate_by_data_type(
                 data_type, faker_func, is_nullable, character_maximum_length,
                 num_precision, num_scale, values, fully_qualified_column_name=f"{table_key}.{column}"
@@ -1285,6 +2524,49 @@ class DataGenerator:
             # logger.debug(f"Error generating value for column '{column}' with type '{data_type}': {e}")
             self._handle_generation_error(is_nullable, character_maximum_length, values)
 
+    def _resolve_faker_func(self, table_key, column):
+        """
+        Find the Faker provider whose name is semantically closest to the column, caching the result.
+
+        Args:
+            table_key (str): Table name with schema (schema.table)
+            column (str): Column name
+
+        Returns:
+            function: The bound Faker (unique) provider method
+        """
+        cache_key = (table_key, column)
+        if cache_key in self.faker_func_cache:
+            return self.faker_func_cache[cache_key]
+
+        faker_func_name = self.match_cache.get_match(table_key, column) if self.match_cache else None
+        if (faker_func_name is None or not hasattr(self.fake, faker_func_name)) and self.heuristic_matcher:
+            candidates = self.heuristic_matcher.match(table_key, column, top_k=1)
+            faker_func_name = candidates[0][0] if candidates else None
+            if faker_func_name is None:
+                raise ValueError(f"No Faker provider matches {table_key}.{column}")
+            self.match_cache.set_match(table_key, column, faker_func_name)
+        elif faker_func_name is None or not hasattr(self.fake, faker_func_name):
+            schema, table_name = table_key.split('.')
+
+            # Combine table name and column name for context
+            context_name = f"{column} {table_name}"
+
+            column_embedding = self._get_model().encode(context_name, convert_to_numpy=True,
+                                                        normalize_embeddings=True)
+            # Both sides are normalized, so the dot product is the cosine similarity
+            best_match_index = int(np.argmax(self.faker_embeddings @ column_embedding))
+            faker_func_name = self.faker_names[best_match_index]
+            if self.match_cache:
+                self.match_cache.set_match(table_key, column, faker_func_name)
+
+        faker_func = getattr(self.fake.unique, faker_func_name)
+        self.used_faker_funcs.add((table_key, column, faker_func_name))
+
+        # Add this line to store the function in the cache
+        self.faker_func_cache[cache_key] = faker_func
+        return faker_func
+
     def _get_table_description(self, schema, table_name):
         """Retrieve the description of a table."""
         try:
@@ -1341,15 +2623,15 @@ class DataGenerator:
             self._generate_numeric_value(num_precision, num_scale, values)
         elif data_type in ["boolean"]:
             values.append(self.fake.pybool())
-        elif data_type in ["text"] and fully_qualified_column_name and previous_responses.get(
+        elif data_type in ["text"] and fully_qualified_column_name and get_previous_responses().get(
                 fully_qualified_column_name):
-            prev = previous_responses.get(fully_qualified_column_name)
-            value = random.choice(prev)
+            prev = get_previous_responses().get(fully_qualified_column_name)
+            value = current_random().choice(prev)
             values.append(value)
         elif data_type in ["varchar", "character varying", "char"]:
             try:
                 self._generate_string_value(faker_func, character_maximum_length, values)
-            except UniquenessException as _e:
+            except faker.exceptions.UniquenessException as _e:
                 value = self.fake.unique.paragraph()
                 if value and character_maximum_length and len(str(value)) > character_maximum_length:
                     values.append(str(value)[:character_maximum_length])
@@ -1460,99 +2742,54 @@ class DataGenerator:
         """
         self._batch_row(table_key, column_names, values)
 
-    def _store_primary_key(self, table_key, inserted_row):
+    def _store_primary_key(self, table_key, inserted_row, column_names=None):
         """
         Store the primary key value of the inserted row for foreign key references.
         Works with any type of primary key (serial, UUID, composite, etc.)
 
         Args:
             table_key (str): The table identifier in the format "schema.table"
-            inserted_row (tuple): The row returned by the INSERT ... RETURNING * statement
+            inserted_row (tuple): The row returned by the loader
+            column_names (list, optional): Names of the columns in inserted_row. Defaults to all table columns.
         """
-        schema, table = table_key.split('.')
-
-        try:
-            # Get the primary key column name(s) for this table
-            pk_query = """
-                SELECT kcu.column_name 
-                FROM information_schema.table_constraints tc
-                JOIN information_schema.key_column_usage kcu
-                    ON tc.constraint_name = kcu.constraint_name
-                    AND tc.table_schema = kcu.table_schema
-                WHERE tc.constraint_type = 'PRIMARY KEY'
-                    AND tc.table_schema = %s
-                    AND tc.table_name = %s
-                ORDER BY kcu.ordinal_position
-            """
-            pk_cursor = self.conn.cursor(cursor_factory=extensions.cursor)
-            pk_cursor.execute(pk_query, (schema, table))
-            pk_columns = [row[0] for row in pk_cursor.fetchall()]
-            pk_cursor.close()
-
-            if not pk_columns:
-                # logger.debug(f"No primary key found for table {table_key}")
-                return
-
-            # Get the column names from the INSERT query
-            query_cursor = self.conn.cursor(cursor_factory=extensions.cursor)
-            query_cursor.execute(f'SELECT * FROM "{schema}"."{table}" WHERE FALSE')
-            column_names = [desc.name for desc in query_cursor.description]
-            query_cursor.close()
-
-            # Find the indices of primary key columns in the returned row
-            pk_values = []
-            missing_pk_columns = []
-
-            for pk_col in pk_columns:
-                try:
-                    # Find this primary key column in the list of all columns
-                    if pk_col in column_names:
-                        idx = column_names.index(pk_col)
-
-                        # Check if this PK column is in our inserted data
-                        if idx < len(inserted_row):
-                            pk_values.append(inserted_row[idx])
-                        else:
-                            missing_pk_columns.append(pk_col)
-                    else:
-                        missing_pk_columns.append(pk_col)
-                except ValueError:
-                    missing_pk_columns.append(pk_col)
-
-            if missing_pk_columns:
-                logger.debug(f"Could not find these PK columns in result: {missing_pk_columns}")
-                logger.debug(f"Available columns: {column_names}")
-                logger.debug(f"Inserted row length: {len(inserted_row)}")
-                logger.debug(f"Inserted row data sample: {inserted_row[:3]}...")
-                return
-
-            # For composite keys, store the tuple of values
-            pk_value = tuple(pk_values) if len(pk_values) > 1 else pk_values[0]
-
-            # Store the primary key for future reference
-            if table_key not in self.inserted_pks:
-                self.inserted_pks[table_key] = []
-
-            self.inserted_pks[table_key].append(pk_value)
-            # logger.debug(f"Stored PK for {table_key}: {pk_value} (columns: {pk_columns})")
-
-        except Exception as e:
-            logger.debug(f"Error storing primary key for {table_key}: {e}")
+        metadata = self.table_metadata.get(table_key)
+        if not metadata or not metadata.pk_columns:
+            # logger.debug(f"No primary key found for table {table_key}")
+            return
 
-            # Additional error info
-            logger.debug(f"Table: {table_key}")
-            logger.debug(f"Inserted row data: {inserted_row}")
+        pk_value = metadata.primary_key_value(inserted_row, column_names)
+        if pk_value is None:
+            logger.debug(f"Could not find PK columns {metadata.pk_columns} of {table_key} in result")
+            logger.debug(f"Available columns: {column_names or metadata.columns}")
+            logger.debug(f"Inserted row length: {len(inserted_row)}")
+            return
 
-            # This is a problem with the RETURNING clause - log the issue
-            if hasattr(self.cur, 'description') and self.cur.description:
-                logger.debug(f"Current cursor description: {[desc.name for desc in self.cur.description]}")
+        # Store the primary key for future reference
+        self._get_pk_store(table_key, metadata).append(pk_value)
 
-            # Log our inserted columns for comparison
-            if table_key in self.batch_data and 'column_names' in self.batch_data[table_key]:
-                logger.debug(f"Columns we tried to insert: {self.batch_data[table_key]['column_names']}")
+    def _store_primary_keys(self, table_key, pk_values):
+        """Append already extracted primary key values (scalars, or tuples for composite keys) to a table's store."""
+        metadata = self.table_metadata.get(table_key)
+        if not metadata or not metadata.pk_columns:
+            return
+        self._get_pk_store(table_key, metadata).extend(pk_values)
+
+    def _get_pk_store(self, table_key, metadata):
+        if table_key not in self.inserted_pks:
+            self.inserted_pks[table_key] = PrimaryKeyStore(
+                table_key,
+                data_types=[metadata.data_types.get(col) for col in metadata.pk_columns],
+                spill_threshold=self.pk_spill_threshold
+            )
+        return self.inserted_pks[table_key]
 
     def close_connection(self):
-        """Close the database connection."""
+        """Close the database connection and release any spilled primary key files."""
+        for loader in self.loaders.values():
+            loader.close()
+        for pk_store in self.inserted_pks.values():
+            pk_store.close()
+        self.row_cache.close()
         if self.conn:
             if self.cur:
                 self.cur.close()
@@ -1615,9 +2852,16 @@ class DataGenerator:
 
             # Generate the data
             self.generate_data(row_counts, commit_frequency, scale)
-
-            # Get actual total rows by summing table counts
-            for table_key in self.ordered_tables:
+            self.match_cache.save_matches()
+            if os.environ.get('FAKER_MATCH_REPORT'):
+                self.write_faker_match_report(os.environ['FAKER_MATCH_REPORT'])
+
+            # Get actual total rows by summing table counts, or the rows generated when they went to files
+            counted_tables = self.ordered_tables
+            if not LOADERS[self.default_loader.lower()].writes_database:
+                total_rows = sum(timing['rows'] for timing in self.table_timings.values())
+                counted_tables = []
+            for table_key in counted_tables:
                 schema, table = table_key.split('.')
                 try:
                     self.tuple_cursor.execute(f'SELECT COUNT(*) FROM "{schema}"."{table}"')
@@ -1628,6 +2872,37 @@ class DataGenerator:
                     logger.debug(f"Error counting rows in {table_key}: {e}")
 
             self._log_performance_stats("Data generation and insertion", total_rows, insert_start)
+            self._log_performance_stats("Row generation (excluding load)",
+                                        sum(stats['rows'] for stats in self.plan_stats.values()), insert_start,
+                                        duration=sum(stats['generate_seconds'] for stats in self.plan_stats.values()))
+            logger.info(f"Generation plan compilation: {len(self.plan_stats)} tables in "
+                        f"{sum(stats['compile_seconds'] for stats in self.plan_stats.values()):.2f} seconds")
+            logger.info(f"Primary key capture: {sum(stats['pk_seconds'] for stats in self.load_stats.values()):.2f} "
+                        f"seconds")
+            llm_usage = get_llm_usage().values()
+            if llm_usage:
+                logger.info(f"LLM text: {sum(stats['calls'] for stats in llm_usage)} requests, "
+                            f"{sum(stats['input_tokens'] for stats in llm_usage)} input and "
+                            f"{sum(stats['output_tokens'] for stats in llm_usage)} output tokens, "
+                            f"{sum(stats['seconds'] for stats in llm_usage):.2f} seconds")
+            for table_key, stats in sorted(self.load_stats.items(), key=lambda item: -item[1]['seconds']):
+                self._log_performance_stats(f"Loaded {table_key} via {stats['loader']}", stats['rows'],
+                                            insert_start, duration=stats['seconds'])
+            for table_key, timing in sorted(self.table_timings.items(), key=lambda item: -item[1]['seconds']):
+                worker = f" (worker {timing['worker']})" if timing['worker'] else ""
+                self._log_performance_stats(f"Generated {table_key}{worker}", timing['rows'], insert_start,
+                                            duration=timing['seconds'])
+            cache_stats = self.row_cache.stats
+            logger.info(f"Row cache: {cache_stats['hits']} lookups served from memory, {cache_stats['misses']} "
+                        f"read from the database in {cache_stats['db_queries']} queries, "
+                        f"{cache_stats['spilled']} rows spilled, {cache_stats['samples']} samples drawn, "
+                        f"{cache_stats['pending_hits']} lookups answered from unflushed batches")
+            if self.unique_values.stats:
+                logger.info(f"Unique values:\n{self.unique_values.report()}")
+            if self.profiler.enabled:
+                logger.info(f"Profile:\n{self.profiler.report()}")
+                if self.profile_trace:
+                    self.profiler.write_trace(self.profile_trace)
             logger.debug(f"\n\nPopulated these tables: {self.populated_tables}")
             logger.debug(f"\n\nUsed faker funcs: {self.used_faker_funcs}")
             logger.debug(f"\n\nNot populated tables: {self.not_populated_tables}")
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of EnumUtilities.get_random: the per-row cost of drawing a member of every enum under
+intelligent_generators/*/enums, with the cached alias samplers, one by one and in batches, against the previous
+implementation that rebuilt the member list and called random.choices on every draw.
+
+Usage:
+    python enum_benchmark.py [--draws 20000] [--batch 10000] [--check]
+
+--check also compares the frequencies drawn by get_random and get_random_batch with the enum weights.
+"""
+import argparse
+import enum
+import importlib
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+DOMAINS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fsi_data_generator', 'fsi_generators',
+                           'intelligent_generators')
+
+
+def enum_classes():
+    """Every enum class of the generators that uses EnumUtilities.get_random as is."""
+    import fsi_data_generator  # noqa: F401, resolves the circular import of data_generator
+    from fsi_data_generator.fsi_generators.helpers import EnumUtilities
+
+    classes = {}
+    for domain in sorted(os.listdir(DOMAINS_DIR)):
+        if not os.path.isdir(os.path.join(DOMAINS_DIR, domain, 'enums')):
+            continue
+        module = importlib.import_module(f'fsi_data_generator.fsi_generators.intelligent_generators.{domain}.enums')
+        for value in vars(module).values():
+            if (isinstance(value, type) and issubclass(value, enum.Enum) and issubclass(value, EnumUtilities)
+                    and value.get_random.__func__ is EnumUtilities.get_random.__func__):
+                classes[f"{domain}.{value.__name__}"] = value
+    return classes
+
+
+def legacy_get_random(cls, weights=None):
+    """EnumUtilities.get_random before the samplers were cached."""
+    enum_members = [member for member in cls if not member.name.startswith("_")]
+    weights = weights or (cls._DEFAULT_WEIGHTS and cls._DEFAULT_WEIGHTS.value)
+    if weights is None:
+        return random.choice(enum_members)
+    return random.choices(enum_members, weights=weights)[0]
+
+
+def per_draw(func, draws):
+    """Seconds per call of func, over draws calls."""
+    start = time.perf_counter()
+    for _ in range(draws):
+        func()
+    return (time.perf_counter() - start) / draws
+
+
+def check(cls, draws):
+    """Largest difference between the weights of cls and the frequencies drawn one by one and in a batch."""
+    members = cls.get_members()
+    weights = np.asarray(cls._DEFAULT_WEIGHTS.value if cls._DEFAULT_WEIGHTS else [1.0] * len(members), dtype=float)
+    expected = weights / weights.sum()
+    single = np.bincount([members.index(cls.get_random()) for _ in range(draws)], minlength=len(members)) / draws
+    batch = np.bincount(cls.get_random_batch(draws), minlength=len(members)) / draws
+    return max(np.abs(single - expected).max(), np.abs(batch - expected).max())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark EnumUtilities.get_random over the generator enums')
+    parser.add_argument('--draws', type=int, default=20000, help='Draws per enum and implementation')
+    parser.add_argument('--batch', type=int, default=10000, help='Members drawn per get_random_batch call')
+    parser.add_argument('--check', action='store_true', help='Check the drawn frequencies against the weights')
+    args = parser.parse_args()
+
+    classes = enum_classes()
+    weighted = sum(1 for cls in classes.values() if cls._DEFAULT_WEIGHTS)
+    print(f"{len(classes)} enums ({weighted} with _DEFAULT_WEIGHTS), {args.draws} draws each")
+
+    totals = {'legacy': 0.0, 'get_random': 0.0, 'get_random_batch': 0.0}
+    for name, cls in classes.items():
+        totals['legacy'] += per_draw(lambda: legacy_get_random(cls), args.draws)
+        totals['get_random'] += per_draw(cls.get_random, args.draws)
+        batches = max(1, args.draws // args.batch)
+        totals['get_random_batch'] += per_draw(lambda: cls.get_random_batch(args.batch), batches) / args.batch
+
+    print(f"  {'ns/draw':>10}  implementation")
+    for implementation, seconds in totals.items():
+        print(f"  {seconds / len(classes) * 1e9:10.1f}  {implementation}")
+    print(f"get_random is {totals['legacy'] / totals['get_random']:.1f}x faster than before, get_random_batch "
+          f"{totals['legacy'] / totals['get_random_batch']:.0f}x")
+
+    if args.check:
+        worst = max((check(cls, args.draws), name) for name, cls in classes.items())
+        print(f"Largest frequency deviation from the weights: {worst[0]:.4f} ({worst[1]})")
+        if worst[0] > 0.05:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
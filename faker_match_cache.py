@@ -0,0 +1,202 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import hashlib
+import json
+import logging
+import numpy as np
+import os
+import re
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout of the cache files changes
+CACHE_VERSION = 1
+
+
+def schema_hash(table_columns: Dict[str, List[tuple]]) -> str:
+    """
+    Hash the shape of the schema (tables, columns and their types) so that column -> provider matches
+    are invalidated whenever the schema changes.
+
+    Args:
+        table_columns (dict): DataGenerator.table_columns, table_key -> list of column info tuples
+    """
+    digest = hashlib.sha256()
+    for table_key in sorted(table_columns):
+        for column_info in table_columns[table_key]:
+            digest.update(f"{table_key}.{column_info[0]}:{column_info[1]}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+class FakerMatchCache:
+    """
+    On-disk cache for the vector matching of columns to Faker providers.
+
+    Layout under cache_dir::
+
+        v<CACHE_VERSION>-faker<version>-<model>/
+            providers.json          provider names, in embedding row order
+            embeddings.npy          provider embedding matrix, opened as a read-only memmap
+            matches-<schema>.json   "schema.table.column" -> provider name
+
+    Provider names and embeddings only depend on the Faker version and the model, so they are shared by
+    every schema; the resolved matches are additionally keyed on the schema hash.
+
+    A read_only cache serves whatever the model resolved in earlier runs but never writes, so matches made
+    without the model don't end up in the model's cache.
+    """
+
+    def __init__(self, cache_dir: str, model_name: str, schema_key: Optional[str] = None, read_only: bool = False):
+        from faker import VERSION as faker_version
+
+        safe_model_name = model_name.replace('/', '_')
+        self.directory = os.path.join(cache_dir, f"v{CACHE_VERSION}-faker{faker_version}-{safe_model_name}")
+        self.schema_key = schema_key
+        self.read_only = read_only
+        self.matches: Dict[str, str] = {}
+        self._dirty = False
+
+    @property
+    def providers_file(self):
+        return os.path.join(self.directory, 'providers.json')
+
+    @property
+    def embeddings_file(self):
+        return os.path.join(self.directory, 'embeddings.npy')
+
+    @property
+    def matches_file(self):
+        return os.path.join(self.directory, f"matches-{self.schema_key or 'default'}.json")
+
+    def load_providers(self) -> Optional[Tuple[List[str], np.ndarray]]:
+        """
+        Returns:
+            tuple or None: (provider names, embedding matrix memmap), or None if not cached
+        """
+        try:
+            with open(self.providers_file, 'r') as f:
+                names = json.load(f)
+            embeddings = np.load(self.embeddings_file, mmap_mode='r')
+        except (OSError, ValueError) as e:
+            logger.debug(f"No usable Faker provider cache in {self.directory}: {e}")
+            return None
+
+        if len(names) != embeddings.shape[0]:
+            logger.debug(f"Faker provider cache in {self.directory} is inconsistent, ignoring it")
+            return None
+        return names, embeddings
+
+    def save_providers(self, names: List[str], embeddings: np.ndarray):
+        if self.read_only:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        self._atomic_write(self.embeddings_file, lambda f: np.save(f, np.asarray(embeddings, dtype=np.float32)))
+        self._atomic_write(self.providers_file, lambda f: f.write(json.dumps(names).encode()))
+
+    def load_matches(self) -> Dict[str, str]:
+        try:
+            with open(self.matches_file, 'r') as f:
+                self.matches = json.load(f)
+        except (OSError, ValueError):
+            self.matches = {}
+        return self.matches
+
+    def get_match(self, table_key: str, column: str) -> Optional[str]:
+        return self.matches.get(f"{table_key}.{column}")
+
+    def set_match(self, table_key: str, column: str, provider: str):
+        self.matches[f"{table_key}.{column}"] = provider
+        self._dirty = True
+
+    def missing(self, pairs: Iterable[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        return [(table_key, column) for table_key, column in pairs if f"{table_key}.{column}" not in self.matches]
+
+    def save_matches(self):
+        if not self._dirty or self.read_only:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        self._atomic_write(self.matches_file, lambda f: f.write(json.dumps(self.matches, indent=1).encode()))
+        self._dirty = False
+
+    def _atomic_write(self, path, write):
+        """Write to a temporary file in the same directory and rename it over the target."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+class HeuristicFakerMatcher:
+    """
+    Deterministic column -> Faker provider matching on name words, used when the sentence transformer is
+    not loaded.
+
+    A provider scores by the share of its name words found in the column name, plus a smaller weight for
+    words found in the table name; an exact name match (ignoring underscores) always wins, and a provider
+    must share at least one word with the column. Ties go to the provider matching the earliest word of the
+    column ("company_name" -> company), then to the shorter name, then alphabetically, so the result is
+    stable across runs.
+
+    Args:
+        provider_names (list): Names of the Faker provider methods to choose from
+        fallback (str, optional): Provider used when no name shares a word with the column. Default is 'word'.
+    """
+
+    def __init__(self, provider_names: List[str], fallback: str = 'word'):
+        self.provider_names = list(provider_names)
+        self.provider_words = [self._words(name) for name in self.provider_names]
+        self.fallback = fallback if fallback in self.provider_names else None
+
+    @staticmethod
+    def _words(name: str) -> List[frozenset]:
+        """Split a name into words, each given as the set of its forms (the word and a crude singular)."""
+        words = []
+        for word in re.split(r'[^a-z0-9]+', name.lower()):
+            if not word:
+                continue
+            forms = {word}
+            # So that "addresses" matches "address" and "cities" matches "city"
+            if word.endswith('ies') and len(word) > 4:
+                forms.add(word[:-3] + 'y')
+            elif word.endswith('es') and len(word) > 4:
+                forms.update((word[:-2], word[:-1]))
+            elif word.endswith('s') and not word.endswith(('ss', 'us', 'is')) and len(word) > 3:
+                forms.add(word[:-1])
+            words.append(frozenset(forms))
+        return words
+
+    def match(self, table_key: str, column: str, top_k: int = 5) -> List[Tuple[str, float]]:
+        """
+        Returns:
+            list: Up to top_k (provider, score) candidates, best first
+        """
+        column_words = self._words(column)
+        column_forms = set().union(*column_words) if column_words else set()
+        table_forms = set().union(*self._words(table_key.split('.')[-1])) - column_forms
+        column_name = column.lower().replace('_', '')
+
+        scored = []
+        for name, words in zip(self.provider_names, self.provider_words):
+            in_column = sum(1 for forms in words if forms & column_forms)
+            if name.replace('_', '') == column_name:
+                score = 1.0
+            elif in_column:
+                in_table = sum(1 for forms in words if forms & table_forms)
+                score = (in_column + 0.25 * in_table) / (len(words) + 1)
+            else:
+                continue
+            first = next((i for i, forms in enumerate(column_words) if any(forms & w for w in words)),
+                         len(column_words))
+            scored.append((-score, first, len(words), name))
+
+        scored.sort()
+        candidates = [(name, -neg_score) for neg_score, _, _, name in scored[:top_k]]
+        if not candidates and self.fallback:
+            candidates = [(self.fallback, 0.0)]
+        return candidates
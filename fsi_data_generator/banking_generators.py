@@ -5,6 +5,8 @@ from fsi_data_generator.fsi_generators.consumer_lending import consumer_lending
 from fsi_data_generator.fsi_generators.credit_cards import credit_cards
 from fsi_data_generator.fsi_generators.data_quality import data_quality
 from fsi_data_generator.fsi_generators.enterprise import enterprise
+from fsi_data_generator.fsi_generators.intelligent_generators.consumer_banking import \
+    account_time_series_generators
 from fsi_data_generator.fsi_generators.mortgage_services import \
     mortgage_services
 from fsi_data_generator.fsi_generators.security import security
@@ -30,3 +32,8 @@ def custom_generators(gen: DataGenerator):
             app_mgmt(dg) +
             data_quality(dg)
     )
+
+
+def table_generators():
+    """Generators of whole tables, used instead of the custom generators of their columns."""
+    return account_time_series_generators()
@@ -1,6 +1,8 @@
 from ..fsi_text.consumer_lending.consumer_lending__adverse_action_details__credit_bureau_name import \
     consumer_lending__adverse_action_details__credit_bureau_name
+from .helpers.reads import reads
 from .helpers.text_list import text_list
+from .helpers.unique_generator import unique_generator
 from faker import Faker
 from fsi_data_generator.fsi_text.consumer_lending.consumer_lending__adverse_action_details__credit_score_factors import \
     consumer_lending__adverse_action_details__credit_score_factors
@@ -446,7 +448,7 @@ def consumer_lending(dg):
         ('consumer_lending\\.loan_applications', '^referral_source$', text_list(
             consumer_lending__loan_applications__referral_source)),
         ('consumer_lending\\.application_applicants', 'consumer_lending_application_id',
-         lambda a, b, c: loan_applications(dg)),
+         unique_generator(reads('consumer_lending.loan_applications')(lambda a, b, c: loan_applications(dg)))),
         ('consumer_lending\\.application_applicants', 'consumer_lending_applicant_id',
-         lambda a, b, c: loan_applicants(dg)),
+         unique_generator(reads('consumer_lending.applicants')(lambda a, b, c: loan_applicants(dg)))),
     ]
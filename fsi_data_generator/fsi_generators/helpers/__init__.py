@@ -1,15 +1,18 @@
 """Automatically generated __init__.py"""
-__all__ = ['AutoName', 'BaseEnum', 'EnumUtilities', 'apply_schema_to_regex', 'auto_name', 'base_enum', 'constants',
-           'consumer_banking_generate_transaction_fee', 'enum_utilities', 'generate_account_number',
-           'generate_account_numbers', 'generate_all_permission_names', 'generate_clabe',
-           'generate_combinations_random', 'generate_composite_key', 'generate_correlated_subnet',
-           'generate_credit_score', 'generate_ein', 'generate_eins', 'generate_fake_balance',
-           'generate_fake_transaction', 'generate_leis', 'generate_mortgage_rate', 'generate_mortgage_size',
-           'generate_permission_name', 'generate_product_code', 'generate_product_codes', 'generate_random_interval',
-           'generate_random_interval_with_optional_weights', 'generate_transactions_and_balances',
-           'generate_unique_composite_key', 'generate_unique_json_array', 'get_product_type_by_account_id',
-           'load_previous_responses', 'parse_address', 'random_record', 'save_previous_responses', 'text_list',
-           'unique_list']
+__all__ = ['AutoName', 'BaseEnum', 'EnumUtilities', 'RandomStreams', 'ResponseStore', 'StreamRandom', 'ValuePool',
+           'apply_schema_to_regex', 'auto_name', 'base_enum', 'batch_generator', 'constants',
+           'consumer_banking_generate_transaction_fee', 'current_numpy', 'current_random', 'enum_utilities',
+           'generate_account_number', 'generate_account_numbers', 'generate_account_time_series',
+           'generate_all_permission_names', 'generate_clabe', 'generate_combinations_random', 'generate_composite_key',
+           'generate_correlated_subnet', 'generate_credit_score', 'generate_ein', 'generate_eins',
+           'generate_fake_balance', 'generate_fake_transaction', 'generate_lei', 'generate_leis',
+           'generate_mortgage_rate', 'generate_mortgage_size', 'generate_permission_name', 'generate_product_code',
+           'generate_product_codes', 'generate_random_interval', 'generate_random_interval_with_optional_weights',
+           'generate_transactions_and_balances', 'generate_unique_composite_key', 'generate_unique_json_array',
+           'get_llm_usage', 'get_previous_responses', 'get_product_type_by_account_id', 'get_value_pool', 'lazy_import',
+           'load_previous_responses', 'parse_address', 'prefetch_unique_json_arrays', 'random_record', 'random_streams',
+           'reads', 'response_store', 'save_previous_responses', 'slice_dbml', 'text_list', 'unique_generator',
+           'unique_list', 'value_pool']
 
 from . import auto_name
 from . import base_enum
@@ -19,6 +22,9 @@ from . import generate_composite_key
 from . import generate_permission_name
 from . import generate_random_interval
 from . import generate_transactions_and_balances
+from . import random_streams
+from . import response_store
+from . import value_pool
 from .apply_schema_to_regex import apply_schema_to_regex
 from .auto_name import AutoName
 from .base_enum import BaseEnum
@@ -33,6 +39,7 @@ from .generate_correlated_subnet import generate_correlated_subnet
 from .generate_credit_score import generate_credit_score
 from .generate_ein import generate_ein
 from .generate_ein import generate_eins
+from .generate_leis import generate_lei
 from .generate_leis import generate_leis
 from .generate_mortgage_rate import generate_mortgage_rate
 from .generate_mortgage_size import generate_mortgage_size
@@ -40,13 +47,29 @@ from .generate_permission_name import generate_all_permission_names
 from .generate_product_code import generate_product_code
 from .generate_product_code import generate_product_codes
 from .generate_random_interval import generate_random_interval_with_optional_weights
+from .generate_transactions_and_balances import generate_account_time_series
 from .generate_transactions_and_balances import generate_fake_balance
 from .generate_transactions_and_balances import generate_fake_transaction
 from .generate_unique_json_array import generate_unique_json_array
+from .generate_unique_json_array import get_llm_usage
+from .generate_unique_json_array import get_previous_responses
 from .generate_unique_json_array import load_previous_responses
+from .generate_unique_json_array import prefetch_unique_json_arrays
 from .generate_unique_json_array import save_previous_responses
 from .get_product_type_by_account_id import get_product_type_by_account_id
+from .lazy_import import lazy_import
 from .parse_address import parse_address
+from .random_record import batch_generator
 from .random_record import random_record
+from .random_streams import current_numpy
+from .random_streams import current_random
+from .random_streams import RandomStreams
+from .random_streams import StreamRandom
+from .reads import reads
+from .response_store import ResponseStore
+from .slice_dbml import slice_dbml
 from .text_list import text_list
+from .unique_generator import unique_generator
 from .unique_list import unique_list
+from .value_pool import get_value_pool
+from .value_pool import ValuePool
@@ -1,6 +1,11 @@
-from typing import List, Optional
+from .random_streams import current_numpy, current_random
+from samplers import AliasSampler
+from typing import Dict, List, Optional, Tuple
 
-import random
+import numpy as np
+
+# (enum class, weights) -> (members, alias sampler or None for uniform), built on first use
+_samplers: Dict[Tuple[type, Optional[tuple]], Tuple[tuple, Optional[AliasSampler]]] = {}
 
 
 class EnumUtilities:
@@ -10,6 +15,33 @@ class EnumUtilities:
     """
     _DEFAULT_WEIGHTS: Optional[List[float]] = None
 
+    @classmethod
+    def get_members(cls) -> tuple:
+        """The members of the enum that get_random draws from, in definition order (_DEFAULT_WEIGHTS excluded)."""
+        return cls._sampler(None)[0]
+
+    @classmethod
+    def _sampler(cls, weights: Optional[List[float]]):
+        """
+        The members and the alias sampler of a weight vector, built once per enum class and weights. Without
+        weights, _DEFAULT_WEIGHTS or else a uniform draw (no sampler) is used.
+        """
+        key = (cls, tuple(weights) if weights else None)
+        cached = _samplers.get(key)
+        if cached is None:
+            # Get all enum members
+            enum_members = tuple(member for member in cls if not member.name.startswith("_"))
+
+            # If no weights are provided, fall back to DEFAULT_WEIGHTS or uniform distribution
+            weights = weights or (cls._DEFAULT_WEIGHTS and cls._DEFAULT_WEIGHTS.value)
+
+            # Ensure weights match number of enum members
+            if weights is not None and len(weights) != len(enum_members):
+                raise ValueError(
+                    f"Number of weights ({len(weights)}) must match the number of enum values ({len(enum_members)})")
+            cached = _samplers[key] = (enum_members, AliasSampler(weights) if weights is not None else None)
+        return cached
+
     @classmethod
     def get_random(cls, weights: Optional[List[float]] = None):
         """
@@ -21,18 +53,28 @@ class EnumUtilities:
         Returns:
             The randomly selected enum member.
         """
-        # Get all enum members
-        enum_members = [member for member in cls if not member.name.startswith("_")]
+        cached = _samplers.get((cls, tuple(weights) if weights else None))
+        enum_members, sampler = cached if cached is not None else cls._sampler(weights)
+        if sampler is None:
+            return current_random().choice(enum_members)
+
+        # Perform weighted random choice, in constant time
+        return enum_members[sampler.sample_index(current_random())]
 
-        # If no weights are provided, fall back to DEFAULT_WEIGHTS or uniform distribution
-        weights = weights or (cls._DEFAULT_WEIGHTS and cls._DEFAULT_WEIGHTS.value)
-        if weights is None:
-            return random.choice(enum_members)
+    @classmethod
+    def get_random_batch(cls, n: int, weights: Optional[List[float]] = None) -> np.ndarray:
+        """
+        Draw n random members at once, for generators producing whole columns, see get_random.
 
-        # Ensure weights match number of enum members
-        if len(weights) != len(enum_members):
-            raise ValueError(
-                f"Number of weights ({len(weights)}) must match the number of enum values ({len(enum_members)})")
+        Args:
+            n (int): Number of members to draw.
+            weights (Optional[List[float]]): A list of weights for weighted random selection.
 
-        # Perform weighted random choice
-        return random.choices(enum_members, weights=weights)[0]
+        Returns:
+            np.ndarray: Indices into get_members()
+        """
+        enum_members, sampler = cls._sampler(weights)
+        rng = current_numpy()
+        if sampler is None:
+            return rng.randint(0, len(enum_members), size=n)
+        return sampler.sample_indices(n, rng)
@@ -1,3 +1,5 @@
+from .value_pool import ValuePool
+
 import random
 
 
@@ -35,4 +37,12 @@ def generate_account_numbers(num_account_numbers=10000):
     return list(account_numbers)
 
 
-fake_account_numbers = generate_account_numbers()
+# Distinct account numbers, see ValuePool
+account_number_pool = ValuePool(generate_account_number, name='account_numbers', size=10000)
+
+
+def __getattr__(name):
+    # Keeps `from ...generate_account_number import fake_account_numbers` working, built on first lookup instead of at import
+    if name == 'fake_account_numbers':
+        return list(account_number_pool.ensure(10000))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
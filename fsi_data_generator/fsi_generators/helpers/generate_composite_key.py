@@ -1,6 +1,7 @@
 # Global dictionary to store combinations keyed by (field_a, field_b)
 from fsi_data_generator.fsi_generators.helpers.generate_combinations_random import \
     generate_combinations_random
+from pk_store import PrimaryKeyStore
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -46,19 +47,16 @@ def generate_unique_composite_key(dg, foreign_fields, local_fields, custom_cache
         :return: The first entity ID (entity_a_id) from the combination.
         """
 
-        # Validate schema_table_a and schema_table_b exist and contain valid data
-        if not isinstance(dg.inserted_pks.get(schema_table_a), list):
-            raise ValueError(f"{schema_table_a} must be a list, but got {type(dg.inserted_pks.get(schema_table_a))}")
-        if not isinstance(dg.inserted_pks.get(schema_table_b), list):
-            raise ValueError(f"{schema_table_b} must be a list, but got {type(dg.inserted_pks.get(schema_table_b))}")
-
-        if not all(isinstance(item, (str, int, float)) for item in dg.inserted_pks[schema_table_a]):
-            raise ValueError(f"{schema_table_a} must contain only strings, integers, or floats")
-        if not all(isinstance(item, (str, int, float)) for item in dg.inserted_pks[schema_table_b]):
-            raise ValueError(f"{schema_table_b} must contain only strings, integers, or floats")
-
         # Check if cached combinations already exist
         if cache_key not in global_entity_combinations:
+            # Validate schema_table_a and schema_table_b exist and contain single-column keys, once per cache key
+            for schema_table in (schema_table_a, schema_table_b):
+                pks = dg.inserted_pks.get(schema_table)
+                if not isinstance(pks, (PrimaryKeyStore, list)):
+                    raise ValueError(f"{schema_table} must be a PK store, but got {type(pks)}")
+                if isinstance(pks, PrimaryKeyStore) and pks.composite:
+                    raise ValueError(f"{schema_table} must have a single-column primary key")
+
             # Generate combinations if not in cache
             global_entity_combinations[cache_key] = generate_combinations_random(
                 dg.inserted_pks[schema_table_a],  # Use string/number array directly
@@ -81,4 +79,6 @@ def generate_unique_composite_key(dg, foreign_fields, local_fields, custom_cache
             data_item[local_key_a] = entity_a_id
             return entity_b_id
 
+    get_combination.unique = True  # Never sharded across processes, see DataGenerator._get_process_count
+    get_combination.reads = frozenset((schema_table_a, schema_table_b))  # See reads
     return get_combination
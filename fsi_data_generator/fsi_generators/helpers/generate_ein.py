@@ -1,3 +1,4 @@
+from .value_pool import ValuePool
 from faker import Faker
 
 fake = Faker()
@@ -16,4 +17,12 @@ def generate_eins(num_eins=10000):
     return list(eins)
 
 
-fake_eins = generate_eins()
+# Distinct EINs, see ValuePool
+ein_pool = ValuePool(generate_ein, name='eins', size=10000)
+
+
+def __getattr__(name):
+    # Keeps `from ...generate_ein import fake_eins` working, built on first lookup instead of at import
+    if name == 'fake_eins':
+        return list(ein_pool.ensure(10000))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
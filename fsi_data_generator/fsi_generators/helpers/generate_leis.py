@@ -1,12 +1,19 @@
+from .value_pool import ValuePool
+
 import random
 import string
 
 
+def generate_lei():
+    """Generates a random LEI with a fixed LOU prefix."""
+    prefix = "549300"
+    random_chars = ''.join(random.choices(string.ascii_uppercase + string.digits, k=14))
+    return prefix + random_chars
+
+
 def generate_leis(num_leis=10000):
-    leis = []
-    for _ in range(num_leis):
-        prefix = "549300"
-        random_chars = ''.join(random.choices(string.ascii_uppercase + string.digits, k=14))
-        lei = prefix + random_chars
-        leis.append(lei)
-    return leis
+    return [generate_lei() for _ in range(num_leis)]
+
+
+# Distinct LEIs, see ValuePool
+lei_pool = ValuePool(generate_lei, name='leis', size=10000)
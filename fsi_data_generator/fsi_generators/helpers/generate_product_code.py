@@ -1,3 +1,4 @@
+from .value_pool import ValuePool
 from typing import cast
 
 import random
@@ -24,4 +25,12 @@ def generate_product_codes(num_product_codes=10000):
     return list(product_codes)
 
 
-fake_product_codes = generate_product_codes()
+# Distinct product codes, see ValuePool
+product_code_pool = ValuePool(generate_product_code, name='product_codes', size=10000)
+
+
+def __getattr__(name):
+    # Keeps `from ...generate_product_code import fake_product_codes` working, built on first lookup instead of at import
+    if name == 'fake_product_codes':
+        return list(product_code_pool.ensure(10000))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,43 @@
+from .random_streams import current_numpy
+
 import numpy as np
 import random
 
+# Per product type: opening balance distribution ('lognormal', mean, sigma) or ('uniform', low, high),
+# transaction amounts (low, cap, fraction of the balance), and the relative number of transactions per day
+PRODUCT_PROFILES = {
+    # Checking accounts typically have $100–$10,000 in balances, mostly small ($5–$500), frequent transactions
+    "CHECKING": {'balance': ('lognormal', 8, 0.4), 'transaction': (5, 500, 0.25), 'frequency': 1.0},
+    # Savings accounts typically have $1,000–$50,000, less frequent, larger transactions ($50–$2,500)
+    "SAVINGS": {'balance': ('lognormal', 9, 0.5), 'transaction': (50, 2500, 0.1), 'frequency': 0.2},
+    # Money Market Accounts range from $5,000–$100,000+, high-value transactions ($500–$10,000)
+    "MONEY_MARKET_ACCOUNT": {'balance': ('lognormal', 10, 0.6), 'transaction': (500, 10000, 0.2),
+                             'frequency': 0.15},
+    # IRAs typically hold $10,000–$500,000+, large, rare transactions ($1,000–$25,000)
+    "INDIVIDUAL_RETIREMENT_ACCOUNT": {'balance': ('lognormal', 11, 0.7), 'transaction': (1000, 25000, 0.05),
+                                      'frequency': 0.03},
+    # HSAs have lower balances, typically $500–$10,000, frequent small payments ($10–$1,000)
+    "HEALTH_SAVINGS_ACCOUNT": {'balance': ('uniform', 500, 10000), 'transaction': (10, 1000, 0.2),
+                               'frequency': 0.3},
+    # CDs typically fixed $1,000–$500,000+, interest or rare withdrawals ($0–$5,000)
+    "CERTIFICATE_OF_DEPOSIT": {'balance': ('lognormal', 10.5, 0.5), 'transaction': (0, 5000, 0.01),
+                               'frequency': 0.02},
+    # Debit cards tied to linked accounts typically have $50–$5,000, frequent, small transactions ($5–$300)
+    "DEBIT_CARD": {'balance': ('uniform', 50, 5000), 'transaction': (5, 300, 0.5), 'frequency': 1.5},
+    # Prepaid cards typically hold $10–$1,000, frequent, small transactions ($1–$200)
+    "PREPAID_CARD": {'balance': ('uniform', 10, 1000), 'transaction': (1, 200, 0.8), 'frequency': 1.0},
+    # Trust services handle large sums, $50,000–$10,000,000, rare but large transactions ($10,000–$500,000)
+    "TRUST_SERVICE": {'balance': ('lognormal', 13, 0.8), 'transaction': (10000, 500000, 0.05), 'frequency': 0.05},
+}
+
+# consumer_banking.product_type values without a profile of their own
+PRODUCT_TYPE_ALIASES = {
+    "MONEY_MARKET": "MONEY_MARKET_ACCOUNT",
+    "IRA": "INDIVIDUAL_RETIREMENT_ACCOUNT",
+    "HSA": "HEALTH_SAVINGS_ACCOUNT",
+    "BUSINESS_SAVINGS": "SAVINGS",
+}
+
 
 def generate_fake_balance(product_type):
     """
@@ -9,36 +46,14 @@ def generate_fake_balance(product_type):
     :param product_type: Type of banking product (e.g., "CHECKING", "SAVINGS").
     :return: A fake balance (float).
     """
-    if product_type == "CHECKING":
-        # Checking accounts typically have $100–$10,000 in balances
-        return round(np.random.lognormal(mean=8, sigma=0.4), 2)
-    elif product_type == "SAVINGS":
-        # Savings accounts typically have $1,000–$50,000 in balances
-        return round(np.random.lognormal(mean=9, sigma=0.5), 2)
-    elif product_type == "MONEY_MARKET_ACCOUNT":
-        # Money Market Accounts range from $5,000–$100,000+
-        return round(np.random.lognormal(mean=10, sigma=0.6), 2)
-    elif product_type == "INDIVIDUAL_RETIREMENT_ACCOUNT":
-        # IRAs typically hold $10,000–$500,000+
-        return round(np.random.lognormal(mean=11, sigma=0.7), 2)
-    elif product_type == "HEALTH_SAVINGS_ACCOUNT":
-        # HSAs have lower balances, typically $500–$10,000
-        return round(random.uniform(500, 10000), 2)
-    elif product_type == "CERTIFICATE_OF_DEPOSIT":
-        # CDs typically fixed $1,000–$500,000+
-        return round(np.random.lognormal(mean=10.5, sigma=0.5), 2)
-    elif product_type == "DEBIT_CARD":
-        # Debit cards tied to linked accounts typically have $50–$5,000
-        return round(random.uniform(50, 5000), 2)
-    elif product_type == "PREPAID_CARD":
-        # Prepaid cards typically hold $10–$1,000
-        return round(random.uniform(10, 1000), 2)
-    elif product_type == "TRUST_SERVICE":
-        # Trust services handle large sums, $50,000–$10,000,000
-        return round(np.random.lognormal(mean=13, sigma=0.8), 2)
-    else:
+    if product_type not in PRODUCT_PROFILES:
         raise ValueError(f"Unknown product type: {product_type}")
 
+    distribution, a, b = PRODUCT_PROFILES[product_type]['balance']
+    if distribution == 'lognormal':
+        return round(current_numpy().lognormal(mean=a, sigma=b), 2)
+    return round(random.uniform(a, b), 2)
+
 
 def generate_fake_transaction(product_type, balance=None):
     """
@@ -48,38 +63,147 @@ def generate_fake_transaction(product_type, balance=None):
     :param balance: Account balance (optional; if provided, scales transaction size).
     :return: A fake transaction amount (float, can be negative for withdrawals).
     """
-    if product_type == "CHECKING":
-        # Transactions: mostly small ($5–$500), frequent
-        transaction = round(random.uniform(5, min(balance * 0.25 if balance else 500, 500)), 2)
-    elif product_type == "SAVINGS":
-        # Transactions: less frequent, larger ($50–$2,500)
-        transaction = round(random.uniform(50, min(balance * 0.1 if balance else 2500, 2500)), 2)
-    elif product_type == "MONEY_MARKET_ACCOUNT":
-        # Transactions: high-value ($500–$10,000)
-        transaction = round(random.uniform(500, min(balance * 0.2 if balance else 10000, 10000)), 2)
-    elif product_type == "INDIVIDUAL_RETIREMENT_ACCOUNT":
-        # Transactions: large, rare ($1,000–$25,000)
-        transaction = round(random.uniform(1000, min(balance * 0.05 if balance else 25000, 25000)), 2)
-    elif product_type == "HEALTH_SAVINGS_ACCOUNT":
-        # Transactions: frequent small payments ($10–$1,000)
-        transaction = round(random.uniform(10, min(balance * 0.2 if balance else 1000, 1000)), 2)
-    elif product_type == "CERTIFICATE_OF_DEPOSIT":
-        # CDs typically have no transactions, simulate interest or rare withdrawals ($0–$5,000)
-        transaction = round(random.uniform(0, min(balance * 0.01 if balance else 5000, 5000)), 2)
-    elif product_type == "DEBIT_CARD":
-        # Transactions: frequent, small ($5–$300)
-        transaction = round(random.uniform(5, min(balance * 0.5 if balance else 300, 300)), 2)
-    elif product_type == "PREPAID_CARD":
-        # Transactions: frequent, small ($1–$200)
-        transaction = round(random.uniform(1, min(balance * 0.8 if balance else 200, 200)), 2)
-    elif product_type == "TRUST_SERVICE":
-        # Trust transactions: rare but large ($10,000–$500,000)
-        transaction = round(random.uniform(10000, min(balance * 0.05 if balance else 500000, 500000)), 2)
-    else:
+    if product_type not in PRODUCT_PROFILES:
         raise ValueError(f"Unknown product type: {product_type}")
 
+    low, cap, fraction = PRODUCT_PROFILES[product_type]['transaction']
+    transaction = round(random.uniform(low, min(balance * fraction if balance else cap, cap)), 2)
+
     # Randomize transaction direction (negative for withdrawals, positive for deposits)
     if random.random() > 0.5:
         transaction = -transaction  # Withdrawals are negative
 
     return transaction
+
+
+def _profile(product_type):
+    """Profile of a product type, product types without one behave like checking accounts."""
+    product_type = PRODUCT_TYPE_ALIASES.get(product_type, product_type)
+    return PRODUCT_PROFILES.get(product_type, PRODUCT_PROFILES["CHECKING"])
+
+
+def generate_account_time_series(product_types, start_times, end_times, transactions, balances, rng=None):
+    """
+    Generate the transaction history and balance snapshots of many accounts at once, as NumPy columns.
+
+    Transactions are spread over the accounts in proportion to each product's frequency and the length of the
+    account's history (a multinomial draw, i.e. Poisson counts conditioned on the total), then placed uniformly
+    in time and sorted per account. Amounts follow the same per-product ranges as generate_fake_transaction,
+    deposits and withdrawals being equally likely. Running balances are the opening balance plus a cumulative
+    sum of the signed amounts per account, computed in cents so every balance equals the previous one plus the
+    transaction; the opening balance is raised where needed so that no account goes overdrawn.
+
+    Every account gets an opening balance snapshot at its start time, the remaining snapshots are placed at
+    random times and carry the running balance at that time.
+
+    Args:
+        product_types (sequence): Product type of each account, consumer_banking.product_type values or the
+                                  keys of PRODUCT_PROFILES
+        start_times (array-like): Start of each account's history, as epoch seconds
+        end_times (array-like): End of each account's history, as epoch seconds
+        transactions (int): Total number of transactions
+        balances (int): Total number of balance snapshots, at least one per account
+        rng (np.random.RandomState, optional): Random stream. Defaults to current_numpy().
+
+    Returns:
+        tuple: (transactions, balances) dicts of equal length column arrays, ordered by account then time:
+               transactions has 'account_index', 'time', 'amount' (positive), 'credit' (True for deposits)
+               and 'balance_after'; balances has 'account_index', 'time', 'amount' and 'opening'
+    """
+    rng = rng if rng is not None else current_numpy()
+    start_times = np.asarray(start_times, dtype=np.float64)
+    end_times = np.maximum(np.asarray(end_times, dtype=np.float64), start_times)
+    accounts = len(start_times)
+    if accounts == 0:
+        # No account to spread the transactions and snapshots over
+        return ({
+            'account_index': np.zeros(0, dtype=np.int64),
+            'time': np.zeros(0),
+            'amount': np.zeros(0),
+            'credit': np.zeros(0, dtype=bool),
+            'balance_after': np.zeros(0),
+        }, {
+            'account_index': np.zeros(0, dtype=np.int64),
+            'time': np.zeros(0),
+            'amount': np.zeros(0),
+            'opening': np.zeros(0, dtype=bool),
+        })
+    profiles = [_profile(product_type) for product_type in product_types]
+
+    # Opening balances, in cents
+    opening = np.empty(accounts)
+    for distribution in ('lognormal', 'uniform'):
+        mask = np.array([profile['balance'][0] == distribution for profile in profiles], dtype=bool)
+        if not mask.any():
+            continue
+        a = np.array([profile['balance'][1] for profile, m in zip(profiles, mask) if m])
+        b = np.array([profile['balance'][2] for profile, m in zip(profiles, mask) if m])
+        opening[mask] = rng.lognormal(a, b) if distribution == 'lognormal' else rng.uniform(a, b)
+    opening_cents = np.round(opening * 100).astype(np.int64)
+
+    # Transactions per account and their times, sorted per account
+    days = (end_times - start_times) / 86400 + 1
+    weights = np.array([profile['frequency'] for profile in profiles]) * days
+    counts = rng.multinomial(transactions, weights / weights.sum()) if accounts and transactions else \
+        np.zeros(accounts, dtype=np.int64)
+    tx_account = np.repeat(np.arange(accounts), counts)
+    tx_time = start_times[tx_account] + rng.random_sample(len(tx_account)) * (end_times - start_times)[tx_account]
+    order = np.lexsort((tx_time, tx_account))
+    tx_time = tx_time[order]
+
+    # Amounts, capped by a fraction of the opening balance like generate_fake_transaction
+    low = np.array([profile['transaction'][0] for profile in profiles])
+    cap = np.array([profile['transaction'][1] for profile in profiles])
+    fraction = np.array([profile['transaction'][2] for profile in profiles])
+    high = np.where(opening > 0, np.minimum(opening * fraction, cap), cap)
+    u = rng.random_sample(len(tx_account))
+    amount_cents = np.round((low[tx_account] + u * (high - low)[tx_account]) * 100).astype(np.int64)
+    credit = rng.random_sample(len(tx_account)) < 0.5
+    signed = np.where(credit, amount_cents, -amount_cents)
+
+    # Running balances: a cumulative sum restarted at the first transaction of every account
+    starts = np.cumsum(counts) - counts
+    active = counts > 0
+    running = np.cumsum(signed)
+    running -= np.repeat((running - signed)[starts[active]], counts[active])
+    if len(running):
+        lowest = np.zeros(accounts, dtype=np.int64)
+        lowest[active] = np.minimum.reduceat(running, starts[active])
+        opening_cents = np.maximum(opening_cents, -lowest)
+    balance_after = opening_cents[tx_account] + running
+
+    # Balance snapshots: the opening balance, plus snapshots at random times valued at the running balance
+    extra = max(0, balances - accounts)
+    extra_counts = rng.multinomial(extra, days / days.sum()) if accounts and extra else \
+        np.zeros(accounts, dtype=np.int64)
+    snapshot_account = np.concatenate([np.arange(accounts), np.repeat(np.arange(accounts), extra_counts)])
+    snapshot_time = start_times[snapshot_account]
+    snapshot_time[accounts:] += rng.random_sample(extra) * (end_times - start_times)[snapshot_account[accounts:]]
+    opening_snapshot = np.arange(len(snapshot_account)) < accounts
+
+    # Number of transactions of the account up to each snapshot, from one sort of transactions and snapshots
+    merged_account = np.concatenate([tx_account, snapshot_account])
+    merged_time = np.concatenate([tx_time, snapshot_time])
+    is_snapshot = np.concatenate([np.zeros(len(tx_account), dtype=bool), np.ones(len(snapshot_account), dtype=bool)])
+    merged = np.lexsort((is_snapshot, merged_time, merged_account))
+    preceding = np.cumsum(~is_snapshot[merged]) - 1  # index of the last transaction at or before each position
+    last_transaction = np.empty(len(snapshot_account), dtype=np.int64)
+    last_transaction[merged[is_snapshot[merged]] - len(tx_account)] = preceding[is_snapshot[merged]]
+    same_account = last_transaction >= 0
+    same_account[same_account] = tx_account[last_transaction[same_account]] == snapshot_account[same_account]
+    snapshot_cents = np.where(same_account & ~opening_snapshot, balance_after[np.maximum(last_transaction, 0)]
+                              if len(balance_after) else 0, opening_cents[snapshot_account])
+    snapshot_order = np.lexsort((~opening_snapshot, snapshot_time, snapshot_account))
+
+    return ({
+        'account_index': tx_account,
+        'time': tx_time,
+        'amount': amount_cents / 100,
+        'credit': credit,
+        'balance_after': balance_after / 100,
+    }, {
+        'account_index': snapshot_account[snapshot_order],
+        'time': snapshot_time[snapshot_order],
+        'amount': snapshot_cents[snapshot_order] / 100,
+        'opening': opening_snapshot[snapshot_order],
+    })
@@ -1,41 +1,273 @@
+from .lazy_import import lazy_import
+from .response_store import ResponseStore
+from .slice_dbml import slice_dbml
 from dotenv import load_dotenv  # Import load_dotenv
 from json import JSONDecodeError
 
-import anthropic
+import asyncio
 import json
 import logging
 import os
+import random
+import re
+import threading
+import time
 
 load_dotenv()  # Load environment variables from .env file
-# Assuming you have your Anthropic API key set as an environment variable or otherwise accessible
-client = anthropic.Anthropic()
 
-PREVIOUS_RESPONSES_FILE = "previous_responses.json"
+# Loaded on first use. Generators import this lazy module from here, since a plain `import anthropic` loads it
+anthropic = lazy_import('anthropic')
+_client = None
+
+PREVIOUS_RESPONSES_FILE = "previous_responses.jsonl"
+# Imported into PREVIOUS_RESPONSES_FILE when that doesn't exist yet
+LEGACY_PREVIOUS_RESPONSES_FILE = "previous_responses.json"
 logger = logging.getLogger(__name__)
 logging.getLogger("anthropic._base_client").setLevel(logging.INFO)
 
+# Schema context of a prompt: 'table' for the column's table and its foreign key neighbours, 'full' for the DBML
+SCHEMA_CONTEXT = os.environ.get('LLM_SCHEMA_CONTEXT', 'table')
+# Existing elements quoted in a prompt, and characters quoted of each; duplicates are dropped on merge anyway
+EXCLUSION_LIMIT = int(os.environ.get('LLM_EXCLUSION_LIMIT', '200'))
+EXCLUSION_ELEMENT_CHARS = 100
+
+_TABLE_KEY = re.compile(r'^(\w+)\.(\w+)\.')
+_usage = {}
+_usage_lock = threading.Lock()
+
+
+def _get_client():
+    """Create the Anthropic client on first use."""
+    global _client
+    if _client is None:
+        # Assuming you have your Anthropic API key set as an environment variable or otherwise accessible
+        _client = anthropic.Anthropic()
+    return _client
+
 
 def load_previous_responses():
-    """Loads previous responses from disk."""
-    if os.path.exists(PREVIOUS_RESPONSES_FILE):
-        try:
-            with open(PREVIOUS_RESPONSES_FILE, "r") as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
-    return {}
+    """Opens the previous responses store; its text pools are read from disk as they are looked up."""
+    return ResponseStore(PREVIOUS_RESPONSES_FILE, legacy_path=LEGACY_PREVIOUS_RESPONSES_FILE)
 
 
 def save_previous_responses(responses):
-    """Saves previous responses to disk."""
+    """
+    Saves previous responses to disk. Assigning to the store already appends to its file, so this only adds the
+    lists of a plain dict, and compacts the store once appends have fragmented it.
+    """
+    store = get_previous_responses()
+    try:
+        if responses is not store:
+            for key, values in dict(responses).items():
+                store[key] = values
+        if store.fragmented:
+            store.compact()
+    except OSError as e:
+        logger.error(f"Error saving previous responses: {e}")
+
+
+_previous_responses = None
+
+
+def get_previous_responses():
+    """Returns the previous responses, loading them from disk on first use."""
+    global _previous_responses
+    if _previous_responses is None:
+        _previous_responses = load_previous_responses()
+    return _previous_responses
+
+
+def __getattr__(name):
+    # Keeps `from ...generate_unique_json_array import previous_responses` working; loaded on first lookup
+    if name == 'previous_responses':
+        return get_previous_responses()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _schema_context(dbml_string, fully_qualified_column_name):
+    """
+    The DBML given as context for a column: the slice of its table (see slice_dbml), or nothing when the name
+    doesn't start with a table of the schema, e.g. a free form description; the whole DBML with
+    LLM_SCHEMA_CONTEXT=full.
+    """
+    if SCHEMA_CONTEXT == 'full' or not dbml_string:
+        return dbml_string
+    match = _TABLE_KEY.match(fully_qualified_column_name)
+    return slice_dbml(dbml_string, f"{match.group(1)}.{match.group(2)}") if match else ''
+
+
+def _exclusions(cached_results):
+    """
+    The existing elements quoted in a prompt: all of them while there are at most EXCLUSION_LIMIT, otherwise an
+    evenly spaced sample, so that the prompt stops growing with the pool. Long elements are shortened.
+    """
+    if len(cached_results) > EXCLUSION_LIMIT:
+        step = len(cached_results) / EXCLUSION_LIMIT
+        cached_results = [cached_results[int(i * step)] for i in range(EXCLUSION_LIMIT)]
+    return [element if len(element) <= EXCLUSION_ELEMENT_CHARS else element[:EXCLUSION_ELEMENT_CHARS] + '...'
+            for element in cached_results]
+
+
+def _build_prompt(dbml_string, fully_qualified_column_name, additional_needed, cached_results):
+    """Prompt asking for additional_needed new elements of a column, none of them in cached_results."""
+    schema = _schema_context(dbml_string, fully_qualified_column_name)
+    excluded = _exclusions(cached_results)
+    if len(excluded) < len(cached_results):
+        existing = (f"I already have {len(cached_results)} elements, please DO NOT duplicate any of them. These are "
+                    f"{len(excluded)} of them: {json.dumps(excluded)}")
+    else:
+        existing = (f"I already have {len(cached_results)} elements, please DO NOT duplicate any of these: "
+                    f"{json.dumps(excluded)}")
+    return f"""
+    {"Here is a DBML string representing the relevant part of a database schema:" if schema else ""}
+
+    {schema}
+
+    Generate a JSON string array of TEXT elements suitable for the column: {fully_qualified_column_name}.
+
+    I requested {additional_needed} NEW and UNIQUE elements.
+    
+    {existing if cached_results else ""}
+
+    Instructions:
+    - If the DBML and field name indicate that each element should be unique and distinct (e.g., customer complaint notes), generate exactly {additional_needed} elements.
+    - If the context suggests that a large number of elements is unreasonable (e.g., insurance company names), generate a reasonable amount, which may be significantly less than {additional_needed}.
+    - Otherwise, generate a reasonable amount.
+    - IMPORTANT: The response must be a valid, properly formatted JSON array of strings ONLY.
+    - Do not include any explanations, markdown formatting, or additional text.
+    - Do not use backticks or code blocks.
+    - Ensure the JSON array is complete and properly closed with a final bracket.
+    - Make sure all new elements are DIFFERENT from the existing cached elements.
+
+    Example output:
+    ["new_value1", "new_value2", "new_value3"]
+    """
+
+
+def _message_params(prompt):
+    """Arguments of the messages API call for a prompt."""
+    return dict(
+        model=os.environ.get('ANTHROPIC_MODEL', 'claude-3-7-sonnet-20250219'),
+        max_tokens=8000,  # Significantly increased token limit for long responses
+        messages=[
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0.2  # Lower temperature for more consistent formatting
+    )
+
+
+def _parse_response(response_text):
+    """
+    Parse a response into a list of strings, recovering truncated arrays.
+
+    Raises:
+        ValueError: If the response isn't a JSON string array and can't be recovered
+    """
+    # Clean up response if it's wrapped in Markdown code blocks
+    response_text = response_text.strip()
+    if response_text.startswith("```json"):
+        response_text = response_text.replace("```json", "", 1)
+        if response_text.endswith("```"):
+            response_text = response_text[:-3]
+    elif response_text.startswith("```"):
+        response_text = response_text.replace("```", "", 1)
+        if response_text.endswith("```"):
+            response_text = response_text[:-3]
+
+    response_text = response_text.strip()
+
+    try:
+        # Attempt to parse the response as JSON
+        new_data = json.loads(response_text)
+        if isinstance(new_data, list) and all(isinstance(item, str) for item in new_data):
+            return new_data
+        raise ValueError("Anthropic response was not a valid JSON string array of strings.")
+    except json.JSONDecodeError as e:
+        # Attempt recovery for incomplete JSON responses
+        logger.debug(f"Received potentially incomplete JSON: {e}")
+
+        # Try to recover truncated JSON array
+        if response_text.startswith("[") and not response_text.endswith("]"):
+            try:
+                # Add closing bracket and try parsing again
+                new_data = json.loads(response_text + "]")
+                if isinstance(new_data, list) and all(isinstance(item, str) for item in new_data):
+                    logger.debug("Successfully recovered from truncated JSON array")
+                    return new_data
+            except JSONDecodeError:
+                pass
+
+        # For other common truncation patterns
+        if "," in response_text and not response_text.endswith("]"):
+            try:
+                # Find last complete item by finding the last valid comma
+                last_comma = response_text.rstrip().rfind(",")
+                if last_comma > 0:
+                    new_data = json.loads(response_text[:last_comma] + "]")
+                    if isinstance(new_data, list) and all(isinstance(item, str) for item in new_data):
+                        logger.debug("Successfully recovered from malformed JSON array")
+                        return new_data
+            except JSONDecodeError:
+                pass  # If recovery fails, continue to original error
+
+        # If all recovery attempts fail, raise the original error
+        logger.error(f"Error decoding JSON: {e}")
+        raise ValueError("Anthropic response was not valid JSON and could not be recovered.")
+
+
+def _fingerprint(element):
+    return ' '.join(element.casefold().split())
+
+
+def _merge_responses(key_to_use, cached_results, new_data):
+    """
+    Add new elements to the cached ones of a key, returning the combined list. New elements differing from an
+    existing one only in case or whitespace are dropped, as the prompt may not have quoted that one.
+    """
+    seen = {_fingerprint(element) for element in cached_results}
+    combined_results = list(cached_results)
+    for element in new_data:
+        fingerprint = _fingerprint(element)
+        if fingerprint not in seen:
+            seen.add(fingerprint)
+            combined_results.append(element)
     try:
-        with open(PREVIOUS_RESPONSES_FILE, "w") as f:
-            json.dump(responses, f, indent=4)
-    except IOError as e:
+        # Appends the new elements to the store's file
+        get_previous_responses()[key_to_use] = combined_results
+    except OSError as e:
         logger.error(f"Error saving previous responses: {e}")
+    return combined_results
 
 
-previous_responses = load_previous_responses()  # Load on startup
+def _record_usage(key_to_use, seconds, message=None, added=None):
+    """
+    Account one request of a key: its latency, the tokens of its response message if one was received, and the
+    elements it added, None if it failed.
+    """
+    with _usage_lock:
+        usage = _usage.setdefault(key_to_use, {'calls': 0, 'failures': 0, 'input_tokens': 0, 'output_tokens': 0,
+                                               'seconds': 0.0, 'elements': 0})
+        usage['calls'] += 1
+        usage['seconds'] += seconds
+        if message is not None:
+            usage['input_tokens'] += message.usage.input_tokens
+            usage['output_tokens'] += message.usage.output_tokens
+        if added is None:
+            usage['failures'] += 1
+        else:
+            usage['elements'] += added
+    if message is not None:
+        logger.debug(f"LLM text for {key_to_use}: {added or 0} new elements, {message.usage.input_tokens} input and "
+                     f"{message.usage.output_tokens} output tokens in {seconds:.2f} seconds")
+
+
+def get_llm_usage():
+    """
+    Cache key -> requests ('calls', 'failures'), 'input_tokens', 'output_tokens', 'seconds' and new 'elements'
+    of the LLM requests made by this process so far.
+    """
+    with _usage_lock:
+        return {key: dict(usage) for key, usage in _usage.items()}
 
 
 def generate_unique_json_array(dbml_string, fully_qualified_column_name, count, cache_key=None):
@@ -54,6 +286,7 @@ def generate_unique_json_array(dbml_string, fully_qualified_column_name, count,
     """
 
     key_to_use = cache_key if cache_key is not None else fully_qualified_column_name
+    previous_responses = get_previous_responses()
 
     # Check if we have cached results
     if key_to_use in previous_responses:
@@ -65,134 +298,147 @@ def generate_unique_json_array(dbml_string, fully_qualified_column_name, count,
 
         # If we have some but not enough, only request the additional elements needed
         additional_needed = count - len(cached_results)
-        # logger.debug(f"Found {len(cached_results)} cached elements. Requesting {additional_needed} additional elements.")
     else:
         cached_results = []
         additional_needed = count
 
     # Adjust the prompt to request only the additional elements needed
-    prompt = f"""
-    Here is a DBML string representing a database schema:
-
-    {dbml_string}
-
-    Generate a JSON string array of TEXT elements suitable for the column: {fully_qualified_column_name}.
-
-    I requested {additional_needed} NEW and UNIQUE elements.
-    
-    {"I already have the following elements, please DO NOT duplicate any of these: " + json.dumps(cached_results) if cached_results else ""}
-
-    Instructions:
-    - If the DBML and field name indicate that each element should be unique and distinct (e.g., customer complaint notes), generate exactly {additional_needed} elements.
-    - If the context suggests that a large number of elements is unreasonable (e.g., insurance company names), generate a reasonable amount, which may be significantly less than {additional_needed}.
-    - Otherwise, generate a reasonable amount.
-    - IMPORTANT: The response must be a valid, properly formatted JSON array of strings ONLY.
-    - Do not include any explanations, markdown formatting, or additional text.
-    - Do not use backticks or code blocks.
-    - Ensure the JSON array is complete and properly closed with a final bracket.
-    - Make sure all new elements are DIFFERENT from the existing cached elements.
-
-    Example output:
-    ["new_value1", "new_value2", "new_value3"]
-    """
+    prompt = _build_prompt(dbml_string, fully_qualified_column_name, additional_needed, cached_results)
 
+    request_start = time.perf_counter()
+    message = None
     try:
         # Using the messages API with streaming to handle long responses
         complete_response = ""
 
         # Stream the response to ensure we get the full content
-        with client.messages.stream(
-                model=os.environ.get('ANTHROPIC_MODEL', 'claude-3-7-sonnet-20250219'),
-                max_tokens=8000,  # Significantly increased token limit for long responses
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.2  # Lower temperature for more consistent formatting
-        ) as stream:
+        with _get_client().messages.stream(**_message_params(prompt)) as stream:
             for text in stream.text_stream:
                 complete_response += text
+            message = stream.get_final_message()
 
-        response_text = complete_response
-
-        # Clean up response if it's wrapped in Markdown code blocks
-        response_text = response_text.strip()
-        if response_text.startswith("```json"):
-            response_text = response_text.replace("```json", "", 1)
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
-        elif response_text.startswith("```"):
-            response_text = response_text.replace("```", "", 1)
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
-
-        response_text = response_text.strip()
-
-        try:
-            # Attempt to parse the response as JSON
-            new_data = json.loads(response_text)
-            if isinstance(new_data, list) and all(isinstance(item, str) for item in new_data):
-                # Combine cached results with new results
-                combined_results = cached_results + new_data
-
-                # Remove any potential duplicates (just to be safe)
-                combined_results = list(dict.fromkeys(combined_results))
-
-                # Update the cache with the combined results
-                previous_responses[key_to_use] = combined_results
-                save_previous_responses(previous_responses)
-
-                return combined_results
-            else:
-                raise ValueError("Anthropic response was not a valid JSON string array of strings.")
-        except json.JSONDecodeError as e:
-            # Attempt recovery for incomplete JSON responses
-            logger.debug(f"Received potentially incomplete JSON: {e}")
-
-            # Try to recover truncated JSON array
-            if response_text.startswith("[") and not response_text.endswith("]"):
-                try:
-                    # Add closing bracket and try parsing again
-                    recovered_text = response_text + "]"
-                    new_data = json.loads(recovered_text)
-                    if isinstance(new_data, list) and all(isinstance(item, str) for item in new_data):
-                        print("Successfully recovered from truncated JSON array")
-                        combined_results = cached_results + new_data
-                        combined_results = list(dict.fromkeys(combined_results))
-                        previous_responses[key_to_use] = combined_results
-                        save_previous_responses(previous_responses)
-                        return combined_results
-                except JSONDecodeError:
-                    pass
-
-            # For other common truncation patterns
-            if "," in response_text and not response_text.endswith("]"):
-                try:
-                    # Find last complete item by finding the last valid comma
-                    last_comma = response_text.rstrip().rfind(",")
-                    if last_comma > 0:
-                        recovered_text = response_text[:last_comma] + "]"
-                        new_data = json.loads(recovered_text)
-                        if isinstance(new_data, list) and all(isinstance(item, str) for item in new_data):
-                            print("Successfully recovered from malformed JSON array")
-                            combined_results = cached_results + new_data
-                            combined_results = list(dict.fromkeys(combined_results))
-                            previous_responses[key_to_use] = combined_results
-                            save_previous_responses(previous_responses)
-                            return combined_results
-                except JSONDecodeError:
-                    pass  # If recovery fails, continue to original error
-
-            # If all recovery attempts fail, raise the original error
-            logger.error(f"Error decoding JSON: {e}")
-            # logger.debug(f"Raw response: {response_text}")
-            raise ValueError("Anthropic response was not valid JSON and could not be recovered.")
+        combined_results = _merge_responses(key_to_use, cached_results, _parse_response(complete_response))
+        _record_usage(key_to_use, time.perf_counter() - request_start, message,
+                      len(combined_results) - len(cached_results))
+        save_previous_responses(previous_responses)
+        return combined_results
 
     except anthropic.APIConnectionError as e:
+        _record_usage(key_to_use, time.perf_counter() - request_start)
         logger.error(f"Error connecting to Anthropic API: {e}")
         raise
     except anthropic.APIStatusError as e:
+        _record_usage(key_to_use, time.perf_counter() - request_start)
         logger.debug(f"Anthropic API returned an error: {e}")
         raise
     except Exception as e:
+        _record_usage(key_to_use, time.perf_counter() - request_start, message)
         logger.debug(f"An unexpected error occurred: {e}")
         raise
+
+
+# Status codes worth retrying: timeouts, conflicts, rate limits, server errors and overload
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+_jitter = random.Random()
+
+
+def _retry_delay(error, attempt, backoff):
+    """Seconds to wait before retrying after error, or None if it isn't worth retrying."""
+    if isinstance(error, anthropic.APIStatusError):
+        if error.status_code not in RETRYABLE_STATUS_CODES:
+            return None
+        retry_after = error.response.headers.get('retry-after')
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+    elif not isinstance(error, (anthropic.APIConnectionError, ValueError)):
+        # Authentication, bad requests and bugs fail the same way every time
+        return None
+    return backoff * 2 ** attempt * (0.5 + _jitter.random())
+
+
+async def _fill(client, semaphore, dbml_string, key_to_use, fully_qualified_column_name, count, retries, backoff):
+    """Request the missing elements of one cache key, retrying transient errors; None if it failed."""
+    async with semaphore:
+        for attempt in range(retries + 1):
+            cached_results = get_previous_responses().get(key_to_use, [])
+            prompt = _build_prompt(dbml_string, fully_qualified_column_name, count - len(cached_results),
+                                   cached_results)
+            request_start = time.perf_counter()
+            message = None
+            try:
+                complete_response = ""
+                async with client.messages.stream(**_message_params(prompt)) as stream:
+                    async for text in stream.text_stream:
+                        complete_response += text
+                    message = await stream.get_final_message()
+                combined_results = _merge_responses(key_to_use, cached_results, _parse_response(complete_response))
+                _record_usage(key_to_use, time.perf_counter() - request_start, message,
+                              len(combined_results) - len(cached_results))
+                return combined_results
+            except Exception as e:
+                # Tokens of an unparseable response were still spent
+                _record_usage(key_to_use, time.perf_counter() - request_start, message)
+                delay = _retry_delay(e, attempt, backoff) if attempt < retries else None
+                if delay is None:
+                    logger.warning(f"Prefetching {key_to_use} failed after {attempt + 1} attempts: {e}")
+                    return None
+                logger.debug(f"Prefetching {key_to_use} failed ({e}), retrying in {delay:.1f} seconds")
+                await asyncio.sleep(delay)
+
+
+async def _prefetch(dbml_string, pending, concurrency, retries, backoff):
+    # Retries are ours, with the semaphore held, so that a rate limited key doesn't let others pile up
+    client = anthropic.AsyncAnthropic(max_retries=0)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    try:
+        results = await asyncio.gather(*(
+            _fill(client, semaphore, dbml_string, key_to_use, fully_qualified_column_name, count, retries, backoff)
+            for key_to_use, (fully_qualified_column_name, count) in pending.items()))
+    finally:
+        await client.close()
+    return {key_to_use: result for key_to_use, result in zip(pending, results) if result is not None}
+
+
+def prefetch_unique_json_arrays(dbml_string, requests, concurrency=4, retries=3, backoff=1.0):
+    """
+    Fill the cached arrays of many columns at once before generation starts, so that the later
+    generate_unique_json_array calls are cache hits instead of one blocking request each.
+
+    Requests run concurrently, at most `concurrency` at a time, and transient failures (connection errors,
+    rate limits, overload, unparseable responses) are retried with exponential backoff and jitter, honoring
+    retry-after. Every filled key is appended to the previous responses store as it arrives. A request that still
+    fails is logged and left to generate_unique_json_array.
+
+    Set ANTHROPIC_BASE_URL to the address of llm_stub_server.py to run offline.
+
+    Args:
+        dbml_string (str): The DBML string representing the database schema.
+        requests (iterable): (fully_qualified_column_name, count) or (fully_qualified_column_name, count,
+                             cache_key) tuples, like the arguments of generate_unique_json_array
+        concurrency (int, optional): Maximum number of requests in flight. Default is 4.
+        retries (int, optional): Retries per request after a transient failure. Default is 3.
+        backoff (float, optional): Seconds before the first retry, doubled for every further one. Default is 1.
+
+    Returns:
+        dict: Cache key -> elements, for the keys that were filled
+    """
+    previous_responses = get_previous_responses()
+
+    # One request per cache key, for the largest count asked, and none for keys that already have enough
+    pending = {}
+    for fully_qualified_column_name, count, *cache_key in requests:
+        key_to_use = cache_key[0] if cache_key and cache_key[0] is not None else fully_qualified_column_name
+        if len(previous_responses.get(key_to_use, [])) >= count:
+            continue
+        if key_to_use not in pending or pending[key_to_use][1] < count:
+            pending[key_to_use] = (fully_qualified_column_name, count)
+    if not pending:
+        return {}
+
+    filled = asyncio.run(_prefetch(dbml_string, pending, concurrency, retries, backoff))
+    if filled:
+        save_previous_responses(previous_responses)
+    return filled
@@ -0,0 +1,30 @@
+import importlib.util
+import sys
+
+
+def lazy_import(name):
+    """
+    Import a module without executing it until one of its attributes is first accessed.
+
+    The lazy module is registered in sys.modules, so a later plain `import <name>` anywhere else returns the
+    same lazy module instead of paying the import cost up front.
+
+    Args:
+        name (str): Fully qualified module name, e.g. 'anthropic'
+
+    Returns:
+        module: The (possibly not yet executed) module
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
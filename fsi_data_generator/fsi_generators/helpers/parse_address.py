@@ -64,9 +64,6 @@ def parse_address(full_address: str) -> Dict[str, str]:
                     'post_code': city_state_zip[-1]
                 }
 
-    # Use Faker again to ensure consistent parsing
-    fake = Faker('en_US')
-
     # Try to handle standard address formats
     # First pattern: number + street, city, state zip
     standard_pattern = r'^(\d+\s+.+?),\s*(.+?),\s*([A-Z]{2})\s+(\d{5}(?:-\d{4})?)$'
@@ -142,7 +139,7 @@ def parse_address(full_address: str) -> Dict[str, str]:
 
     # Absolute last resort: generate random address
     # In production, you might want to raise an exception instead
-    fake_addr = fake
+    fake_addr = Faker('en_US')
     return {
         'street_address': fake_addr.street_address(),
         'city': fake_addr.city(),
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Any, Callable, Dict, List, Optional
 
 # from data_generator import DataGenerator
 
@@ -8,4 +8,41 @@ def random_record(dg, fn):
         record.update(fn(record, dg))
         return record.get(field)
 
+    get_it.target = fn  # Named after fn when profiling
+    if hasattr(fn, 'reads'):
+        get_it.reads = fn.reads  # See reads
+    if getattr(fn, 'unique', False):
+        get_it.unique = True  # See unique_generator
+    generate_batch = getattr(fn, 'generate_batch', None)
+    if generate_batch is not None:
+        # Whole blocks of rows, see batch_generator and DataGenerator._fill_columns
+        def fill_rows(n):
+            return generate_batch([{} for _ in range(n)], dg, n)
+
+        get_it.fill_rows = fill_rows
     return get_it
+
+
+def batch_generator(fn: Callable[[Dict[str, Any], Any], Dict[str, Any]],
+                    generate_batch: Optional[Callable[[List[Dict[str, Any]], Any, int], Dict[str, list]]] = None):
+    """
+    Declare that a random_record generator fn(id_fields, dg) -> row dict can produce a whole block of rows at
+    once, because it doesn't depend on the id fields, the database or the rows generated before. The block is
+    generated before its rows' foreign keys are drawn, so id_fields_batch holds an empty dict per row.
+
+    Args:
+        fn (callable): The per-row generator
+        generate_batch (callable, optional): generate_batch(id_fields_batch, dg, n) -> column -> list of n values.
+                                             Defaults to calling fn once per row and turning the rows into columns.
+
+    Returns:
+        callable: fn, with its generate_batch attribute set
+    """
+    if generate_batch is None:
+        def generate_batch(id_fields_batch, dg, n):
+            rows = [fn(id_fields, dg) for id_fields in id_fields_batch[:n]]
+            columns = dict.fromkeys(key for row in rows for key in row)
+            return {column: [row.get(column) for row in rows] for column in columns}
+
+    fn.generate_batch = generate_batch
+    return fn
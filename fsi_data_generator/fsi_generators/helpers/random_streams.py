@@ -0,0 +1,104 @@
+from contextlib import contextmanager
+
+import hashlib
+import numpy as np
+import random
+import threading
+
+# Per-thread (random.Random, np.random.RandomState) of the active stream, see RandomStreams.activate
+_state = threading.local()
+
+
+def current_random():
+    """The calling thread's active random.Random stream, or the random module when no stream is active."""
+    # The thread's __dict__, as getattr with a default raises and catches AttributeError when no stream is active
+    streams = _state.__dict__.get('streams')
+    return streams[0] if streams else random
+
+
+def current_numpy():
+    """The calling thread's active np.random.RandomState stream, or the np.random module when none is active."""
+    streams = _state.__dict__.get('streams')
+    return streams[1] if streams else np.random
+
+
+def _delegate(name):
+    fallback = getattr(random.Random, name)
+
+    def method(self, *args, **kwargs):
+        streams = _state.__dict__.get('streams')
+        if streams:
+            return getattr(streams[0], name)(*args, **kwargs)
+        return fallback(self, *args, **kwargs)
+
+    method.__name__ = name
+    return method
+
+
+class StreamRandom(random.Random):
+    """
+    random.Random whose draws come from the calling thread's active stream, falling back to its own state
+    when no stream is active. Give one to a Faker instance (fake.random = StreamRandom()) to have its draws
+    follow the streams, as DataGenerator.fake does in seeded runs.
+    """
+
+
+_DELEGATED = [name for name in dir(random.Random)
+              if not name.startswith('_') and callable(getattr(random.Random, name))]
+for _name in _DELEGATED:
+    setattr(StreamRandom, _name, _delegate(_name))
+
+
+class RandomStreams:
+    """
+    Seed manager deriving independent, reproducible random streams from one base seed.
+
+    A stream is named by any tuple of values, e.g. (table_key, block): its seed is a hash of the base seed and
+    the name, so it doesn't depend on which tables ran before it, on which thread or process draws from it, or
+    on Python's hash randomization. While a stream is active on a thread (see activate), current_random(),
+    current_numpy() and Faker instances given a StreamRandom (such as DataGenerator.fake) draw from it. The random
+    module, np.random and other Faker instances are left alone, so only generators drawing through these are
+    reproducible.
+
+    Args:
+        seed (int or str): The base seed
+    """
+
+    def __init__(self, seed):
+        self.seed = self.normalize_seed(seed)
+
+    @staticmethod
+    def normalize_seed(seed):
+        """
+        The seed as an int when it is one, or a numeric string such as SEED from the environment, so that
+        SEED=42 and seed=42 derive the same streams; other strings are kept as they are.
+        """
+        if isinstance(seed, str):
+            try:
+                return int(seed.strip())
+            except ValueError:
+                return seed
+        return int(seed) if seed is not None else None
+
+    def derive(self, *names) -> int:
+        """64 bit seed of the stream with the given name."""
+        digest = hashlib.sha256(repr((self.seed,) + names).encode()).digest()
+        return int.from_bytes(digest[:8], 'big')
+
+    def rng(self, *names) -> random.Random:
+        """A new random.Random for the named stream."""
+        return random.Random(self.derive(*names))
+
+    def numpy_rng(self, *names) -> np.random.RandomState:
+        """A new np.random.RandomState for the named stream, with the same API as the np.random module."""
+        return np.random.RandomState(self.derive(*names) % 2 ** 32)
+
+    @contextmanager
+    def activate(self, *names):
+        """Draw from the named stream on the calling thread until the block exits."""
+        previous = getattr(_state, 'streams', None)
+        _state.streams = (self.rng(*names), self.numpy_rng(*names))
+        try:
+            yield
+        finally:
+            _state.streams = previous
@@ -0,0 +1,23 @@
+from typing import Callable
+
+
+def reads(*table_keys: str) -> Callable[[Callable], Callable]:
+    """
+    Declare the tables a custom or table generator reads besides its own, through dg.inserted_pks, dg.lookup,
+    dg.sample or SQL, so DataGenerator generates them first, see DataGenerator._table_reads.
+
+    Example:
+        @reads('consumer_banking.accounts', 'consumer_banking.products')
+        def generate_random_offer(id_fields, dg): ...
+
+    Args:
+        *table_keys (str): The tables, as "schema.table"
+
+    Returns:
+        callable: A decorator setting the reads attribute of the generator
+    """
+    def declare(fn):
+        fn.reads = frozenset(table_keys)
+        return fn
+
+    return declare
@@ -0,0 +1,236 @@
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+
+import json
+import logging
+import os
+import tempfile
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows: only threads are serialized
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseStore(MutableMapping):
+    """
+    Append-only store of the LLM generated text pools, a mapping of cache key -> list of unique strings.
+
+    The store is a JSONL file of segments, one line per append: the JSON encoded key, a tab, and the JSON array of
+    the elements added (or null, which deletes the key). A key's list is the concatenation of its segments,
+    without duplicates. Keeping the key before the tab lets the offset index (key -> byte ranges of its segments)
+    be built without decoding any elements, and a key's elements are only decoded on its first lookup.
+
+    Assigning a list appends the elements the key doesn't have yet, as a single write under a lock file, so
+    worker threads and forked processes can append concurrently; each of them notices the others' segments when
+    it next looks up a key it hasn't looked up before, or appends. compact rewrites the file with one segment per
+    key and atomically replaces it; readers take no lock, but check the inode and size of the file they open
+    before trusting the offsets of the index, and reindex a file that was replaced.
+
+    Args:
+        path (str): The JSONL file
+        legacy_path (str, optional): JSON file of a {key: [elements]} dict, imported when path doesn't exist yet
+    """
+
+    def __init__(self, path, legacy_path=None):
+        self.path = path
+        self.legacy_path = legacy_path
+        self._lock = threading.RLock()
+        self._index = None  # key -> [(offset, length)] of its segments, None until first use
+        self._values = {}  # key -> decoded list, for the keys looked up so far
+        self._scanned = 0  # bytes of the file covered by the index
+        self._inode = None  # the file the index describes, replaced by compaction
+        self._segments = 0
+        self._lock_file = None  # Open while the calling thread holds the file lock
+
+    @contextmanager
+    def _file_lock(self):
+        """Serialize writers across threads and processes, on a lock file compaction never replaces."""
+        with self._lock:
+            if fcntl is None or self._lock_file is not None:
+                yield
+                return
+            with open(self.path + '.lock', 'a') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                self._lock_file = lock_file
+                try:
+                    yield
+                finally:
+                    self._lock_file = None
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _refresh(self):
+        """Index the segments appended since the last refresh, or the whole file if it was replaced."""
+        if self._index is None and not os.path.exists(self.path) and self.legacy_path \
+                and os.path.exists(self.legacy_path):
+            self._import_legacy()
+        try:
+            file = open(self.path, 'rb')
+        except FileNotFoundError:
+            self._index = self._index if self._index is not None else {}
+            return
+        with file:
+            self._refresh_from(file)
+
+    def _refresh_from(self, file):
+        """
+        _refresh against an open handle of the store, whose inode and size are checked before any offset of the
+        index is trusted: compaction may have replaced the file since it was indexed.
+
+        Returns:
+            bool: True if the index was rebuilt for a replaced file
+        """
+        stat = os.fstat(file.fileno())
+        rebuilt = self._index is None or stat.st_ino != self._inode or stat.st_size < self._scanned
+        if rebuilt:
+            self._index, self._values, self._scanned, self._segments = {}, {}, 0, 0
+            self._inode = stat.st_ino
+        if stat.st_size == self._scanned:
+            return rebuilt
+
+        file.seek(self._scanned)
+        offset = self._scanned
+        for line in file:
+            if not line.endswith(b'\n'):
+                break  # An append in progress, picked up by the next refresh
+            key = json.loads(line[:line.index(b'\t')])
+            self._index.setdefault(key, []).append((offset, len(line)))
+            self._segments += 1
+            if key in self._values:
+                self._values[key] = self._apply(self._values[key], line)
+            offset += len(line)
+        self._scanned = offset
+        return rebuilt
+
+    @staticmethod
+    def _apply(values, line):
+        """values with the elements of one more segment, None if the segment deletes the key."""
+        added = json.loads(line[line.index(b'\t') + 1:])
+        if added is None:
+            return None
+        return list(dict.fromkeys((values or []) + added))
+
+    def _load(self, key):
+        """Decode the segments of one key, from the file the index describes."""
+        values = None
+        segments = self._index.get(key)
+        if segments:
+            with open(self.path, 'rb') as file:
+                # The file opened may not be the one indexed, if another process compacted it meanwhile
+                if self._refresh_from(file):
+                    segments = self._index.get(key, [])
+                for offset, length in segments:
+                    file.seek(offset)
+                    values = self._apply(values, file.read(length))
+        self._values[key] = values
+        return values
+
+    def _import_legacy(self):
+        with open(self.legacy_path, 'r') as file:
+            try:
+                responses = json.load(file)
+            except json.JSONDecodeError as e:
+                logger.error(f"Could not import {self.legacy_path}: {e}")
+                return
+        with self._file_lock():
+            if not os.path.exists(self.path):
+                self._write_atomically(responses)
+                logger.info(f"Imported {len(responses)} text pools from {self.legacy_path} into {self.path}")
+
+    def _write_atomically(self, responses):
+        """Write one segment per key to a temporary file and move it over the store."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.responses-', suffix='.jsonl')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                for key, values in responses.items():
+                    if values is not None:
+                        file.write(self._segment(key, values))
+                file.flush()
+                os.fsync(file.fileno())
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    @staticmethod
+    def _segment(key, values):
+        return (json.dumps(key) + '\t' + json.dumps(values) + '\n').encode()
+
+    def __getitem__(self, key):
+        values = self.get(key)
+        if values is None:
+            raise KeyError(key)
+        return values
+
+    def get(self, key, default=None):
+        """The elements of a key, decoded on first use."""
+        if key in self._values:
+            values = self._values[key]
+            return default if values is None else values
+        with self._lock:
+            self._refresh()
+            values = self._values[key] if key in self._values else self._load(key)
+        return default if values is None else values
+
+    def __setitem__(self, key, values):
+        """Append the elements of values the key doesn't have yet; elements are never removed."""
+        with self._file_lock():
+            self._refresh()
+            current = self._values[key] if key in self._values else self._load(key)
+            known = set(current or [])
+            added = [value for value in dict.fromkeys(values) if value not in known]
+            if not added and current is not None:
+                return
+            self._append(key, added)
+
+    def __delitem__(self, key):
+        with self._file_lock():
+            self._refresh()
+            if self.get(key) is None:
+                raise KeyError(key)
+            self._append(key, None)
+
+    def _append(self, key, values):
+        """Write one segment at the end of the file and index it, with the file lock held."""
+        segment = self._segment(key, values)
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, segment)
+        finally:
+            os.close(fd)
+        # Index it, and anything another process appended meanwhile
+        self._refresh()
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __iter__(self):
+        with self._lock:
+            self._refresh()
+            keys = list(self._index)
+        return (key for key in keys if self.get(key) is not None)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    @property
+    def fragmented(self):
+        """Whether the file holds noticeably more segments than keys."""
+        with self._lock:
+            self._refresh()
+            return self._segments > 2 * len(self._index) + 100
+
+    def compact(self):
+        """Rewrite the store with one segment per live key, dropping deleted keys."""
+        with self._file_lock():
+            self._refresh()
+            responses = {key: self.get(key) for key in list(self._index)}
+            self._write_atomically(responses)
+            self._index = None
+            self._refresh()
+        logger.debug(f"Compacted {self.path} to {len(self._index)} text pools")
@@ -0,0 +1,85 @@
+from functools import lru_cache
+
+import re
+
+_BLOCK_START = re.compile(r'^(Table|Enum|enum)\s+("?\w+"?\s*\.\s*"?\w+"?)')
+_COLUMN = re.compile(r'^\s+"?(\w+)"?\s+("?\w+"?(?:\s*\.\s*"?\w+"?)?)')
+_INLINE_REF = re.compile(r'ref:\s*[<>-]+\s*"?(\w+)"?\s*\.\s*"?(\w+)"?\s*\.\s*"?\w+"?')
+_TOP_LEVEL_REF = re.compile(r'^Ref\b[^:]*:\s*"?(\w+)"?\s*\.\s*"?(\w+)"?\s*\.\s*"?\w+"?\s*[<>-]+\s*"?(\w+)"?\s*\.\s*'
+                            r'"?(\w+)"?\s*\.')
+_KEY_COLUMN = re.compile(r'[\[,]\s*(pk|ref:)')
+
+
+def _name(quoted):
+    return quoted.replace('"', '').replace(' ', '')
+
+
+@lru_cache(maxsize=4)
+def _parse(dbml_string):
+    """
+    The Table and Enum blocks of a DBML string by schema.name, and the foreign key references between tables as
+    table -> set of tables, in both directions.
+    """
+    tables, enums, references = {}, {}, {}
+    block_kind, block_name, block_lines = None, None, []
+    for line in dbml_string.splitlines():
+        if block_kind is None:
+            match = _BLOCK_START.match(line)
+            if match:
+                block_kind, block_name, block_lines = match.group(1).lower(), _name(match.group(2)), [line]
+            else:
+                match = _TOP_LEVEL_REF.match(line)
+                if match:
+                    source, target = f"{match.group(1)}.{match.group(2)}", f"{match.group(3)}.{match.group(4)}"
+                    references.setdefault(source, set()).add(target)
+                    references.setdefault(target, set()).add(source)
+            continue
+        block_lines.append(line)
+        if line.startswith('}'):
+            (tables if block_kind == 'table' else enums)[block_name] = block_lines
+            block_kind = None
+
+    for table_key, lines in tables.items():
+        for line in lines:
+            for schema, table in _INLINE_REF.findall(line):
+                referenced = f"{schema}.{table}"
+                if referenced != table_key:
+                    references.setdefault(table_key, set()).add(referenced)
+                    references.setdefault(referenced, set()).add(table_key)
+    return tables, enums, references
+
+
+def _outline(lines):
+    """A table block reduced to its header, key and reference columns and table note."""
+    return [line for i, line in enumerate(lines)
+            if i == 0 or line.startswith('}') or line.lstrip().startswith('note:') or _KEY_COLUMN.search(line)]
+
+
+@lru_cache(maxsize=1024)
+def slice_dbml(dbml_string, table_key):
+    """
+    The part of a DBML schema that gives context to one table: its Table block and the Enums its columns use,
+    followed by an outline (key and reference columns, and note) of every table it references or is referenced by.
+
+    Args:
+        dbml_string (str): The DBML string representing the database schema
+        table_key (str): The table, as schema.table
+
+    Returns:
+        str: The slice, or an empty string when the table isn't in the schema
+    """
+    tables, enums, references = _parse(dbml_string)
+    lines = tables.get(table_key)
+    if lines is None:
+        return ''
+
+    enum_names = []
+    for line in lines[1:]:
+        match = _COLUMN.match(line)
+        if match and _name(match.group(2)) in enums and _name(match.group(2)) not in enum_names:
+            enum_names.append(_name(match.group(2)))
+
+    blocks = [lines] + [enums[name] for name in enum_names]
+    blocks += [_outline(tables[neighbour]) for neighbour in sorted(references.get(table_key, ()))
+               if neighbour in tables]
+    return '\n\n'.join('\n'.join(block) for block in blocks)
@@ -1,13 +1,40 @@
+from .random_streams import current_numpy, current_random
 from faker import Faker
+from samplers import AliasSampler
+
+import numpy as np
 
 fake = Faker()
 
 
 def text_list(d, lower=False):
+    # Weighted dicts keep going through Faker, plain sequences are drawn from the active random stream
+    values = d if isinstance(d, dict) else tuple(d)
+
     def list_values(_a, _b, _c):
-        v = fake.random_element(d)
+        if isinstance(values, dict):
+            v = fake.random_element(values)
+        else:
+            v = current_random().choice(values)
         if lower:
             v = v.lower()
         return v
 
+    # Whole columns are drawn as NumPy indices into the (lowered) values, built on the first fill
+    column = {}
+
+    def fill_column(n):
+        if not column:
+            elements = [v.lower() for v in values] if lower else list(values)
+            column['values'] = np.empty(len(elements), dtype=object)
+            column['values'][:] = elements
+            column['sampler'] = AliasSampler(list(values.values())) if isinstance(values, dict) else None
+        rng = current_numpy()
+        if column['sampler'] is None:
+            indices = rng.randint(0, len(column['values']), size=n)
+        else:
+            indices = column['sampler'].sample_indices(n, rng)
+        return column['values'][indices].tolist()
+
+    list_values.fill_column = fill_column  # Whole batch columns, see DataGenerator._fill_columns
     return list_values
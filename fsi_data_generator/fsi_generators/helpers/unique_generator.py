@@ -0,0 +1,15 @@
+def unique_generator(fn):
+    """
+    Declare that a custom generator never repeats a value, drawing it from state that lives in one process:
+    Faker unique, dg.unique_values, a ValuePool or a list of keys it takes from. Forked shards would each draw
+    from their own copy of that state, so DataGenerator never shards its table, see
+    DataGenerator._get_process_count.
+
+    Args:
+        fn (callable): The generator
+
+    Returns:
+        callable: fn, with its unique attribute set
+    """
+    fn.unique = True
+    return fn
@@ -1,7 +1,8 @@
-from faker import Faker
+from .random_streams import current_numpy, current_random
+from faker.exceptions import UniquenessException
 from typing import Union
 
-fake = Faker()
+import numpy as np
 
 
 def unique_list(d: Union[list, tuple]):
@@ -11,8 +12,35 @@ def unique_list(d: Union[list, tuple]):
     elif not isinstance(d, tuple):
         raise TypeError("The input must be a list or a tuple.")
 
+    # Values not returned yet by this generator, drawn from the active random stream
+    remaining = list(dict.fromkeys(d))
+
     def list_values(_a, _b, _c):
-        v = fake.unique.random_element(d)
-        return v
+        if not remaining:
+            raise UniquenessException(f"Got duplicated values after drawing all {len(d)} elements.")
+        i = current_random().randrange(len(remaining))
+        remaining[i], remaining[-1] = remaining[-1], remaining[i]
+        return remaining.pop()
+
+    def fill_column(n):
+        # n values at once, leaving the per-row path to fail on the values past the last one
+        if n > len(remaining):
+            raise UniquenessException(f"Only {len(remaining)} of the {len(d)} elements are left for {n} rows.")
+        if n <= 0:
+            return []
+        # Partial Fisher-Yates: the k-th draw swaps one of the first len - k values to the end and pops it
+        picks = current_numpy().randint(0, np.arange(len(remaining), len(remaining) - n, -1))
+        values = []
+        for i in picks.tolist():
+            remaining[i], remaining[-1] = remaining[-1], remaining[i]
+            values.append(remaining.pop())
+        return values
+
+    def release(values):
+        # Values of a fill that no row kept (the column was set by another generator), drawable again
+        remaining.extend(values)
 
+    list_values.fill_column = fill_column  # Whole batch columns, see DataGenerator._fill_columns
+    list_values.release = release
+    list_values.unique = True  # Never sharded across processes, see DataGenerator._get_process_count
     return list_values
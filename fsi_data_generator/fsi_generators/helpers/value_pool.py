@@ -0,0 +1,95 @@
+from .random_streams import current_random
+from typing import Callable, Dict, List, Optional, Union
+
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class ValuePool:
+    """
+    Pool of distinct generated values, built on first use instead of at import time, and grown as needed.
+
+    `take` hands out every value at most once, e.g. for unique account numbers; the first call builds as many
+    values as the caller expects to take (usually the row count of its table), and later calls add more
+    values, never repeating one, whenever the pool runs out. `choice` picks any value, repeats allowed.
+
+    Pools are registered by name in ValuePool.registry, see get_value_pool.
+
+    Args:
+        draw (callable): Returns one random candidate value
+        name (str, optional): Registry name
+        size (int, optional): Values built when the first caller doesn't say how many it needs. Default is 1000.
+    """
+    registry: Dict[str, 'ValuePool'] = {}
+
+    def __init__(self, draw: Callable[[], object], name: Optional[str] = None, size: int = 1000):
+        self.draw = draw
+        self.name = name
+        self.size = max(1, int(size))
+        self.values: List = []
+        self.taken = 0  # values[:taken] were handed out by take
+        self._seen = set()
+        self._lock = threading.Lock()
+        if name:
+            ValuePool.registry[name] = self
+
+    def _grow(self, count):
+        """Add up to count new distinct values, giving up after 10 draws per value when the value space is small."""
+        target = len(self.values) + count
+        for _ in range(10 * count):
+            if len(self.values) >= target:
+                break
+            value = self.draw()
+            if value not in self._seen:
+                self._seen.add(value)
+                self.values.append(value)
+        logger.debug(f"Value pool {self.name or self.draw.__name__} grown to {len(self.values)} values")
+
+    def ensure(self, count: int) -> List:
+        """The pool's values, after growing it to at least count values."""
+        with self._lock:
+            if len(self.values) < count:
+                self._grow(count - len(self.values))
+            return self.values
+
+    def take(self, expected: Optional[Union[int, Callable[[], int]]] = None):
+        """
+        A value no earlier take returned.
+
+        Args:
+            expected (int or callable, optional): Values the caller expects to take in total, built at once on
+                                                  first use; a function returning it is only called when the pool
+                                                  has to grow, not on every take
+
+        Raises:
+            IndexError: If no new value could be drawn
+        """
+        with self._lock:
+            if self.taken >= len(self.values):
+                if callable(expected):
+                    expected = expected()
+                if expected and expected > len(self.values):
+                    # Build what the caller expects to take at once
+                    self._grow(expected - len(self.values))
+                else:
+                    # Ran out anyway: grow by half the pool
+                    self._grow(max(len(self.values) // 2, 1 if expected else self.size))
+                if self.taken >= len(self.values):
+                    raise IndexError(f"Value pool {self.name or self.draw.__name__} is exhausted")
+            value = self.values[self.taken]
+            self.taken += 1
+            return value
+
+    def choice(self):
+        """Any value of the pool, which is built on first use."""
+        return current_random().choice(self.values or self.ensure(self.size))
+
+    def __len__(self):
+        return len(self.values)
+
+
+def get_value_pool(name: str) -> ValuePool:
+    """The registered pool of a name, see ValuePool."""
+    return ValuePool.registry[name]
@@ -1,3 +1,5 @@
+from ...helpers.reads import reads
+from ...helpers.unique_generator import unique_generator
 from .enums import (ApplicationLifecycleStatus, ApplicationType,
                     DeploymentEnvironment)
 from data_generator import DataGenerator
@@ -7,12 +9,15 @@ from typing import Any, Dict
 
 import datetime
 import logging
-import psycopg2
 import random
 
 logger = logging.getLogger(__name__)
 
+APPLICATION_NAMES = 'app_mgmt.applications.application_name'
 
+
+@unique_generator
+@reads('enterprise.associates', 'enterprise.departments')
 def generate_random_application(_id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random app_mgmt application record with reasonable values.
@@ -26,12 +31,6 @@ def generate_random_application(_id_fields: Dict[str, Any], dg: DataGenerator) -
     Returns:
         Dictionary containing randomly generated application data (without ID fields)
     """
-    # Get connection for fetching related data
-    conn = dg.conn
-
-    # First, get existing application names to avoid duplicates
-    existing_application_names = get_existing_application_names(conn)
-
     # Default fallback values
     application_names = [
         "Customer Account Portal", "Loan Origination System", "Mobile Banking App",
@@ -83,8 +82,9 @@ def generate_random_application(_id_fields: Dict[str, Any], dg: DataGenerator) -
         # Continue with fallback values
         pass
 
-    # Filter out names that already exist in the database
-    available_names = [name for name in application_names if name not in existing_application_names]
+    # Filter out names that already exist in the database or were generated
+    taken = dg.unique_values.taken(APPLICATION_NAMES)
+    available_names = [name for name in application_names if name not in taken]
 
     # If we've run out of available names, create a new unique name
     if not available_names:
@@ -98,16 +98,12 @@ def generate_random_application(_id_fields: Dict[str, Any], dg: DataGenerator) -
             "Service", "Application", "Gateway", "Tracker", "Hub", "Central"
         ]
 
-        # Keep generating new combinations until we find a unique one
-        while True:
-            timestamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%d%H%M%S")
-            application_name = f"{random.choice(base_names)} {random.choice(suffixes)} {timestamp[-4:]}"
+        # Combinations of base names and suffixes, numbered once every combination is taken
+        available_names = [f"{base_name} {suffix}" for base_name in base_names for suffix in suffixes]
 
-            if application_name not in existing_application_names:
-                break
-    else:
-        # Choose a random available name
-        application_name = random.choice(available_names)
+    # Reserve a random available name
+    application_name = dg.unique_values.unique(APPLICATION_NAMES, random.choice, available_names,
+                                               fallback=lambda name, n: f"{name} {n + 1}")
 
     # Get random values from enums using weighted selection
     application_type = ApplicationType.get_random()
@@ -197,9 +193,9 @@ def generate_random_application(_id_fields: Dict[str, Any], dg: DataGenerator) -
     rto, rpo = determine_rto_rpo(application_name, lifecycle_status.name)
 
     # Find suitable application owner and get their department
-    application_owner_id, enterprise_department_id = _get_suitable_application_owner(conn, lifecycle_status)
+    application_owner_id, enterprise_department_id = _get_suitable_application_owner(dg, lifecycle_status)
 
-    candidate_created_by, candidate_modified_by = _get_created_and_modified_user_ids(conn, date_deployed, date_retired)
+    candidate_created_by, candidate_modified_by = _get_created_and_modified_user_ids(dg, date_deployed, date_retired)
 
     # Create the application record
     application = {
@@ -225,35 +221,6 @@ def generate_random_application(_id_fields: Dict[str, Any], dg: DataGenerator) -
     return application
 
 
-def get_existing_application_names(conn) -> list:
-    """
-    Get all existing application names from the database.
-
-    Args:
-        conn: PostgreSQL connection object
-
-    Returns:
-        List of existing application names
-    """
-    try:
-        cursor = conn.cursor()
-
-        cursor.execute("""
-                SELECT application_name
-                FROM app_mgmt.applications
-            """)
-
-        results = cursor.fetchall()
-        cursor.close()
-
-        # Extract the names from the results
-        return [result.get('application_name') for result in results] if results else []
-
-    except (Exception, psycopg2.Error) as error:
-        logger.error(f"Error fetching existing application names: {error}")
-        return []  # Return empty list on error to avoid blocking generation
-
-
 def is_critical_application(application_name: str) -> bool:
     """
     Determine if an application is business-critical based on similarity to known critical applications.
@@ -346,57 +313,35 @@ def determine_rto_rpo(application_name: str, lifecycle_status: str) -> tuple:
     return rto, rpo
 
 
-def _get_suitable_application_owner(conn, lifecycle_status) -> tuple:
+def _get_suitable_application_owner(dg: DataGenerator, lifecycle_status) -> tuple:
     """
     Find a suitable application owner based on application lifecycle status.
     For non-archived applications, owners must be active employees.
 
     Args:
-        conn: Database connection for executing queries
+        dg: DataGenerator instance
         lifecycle_status: Current lifecycle status of the application
 
     Returns:
         Tuple containing (application_owner_id, enterprise_department_id)
     """
     try:
-        cursor = conn.cursor()
-
         if lifecycle_status not in [ApplicationLifecycleStatus.DECOMMISSIONED, ApplicationLifecycleStatus.ARCHIVED]:
             # Find active employees only for non-archived applications
-            cursor.execute("""
-                SELECT a.enterprise_associate_id, a.enterprise_department_id 
-                FROM enterprise.associates a
-                WHERE a.status = 'ACTIVE' AND a.relationship_type = 'EMPLOYEE'
-                ORDER BY RANDOM()
-                LIMIT 1
-            """)
+            owners = dg.sample('enterprise.associates', where={'status': 'ACTIVE', 'relationship_type': 'EMPLOYEE'})
         else:
             # For archived or decommissioned applications, any associate is fine
-            cursor.execute("""
-                SELECT enterprise_associate_id, enterprise_department_id 
-                FROM enterprise.associates
-                ORDER BY RANDOM()
-                LIMIT 1
-            """)
-
-        owner_data = cursor.fetchone()
-        cursor.close()
-
-        if owner_data:
-            application_owner_id = owner_data.get('enterprise_associate_id')
-            enterprise_department_id = owner_data.get('enterprise_department_id')
+            owners = dg.sample('enterprise.associates')
+
+        if owners:
+            application_owner_id = owners[0].get('enterprise_associate_id')
+            enterprise_department_id = owners[0].get('enterprise_department_id')
             return application_owner_id, enterprise_department_id
         else:
             # Fallback to random department if no suitable owner found
             application_owner_id = None
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT enterprise_department_id FROM enterprise.departments
-                ORDER BY RANDOM() LIMIT 1
-            """)
-            dept_data = cursor.fetchone()
-            cursor.close()
-            enterprise_department_id = dept_data.get('enterprise_department_id') if dept_data else None
+            departments = dg.sample('enterprise.departments')
+            enterprise_department_id = departments[0].get('enterprise_department_id') if departments else None
             return application_owner_id, enterprise_department_id
 
     except Exception as e:
@@ -404,14 +349,24 @@ def _get_suitable_application_owner(conn, lifecycle_status) -> tuple:
         return None, None
 
 
-def _get_created_and_modified_user_ids(conn, date_deployed, date_retired) -> tuple:
+def _employed_on(associate: Dict[str, Any], date) -> bool:
+    """Whether an associate was hired on or before date and not released before it."""
+    def as_date(value):
+        return value.date() if isinstance(value, datetime.datetime) else value
+
+    hire_date, release_date = as_date(associate.get('hire_date')), as_date(associate.get('release_date'))
+    date = as_date(date)
+    return hire_date is not None and hire_date <= date and (release_date is None or release_date >= date)
+
+
+def _get_created_and_modified_user_ids(dg: DataGenerator, date_deployed, date_retired) -> tuple:
     """
     Find appropriate user IDs for application creation and modification based on dates.
     - created_by_user_id must be an associate who was employed during date_deployed
     - If DECOMMISSIONED, modified_by_user_id must be an associate who was employed on date_retired
 
     Args:
-        conn: Database connection for executing queries
+        dg: DataGenerator instance
         date_deployed: Date when the application was deployed
         date_retired: Date when the application was retired (if applicable)
 
@@ -422,50 +377,22 @@ def _get_created_and_modified_user_ids(conn, date_deployed, date_retired) -> tup
     modified_by_user_id = None
 
     try:
-        cursor = conn.cursor()
-
         # Find an associate who was employed during date_deployed
         if date_deployed:
-            cursor.execute("""
-                SELECT enterprise_associate_id 
-                FROM enterprise.associates
-                WHERE hire_date <= %s 
-                AND (release_date IS NULL OR release_date >= %s)
-                ORDER BY RANDOM()
-                LIMIT 1
-            """, (date_deployed, date_deployed))
-
-            result = cursor.fetchone()
-            if result:
-                created_by_user_id = result.get('enterprise_associate_id')
+            result = dg.sample('enterprise.associates', predicate=lambda row: _employed_on(row, date_deployed),
+                               columns=['hire_date', 'release_date'])
         else:
             # If no deployment date, just get a random associate
-            cursor.execute("""
-                SELECT enterprise_associate_id 
-                FROM enterprise.associates
-                ORDER BY RANDOM()
-                LIMIT 1
-            """)
-            result = cursor.fetchone()
-            if result:
-                created_by_user_id = result.get('enterprise_associate_id')
+            result = dg.sample('enterprise.associates')
+        if result:
+            created_by_user_id = result[0].get('enterprise_associate_id')
 
         # For retired applications, find an associate who was employed on the retirement date
         if date_retired:
-            cursor.execute("""
-                SELECT enterprise_associate_id 
-                FROM enterprise.associates
-                WHERE hire_date <= %s 
-                AND (release_date IS NULL OR release_date >= %s)
-                ORDER BY RANDOM()
-                LIMIT 1
-            """, (date_retired, date_retired))
-
-            result = cursor.fetchone()
+            result = dg.sample('enterprise.associates', predicate=lambda row: _employed_on(row, date_retired),
+                               columns=['hire_date', 'release_date'])
             if result:
-                modified_by_user_id = result.get('enterprise_associate_id')
-
-        cursor.close()
+                modified_by_user_id = result[0].get('enterprise_associate_id')
 
     except Exception as e:
         logger.error(f"Error finding application user IDs: {e}")
@@ -1,10 +1,9 @@
 import random
 from typing import Dict, Any
 
-import anthropic
-
 from data_generator import DataGenerator
 from ...helpers import generate_unique_json_array
+from ...helpers.generate_unique_json_array import anthropic
 from .enums import ComponentType
 
 
@@ -1,8 +1,7 @@
-from ...helpers.generate_unique_json_array import generate_unique_json_array
+from ...helpers.generate_unique_json_array import anthropic, generate_unique_json_array
 from data_generator import DataGenerator
 from typing import Any, Dict
 
-import anthropic
 import logging
 import random
 
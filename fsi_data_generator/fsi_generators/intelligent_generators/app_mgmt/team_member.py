@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from data_generator import DataGenerator, SkipRowGenerationError
 from typing import Any, Dict, Set, Tuple
 
@@ -11,6 +12,7 @@ team_member_assignments: Set[Tuple[str, int]] = set()
 logger = logging.getLogger(__name__)
 
 
+@reads('app_mgmt.teams', 'enterprise.associates')
 def generate_random_team_member(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random app_mgmt.team_members record.
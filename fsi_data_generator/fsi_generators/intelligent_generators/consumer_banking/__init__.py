@@ -1,10 +1,11 @@
 """Automatically generated __init__.py"""
-__all__ = ['account', 'account_access_consent', 'account_statement_preference', 'balance', 'beneficiary', 'beneficiary_creditor_account', 'beneficiary_creditor_agent', 'calculate_statement_end_date', 'customer_interaction', 'direct_debit', 'generate_prior_statement', 'generate_random_account', 'generate_random_account_access_consent', 'generate_random_account_statement_preference', 'generate_random_balance', 'generate_random_beneficiary', 'generate_random_beneficiary_creditor_account', 'generate_random_beneficiary_creditor_agent', 'generate_random_customer_interaction', 'generate_random_direct_debit', 'generate_random_mandate_related_information', 'generate_random_offer', 'generate_random_other_product_type', 'generate_random_product', 'generate_random_proprietary_transaction_code', 'generate_random_scheduled_payment', 'generate_random_scheduled_payment_creditor_account', 'generate_random_scheduled_payment_creditor_agent', 'generate_random_standing_order', 'generate_random_standing_order_creditor_account', 'generate_random_standing_order_creditor_agent', 'generate_random_statement', 'generate_random_statement_amount', 'generate_random_statement_benefit', 'generate_random_statement_date_time', 'generate_random_statement_fee', 'generate_random_statement_interest', 'generate_random_statement_rate', 'generate_random_statement_value', 'generate_random_transaction', 'generate_random_transaction_balance', 'generate_random_transaction_bank_transaction_code', 'generate_random_transaction_card_instrument', 'generate_random_transaction_creditor_account', 'generate_random_transaction_creditor_agent', 'generate_random_transaction_currency_exchange', 'generate_random_transaction_debtor_account', 'generate_random_transaction_debtor_agent', 'generate_random_transaction_merchant_detail', 'generate_random_transaction_statement_reference', 'generate_random_transaction_ultimate_creditor', 'generate_random_transaction_ultimate_debtor', 'get_account', 'mandate_related_information', 'offer', 'other_product_type', 'product', 'proprietary_transaction_code', 'scheduled_payment', 'scheduled_payment_creditor_account', 'scheduled_payment_creditor_agent', 'standing_order', 'standing_order_creditor_account', 'standing_order_creditor_agent', 'statement', 'statement_amount', 'statement_benefit', 'statement_date_time', 'statement_fee', 'statement_interest', 'statement_rate', 'statement_value', 'today', 'transaction', 'transaction_balance', 'transaction_bank_transaction_code', 'transaction_card_instrument', 'transaction_creditor_account', 'transaction_creditor_agent', 'transaction_currency_exchange', 'transaction_debtor_account', 'transaction_debtor_agent', 'transaction_merchant_detail', 'transaction_statement_reference', 'transaction_ultimate_creditor', 'transaction_ultimate_debtor']
+__all__ = ['account', 'account_access_consent', 'account_statement_preference', 'account_time_series', 'account_time_series_generators', 'balance', 'beneficiary', 'beneficiary_creditor_account', 'beneficiary_creditor_agent', 'calculate_statement_end_date', 'customer_interaction', 'direct_debit', 'generate_prior_statement', 'generate_random_account', 'generate_random_account_access_consent', 'generate_random_account_statement_preference', 'generate_random_balance', 'generate_random_beneficiary', 'generate_random_beneficiary_creditor_account', 'generate_random_beneficiary_creditor_agent', 'generate_random_customer_interaction', 'generate_random_direct_debit', 'generate_random_mandate_related_information', 'generate_random_offer', 'generate_random_other_product_type', 'generate_random_product', 'generate_random_proprietary_transaction_code', 'generate_random_scheduled_payment', 'generate_random_scheduled_payment_creditor_account', 'generate_random_scheduled_payment_creditor_agent', 'generate_random_standing_order', 'generate_random_standing_order_creditor_account', 'generate_random_standing_order_creditor_agent', 'generate_random_statement', 'generate_random_statement_amount', 'generate_random_statement_benefit', 'generate_random_statement_date_time', 'generate_random_statement_fee', 'generate_random_statement_interest', 'generate_random_statement_rate', 'generate_random_statement_value', 'generate_random_transaction', 'generate_random_transaction_balance', 'generate_random_transaction_bank_transaction_code', 'generate_random_transaction_card_instrument', 'generate_random_transaction_creditor_account', 'generate_random_transaction_creditor_agent', 'generate_random_transaction_currency_exchange', 'generate_random_transaction_debtor_account', 'generate_random_transaction_debtor_agent', 'generate_random_transaction_merchant_detail', 'generate_random_transaction_statement_reference', 'generate_random_transaction_ultimate_creditor', 'generate_random_transaction_ultimate_debtor', 'get_account', 'mandate_related_information', 'offer', 'other_product_type', 'product', 'proprietary_transaction_code', 'scheduled_payment', 'scheduled_payment_creditor_account', 'scheduled_payment_creditor_agent', 'standing_order', 'standing_order_creditor_account', 'standing_order_creditor_agent', 'statement', 'statement_amount', 'statement_benefit', 'statement_date_time', 'statement_fee', 'statement_interest', 'statement_rate', 'statement_value', 'today', 'transaction', 'transaction_balance', 'transaction_bank_transaction_code', 'transaction_card_instrument', 'transaction_creditor_account', 'transaction_creditor_agent', 'transaction_currency_exchange', 'transaction_debtor_account', 'transaction_debtor_agent', 'transaction_merchant_detail', 'transaction_statement_reference', 'transaction_ultimate_creditor', 'transaction_ultimate_debtor']
 
 from . import (account, account_access_consent, account_statement_preference,
-               balance, beneficiary, beneficiary_creditor_account,
-               beneficiary_creditor_agent, customer_interaction, direct_debit,
-               mandate_related_information, offer, other_product_type, product,
+               account_time_series, balance, beneficiary,
+               beneficiary_creditor_account, beneficiary_creditor_agent,
+               customer_interaction, direct_debit, mandate_related_information,
+               offer, other_product_type, product,
                proprietary_transaction_code, scheduled_payment,
                scheduled_payment_creditor_account,
                scheduled_payment_creditor_agent, standing_order,
@@ -22,6 +23,7 @@ from .account import generate_random_account
 from .account_access_consent import generate_random_account_access_consent
 from .account_statement_preference import \
     generate_random_account_statement_preference
+from .account_time_series import account_time_series_generators
 from .balance import generate_random_balance
 from .beneficiary import generate_random_beneficiary
 from .beneficiary_creditor_account import \
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .enums import AccountStatus, ProductType
 
 from data_generator import DataGenerator
@@ -31,6 +32,7 @@ _nicknames_by_product_type = {
 }
 
 
+@reads('consumer_banking.products', 'enterprise.accounts', 'enterprise.identifiers')
 def generate_random_account(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random consumer banking account with plausible values.
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .enums import ConsentStatus
 from .get_account import get_account
 from .today import today
@@ -8,6 +9,7 @@ import datetime
 import random
 
 
+@reads('consumer_banking.accounts')
 def generate_random_account_access_consent(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random consumer banking account access consent with plausible values.
@@ -29,7 +31,7 @@ def generate_random_account_access_consent(id_fields: Dict[str, Any], dg: DataGe
     # Fetch the consumer banking account to get its opened date
     cursor = conn.cursor()
     try:
-        consumer_account = get_account(conn, id_fields['consumer_banking_account_id'])
+        consumer_account = get_account(dg, id_fields['consumer_banking_account_id'])
 
         account_opened_date = consumer_account.get('opened_date')
 
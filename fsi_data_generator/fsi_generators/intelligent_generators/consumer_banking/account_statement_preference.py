@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from ..enterprise.enums import Frequency
 from .enums import AccountStatus, CommunicationMethod, StatementFormat
 from .today import today
@@ -9,6 +10,8 @@ import datetime
 import random
 
 
+@reads('consumer_banking.accounts', 'consumer_banking.statements', 'enterprise.account_ownership',
+       'enterprise.addresses', 'enterprise.party_entity_addresses')
 def generate_random_account_statement_preference(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate random account statement preferences with plausible values.
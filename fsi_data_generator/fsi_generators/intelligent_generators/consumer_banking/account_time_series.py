@@ -0,0 +1,255 @@
+from ...helpers import current_numpy, generate_account_time_series, reads
+from ..enterprise.enums import CreditDebitIndicator
+from .enums import (AccountStatus, BalanceSubType, BalanceType,
+                    TransactionCategory, TransactionMutability,
+                    TransactionStatus, TransactionType)
+from data_generator import DataGenerator
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Tuple
+
+import logging
+import numpy as np
+import threading
+
+logger = logging.getLogger(__name__)
+
+ACCOUNTS = 'consumer_banking.accounts'
+PRODUCTS = 'consumer_banking.products'
+BALANCES = 'consumer_banking.balances'
+TRANSACTIONS = 'consumer_banking.transactions'
+TRANSACTION_BALANCES = 'consumer_banking.transaction_balances'
+
+ACCOUNT_COLUMNS = ['consumer_banking_account_id', 'consumer_banking_product_id', 'opened_date', 'status',
+                   'status_update_date_time', 'currency_code']
+
+# Categories of deposits, every other category is a withdrawal, see generate_random_transaction
+CREDIT_CATEGORIES = [TransactionCategory.DEPOSIT, TransactionCategory.CREDIT, TransactionCategory.REVERSAL]
+
+# Transaction types that make sense for a category, other categories use any type
+CATEGORY_TYPES = {
+    TransactionCategory.PAYMENT: [TransactionType.BILL_PAYMENT, TransactionType.MERCHANT_PAYMENT,
+                                  TransactionType.UTILITY_PAYMENT],
+    TransactionCategory.DEPOSIT: [TransactionType.SALARY, TransactionType.REFUND, TransactionType.TAX_REFUND],
+    TransactionCategory.ATM: [TransactionType.CASH_WITHDRAWAL],
+    TransactionCategory.DIRECT_DEBIT: [TransactionType.BILL_PAYMENT, TransactionType.UTILITY_PAYMENT,
+                                       TransactionType.INSURANCE_PREMIUM, TransactionType.SUBSCRIPTION],
+}
+
+REFERENCE_PREFIXES = {
+    TransactionType.INTERNAL_TRANSFER: 'TRF',
+    TransactionType.EXTERNAL_TRANSFER: 'TRF',
+    TransactionType.BILL_PAYMENT: 'BILL',
+    TransactionType.PURCHASE: 'POS',
+    TransactionType.MERCHANT_PAYMENT: 'POS',
+    TransactionType.CASH_WITHDRAWAL: 'ATM',
+    TransactionType.SALARY: 'SAL',
+}
+
+# Balance snapshots after the opening one, and the balance reported with a transaction
+SNAPSHOT_TYPES = ([BalanceType.CURRENT, BalanceType.AVAILABLE, BalanceType.CLOSING, BalanceType.LEDGER],
+                  [40, 30, 15, 15])
+SNAPSHOT_SUB_TYPES = [BalanceSubType.INTRA_DAY, BalanceSubType.INTERIM, BalanceSubType.PREVIOUS_DAY]
+TRANSACTION_BALANCE_TYPES = ([BalanceType.AVAILABLE, BalanceType.CURRENT, BalanceType.LEDGER], [60, 30, 10])
+
+
+def _members(enum_cls) -> Tuple[list, List[float]]:
+    """Members of an enum and the weights EnumUtilities.get_random draws them with."""
+    members = [member for member in enum_cls if not member.name.startswith('_')]
+    weights = enum_cls._DEFAULT_WEIGHTS.value if enum_cls._DEFAULT_WEIGHTS else [1.0] * len(members)
+    return members, weights
+
+
+def _choose(rng, options, weights, size) -> np.ndarray:
+    """Weighted random choice of `size` enum values, as an array of strings."""
+    p = np.asarray(weights, dtype=np.float64)
+    values = np.array([option.value for option in options], dtype=object)
+    return values[rng.choice(len(values), size=size, p=p / p.sum())]
+
+
+def _datetimes(seconds) -> List[datetime]:
+    return [datetime.fromtimestamp(t, timezone.utc) for t in np.asarray(seconds).tolist()]
+
+
+def _account_rows(dg: DataGenerator) -> List[Dict[str, Any]]:
+    """
+    Rows of the accounts, read through the row cache when they were generated in this run; accounts of an
+    earlier run are selected from the database, as the row cache would.
+    """
+    pks = dg.inserted_pks.get(ACCOUNTS)
+    if pks:
+        return [row for row in (dg.lookup(ACCOUNTS, pk, ACCOUNT_COLUMNS) for pk in pks) if row is not None]
+
+    cursor = dg.conn.cursor()
+    try:
+        cursor.execute(f"""
+            SELECT {', '.join(ACCOUNT_COLUMNS)} FROM consumer_banking.accounts
+            ORDER BY consumer_banking_account_id
+        """)
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def _load_accounts(dg: DataGenerator) -> Dict[str, Any]:
+    """Accounts with a history to generate up to the start of the run, the product type and currency of each."""
+    product_types = {}
+    now = dg.run_started.timestamp()
+    columns = {'id': [], 'product_type': [], 'currency': [], 'start': [], 'end': []}
+    for account in _account_rows(dg):
+        start = account['opened_date'].timestamp()
+        end = now
+        if account['status'] != AccountStatus.ACTIVE.value:
+            end = account['status_update_date_time'].timestamp()
+        if end <= start:
+            continue
+        product_id = account['consumer_banking_product_id']
+        if product_id not in product_types:
+            product = dg.lookup(PRODUCTS, product_id, ['product_type']) if product_id is not None else None
+            product_types[product_id] = product['product_type'] if product else None
+        columns['id'].append(account['consumer_banking_account_id'])
+        columns['product_type'].append(product_types[product_id] or 'CHECKING')
+        columns['currency'].append(account['currency_code'] or 'USD')
+        columns['start'].append(start)
+        columns['end'].append(min(end, now))
+    return {name: np.array(values, dtype=object if name in ('product_type', 'currency') else None)
+            for name, values in columns.items()}
+
+
+def account_time_series_generators() -> List[Tuple[str, Callable]]:
+    """
+    Table generators writing consumer_banking balances, transactions and transaction balances as one time
+    series per account, see generate_account_time_series and DataGenerator.table_generators.
+
+    The series of all accounts is drawn once, by whichever of the three tables is generated first, with as
+    many transactions and balance snapshots as their row counts; every transaction then refers to its
+    account's opening balance, and every transaction balance carries the running balance after its
+    transaction.
+
+    Returns:
+        list: (table_pattern, generator_func) tuples
+    """
+    state: Dict[str, Any] = {}
+    lock = threading.Lock()
+
+    def series(dg: DataGenerator):
+        with lock:
+            if 'transactions' not in state:
+                accounts = _load_accounts(dg)
+                transactions, balances = generate_account_time_series(
+                    accounts['product_type'], accounts['start'], accounts['end'],
+                    transactions=dg.row_count(TRANSACTIONS), balances=dg.row_count(BALANCES))
+                state.update(accounts=accounts, transactions=transactions, balances=balances)
+                logger.debug(f"Generated time series of {len(accounts['id'])} accounts: "
+                             f"{len(transactions['amount'])} transactions, {len(balances['amount'])} balances")
+            return state['accounts'], state['transactions'], state['balances']
+
+    @reads(ACCOUNTS, PRODUCTS)
+    def generate_balances(dg: DataGenerator, table_key: str, _num_rows: int) -> int:
+        accounts, _, balances = series(dg)
+        rng = current_numpy()
+        n = len(balances['amount'])
+        opening = balances['opening']
+        types = np.where(opening, BalanceType.CURRENT.value, _choose(rng, *SNAPSHOT_TYPES, n))
+        sub_types = np.where(rng.random_sample(n) < 0.6, _choose(rng, SNAPSHOT_SUB_TYPES, [1] * 3, n), None)
+
+        keys = dg.load_columns(table_key, {
+            'consumer_banking_account_id': accounts['id'][balances['account_index']],
+            'credit_debit_indicator': np.where(balances['amount'] >= 0, CreditDebitIndicator.CREDIT.value,
+                                               CreditDebitIndicator.DEBIT.value),
+            'type': types,
+            'date_time': _datetimes(balances['time']),
+            'amount': balances['amount'],
+            'currency': accounts['currency'][balances['account_index']],
+            'sub_type': np.where(opening, BalanceSubType.OPENING.value, sub_types),
+        })
+        if len(keys) == n:
+            opening_ids = np.full(len(accounts['id']), None, dtype=object)
+            opening_ids[balances['account_index'][opening]] = np.array(keys, dtype=object)[opening]
+            state['opening_balance_ids'] = opening_ids
+        return len(keys)
+
+    @reads(ACCOUNTS, PRODUCTS)
+    def generate_transactions(dg: DataGenerator, table_key: str, _num_rows: int) -> int:
+        accounts, transactions, _ = series(dg)
+        rng = current_numpy()
+        n = len(transactions['amount'])
+        credit = transactions['credit']
+
+        # Category by direction, then a type that makes sense for the category
+        categories, category_weights = _members(TransactionCategory)
+        credit_weights = [w if c in CREDIT_CATEGORIES else 0 for c, w in zip(categories, category_weights)]
+        debit_weights = [0 if c in CREDIT_CATEGORIES else w for c, w in zip(categories, category_weights)]
+        category = np.where(credit, _choose(rng, categories, credit_weights, n),
+                            _choose(rng, categories, debit_weights, n))
+        transaction_type = _choose(rng, *_members(TransactionType), n)
+        for chosen_category, options in CATEGORY_TYPES.items():
+            mask = category == chosen_category.value
+            transaction_type[mask] = _choose(rng, options, [1] * len(options), int(mask.sum()))
+
+        # Recent pending transactions are mutable, booked and held ones are mostly immutable
+        status = _choose(rng, *_members(TransactionStatus), n)
+        mutability = np.where(status == TransactionStatus.PENDING.value, TransactionMutability.MUTABLE.value,
+                              TransactionMutability.IMMUTABLE.value).astype(object)
+        settled = np.isin(status, [TransactionStatus.BOOKED.value, TransactionStatus.HELD.value])
+        mutability[settled & (rng.random_sample(n) < 0.1)] = TransactionMutability.CONDITIONAL.value
+
+        # Value date is usually the transaction date, sometimes 1-2 days later
+        value_delay = np.where(rng.random_sample(n) < 0.8, 0, rng.randint(1, 3, n)) * 86400
+
+        prefixes = {t.value: prefix for t, prefix in REFERENCE_PREFIXES.items()}
+        references = [f"{prefixes.get(t, 'REF')}{number}"
+                      for t, number in zip(transaction_type.tolist(), rng.randint(10000000, 100000000, n).tolist())]
+        descriptions = {t.value: f"{t.value.replace('_', ' ').title()} Transaction"
+                        for t in _members(TransactionType)[0]}
+
+        balance_ids = state.get('opening_balance_ids')
+        keys = dg.load_columns(table_key, {
+            'consumer_banking_account_id': accounts['id'][transactions['account_index']],
+            'consumer_banking_balance_id': balance_ids[transactions['account_index']] if balance_ids is not None
+            else [None] * n,
+            'transaction_reference': references,
+            'credit_debit_indicator': np.where(credit, CreditDebitIndicator.CREDIT.value,
+                                               CreditDebitIndicator.DEBIT.value),
+            'status': status,
+            'transaction_mutability': mutability,
+            'transaction_date': _datetimes(transactions['time']),
+            'category': category,
+            'transaction_type': transaction_type,
+            'value_date': _datetimes(transactions['time'] + value_delay),
+            'description': [descriptions[t] for t in transaction_type.tolist()],
+            'amount': transactions['amount'],
+            'currency': accounts['currency'][transactions['account_index']],
+        })
+        if len(keys) == n:
+            state['transaction_ids'] = keys
+        return len(keys)
+
+    @reads(ACCOUNTS, PRODUCTS)
+    def generate_transaction_balances(dg: DataGenerator, table_key: str, num_rows: int) -> int:
+        accounts, transactions, _ = series(dg)
+        transaction_ids = state.get('transaction_ids')
+        if transaction_ids is None:
+            logger.debug(f"Skipping {table_key}, the transactions of the account time series were not loaded")
+            return 0
+
+        # The running balance after a sample of the transactions, in transaction order
+        rng = current_numpy()
+        n = len(transaction_ids)
+        chosen = np.sort(rng.choice(n, size=min(num_rows, n), replace=False))
+        balance = transactions['balance_after'][chosen]
+
+        keys = dg.load_columns(table_key, {
+            'consumer_banking_transaction_id': np.array(transaction_ids, dtype=object)[chosen],
+            'credit_debit_indicator': np.where(balance >= 0, CreditDebitIndicator.CREDIT.value,
+                                               CreditDebitIndicator.DEBIT.value),
+            'type': _choose(rng, *TRANSACTION_BALANCE_TYPES, len(chosen)),
+            'amount': np.abs(balance),
+            'currency': accounts['currency'][transactions['account_index'][chosen]],
+        })
+        return len(keys)
+
+    return [
+        (r'^consumer_banking\.balances$', generate_balances),
+        (r'^consumer_banking\.transactions$', generate_transactions),
+        (r'^consumer_banking\.transaction_balances$', generate_transaction_balances),
+    ]
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .enums import BeneficiaryType
 from data_generator import DataGenerator
 from typing import Any, Dict
@@ -5,6 +6,7 @@ from typing import Any, Dict
 import random
 
 
+@reads('consumer_banking.accounts')
 def generate_random_beneficiary(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random consumer banking beneficiary with plausible values.
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from ..enterprise import (generate_financial_institution_identifier,
                           generate_financial_institution_identifier_for_type,
                           generate_financial_institution_name)
@@ -8,6 +9,7 @@ from typing import Any, Dict
 import random
 
 
+@reads('consumer_banking.beneficiaries', 'consumer_banking.beneficiary_creditor_agents')
 def generate_random_beneficiary_creditor_account(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random beneficiary creditor account with plausible values.
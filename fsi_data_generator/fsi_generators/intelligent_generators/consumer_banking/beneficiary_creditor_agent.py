@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from ..enterprise import (generate_financial_institution_identifier,
                           generate_financial_institution_identifier_for_type,
                           generate_financial_institution_name)
@@ -6,6 +7,7 @@ from data_generator import DataGenerator
 from typing import Any, Dict
 
 
+@reads('consumer_banking.beneficiaries')
 def generate_random_beneficiary_creditor_agent(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random beneficiary creditor agent with plausible values.
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from ..enterprise.enums import Frequency
 from .enums import (InteractionChannel, InteractionPriority, InteractionStatus,
                     InteractionType)
@@ -9,6 +10,7 @@ import pytz
 import random
 
 
+@reads('enterprise.parties')
 def generate_random_customer_interaction(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random customer interaction with plausible values.
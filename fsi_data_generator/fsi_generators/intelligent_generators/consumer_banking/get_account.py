@@ -1,16 +1,8 @@
-def get_account(conn, id_):
-    # Fetch the consumer banking account to get its opened date
-    cursor = conn.cursor()
-    try:
-        cursor.execute("""SELECT * FROM consumer_banking.accounts WHERE consumer_banking_account_id = %s""", (id_,))
-        consumer_account = cursor.fetchone()
+def get_account(dg, id_):
+    # Read the consumer banking account (e.g. for its opened date) from the rows generated in this run
+    consumer_account = dg.lookup("consumer_banking.accounts", id_)
 
-        if not consumer_account:
-            raise ValueError(f"No consumer banking account found with ID {id_}")
+    if not consumer_account:
+        raise ValueError(f"No consumer banking account found with ID {id_}")
 
-        return consumer_account
-
-    except Exception as e:
-        raise e
-    finally:
-        cursor.close()
+    return consumer_account
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from ..enterprise.enums.frequency import Frequency
 from .enums import DirectDebitCategory, DirectDebitClassification
 from data_generator import DataGenerator
@@ -8,6 +9,7 @@ import datetime
 import random
 
 
+@reads('consumer_banking.accounts', 'consumer_banking.direct_debits')
 def generate_random_mandate_related_information(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate random mandate related information for a direct debit with plausible values.
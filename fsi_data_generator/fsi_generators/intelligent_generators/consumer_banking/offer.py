@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from ..enterprise.enums import CurrencyCode
 from .enums import AccountStatus, OfferType
 from data_generator import DataGenerator, SkipRowGenerationError
@@ -7,6 +8,7 @@ import datetime
 import random
 
 
+@reads('consumer_banking.accounts', 'consumer_banking.products')
 def generate_random_offer(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random consumer banking offer with plausible values.
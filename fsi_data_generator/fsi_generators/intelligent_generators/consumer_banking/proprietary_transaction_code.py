@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from ..enterprise.enums import CreditDebitIndicator
 from .enums.transaction import (TransactionCategory, TransactionStatus,
                                 TransactionType)
@@ -7,6 +8,7 @@ from typing import Any, Dict
 import random
 
 
+@reads('consumer_banking.transactions')
 def generate_random_proprietary_transaction_code(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random proprietary transaction code with plausible values,
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from ..enterprise.enums import CurrencyCode
 from .enums import (PaymentFrequency, PaymentMethod, ScheduledPaymentStatus,
                     ScheduledPaymentType)
@@ -10,6 +11,7 @@ import datetime
 import random
 
 
+@reads('consumer_banking.accounts')
 def generate_random_scheduled_payment(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random consumer banking scheduled payment with plausible values.
@@ -31,7 +33,7 @@ def generate_random_scheduled_payment(id_fields: Dict[str, Any], dg: DataGenerat
     # Fetch the consumer banking account to get its opened date
     cursor = conn.cursor()
     try:
-        consumer_account = get_account(conn, id_fields['consumer_banking_account_id'])
+        consumer_account = get_account(dg, id_fields['consumer_banking_account_id'])
 
         account_opened_date = consumer_account.get('opened_date')
 
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from ..enterprise import (generate_financial_institution_identifier,
                           generate_financial_institution_name)
 from ..enterprise.enums import IdentifierScheme
@@ -7,6 +8,7 @@ from typing import Any, Dict
 import random
 
 
+@reads('consumer_banking.scheduled_payment_creditor_agents', 'consumer_banking.scheduled_payments')
 def generate_random_scheduled_payment_creditor_account(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random scheduled payment creditor account with plausible values.
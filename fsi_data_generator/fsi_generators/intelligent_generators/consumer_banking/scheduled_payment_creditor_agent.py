@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from ..enterprise import (generate_financial_institution_identifier,
                           generate_financial_institution_name)
 from data_generator import DataGenerator
@@ -6,6 +7,7 @@ from typing import Any, Dict
 import random
 
 
+@reads('consumer_banking.scheduled_payments')
 def generate_random_scheduled_payment_creditor_agent(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random scheduled payment creditor agent with plausible values.
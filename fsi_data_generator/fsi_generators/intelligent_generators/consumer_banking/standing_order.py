@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from ..enterprise.enums import CurrencyCode
 from ..enterprise.enums.frequency import Frequency
 from .enums import (StandingOrderCategory, StandingOrderStatusCode,
@@ -10,6 +11,7 @@ import json
 import random
 
 
+@reads('consumer_banking.accounts')
 def generate_random_standing_order(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random standing order with plausible values.
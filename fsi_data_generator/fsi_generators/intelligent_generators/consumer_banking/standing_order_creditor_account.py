@@ -1,9 +1,11 @@
+from ...helpers.reads import reads
 from ..enterprise import (generate_financial_institution_identifier,
                           generate_financial_institution_name)
 from data_generator import DataGenerator
 from typing import Any, Dict
 
 
+@reads('consumer_banking.standing_orders')
 def generate_random_standing_order_creditor_account(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random standing order creditor account with plausible values.
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .enums import StatementType
 from data_generator import DataGenerator
 from datetime import datetime, timedelta, timezone
@@ -9,6 +10,7 @@ import random
 cycle_cut_day = random.randint(1, 28)
 
 
+@reads('consumer_banking.accounts')
 def generate_random_statement(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random account statement with plausible values.
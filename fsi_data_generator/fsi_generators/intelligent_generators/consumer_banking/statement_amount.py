@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from ..enterprise.enums import CreditDebitIndicator, CurrencyCode
 from .enums import AmountSubType, AmountType
 from data_generator import DataGenerator
@@ -6,6 +7,7 @@ from typing import Any, Dict
 import random
 
 
+@reads('consumer_banking.statements')
 def generate_random_statement_amount(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random consumer banking statement amount with plausible values.
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from ..enterprise.enums import CurrencyCode
 from .enums import BenefitType
 from data_generator import DataGenerator, SkipRowGenerationError
@@ -6,6 +7,7 @@ from typing import Any, Dict
 import random
 
 
+@reads('consumer_banking.accounts', 'consumer_banking.products', 'consumer_banking.statements')
 def generate_random_statement_benefit(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random consumer banking statement benefit with plausible values.
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .enums import StatementDateType
 from data_generator import DataGenerator, SkipRowGenerationError
 from datetime import datetime, timedelta
@@ -6,6 +7,7 @@ from typing import Any, Dict
 import random
 
 
+@reads('consumer_banking.statements')
 def generate_random_statement_date_time(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random statement date time with plausible values.
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from ..enterprise.enums import CreditDebitIndicator, CurrencyCode
 from .enums import FeeFrequency, FeeType, RateType
 from data_generator import DataGenerator, SkipRowGenerationError
@@ -6,6 +7,7 @@ from typing import Any, Dict
 import random
 
 
+@reads('consumer_banking.accounts', 'consumer_banking.products', 'consumer_banking.statements')
 def generate_random_statement_fee(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random statement fee with plausible values.
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .enums import StatementRateType
 from data_generator import DataGenerator
 from datetime import datetime, timedelta
@@ -7,6 +8,7 @@ import pytz
 import random
 
 
+@reads('consumer_banking.accounts', 'consumer_banking.products', 'consumer_banking.statements')
 def generate_random_statement_rate(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random statement rate with plausible values.
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .enums import StatementValueType
 from data_generator import DataGenerator, SkipRowGenerationError
 from datetime import datetime
@@ -9,6 +10,7 @@ import pytz
 import random
 
 
+@reads('consumer_banking.accounts', 'consumer_banking.statements')
 def generate_random_statement_value(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random statement value with plausible values.
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from ..enterprise.enums import CreditDebitIndicator, CurrencyCode
 from .enums import BalanceType
 from data_generator import DataGenerator
@@ -6,6 +7,7 @@ from typing import Any, Dict
 import random
 
 
+@reads('consumer_banking.balances', 'consumer_banking.transactions')
 def generate_random_transaction_balance(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random transaction balance with plausible values,
@@ -1,8 +1,10 @@
+from ...helpers.reads import reads
 from .enums import TransactionBankCode
 from data_generator import DataGenerator, SkipRowGenerationError
 from typing import Any, Dict
 
 prev_codes = set()
+@reads('consumer_banking.transactions')
 def generate_random_transaction_bank_transaction_code(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random bank transaction code record with plausible values.
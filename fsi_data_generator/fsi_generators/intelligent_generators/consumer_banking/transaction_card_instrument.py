@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from ..enterprise.enums import CurrencyCode, PartyType
 from .enums import (AuthorizationType, CardSchemeName, TransactionCategory,
                     TransactionType)
@@ -7,6 +8,8 @@ from typing import Any, Dict, Optional
 import random
 
 
+@reads('consumer_banking.accounts', 'consumer_banking.transactions', 'enterprise.account_ownership',
+       'enterprise.parties', 'enterprise.party_relationships')
 def generate_random_transaction_card_instrument(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random transaction card instrument with plausible values.
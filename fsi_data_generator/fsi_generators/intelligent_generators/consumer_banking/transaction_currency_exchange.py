@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from ..enterprise.enums import CurrencyCode
 from .enums import ExchangeRateProvider, ExchangeRateType
 from data_generator import DataGenerator, SkipRowGenerationError
@@ -7,6 +8,7 @@ import datetime
 import random
 
 
+@reads('consumer_banking.transactions')
 def generate_random_transaction_currency_exchange(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random transaction currency exchange with plausible values.
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from ..consumer_banking.enums import TransactionCategory, TransactionType
 from ..enterprise import (generate_financial_institution_identifier,
                           generate_financial_institution_name)
@@ -7,6 +8,7 @@ from typing import Any, Dict
 import random
 
 
+@reads('consumer_banking.transactions')
 def generate_random_transaction_debtor_agent(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random transaction debtor agent with plausible values.
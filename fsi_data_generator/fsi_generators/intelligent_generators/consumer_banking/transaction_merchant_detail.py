@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .enums import TransactionCategory, TransactionType
 from data_generator import DataGenerator, SkipRowGenerationError
 from typing import Any, Dict, Optional
@@ -5,6 +6,7 @@ from typing import Any, Dict, Optional
 import random
 
 
+@reads('consumer_banking.transactions')
 def generate_random_transaction_merchant_detail(id_fields: Dict[str, Any], dg: DataGenerator) -> Optional[
     Dict[str, Any]]:
     """
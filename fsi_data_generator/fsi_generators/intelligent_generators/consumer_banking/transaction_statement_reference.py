@@ -1,7 +1,9 @@
+from ...helpers.reads import reads
 from data_generator import DataGenerator, SkipRowGenerationError
 from typing import Any, Dict
 
 
+@reads('consumer_banking.statements', 'consumer_banking.transactions')
 def generate_random_transaction_statement_reference(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random transaction statement reference with plausible values.
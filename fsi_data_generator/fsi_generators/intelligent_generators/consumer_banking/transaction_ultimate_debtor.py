@@ -1,9 +1,12 @@
+from ...helpers.reads import reads
 from data_generator import DataGenerator, SkipRowGenerationError
 from typing import Any, Dict
 
 import random
 
 
+@reads('consumer_banking.transaction_debtor_accounts', 'consumer_banking.transaction_debtor_agents',
+       'consumer_banking.transactions')
 def generate_random_transaction_ultimate_debtor(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random transaction ultimate debtor with plausible values.
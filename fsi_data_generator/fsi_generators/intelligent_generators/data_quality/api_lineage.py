@@ -7,6 +7,7 @@ import psycopg2
 from faker import Faker
 
 from data_generator import DataGenerator, SkipRowGenerationError
+from ...helpers.reads import reads
 
 logger = logging.getLogger(__name__)
 fake = Faker()  # Initialize Faker
@@ -15,6 +16,7 @@ fake = Faker()  # Initialize Faker
 api_paths_per_app = {}
 
 
+@reads('app_mgmt.applications', 'security.hosts')
 def generate_random_api_lineage(_id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random "data_quality"."api_lineage" record with reasonable values.
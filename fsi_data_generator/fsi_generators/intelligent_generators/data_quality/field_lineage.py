@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from typing import Any, Dict
 import logging
 import psycopg2
@@ -12,6 +13,7 @@ fake = Faker()  # Initialize Faker
 field_lineages_by_record = {}
 
 
+@reads('data_quality.api_lineage', 'data_quality.record_lineage')
 def generate_random_field_lineage(_id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random "data_quality"."field_lineage" record with reasonable values.
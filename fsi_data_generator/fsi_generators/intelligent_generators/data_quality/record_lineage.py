@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from typing import Any, Dict
 import logging
 import psycopg2
@@ -12,6 +13,7 @@ fake = Faker()  # Initialize Faker
 record_lineages_by_api = {}
 
 
+@reads('app_mgmt.applications', 'data_quality.api_lineage')
 def generate_random_record_lineage(_id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random "data_quality"."record_lineage" record with reasonable values.
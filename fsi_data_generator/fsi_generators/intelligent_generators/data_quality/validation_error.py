@@ -2,7 +2,10 @@ import json
 import random
 from typing import Any, Dict, List
 
+from ...helpers.reads import reads
 
+
+@reads('data_quality.validation_run')
 def generate_random_validation_error(id_fields: Dict[str, Any], dg: Any = None) -> Dict[str, Any]:
     """
     Generate a random data quality validation error with plausible values that are consistent
@@ -5,7 +5,10 @@ import random
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from ...helpers.reads import reads
 
+
+@reads('security.accounts', 'security.identities', 'security.roles')
 def generate_random_validation_run(id_fields: Dict[str, Any], dg: Any = None) -> Dict[str, Any]:
     """
     Generate a random data quality validation run with plausible values for GraphQL API validation.
@@ -17,11 +20,6 @@ def generate_random_validation_run(id_fields: Dict[str, Any], dg: Any = None) ->
     Returns:
         Dictionary containing randomly generated validation run data
     """
-    # Get database connection if available
-    conn = None
-    if dg is not None:
-        conn = dg.conn
-
     # Use the timestamp from id_fields or current time
     run_timestamp = id_fields.get('run_timestamp', datetime.now())
 
@@ -50,18 +48,10 @@ def generate_random_validation_run(id_fields: Dict[str, Any], dg: Any = None) ->
     # Instead of hardcoded roles, fetch roles from security system if connection available
     # Otherwise fall back to sample roles
     roles: List[Optional[str]] = []
-    if conn:
-        cursor = conn.cursor()
+    if dg is not None:
         try:
-            # Query roles from the security.roles table
-            cursor.execute("""
-                SELECT role_name 
-                FROM security.roles 
-                WHERE status = 'ACTIVE'
-                ORDER BY RANDOM()
-                LIMIT 20
-            """)
-            roles = [row[0] for row in cursor.fetchall()]
+            # Sample roles from the security.roles table
+            roles = [row['role_name'] for row in dg.sample('security.roles', 20, where={'status': 'ACTIVE'})]
 
             # If no roles found, use fallback roles
             if not roles:
@@ -71,8 +61,6 @@ def generate_random_validation_run(id_fields: Dict[str, Any], dg: Any = None) ->
             # If query fails, use fallback roles
             print(f"Warning: Could not fetch roles from database: {e}")
             roles = _get_fallback_roles()
-        finally:
-            cursor.close()
     else:
         # No connection available, use fallback roles
         roles = _get_fallback_roles()
@@ -244,7 +232,7 @@ def generate_random_validation_run(id_fields: Dict[str, Any], dg: Any = None) ->
         # Include the ID field from id_fields
         "run_timestamp": run_timestamp,
         "source_identifier": random.choice(source_systems),
-        "run_user": _get_random_user(conn) if conn else f"user_{random.randint(1000, 9999)}",
+        "run_user": _get_random_user(dg) if dg is not None else f"user_{random.randint(1000, 9999)}",
         "run_role": random.choice(roles),
         "operation_name": operation_name,
         "variables": json.dumps(variables),
@@ -276,43 +264,24 @@ def _get_fallback_roles():
     ]
 
 
-def _get_random_user(conn):
+def _get_random_user(dg):
     """Get a random username from the security system"""
-    if not conn:
+    if dg is None:
         return f"user_{random.randint(1000, 9999)}"
 
-    cursor = conn.cursor()
     try:
         # Try to get a random identity name from the security system
-        cursor.execute("""
-            SELECT name 
-            FROM security.identities 
-            WHERE inactive = FALSE
-            ORDER BY RANDOM()
-            LIMIT 1
-        """)
-
-        result = cursor.fetchone()
+        result = dg.sample('security.identities', where={'inactive': False})
         if result:
-            return result[0]
+            return result[0]['name']
 
         # If no identities found, try accounts
-        cursor.execute("""
-            SELECT name 
-            FROM security.accounts 
-            WHERE disabled = FALSE
-            ORDER BY RANDOM()
-            LIMIT 1
-        """)
-
-        result = cursor.fetchone()
+        result = dg.sample('security.accounts', where={'disabled': False})
         if result:
-            return result[0]
+            return result[0]['name']
 
         # Fallback
         return f"user_{random.randint(1000, 9999)}"
     except Exception as e:
         print(f"Warning: Could not fetch users from database: {e}")
         return f"user_{random.randint(1000, 9999)}"
-    finally:
-        cursor.close()
@@ -3,11 +3,11 @@ __all__ = ['account', 'address', 'associate', 'building', 'customer_demographic'
            'generate_department_name_for_operating_unit', 'generate_financial_institution_identifier',
            'generate_financial_institution_identifier_for_type', 'generate_financial_institution_name',
            'generate_identification_for_scheme', 'generate_random_account', 'generate_random_address',
-           'generate_random_associate', 'generate_random_building', 'generate_random_customer_demographics',
-           'generate_random_department', 'generate_random_enterprise_identifier', 'generate_random_party',
-           'generate_random_party_entity_address', 'generate_random_party_relationship', 'generate_random_permission',
-           'get_existing_building_names', 'get_existing_department_names', 'get_existing_party_names',
-           'get_existing_permission_names', 'party', 'party_entity_address', 'party_relationship', 'permission']
+           'generate_random_addresses', 'generate_random_associate', 'generate_random_building',
+           'generate_random_customer_demographics', 'generate_random_department',
+           'generate_random_enterprise_identifier', 'generate_random_party', 'generate_random_party_entity_address',
+           'generate_random_party_relationship', 'generate_random_permission', 'party', 'party_entity_address',
+           'party_relationship', 'permission']
 
 from . import account
 from . import address
@@ -22,21 +22,18 @@ from . import party_relationship
 from . import permission
 from .account import generate_random_account
 from .address import generate_random_address
+from .address import generate_random_addresses
 from .associate import generate_random_associate
 from .building import generate_random_building
-from .building import get_existing_building_names
 from .customer_demographic import generate_random_customer_demographics
 from .department import generate_department_name_for_operating_unit
 from .department import generate_random_department
-from .department import get_existing_department_names
 from .enterprise_identifier import generate_identification_for_scheme
 from .enterprise_identifier import generate_random_enterprise_identifier
 from .generate_financial_institution_identifier import generate_financial_institution_identifier
 from .generate_financial_institution_identifier import generate_financial_institution_identifier_for_type
 from .generate_financial_institution_identifier import generate_financial_institution_name
 from .party import generate_random_party
-from .party import get_existing_party_names
 from .party_entity_address import generate_random_party_entity_address
 from .party_relationship import generate_random_party_relationship
 from .permission import generate_random_permission
-from .permission import get_existing_permission_names
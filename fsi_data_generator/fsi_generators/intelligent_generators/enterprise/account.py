@@ -1,9 +1,8 @@
-from ...helpers.generate_unique_json_array import generate_unique_json_array
+from ...helpers.generate_unique_json_array import anthropic, generate_unique_json_array
 from .enums import AccountStatus
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Set
 
-import anthropic
 import logging
 import random
 
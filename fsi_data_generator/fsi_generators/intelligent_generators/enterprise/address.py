@@ -1,10 +1,13 @@
 from ...helpers.parse_address import parse_address
+from ...helpers.random_record import batch_generator
+from ...helpers.random_streams import current_numpy
 from .enums import AddressType
 from data_generator import DataGenerator
 from faker import Faker
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import logging
+import numpy as np
 import random
 import re
 
@@ -12,21 +15,26 @@ logger = logging.getLogger(__name__)
 fake = Faker()  # Initialize Faker
 
 
-def generate_random_address(_id_fields: Dict[str, Any], _dg: DataGenerator) -> Dict[str, Any]:
-    """
-    Generate a random "enterprise.addresses" record with reasonable values.
+# Neighbourhoods used as town_location_name, by a name that appears in the city
+TOWN_LOCATIONS = {
+    'new york': ["Manhattan", "Brooklyn", "Queens", "Bronx", "Staten Island"],
+    'nyc': ["Manhattan", "Brooklyn", "Queens", "Bronx", "Staten Island"],
+    'chicago': ["Loop", "Lincoln Park", "Wicker Park", "Hyde Park", "Lakeview",
+                "River North", "Gold Coast", "Uptown", "Pilsen", "Bucktown"],
+    'los angeles': ["Hollywood", "Venice", "Downtown", "Silver Lake", "Echo Park",
+                    "Koreatown", "Westwood", "Beverly Hills", "Brentwood", "Los Feliz"],
+    'san francisco': ["Mission", "Marina", "SOMA", "Nob Hill", "Castro",
+                      "Haight-Ashbury", "North Beach", "Chinatown", "Financial District", "Richmond"],
+    'boston': ["Back Bay", "Beacon Hill", "North End", "South End", "Fenway",
+               "Allston", "Brighton", "Roxbury", "Charlestown", "Jamaica Plain"]
+}
 
-    Args:
-        _id_fields: Dictionary containing the required ID fields (enterprise_address_id)
-        _dg: DataGenerator instance
 
-    Returns:
-        Dictionary containing randomly generated address data (without ID fields)
+def _street_address():
+    """
+    A parsed Faker address, preferably a standard street address with a building number (not a PO Box or a
+    military address), and its building number, street name and unit number.
     """
-
-    # Choose a random address type
-    address_type = AddressType.get_random()
-
     # Generate a standard street address (keep trying until we get one)
     parsed_address = None
     parsed = None
@@ -63,6 +71,45 @@ def generate_random_address(_id_fields: Dict[str, Any], _dg: DataGenerator) -> D
         building_number = ""
         street_name = parsed_address.get('street_address', '')
 
+    # Check for unit/apt number in street name
+    unit_number = None
+    if street_name:
+        unit_match = re.search(r'(Apt\.?|Apartment|Unit|Suite|#)\s*([0-9A-Za-z-]+)', street_name)
+        if unit_match:
+            unit_number = f"{unit_match.group(1)} {unit_match.group(2)}"
+            street_name = street_name.replace(unit_match.group(0), '').strip()
+
+    return parsed_address, building_number, street_name, unit_number
+
+
+def _town_location_name(city):
+    """A neighbourhood of the city for the few US cities that have them, else None."""
+    # For US addresses, only generate town_location_name for specific cities
+    # (e.g., NYC boroughs, Chicago neighborhoods, etc.)
+    city = city.lower()
+    for name, locations in TOWN_LOCATIONS.items():
+        if name in city:
+            return random.choice(locations)
+    return None
+
+
+def generate_random_address(_id_fields: Dict[str, Any], _dg: DataGenerator) -> Dict[str, Any]:
+    """
+    Generate a random "enterprise.addresses" record with reasonable values.
+
+    Args:
+        _id_fields: Dictionary containing the required ID fields (enterprise_address_id)
+        _dg: DataGenerator instance
+
+    Returns:
+        Dictionary containing randomly generated address data (without ID fields)
+    """
+
+    # Choose a random address type
+    address_type = AddressType.get_random()
+
+    parsed_address, building_number, street_name, unit_number = _street_address()
+
     # Generate additional fields based on probability
     has_department = random.random() < 0.15  # 15% chance
     has_sub_department = has_department and random.random() < 0.3  # 30% of those with department
@@ -78,50 +125,9 @@ def generate_random_address(_id_fields: Dict[str, Any], _dg: DataGenerator) -> D
     building_name = f"{fake.last_name()} Building" if has_building_name else None
     floor = str(random.randint(1, 50)) if has_floor else None
     room = f"Suite {random.randint(100, 999)}" if has_room else None
-
-    # For US addresses, only generate town_location_name for specific cities
-    # (e.g., NYC boroughs, Chicago neighborhoods, etc.)
-    town_location_name = None
-    if has_town_location:
-        city = parsed_address.get('city', '').lower()
-        if 'new york' in city or 'nyc' in city:
-            # NYC boroughs
-            town_location_name = random.choice(["Manhattan", "Brooklyn", "Queens", "Bronx", "Staten Island"])
-        elif 'chicago' in city:
-            # Chicago neighborhoods
-            town_location_name = random.choice([
-                "Loop", "Lincoln Park", "Wicker Park", "Hyde Park", "Lakeview",
-                "River North", "Gold Coast", "Uptown", "Pilsen", "Bucktown"
-            ])
-        elif 'los angeles' in city:
-            # LA neighborhoods
-            town_location_name = random.choice([
-                "Hollywood", "Venice", "Downtown", "Silver Lake", "Echo Park",
-                "Koreatown", "Westwood", "Beverly Hills", "Brentwood", "Los Feliz"
-            ])
-        elif 'san francisco' in city:
-            # SF neighborhoods
-            town_location_name = random.choice([
-                "Mission", "Marina", "SOMA", "Nob Hill", "Castro",
-                "Haight-Ashbury", "North Beach", "Chinatown", "Financial District", "Richmond"
-            ])
-        elif 'boston' in city:
-            # Boston neighborhoods
-            town_location_name = random.choice([
-                "Back Bay", "Beacon Hill", "North End", "South End", "Fenway",
-                "Allston", "Brighton", "Roxbury", "Charlestown", "Jamaica Plain"
-            ])
-
+    town_location_name = _town_location_name(parsed_address.get('city', '')) if has_town_location else None
     care_of = f"C/O {fake.name()}" if has_care_of else None
 
-    # Check for unit/apt number in street name
-    unit_number = None
-    if street_name:
-        unit_match = re.search(r'(Apt\.?|Apartment|Unit|Suite|#)\s*([0-9A-Za-z-]+)', street_name)
-        if unit_match:
-            unit_number = f"{unit_match.group(1)} {unit_match.group(2)}"
-            street_name = street_name.replace(unit_match.group(0), '').strip()
-
     # Create the address record
     address = {
         "address_type": address_type.value,
@@ -144,3 +150,57 @@ def generate_random_address(_id_fields: Dict[str, Any], _dg: DataGenerator) -> D
     }
 
     return address
+
+
+def generate_random_addresses(_id_fields_batch: List[Dict[str, Any]], _dg: DataGenerator,
+                              n: int) -> Dict[str, list]:
+    """
+    Generate n random "enterprise.addresses" records at once, see generate_random_address and batch_generator.
+    The address types, optional field flags and numbers are drawn with NumPy; Faker is only called for the
+    street addresses and the optional fields a row has.
+
+    Args:
+        _id_fields_batch: ID fields of each row (ignored)
+        _dg: DataGenerator instance
+        n: Number of records
+
+    Returns:
+        Dict of column name -> list of n values
+    """
+    rng = current_numpy()
+    address_types = [member.value for member in AddressType.get_members()]
+    streets = [_street_address() for _ in range(n)]
+
+    # Optional fields, with the same probabilities as generate_random_address
+    has_department, has_sub_department, has_building_name, has_floor, has_room, has_town_location, has_care_of = \
+        (rng.random_sample(size=(7, n)) < np.array([[0.15], [0.3], [0.2], [0.15], [0.1], [0.25], [0.1]])).tolist()
+    floors = rng.randint(1, 51, size=n).tolist()
+    rooms = rng.randint(100, 1000, size=n).tolist()
+
+    department = [fake.company_suffix() if flag else None for flag in has_department]
+    cities = [parsed_address.get('city', '') for parsed_address, _, _, _ in streets]
+
+    return {
+        "address_type": [address_types[i] for i in AddressType.get_random_batch(n).tolist()],
+        "department": department,
+        "sub_department": [f"{d} Division" if d is not None and flag else None
+                           for d, flag in zip(department, has_sub_department)],
+        "street_name": [street_name for _, _, street_name, _ in streets],
+        "building_number": [building_number for _, building_number, _, _ in streets],
+        "building_name": [f"{fake.last_name()} Building" if flag else None for flag in has_building_name],
+        "floor": [str(floor) if flag else None for floor, flag in zip(floors, has_floor)],
+        "room": [f"Suite {room}" if flag else None for room, flag in zip(rooms, has_room)],
+        "unit_number": [unit_number for _, _, _, unit_number in streets],
+        "post_box": [None] * n,
+        "town_location_name": [_town_location_name(city) if flag else None
+                               for city, flag in zip(cities, has_town_location)],
+        "district_name": [None] * n,
+        "care_of": [f"C/O {fake.name()}" if flag else None for flag in has_care_of],
+        "post_code": [parsed_address.get('post_code', '') for parsed_address, _, _, _ in streets],
+        "town_name": cities,
+        "country_sub_division": [parsed_address.get('state', '') for parsed_address, _, _, _ in streets],
+        "country": ["US"] * n
+    }
+
+
+batch_generator(generate_random_address, generate_random_addresses)
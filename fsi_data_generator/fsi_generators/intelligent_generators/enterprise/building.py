@@ -1,4 +1,5 @@
 from ...helpers.generate_unique_json_array import generate_unique_json_array
+from ...helpers.unique_generator import unique_generator
 from .enums import BuildingType
 from data_generator import DataGenerator
 from faker import Faker
@@ -6,13 +7,15 @@ from typing import Any, Dict
 
 import datetime
 import logging
-import psycopg2
 import random
 
 logger = logging.getLogger(__name__)
 fake = Faker()  # Initialize Faker
 
+BUILDING_NAMES = 'enterprise.buildings.building_name'
 
+
+@unique_generator
 def generate_random_building(_id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random "enterprise.buildings" record with reasonable values.
@@ -25,12 +28,6 @@ def generate_random_building(_id_fields: Dict[str, Any], dg: DataGenerator) -> D
         Dictionary containing randomly generated building data (without ID fields)
     """
 
-    # Get connection for fetching related data
-    conn = dg.conn
-
-    # First, get existing building names to avoid duplicates
-    existing_building_names = get_existing_building_names(conn)
-
     # Default fallback values for building names
     building_prefixes = ["Main", "Downtown", "Corporate", "Regional", "North", "South", "East", "West", "Central"]
     building_suffixes = ["Branch", "Office", "Tower", "Plaza", "Building", "Campus", "Center", "Facility"]
@@ -53,15 +50,11 @@ def generate_random_building(_id_fields: Dict[str, Any], dg: DataGenerator) -> D
         # Continue with fallback values
         building_names = [f"{prefix} {suffix}" for prefix in building_prefixes for suffix in building_suffixes]
 
-    # Choose a building name and ensure it's unique
-    available_names = [name for name in building_names if name not in existing_building_names]
-
-    if not available_names:
-        # If we've run out of available names, create a new unique name
-        timestamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%d%H%M%S")
-        building_name = f"{random.choice(building_prefixes)} {random.choice(building_suffixes)} {timestamp[-4:]}"
-    else:
-        building_name = random.choice(available_names)
+    # Choose a building name unique among the existing and generated ones, numbered once every name is taken
+    taken = dg.unique_values.taken(BUILDING_NAMES)
+    available_names = [name for name in building_names if name not in taken] or building_names
+    building_name = dg.unique_values.unique(BUILDING_NAMES, random.choice, available_names,
+                                            fallback=lambda name, n: f"{name} {n + 1}")
 
     # Choose building type with appropriate weighting using enum
     # BRANCH should be the most common type
@@ -130,32 +123,3 @@ def generate_random_building(_id_fields: Dict[str, Any], dg: DataGenerator) -> D
     }
 
     return building
-
-
-def get_existing_building_names(conn) -> list:
-    """
-    Get all existing building names from the database.
-
-    Args:
-        conn: PostgreSQL connection object
-
-    Returns:
-        List of existing building names
-    """
-    try:
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT building_name
-            FROM enterprise.buildings
-        """)
-
-        results = cursor.fetchall()
-        cursor.close()
-
-        # Extract the names from the results
-        return [result[0] for result in results] if results else []
-
-    except (Exception, psycopg2.Error) as error:
-        logger.error(f"Error fetching existing building names: {error}")
-        return []  # Return empty list on error to avoid blocking generation
@@ -3,11 +3,14 @@ import random
 from typing import Any, Dict
 
 from data_generator import DataGenerator, SkipRowGenerationError
+from ...helpers.reads import reads
 from .enums import (EducationLevel, IncomeBracket, OccupationCategory,
                     HomeownershipStatus, PoliticalAffiliation, FamilyLifeStage,
                     LifestyleSegment, CreditRiskTier)
 
 
+@reads('consumer_banking.accounts', 'credit_cards.card_accounts', 'enterprise.account_ownership', 'enterprise.parties',
+       'mortgage_services.application_borrowers', 'mortgage_services.borrowers', 'mortgage_services.loans')
 def generate_random_customer_demographics(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate random customer demographic data with plausible values and correlations.
@@ -1,18 +1,19 @@
+from ...helpers.unique_generator import unique_generator
 from .enums.operating_unit import OperatingUnit
 from data_generator import DataGenerator, SkipRowGenerationError
 from faker import Faker
 from typing import Any, Dict
 
 import logging
-import psycopg2
 import random
 
 logger = logging.getLogger(__name__)
 fake = Faker()  # Initialize Faker
 
-prev_department = set()
+DEPARTMENT_NAMES = 'enterprise.departments.department_name'
 
 
+@unique_generator
 def generate_random_department(_id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random "enterprise.departments" record with reasonable values.
@@ -24,17 +25,14 @@ def generate_random_department(_id_fields: Dict[str, Any], dg: DataGenerator) ->
     Returns:
         Dictionary containing randomly generated department data (without ID fields)
     """
-    # Get connection for fetching related data
-    conn = dg.conn
-
-    # First, get existing department names to avoid duplicates (as department_name is unique)
-    existing_department_names = get_existing_department_names(conn)
+    # Existing and generated department names, to avoid duplicates (as department_name is unique)
+    taken = dg.unique_values.taken(DEPARTMENT_NAMES)
 
     # Choose a random operating unit
     operating_unit = OperatingUnit.get_random()
 
     # Create department names based on operating unit
-    department_name = generate_department_name_for_operating_unit(operating_unit, existing_department_names)
+    department_name = generate_department_name_for_operating_unit(operating_unit, taken)
 
     # Create the department record
     department = {
@@ -44,11 +42,10 @@ def generate_random_department(_id_fields: Dict[str, Any], dg: DataGenerator) ->
         # in _id_fields or managed by the system/data insertion process
     }
 
-    if department_name in prev_department:
+    # Another worker may have taken the name since
+    if not dg.unique_values.reserve(DEPARTMENT_NAMES, department_name):
         raise SkipRowGenerationError
 
-    prev_department.add(department_name)
-
     return department
 
 
@@ -151,32 +148,3 @@ def generate_department_name_for_operating_unit(operating_unit, existing_names):
             new_name = f"{prefix} {base_name}"
             if new_name not in existing_names:
                 return new_name
-
-
-def get_existing_department_names(conn) -> list:
-    """
-    Get all existing department names from the database.
-
-    Args:
-        conn: PostgreSQL connection object
-
-    Returns:
-        List of existing department names
-    """
-    try:
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT department_name
-            FROM enterprise.departments
-        """)
-
-        results = cursor.fetchall()
-        cursor.close()
-
-        # Extract the names from the results
-        return [result[0] for result in results] if results else []
-
-    except (Exception, psycopg2.Error) as error:
-        logger.error(f"Error fetching existing department names: {error}")
-        return []  # Return empty list on error to avoid blocking generation
@@ -1,19 +1,21 @@
+from ...helpers.unique_generator import unique_generator
 from .enums import (CitizenshipStatus, LegalStructure, MaritalStatus,
                     PartyStatus, PartyType)
 from data_generator import DataGenerator
 from faker import Faker
 from typing import Any, Dict
 
-import datetime
 import logging
-import psycopg2
 import random
 import string
 
 logger = logging.getLogger(__name__)
 fake = Faker()  # Initialize Faker
 
+PARTY_NAMES = 'enterprise.parties.name'
 
+
+@unique_generator
 def generate_random_party(_id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random "enterprise.parties" record with reasonable values.
@@ -26,33 +28,19 @@ def generate_random_party(_id_fields: Dict[str, Any], dg: DataGenerator) -> Dict
         Dictionary containing randomly generated party data (without ID fields)
     """
     try:
-        # Get connection for fetching related data
-        conn = dg.conn
-
-        # First, get existing party names to avoid duplicates
-        existing_party_names = get_existing_party_names(conn)
-
         # Choose party type with roughly equal distribution
         party_type: PartyType = PartyType.get_random()
 
         # Generate name based on party type
         if party_type == PartyType.INDIVIDUAL:
             name = f"{fake.first_name()} {fake.last_name()}"
+            # Individuals may share a name, but no organization should take it
+            dg.unique_values.seed(PARTY_NAMES, [name])
             full_business_legal_name = None
         else:  # ORGANIZATION
-            # Generate a company name and make sure it's unique
-            name = fake.company()
-
-            # Check for uniqueness and regenerate if needed
-            attempts = 0
-            while name in existing_party_names and attempts < 10:
-                name = fake.company()
-                attempts += 1
-
-            # If still not unique, add a timestamp
-            if name in existing_party_names:
-                timestamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%d%H%M%S")
-                name = f"{name} {timestamp[-4:]}"
+            # Generate a company name unique among the existing and generated party names, numbered if needed
+            name = dg.unique_values.unique(PARTY_NAMES, fake.company, max_attempts=10,
+                                           fallback=lambda company, n: f"{company} {n + 1}")
 
             full_business_legal_name = name + (", LLC" if random.random() < 0.5 else ", Inc.")
 
@@ -133,32 +121,3 @@ def generate_random_party(_id_fields: Dict[str, Any], dg: DataGenerator) -> Dict
     except Exception as e:
         # Raise the exception if anything unexpected occurs
         raise e
-
-
-def get_existing_party_names(conn) -> list:
-    """
-    Get all existing party names from the database.
-
-    Args:
-        conn: PostgreSQL connection object
-
-    Returns:
-        List of existing party names
-    """
-    try:
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT name
-            FROM enterprise.parties
-        """)
-
-        results = cursor.fetchall()
-        cursor.close()
-
-        # Extract the names from the results
-        return [result.get('name') for result in results] if results else []
-
-    except (Exception, psycopg2.Error) as error:
-        logger.error(f"Error fetching existing party names: {error}")
-        return []  # Return empty list on error to avoid blocking generation
@@ -1,14 +1,17 @@
 from ...helpers.generate_unique_json_array import generate_unique_json_array
+from ...helpers.unique_generator import unique_generator
 from data_generator import DataGenerator
 from typing import Any, Dict
 
 import logging
-import psycopg2
 import random
 
 logger = logging.getLogger(__name__)
 
+PERMISSION_NAMES = 'enterprise.permissions.permission_name'
 
+
+@unique_generator
 def generate_random_permission(_id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random "enterprise.permissions" record with reasonable values.
@@ -20,12 +23,6 @@ def generate_random_permission(_id_fields: Dict[str, Any], dg: DataGenerator) ->
     Returns:
         Dictionary containing randomly generated permission data (without ID fields)
     """
-    # Get connection for fetching related data
-    conn = dg.conn
-
-    # First, get existing permission names to avoid duplicates
-    existing_permission_names = get_existing_permission_names(conn)
-
     # Default fallback values for permission names
     permission_actions = ["read", "write", "update", "delete", "create", "view", "manage", "execute", "approve",
                           "reject", "modify", "export", "import", "list", "search"]
@@ -53,17 +50,15 @@ def generate_random_permission(_id_fields: Dict[str, Any], dg: DataGenerator) ->
         permission_names = [f"{action}_{resource}" for action in permission_actions for resource in
                             permission_resources]
 
-    # Choose a permission name and ensure it's unique
-    available_names = [name for name in permission_names if name not in existing_permission_names]
-
+    # Choose a permission name unique among the existing and generated ones, falling back to the combinations of
+    # actions and resources, and numbered once every combination is taken
+    taken = dg.unique_values.taken(PERMISSION_NAMES)
+    available_names = [name for name in permission_names if name not in taken]
     if not available_names:
-        # If we've run out of available names, create a new unique combination
-        while True:
-            permission_name = f"{random.choice(permission_actions)}_{random.choice(permission_resources)}"
-            if permission_name not in existing_permission_names:
-                break
-    else:
-        permission_name = random.choice(available_names)
+        available_names = [f"{action}_{resource}" for action in permission_actions for resource in
+                           permission_resources if f"{action}_{resource}" not in taken] or permission_names
+    permission_name = dg.unique_values.unique(PERMISSION_NAMES, random.choice, available_names,
+                                              fallback=lambda name, n: f"{name}_{n + 1}")
 
     # Create the permission record
     permission = {
@@ -71,32 +66,3 @@ def generate_random_permission(_id_fields: Dict[str, Any], dg: DataGenerator) ->
     }
 
     return permission
-
-
-def get_existing_permission_names(conn) -> list:
-    """
-    Get all existing permission names from the database.
-
-    Args:
-        conn: PostgreSQL connection object
-
-    Returns:
-        List of existing permission names
-    """
-    try:
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT permission_name
-            FROM enterprise.permissions
-        """)
-
-        results = cursor.fetchall()
-        cursor.close()
-
-        # Extract the names from the results
-        return [result[0] for result in results] if results else []
-
-    except (Exception, psycopg2.Error) as error:
-        logger.error(f"Error fetching existing permission names: {error}")
-        return []  # Return empty list on error to avoid blocking generation
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .enums import (ApplicationStatus, ApplicationType, LoanPurpose,
                     SubmissionChannel)
 from data_generator import DataGenerator
@@ -9,6 +10,7 @@ import datetime
 import random
 
 
+@reads('mortgage_services.loan_products')
 def generate_random_application(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random mortgage application with plausible values.
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .enums import BorrowerType, RelationshipType
 from data_generator import DataGenerator
 from fsi_data_generator.fsi_generators.intelligent_generators.enterprise.enums import \
@@ -6,6 +7,7 @@ from fsi_data_generator.fsi_generators.intelligent_generators.enterprise.enums i
 import random
 
 
+@reads('enterprise.parties', 'enterprise.party_relationships', 'mortgage_services.borrowers')
 def generate_random_application_borrower(ids_dict, dg: DataGenerator):
     """
     Generate a realistic random mortgage_services.application_borrowers record.
@@ -204,6 +206,8 @@ def generate_random_application_borrower(ids_dict, dg: DataGenerator):
                         SET contribution_percentage = %s
                         WHERE mortgage_services_application_borrower_id = %s
                     """, (new_primary_contribution, primary_borrower.get('mortgage_services_application_borrower_id')))
+                    dg.row_cache.invalidate("mortgage_services.application_borrowers",
+                                            primary_borrower.get('mortgage_services_application_borrower_id'))
 
                 except Exception as e:
                     raise e
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .enums import AssetType, VerificationStatus
 from data_generator import DataGenerator
 from datetime import datetime, timedelta, timezone
@@ -13,6 +14,7 @@ fake = Faker()
 logger = logging.getLogger(__name__)
 
 
+@reads('mortgage_services.application_borrowers', 'mortgage_services.applications')
 def generate_borrower_asset(ids_dict: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a single random, realistic borrower asset record for a mortgage application.
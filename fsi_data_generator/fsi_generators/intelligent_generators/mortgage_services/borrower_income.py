@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .employment import _get_application_info_for_borrower
 from .enums import (ApplicationStatus, IncomeFrequency, IncomeType,
                     VerificationStatus)
@@ -7,6 +8,7 @@ import datetime
 import random
 
 
+@reads('mortgage_services.application_borrowers', 'mortgage_services.applications')
 def generate_random_borrower_income(id_fields: Dict[str, Any], dg) -> Dict[str, Any]:
     """
     Generate a random mortgage services borrower income record with reasonable values.
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .enums import IncomeFrequency, LiabilityType, VerificationStatus
 from typing import Any, Dict
 
@@ -10,6 +11,7 @@ import sys
 logger = logging.getLogger(__name__)
 
 
+@reads('mortgage_services.borrower_employments', 'mortgage_services.borrower_incomes')
 def generate_random_borrower_liability(id_fields: Dict[str, Any], dg) -> Dict[str, Any]:
     """
     Generate a random mortgage services borrower liability record with reasonable values.
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .enums import DeliveryMethod, DisclosureType
 from typing import Any, Dict, Optional
 
@@ -9,6 +10,7 @@ import random
 logger = logging.getLogger(__name__)
 
 
+@reads('mortgage_services.loans')
 def generate_random_closing_disclosure(id_fields: Dict[str, Any], dg) -> Dict[str, Any]:
     """
     Generate a random mortgage services closing disclosure record with reasonable values.
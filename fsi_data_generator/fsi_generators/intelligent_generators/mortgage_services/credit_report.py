@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .enums import CreditBureau, CreditReportType, VerificationStatus
 from typing import Any, Dict, Optional
 
@@ -10,6 +11,7 @@ import sys
 logger = logging.getLogger(__name__)
 
 
+@reads('mortgage_services.application_borrowers', 'mortgage_services.applications', 'mortgage_services.borrowers')
 def generate_random_credit_report(id_fields: Dict[str, Any], dg) -> Dict[str, Any]:
     """
     Generate a random mortgage services credit report record with reasonable values.
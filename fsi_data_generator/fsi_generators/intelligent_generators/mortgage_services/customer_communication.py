@@ -1,10 +1,10 @@
+from ...helpers.reads import reads
 from .enums import (CommunicationDirection, CommunicationPurpose,
                     CommunicationStatus, CommunicationType)
-from fsi_data_generator.fsi_generators.helpers.generate_unique_json_array import \
-    generate_unique_json_array
+from fsi_data_generator.fsi_generators.helpers.generate_unique_json_array import (
+    anthropic, generate_unique_json_array)
 from typing import Any, Dict, Optional
 
-import anthropic
 import datetime
 import logging
 import psycopg2
@@ -13,6 +13,7 @@ import random
 logger = logging.getLogger(__name__)
 
 
+@reads('mortgage_services.applications', 'mortgage_services.servicing_accounts')
 def generate_random_customer_communication(id_fields: Dict[str, Any], dg) -> Dict[str, Any]:
     """
     Generate a random mortgage services customer communication record with realistic values.
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .enums import EmploymentType, VerificationStatus
 from dateutil.relativedelta import relativedelta
 from faker import Faker
@@ -13,6 +14,8 @@ fake = Faker()
 logger = logging.getLogger(__name__)
 
 
+@reads('enterprise.addresses', 'enterprise.buildings', 'enterprise.parties', 'enterprise.party_entity_addresses',
+       'mortgage_services.application_borrowers', 'mortgage_services.applications', 'mortgage_services.borrowers')
 def generate_random_borrower_employment(id_fields: Dict[str, Any], dg) -> Dict[str, Any]:
     """
     Generate a random mortgage services borrower employment record with reasonable values.
@@ -209,7 +212,7 @@ def generate_random_borrower_employment(id_fields: Dict[str, Any], dg) -> Dict[s
         monthly_income = round(random.uniform(2000, 5000), 2)
 
     # Get a random address ID for the employer - use the updated function
-    enterprise_address_id = _get_random_business_address_id(conn)
+    enterprise_address_id = _get_random_business_address_id(dg)
 
     # Generate phone with Faker
     phone = fake.phone_number()
@@ -367,57 +370,34 @@ def _get_application_info_for_borrower(borrower_id: Optional[int], conn) -> Opti
         return None
 
 
-def _get_random_business_address_id(conn) -> Optional[int]:
+def _get_random_business_address_id(dg) -> Optional[int]:
     """
     Get a random business address ID from the database.
 
     Args:
-        conn: PostgreSQL connection object
+        dg: DataGenerator instance
 
     Returns:
         Random business address ID or None if query fails
     """
-    try:
-        cursor = conn.cursor()
+    def has_address(row):
+        return row.get('enterprise_address_id') is not None
 
+    try:
         # Try to get an address for a business building
-        cursor.execute("""
-            SELECT a.enterprise_address_id 
-            FROM enterprise.addresses a
-            JOIN enterprise.buildings b ON a.enterprise_address_id = b.enterprise_address_id
-            WHERE b.building_type IN ('ADMINISTRATIVE', 'HEADQUARTERS')
-            ORDER BY RANDOM()
-            LIMIT 1
-        """)
-
-        result = cursor.fetchone()
+        result = dg.sample('enterprise.buildings', where={'building_type': ['ADMINISTRATIVE', 'HEADQUARTERS']},
+                           predicate=has_address)
 
         if not result:
             # If no business buildings found, try to get a business relationship address
-            cursor.execute("""
-                SELECT a.enterprise_address_id 
-                FROM enterprise.addresses a
-                JOIN enterprise.party_entity_addresses pea ON a.enterprise_address_id = pea.enterprise_address_id
-                WHERE pea.relationship_type = 'BUSINESS'
-                ORDER BY RANDOM()
-                LIMIT 1
-            """)
-
-            result = cursor.fetchone()
+            result = dg.sample('enterprise.party_entity_addresses', where={'relationship_type': 'BUSINESS'},
+                               predicate=has_address)
 
             if not result:
                 # Last resort - get any address
-                cursor.execute("""
-                    SELECT enterprise_address_id 
-                    FROM enterprise.addresses
-                    ORDER BY RANDOM()
-                    LIMIT 1
-                """)
-                result = cursor.fetchone()
+                result = dg.sample('enterprise.addresses')
 
-        cursor.close()
-
-        return result.get('enterprise_address_id')
+        return result[0].get('enterprise_address_id')
 
 
     except (Exception, psycopg2.Error) as error:
@@ -426,38 +406,28 @@ def _get_random_business_address_id(conn) -> Optional[int]:
 
 
 # Keep the original function for backward compatibility, but make it call the new function
-def get_random_address_id(conn, is_business: bool = False) -> Optional[int]:
+def get_random_address_id(dg, is_business: bool = False) -> Optional[int]:
     """
     Get a random address ID from the database, optionally filtering for business addresses.
 
     This function is maintained for backward compatibility.
 
     Args:
-        conn: PostgreSQL connection object
+        dg: DataGenerator instance
         is_business: Whether to prefer business addresses
 
     Returns:
         Random address ID or None if query fails
     """
     if is_business:
-        return _get_random_business_address_id(conn)
+        return _get_random_business_address_id(dg)
 
     try:
-        cursor = conn.cursor()
-
         # Get any random address
-        cursor.execute("""
-            SELECT enterprise_address_id 
-            FROM enterprise.addresses
-            ORDER BY RANDOM()
-            LIMIT 1
-        """)
-
-        result = cursor.fetchone()
-        cursor.close()
+        result = dg.sample('enterprise.addresses')
 
         if result:
-            return result[0]
+            return result[0].get('enterprise_address_id')
         else:
             # If no addresses found, return None
             return None
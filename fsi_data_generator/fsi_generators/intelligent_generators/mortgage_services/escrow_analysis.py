@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .enums import EscrowAnalysisStatus
 from typing import Any, Dict, Optional
 
@@ -9,6 +10,7 @@ import random
 logger = logging.getLogger(__name__)
 
 
+@reads('mortgage_services.servicing_accounts')
 def generate_random_escrow_analysis(id_fields: Dict[str, Any], dg) -> Dict[str, Any]:
     """
     Generate a random mortgage services escrow analysis record with reasonable values.
@@ -1,9 +1,9 @@
+from ...helpers.reads import reads
 from .enums import DisbursementStatus, DisbursementType
-from fsi_data_generator.fsi_generators.helpers.generate_unique_json_array import \
-    generate_unique_json_array
+from fsi_data_generator.fsi_generators.helpers.generate_unique_json_array import (
+    anthropic, generate_unique_json_array)
 from typing import Any, Dict, Optional
 
-import anthropic
 import datetime
 import logging
 import psycopg2
@@ -12,6 +12,8 @@ import random
 logger = logging.getLogger(__name__)
 
 
+@reads('mortgage_services.applications', 'mortgage_services.loans', 'mortgage_services.properties',
+       'mortgage_services.servicing_accounts')
 def generate_random_escrow_disbursement(id_fields: Dict[str, Any], dg) -> Dict[str, Any]:
     """
     Generate a random mortgage services escrow disbursement record with realistic values.
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .enums import (HmdaAgeGroup, HmdaApplicantPresent, HmdaApplicantType,
                     HmdaCollectionMethod, HmdaEthnicity, HmdaEthnicityDetail,
                     HmdaRace, HmdaRaceAsianDetail,
@@ -16,6 +17,9 @@ from data_generator import DataGenerator, SkipRowGenerationError
 processed_hmda_records = set()
 
 
+@reads('mortgage_services.application_borrowers', 'mortgage_services.applications',
+       'mortgage_services.borrower_employments', 'mortgage_services.borrower_incomes', 'mortgage_services.borrowers',
+       'mortgage_services.hmda_records')
 def generate_random_hmda_applicant_demographics(_id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate random HMDA applicant demographic information.
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .enums import HmdaEditStatus, HmdaEditType
 from data_generator import DataGenerator
 from fsi_data_generator.fsi_generators.helpers.generate_unique_json_array import \
@@ -12,6 +13,7 @@ import random
 logger = logging.getLogger(__name__)
 
 
+@reads('mortgage_services.hmda_records')
 def generate_random_hmda_edit(ids_dict, dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random HMDA edit record with realistic values based on HMDA record ID.
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .enums import (ApplicationStatus, ApplicationType, HmdaActionTaken,
                     HmdaAus, HmdaBalloonPayment,
                     HmdaBusinessOrCommercialPurpose, HmdaConstructionMethod,
@@ -23,6 +24,7 @@ import string
 logger = logging.getLogger(__name__)
 
 
+@reads('mortgage_services.applications', 'mortgage_services.loans', 'mortgage_services.properties')
 def generate_random_hmda_record(id_fields: Dict, dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random mortgage services HMDA record with reasonable values.
@@ -1,10 +1,10 @@
+from ...helpers.reads import reads
 from .enums import InsurancePolicyStatus, InsuranceType
 from data_generator import DataGenerator
-from fsi_data_generator.fsi_generators.helpers.generate_unique_json_array import \
-    generate_unique_json_array
+from fsi_data_generator.fsi_generators.helpers.generate_unique_json_array import (
+    anthropic, generate_unique_json_array)
 from typing import Any, Dict, Optional
 
-import anthropic
 import calendar
 import datetime
 import logging
@@ -15,6 +15,7 @@ import sys
 logger = logging.getLogger(__name__)
 
 
+@reads('mortgage_services.applications', 'mortgage_services.loans', 'mortgage_services.servicing_accounts')
 def generate_random_insurance_policy(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random mortgage services insurance policy record with reasonable values.
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .enums import HardshipReason, LoanModificationStatus, LoanModificationType
 from typing import Any, Dict, Optional
 
@@ -9,6 +10,7 @@ import random
 logger = logging.getLogger(__name__)
 
 
+@reads('mortgage_services.loans', 'mortgage_services.servicing_accounts')
 def generate_random_loan_modification(id_fields: Dict[str, Any], dg) -> Dict[str, Any]:
     """
     Generate a random mortgage services loan modification record with realistic values.
@@ -93,6 +93,7 @@ def generate_random_loan_product(ids_dict, dg: DataGenerator):
                     with conn.cursor() as cursor:
                         cursor.execute(update_query, (previous_discontinue_date.strftime("%Y-%m-%d"),
                                                       latest_product.get('product_code')))
+                    dg.row_cache.invalidate("mortgage_services.loan_products")
             else:
                 # If latest is not active, launch this one 1-30 days after the latest one was discontinued
                 # We don't know discontinue_date from our query, so estimate it based on next product's launch
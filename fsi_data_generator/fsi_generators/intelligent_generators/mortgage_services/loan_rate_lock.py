@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from typing import Any, Dict, Optional
 
 import datetime
@@ -8,6 +9,7 @@ import random
 logger = logging.getLogger(__name__)
 
 
+@reads('mortgage_services.loans')
 def generate_random_loan_rate_lock(id_fields: Dict[str, Any], dg) -> Dict[str, Any]:
     """
     Generate a random mortgage services loan rate lock record with reasonable values.
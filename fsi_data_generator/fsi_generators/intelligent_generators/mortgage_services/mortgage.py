@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .enums import ApplicationStatus, InterestRateType, LoanType
 from data_generator import DataGenerator, SkipRowGenerationError
 from datetime import datetime, timedelta, timezone
@@ -8,6 +9,7 @@ import random
 prev_app = set()
 
 
+@reads('mortgage_services.applications', 'mortgage_services.loan_products')
 def generate_random_mortgage(_ids_dict: Dict[str, Any], dg: DataGenerator):
     """
     Generate a random mortgage with plausible correlations between various factors.
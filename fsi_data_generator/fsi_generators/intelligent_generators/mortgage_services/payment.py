@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .enums import PaymentType
 from typing import Any, Dict, Optional
 
@@ -9,6 +10,7 @@ import random
 logger = logging.getLogger(__name__)
 
 
+@reads('mortgage_services.loans', 'mortgage_services.servicing_accounts')
 def generate_random_payment(id_fields: Dict[str, Any], dg) -> Dict[str, Any]:
     """
     Generate a random mortgage services payment record with reasonable values.
@@ -24,8 +26,7 @@ def generate_random_payment(id_fields: Dict[str, Any], dg) -> Dict[str, Any]:
         SkipRowGenerationError: If payment history is already complete (reached loan origination date)
     """
     # Get loan servicing account information to make payment data reasonable
-    conn = dg.conn
-    servicing_account_info = _get_servicing_account_info(id_fields["mortgage_services_servicing_account_id"], conn)
+    servicing_account_info = _get_servicing_account_info(id_fields["mortgage_services_servicing_account_id"], dg)
 
     if not servicing_account_info:
         # Use default values if no servicing account info is found
@@ -37,10 +38,10 @@ def generate_random_payment(id_fields: Dict[str, Any], dg) -> Dict[str, Any]:
         }
 
     # Get previous payments to ensure consistency
-    previous_payments = _get_previous_payments(id_fields["mortgage_services_servicing_account_id"], conn)
+    previous_payments = _get_previous_payments(id_fields["mortgage_services_servicing_account_id"], dg)
 
     # Get loan origination date to avoid generating payments before the loan existed
-    loan_origination_date = _get_loan_origination_date(id_fields["mortgage_services_servicing_account_id"], conn)
+    loan_origination_date = _get_loan_origination_date(id_fields["mortgage_services_servicing_account_id"], dg)
 
     # Define payment method and status options
     payment_methods = ["ach", "check", "online", "mobile", "wire", "branch", "phone"]
@@ -302,45 +303,29 @@ def generate_random_payment(id_fields: Dict[str, Any], dg) -> Dict[str, Any]:
     return payment
 
 
-def _get_loan_origination_date(servicing_account_id: int, conn) -> Optional[datetime.date]:
+def _get_loan_origination_date(servicing_account_id: int, dg) -> Optional[datetime.date]:
     """
     Get the loan origination date to determine expected payment history length.
 
     Args:
         servicing_account_id: The ID of the servicing account
-        conn: PostgreSQL connection object
+        dg: DataGenerator instance
 
     Returns:
         Loan origination date or None if not found
     """
     try:
-        cursor = conn.cursor()
-
         # First try to get origination date from the servicing account
-        cursor.execute("""
-            SELECT mortgage_services_loan_id
-            FROM mortgage_services.servicing_accounts 
-            WHERE mortgage_services_servicing_account_id = %s
-        """, (servicing_account_id,))
-
-        result = cursor.fetchone()
+        result = dg.lookup("mortgage_services.servicing_accounts", servicing_account_id)
 
         if result and result.get('mortgage_services_loan_id'):
             loan_id = result.get('mortgage_services_loan_id')
 
             # Now get the origination date from the loan
-            cursor.execute("""
-                SELECT origination_date
-                FROM mortgage_services.loans 
-                WHERE mortgage_services_loan_id = %s
-            """, (loan_id,))
-
-            result = cursor.fetchone()
-            cursor.close()
+            result = dg.lookup("mortgage_services.loans", loan_id)
 
             return result.get('origination_date')
 
-        cursor.close()
         return None
 
     except (Exception, psycopg2.Error) as error:
@@ -348,36 +333,19 @@ def _get_loan_origination_date(servicing_account_id: int, conn) -> Optional[date
         return None
 
 
-def _get_servicing_account_info(servicing_account_id: int, conn) -> Optional[Dict[str, Any]]:
+def _get_servicing_account_info(servicing_account_id: int, dg) -> Optional[Dict[str, Any]]:
     """
     Get loan servicing account information to make payment data reasonable.
 
     Args:
         servicing_account_id: The ID of the servicing account
-        conn: PostgreSQL connection object
+        dg: DataGenerator instance
 
     Returns:
         Dictionary containing servicing account information or None if not found
     """
     try:
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT 
-                current_principal_balance, 
-                original_principal_balance,
-                current_interest_rate,
-                next_payment_amount,
-                next_payment_due_date,
-                last_payment_date,
-                last_payment_amount,
-                escrow_balance
-            FROM mortgage_services.servicing_accounts 
-            WHERE mortgage_services_servicing_account_id = %s
-        """, (servicing_account_id,))
-
-        result = cursor.fetchone()
-        cursor.close()
+        result = dg.lookup("mortgage_services.servicing_accounts", servicing_account_id)
 
         if result:
             # Calculate monthly escrow amount based on the difference between total payment and principal+interest
@@ -437,41 +405,22 @@ def _get_servicing_account_info(servicing_account_id: int, conn) -> Optional[Dic
         return None
 
 
-def _get_previous_payments(servicing_account_id: int, conn) -> list:
+def _get_previous_payments(servicing_account_id: int, dg) -> list:
     """
     Get previous payments for consistency checking.
 
     Args:
         servicing_account_id: The ID of the servicing account
-        conn: PostgreSQL connection object
+        dg: DataGenerator instance
 
     Returns:
         List of previous payments sorted by payment date (desc)
     """
     try:
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT 
-                payment_date,
-                payment_type,
-                payment_amount,
-                principal_amount,
-                interest_amount,
-                escrow_amount
-            FROM mortgage_services.payments 
-            WHERE mortgage_services_servicing_account_id = %s
-            ORDER BY payment_date DESC
-        """, (servicing_account_id,))
-
-        results = cursor.fetchall()
-        cursor.close()
-
-        payments = []
-        for row in results:
-            payments.append(row)
-
-        return payments
+        payments = dg.lookup_rows("mortgage_services.payments", "mortgage_services_servicing_account_id",
+                                  servicing_account_id)
+
+        return sorted(payments, key=lambda payment: payment.get('payment_date'), reverse=True)
 
     except (Exception, psycopg2.Error) as error:
         logger.error(f"Error fetching previous payments: {error}")
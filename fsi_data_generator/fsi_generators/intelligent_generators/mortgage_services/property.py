@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .enums import OccupancyType, PropertyType
 from data_generator import DataGenerator, SkipRowGenerationError
 from datetime import timedelta
@@ -41,6 +42,7 @@ def validate_property_association(application_id):
     return True, ""
 
 
+@reads('mortgage_services.applications', 'mortgage_services.loan_products')
 def generate_random_property(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random, plausible property record based on the loan application and product type.
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from .enums import ServicingAccountStatus
 from typing import Any, Dict, Optional
 
@@ -9,6 +10,7 @@ import random
 logger = logging.getLogger(__name__)
 
 
+@reads('mortgage_services.closed_loans', 'mortgage_services.loans')
 def generate_random_servicing_account(id_fields: Dict[str, Any], dg) -> Dict[str, Any]:
     """
     Generate a random mortgage_services servicing account record with reasonable values.
@@ -12,9 +12,9 @@ __all__ = ['AgentStatus', 'ComplianceStatus', 'PatchStatus', 'ServiceStatus', 'S
            'generate_random_file_threat', 'generate_random_governance_group', 'generate_random_host',
            'generate_random_iam_login', 'generate_random_identity', 'generate_random_identity_profile',
            'generate_random_identity_role', 'generate_random_installed_application',
-           'generate_random_network_connection', 'generate_random_network_event', 'generate_random_open_port',
-           'generate_random_policy', 'generate_random_policy_attribute', 'generate_random_policy_rule',
-           'generate_random_process_execution', 'generate_random_resource_definition',
+           'generate_random_network_connection', 'generate_random_network_event', 'generate_random_network_events',
+           'generate_random_open_port', 'generate_random_policy', 'generate_random_policy_attribute',
+           'generate_random_policy_rule', 'generate_random_process_execution', 'generate_random_resource_definition',
            'generate_random_role_entitlement', 'generate_random_running_service', 'generate_random_security_role',
            'generate_random_system_stat', 'generate_random_usb_device_usage', 'generate_risk_policy_description',
            'get_default_user', 'get_host_info', 'get_host_owner', 'get_host_users', 'get_linux_processes',
@@ -52,6 +52,7 @@ from .identity_role import generate_random_identity_role
 from .installed_application import generate_random_installed_application
 from .network_connection import generate_random_network_connection
 from .network_event import generate_random_network_event
+from .network_event import generate_random_network_events
 from .open_port import generate_random_open_port
 from .patch_status import PatchStatus
 from .policy import (generate_access_policy_description,
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from data_generator import DataGenerator, SkipRowGenerationError
 from datetime import datetime, timedelta, timezone
 from faker import Faker
@@ -11,6 +12,7 @@ prev_account_id_strings = set()
 logger = logging.getLogger(__name__)
 
 
+@reads('app_mgmt.applications', 'security.identities')
 def generate_random_account(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random security.accounts record.
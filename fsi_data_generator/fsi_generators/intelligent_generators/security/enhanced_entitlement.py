@@ -1,9 +1,8 @@
 from data_generator import DataGenerator
-from fsi_data_generator.fsi_generators.helpers.generate_unique_json_array import \
-    generate_unique_json_array
+from fsi_data_generator.fsi_generators.helpers.generate_unique_json_array import (
+    anthropic, generate_unique_json_array)
 from typing import Any, Dict
 
-import anthropic
 import random
 
 
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from data_generator import DataGenerator, SkipRowGenerationError
 from typing import Any, Dict, List, Optional
 
@@ -6,6 +7,7 @@ import random
 prev_entitlement_resources = set()
 
 
+@reads('security.resource_definitions')
 def generate_random_entitlement_resource(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random security.entitlement_resources record with context-aware values.
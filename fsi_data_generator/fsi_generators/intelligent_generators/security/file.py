@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from data_generator import DataGenerator, SkipRowGenerationError
 from datetime import datetime, timedelta, timezone
 from faker import Faker
@@ -11,6 +12,7 @@ import random
 logger = logging.getLogger(__name__)
 
 
+@reads('security.hosts')
 def generate_random_file(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random "security.files" record.
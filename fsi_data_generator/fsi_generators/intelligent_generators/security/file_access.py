@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from data_generator import DataGenerator
 from datetime import datetime, timedelta
 from faker import Faker
@@ -10,6 +11,7 @@ import random
 logger = logging.getLogger(__name__)
 
 
+@reads('enterprise.associates', 'security.files', 'security.hosts', 'security.process_executions')
 def generate_random_file_access(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random security.file_accesses record.
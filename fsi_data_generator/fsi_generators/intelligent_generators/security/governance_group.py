@@ -1,10 +1,10 @@
+from ...helpers.reads import reads
 from data_generator import DataGenerator, SkipRowGenerationError
 from faker import Faker
-from fsi_data_generator.fsi_generators.helpers.generate_unique_json_array import \
-    generate_unique_json_array
+from fsi_data_generator.fsi_generators.helpers.generate_unique_json_array import (
+    anthropic, generate_unique_json_array)
 from typing import Any, Dict
 
-import anthropic
 import logging
 import random
 
@@ -13,6 +13,7 @@ prev_governance_group_names = set()
 logger = logging.getLogger(__name__)
 
 
+@reads('enterprise.associates')
 def generate_random_governance_group(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random security.governance_groups record.
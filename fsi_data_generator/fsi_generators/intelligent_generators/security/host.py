@@ -1,8 +1,8 @@
 from data_generator import DataGenerator, SkipRowGenerationError
 from datetime import datetime, timedelta, timezone
 from faker import Faker
-from fsi_data_generator.fsi_generators.helpers.generate_unique_json_array import \
-    generate_unique_json_array
+from fsi_data_generator.fsi_generators.helpers.generate_unique_json_array import (
+    anthropic, generate_unique_json_array)
 from fsi_data_generator.fsi_generators.intelligent_generators.security.agent_status import \
     AgentStatus
 from fsi_data_generator.fsi_generators.intelligent_generators.security.compliance_status import \
@@ -13,8 +13,6 @@ from fsi_data_generator.fsi_generators.intelligent_generators.security.system_st
     SystemType
 from typing import Any, Dict
 
-import anthropic
-import uuid
 
 # Track previously generated hostnames for uniqueness
 prev_hostnames = set()
@@ -87,7 +85,7 @@ def generate_random_host(_id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[
         raise SkipRowGenerationError("Could not generate a unique hostname")
 
     # Generate agent identifier (UUIDv4 format)
-    agent_identifier = str(uuid.uuid4())
+    agent_identifier = fake.uuid4()
 
     # Generate IP addresses
     ip_address_internal = fake.ipv4_private()
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from data_generator import DataGenerator
 from datetime import datetime, timedelta
 from typing import Any, Dict
@@ -8,6 +9,7 @@ import random
 logger = logging.getLogger(__name__)
 
 
+@reads('security.accounts')
 def generate_random_iam_login(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random security.iam_logins record.
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from data_generator import DataGenerator, SkipRowGenerationError
 from datetime import datetime, timedelta, timezone
 from faker import Faker
@@ -11,6 +12,7 @@ prev_identity_names = set()
 logger = logging.getLogger(__name__)
 
 
+@reads('enterprise.associates', 'security.identity_profiles')
 def generate_random_identity(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random "security.identities" record.
@@ -1,11 +1,10 @@
 from data_generator import DataGenerator, SkipRowGenerationError
 from datetime import datetime, timedelta
 from faker import Faker
-from fsi_data_generator.fsi_generators.helpers.generate_unique_json_array import \
-    generate_unique_json_array
+from fsi_data_generator.fsi_generators.helpers.generate_unique_json_array import (
+    anthropic, generate_unique_json_array)
 from typing import Any, Dict
 
-import anthropic
 import random
 
 # Track previously generated profile names for uniqueness
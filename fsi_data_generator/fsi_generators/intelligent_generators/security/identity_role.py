@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from data_generator import DataGenerator, SkipRowGenerationError
 from datetime import datetime, timedelta
 from typing import Any, Dict, Set, Tuple
@@ -10,6 +11,7 @@ active_role_assignments: Set[Tuple[str, str]] = set()
 logger = logging.getLogger(__name__)
 
 
+@reads('app_mgmt.applications', 'enterprise.associates', 'security.identities', 'security.roles')
 def generate_random_identity_role(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random security.identity_roles record.
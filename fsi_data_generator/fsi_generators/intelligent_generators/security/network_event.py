@@ -1,12 +1,22 @@
+from ...helpers.random_record import batch_generator
+from ...helpers.random_streams import current_numpy
 from data_generator import DataGenerator
 from faker import Faker
-from typing import Any, Dict
+from faker.providers.internet import _IPv4Constants
+from typing import Any, Dict, List
 
 import datetime
+import numpy as np
 import random
 
 fake = Faker()
 
+PROTOCOLS = ["TCP", "UDP", "ICMP", "HTTP2", "TLS", "QUIC", "SIP"]
+STATUSES = ["success", "failure", "blocked", "timeout", "reset"]
+TCP_FLAGS = ["SYN", "ACK", "FIN", "RST", "PSH", "URG", "ECE", "CWR"]
+WELL_KNOWN_PORTS = [80, 443, 22, 21, 25, 53, 3306, 5432]
+WINDOW_SIZES = [8192, 16384, 32768, 65535]
+
 
 def generate_random_network_event(_id_fields: Dict[str, Any], _dg: DataGenerator) -> Dict[str, Any]:
     """
@@ -20,12 +30,6 @@ def generate_random_network_event(_id_fields: Dict[str, Any], _dg: DataGenerator
         Dict containing a random network event record
     """
 
-    protocols = ["TCP", "UDP", "ICMP", "HTTP2", "TLS", "QUIC", "SIP"]
-    statuses = ["success", "failure", "blocked", "timeout", "reset"]
-
-    # Get TCP flag from the enum
-    tcp_flags = ["SYN", "ACK", "FIN", "RST", "PSH", "URG", "ECE", "CWR"]
-
     # Get current time
     now = datetime.datetime.now()
     timestamp = now - datetime.timedelta(minutes=random.randint(0, 1440))  # Random time in the last 24 hours
@@ -36,20 +40,20 @@ def generate_random_network_event(_id_fields: Dict[str, Any], _dg: DataGenerator
 
     # Generate ports
     source_port = random.randint(1024, 65535)
-    dest_port = random.choice([80, 443, 22, 21, 25, 53, 3306, 5432] + [random.randint(1024, 65535)])
+    dest_port = random.choice(WELL_KNOWN_PORTS + [random.randint(1024, 65535)])
 
     # Determine protocol and TCP-specific fields
-    protocol = random.choice(protocols)
+    protocol = random.choice(PROTOCOLS)
     tcp_flag = None
     sequence = None
     ack = None
     window_size = None
 
     if protocol == "TCP":
-        tcp_flag = random.choice(tcp_flags)
+        tcp_flag = random.choice(TCP_FLAGS)
         sequence = random.randint(0, 2 ** 32 - 1)
         ack = random.randint(0, 2 ** 32 - 1)
-        window_size = random.choice([8192, 16384, 32768, 65535])
+        window_size = random.choice(WINDOW_SIZES)
 
     # Generate random data sizes
     length = random.randint(64, 8192)
@@ -69,7 +73,7 @@ def generate_random_network_event(_id_fields: Dict[str, Any], _dg: DataGenerator
         "dest_ip": dest_ip,
         "dest_port": dest_port,
         "protocol": protocol,
-        "status": random.choice(statuses),
+        "status": random.choice(STATUSES),
         "tcp_flag": tcp_flag,
         "sequence": sequence,
         "ack": ack,
@@ -82,3 +86,111 @@ def generate_random_network_event(_id_fields: Dict[str, Any], _dg: DataGenerator
     }
 
     return network_event
+
+
+def _ipv4_ranges():
+    """
+    Start addresses and cumulative sizes of the ranges fake.ipv4() draws from: all of IPv4, private networks
+    included, but the special networks Faker excludes (this network, loopback, link local, multicast...).
+    """
+    starts, ends, start = [], [], 0
+    for network in sorted(_IPv4Constants._excluded_networks):
+        first = int(network.network_address)
+        if first > start:
+            starts.append(start)
+            ends.append(first)
+        start = max(start, int(network.broadcast_address) + 1)
+    if start < 2 ** 32:
+        starts.append(start)
+        ends.append(2 ** 32)
+    starts, ends = np.asarray(starts, dtype=np.int64), np.asarray(ends, dtype=np.int64)
+    return starts, np.cumsum(ends - starts)
+
+
+_IPV4_STARTS, _IPV4_CUMULATIVE = _ipv4_ranges()
+
+
+def _ipv4_addresses(rng, n) -> List[str]:
+    """n random IPv4 addresses, uniform over the addresses fake.ipv4() returns."""
+    # Offset into the concatenated ranges, then the range it falls in
+    offsets = rng.randint(0, _IPV4_CUMULATIVE[-1], size=n, dtype=np.int64)
+    ranges = np.searchsorted(_IPV4_CUMULATIVE, offsets, side='right')
+    addresses = _IPV4_STARTS[ranges] + offsets - np.concatenate(([0], _IPV4_CUMULATIVE[:-1]))[ranges]
+    octets = (addresses[:, None] >> np.array([24, 16, 8, 0])) & 255
+    return [f"{a}.{b}.{c}.{d}" for a, b, c, d in octets.tolist()]
+
+
+def _choose(rng, options, n) -> np.ndarray:
+    """n random elements of options, as an object array."""
+    choices = np.empty(len(options), dtype=object)
+    choices[:] = options
+    return choices[rng.randint(0, len(options), size=n)]
+
+
+def generate_random_network_events(_id_fields_batch: List[Dict[str, Any]], _dg: DataGenerator,
+                                   n: int) -> Dict[str, list]:
+    """
+    Generate n random security.network_events records at once, drawn with NumPy, see
+    generate_random_network_event and batch_generator.
+
+    Args:
+        _id_fields_batch: Predetermined ID fields of each row (ignored)
+        _dg: DataGenerator instance
+        n: Number of records
+
+    Returns:
+        Dict of column name -> list of n values
+    """
+    rng = current_numpy()
+
+    # Random times in the last 24 hours, created a few seconds later
+    now = np.datetime64(datetime.datetime.now(), 'us')
+    timestamp = now - rng.randint(0, 1441, size=n).astype('timedelta64[m]')
+    created_at = timestamp + (rng.uniform(0.1, 5.0, size=n) * 1e6).astype('timedelta64[us]')
+
+    source_ip = _ipv4_addresses(rng, n)
+    dest_ip = _ipv4_addresses(rng, n)
+    source_port = rng.randint(1024, 65536, size=n)
+
+    # A well known port, or (one time in nine) any unprivileged port
+    dest_port = np.asarray(WELL_KNOWN_PORTS + [0])[rng.randint(0, len(WELL_KNOWN_PORTS) + 1, size=n)]
+    dest_port = np.where(dest_port == 0, rng.randint(1024, 65536, size=n), dest_port)
+
+    # TCP-specific fields are NULL for the other protocols
+    protocol = _choose(rng, PROTOCOLS, n)
+    is_tcp = protocol == "TCP"
+    tcp_flag = np.where(is_tcp, _choose(rng, TCP_FLAGS, n), None)
+    sequence = np.where(is_tcp, rng.randint(0, 2 ** 32, size=n, dtype=np.int64).astype(object), None)
+    ack = np.where(is_tcp, rng.randint(0, 2 ** 32, size=n, dtype=np.int64).astype(object), None)
+    window_size = np.where(is_tcp, _choose(rng, WINDOW_SIZES, n), None)
+
+    length = rng.randint(64, 8193, size=n)
+    bytes_sent = rng.randint(0, length + 1)
+    allowed = rng.random_sample(size=n) > 0.3
+
+    source_port, dest_port, protocol = source_port.tolist(), dest_port.tolist(), protocol.tolist()
+    log_message = [f"{p} connection from {sip}:{sport} to {dip}:{dport} was {'allowed' if a else 'blocked'}"
+                   for p, sip, sport, dip, dport, a in zip(protocol, source_ip, source_port, dest_ip, dest_port,
+                                                           allowed.tolist())]
+
+    return {
+        "timestamp": np.datetime_as_string(timestamp, unit='us').tolist(),
+        "source_ip": source_ip,
+        "source_port": source_port,
+        "dest_ip": dest_ip,
+        "dest_port": dest_port,
+        "protocol": protocol,
+        "status": _choose(rng, STATUSES, n).tolist(),
+        "tcp_flag": tcp_flag.tolist(),
+        "sequence": sequence.tolist(),
+        "ack": ack.tolist(),
+        "window_size": window_size.tolist(),
+        "length": length.tolist(),
+        "bytes_sent": bytes_sent.tolist(),
+        "bytes_received": (length - bytes_sent).tolist(),
+        "log_message": log_message,
+        "created_at": np.datetime_as_string(created_at, unit='us').tolist()
+    }
+
+
+batch_generator(generate_random_network_event, generate_random_network_events)
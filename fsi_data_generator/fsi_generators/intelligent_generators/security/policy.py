@@ -1,10 +1,9 @@
 from data_generator import DataGenerator, SkipRowGenerationError
 from datetime import datetime, timedelta
-from fsi_data_generator.fsi_generators.helpers.generate_unique_json_array import \
-    generate_unique_json_array
+from fsi_data_generator.fsi_generators.helpers.generate_unique_json_array import (
+    anthropic, generate_unique_json_array)
 from typing import Any, Dict, Set
 
-import anthropic
 import logging
 import random
 
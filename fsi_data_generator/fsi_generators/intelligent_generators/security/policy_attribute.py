@@ -1,10 +1,10 @@
+from ...helpers.reads import reads
 from data_generator import DataGenerator, SkipRowGenerationError
 from faker import Faker
-from fsi_data_generator.fsi_generators.helpers.generate_unique_json_array import \
-    generate_unique_json_array
+from fsi_data_generator.fsi_generators.helpers.generate_unique_json_array import (
+    anthropic, generate_unique_json_array)
 from typing import Any, Dict
 
-import anthropic
 import logging
 import psycopg2
 import random
@@ -14,6 +14,7 @@ prev_policy_attributes = set()
 logger = logging.getLogger(__name__)
 
 
+@reads('security.policies')
 def generate_random_policy_attribute(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random security.policy_attributes record.
@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from data_generator import DataGenerator
 from datetime import datetime, timedelta, timezone
 from faker import Faker
@@ -10,6 +11,8 @@ fake = Faker()
 logger = logging.getLogger(__name__)
 
 
+@reads('enterprise.associates', 'security.accounts', 'security.file_accesses', 'security.hosts', 'security.identities',
+       'security.network_connections')
 def generate_random_process_execution(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random security.process_executions record.
@@ -150,17 +153,7 @@ def get_host_info(host_id: Any, dg: DataGenerator) -> Dict[str, Any]:
     Get host information using the PK
     """
     try:
-        query = """
-        SELECT hostname, os, os_version, system_type, last_seen, agent_status
-        FROM security.hosts
-        WHERE security_host_id = %s
-        """
-
-        with dg.conn.cursor() as cursor:
-            cursor.execute(query, (host_id,))
-            result = cursor.fetchone()
-
-        return result
+        return dg.lookup("security.hosts", host_id)
 
     except Exception as e:
         # Handle database errors gracefully
@@ -213,36 +206,20 @@ def get_host_users(host_id: Any, dg: DataGenerator) -> list:
 
         # If still no users found, get users from process executions directly
         if not users:
-            query = """
-            SELECT DISTINCT user_name
-            FROM security.process_executions
-            WHERE security_host_id = %s AND user_name IS NOT NULL
-            """
-
-            with dg.conn.cursor() as cursor:
-                cursor.execute(query, (host_id,))
-                for row in cursor.fetchall():
-                    if row.get('name'):  # Ensure name is not None
-                        users.append({'name': row['name'], 'is_service': False})
+            for row in dg.lookup_rows("security.process_executions", "security_host_id", host_id):
+                user_name = row.get('user_name')
+                if user_name and not any(u['name'] == user_name for u in users):  # Distinct, not None
+                    users.append({'name': user_name, 'is_service': False})
 
         # If still no users found, get some random enterprise associates
         if not users:
             # Get 2-3 random associates as potential users
             num_associates = random.randint(2, 3)
-            query = """
-            SELECT first_name, last_name
-            FROM enterprise.associates
-            ORDER BY RANDOM()
-            LIMIT %s
-            """
-
-            with dg.conn.cursor() as cursor:
-                cursor.execute(query, (num_associates,))
-                for row in cursor.fetchall():
-                    if row[0] and row[1]:  # Ensure names are not None
-                        # Create a username from first name and first letter of last name
-                        username = f"{row[0].lower()}{row[1][0].lower()}"
-                        users.append({'name': username, 'is_service': False})
+            for row in dg.sample("enterprise.associates", num_associates):
+                if row.get('first_name') and row.get('last_name'):  # Ensure names are not None
+                    # Create a username from first name and first letter of last name
+                    username = f"{row['first_name'].lower()}{row['last_name'][0].lower()}"
+                    users.append({'name': username, 'is_service': False})
 
     except Exception as e:
         # Handle database errors gracefully
@@ -320,7 +297,8 @@ def select_process_for_host(process_options, host_info, _dg: DataGenerator):
     # Use a seed from the host_id to make the selection deterministic
     host_id_str = str(host_info.get('hostname', ''))
     seed = sum(ord(c) for c in host_id_str) % len(process_options)
-    random.seed(seed)
+    # A private Random, so the selection doesn't reseed the random module for every row that follows
+    rng = random.Random(seed)
 
     # Certain processes should only appear on servers
     server_processes = ["sshd", "apache2", "nginx", "mysqld", "postgres", "dockerd"]
@@ -341,7 +319,7 @@ def select_process_for_host(process_options, host_info, _dg: DataGenerator):
         filtered_processes = process_options
 
     # Select a process using our seed
-    return random.choice(filtered_processes)
+    return rng.choice(filtered_processes)
 
 
 def select_user_for_process(host_users, process_info, is_windows, host_id, dg):
@@ -420,50 +398,22 @@ def get_host_owner(host_id, dg):
         return None
 
     try:
-        # Query for asset owner information directly from hosts table
-        query = """
-        SELECT asset_owner_name
-        FROM security.hosts
-        WHERE security_host_id = %s AND asset_owner_name IS NOT NULL
-        """
-
-        with dg.conn.cursor() as cursor:
-            cursor.execute(query, (host_id,))
-            result = cursor.fetchone()
+        # Asset owner information directly from the hosts table
+        result = dg.lookup("security.hosts", host_id)
 
         if result and result.get('asset_owner_name'):
             return result.get('asset_owner_name')
 
         # If no asset owner, try to find owner through process executions on this host
-        query = """
-        SELECT DISTINCT user_name
-        FROM security.process_executions
-        WHERE security_host_id = %s AND user_name IS NOT NULL
-        AND user_name NOT IN ('SYSTEM', 'root', 'www-data', 'nobody', 'mysql', 'postgres')
-        LIMIT 1
-        """
-
-        with dg.conn.cursor() as cursor:
-            cursor.execute(query, (host_id,))
-            result = cursor.fetchone()
-
-        if result and result.get('user_name'):
-            return result.get('user_name')
+        system_users = ('SYSTEM', 'root', 'www-data', 'nobody', 'mysql', 'postgres')
+        for row in dg.lookup_rows("security.process_executions", "security_host_id", host_id):
+            if row.get('user_name') and row.get('user_name') not in system_users:
+                return row.get('user_name')
 
         # Last resort - try to find a relevant associate
-        query = """
-        SELECT first_name || last_name AS fullname
-        FROM enterprise.associates
-        ORDER BY RANDOM()
-        LIMIT 1
-        """
-
-        with dg.conn.cursor() as cursor:
-            cursor.execute(query)
-            result = cursor.fetchone()
-
-        if result and result.get('fullname'):
-            return result.get('fullname').lower()
+        for row in dg.sample("enterprise.associates"):
+            if row.get('first_name') is not None and row.get('last_name') is not None:
+                return f"{row['first_name']}{row['last_name']}".lower()
 
     except Exception as e:
         # Handle database errors gracefully
@@ -477,17 +427,8 @@ def get_random_associate(dg):
     Get a random username from "enterprise.associates"
     """
     try:
-        # Query for a random associate
-        query = """
-        SELECT first_name, last_name
-        FROM enterprise.associates
-        ORDER BY RANDOM()
-        LIMIT 1
-        """
-
-        with dg.conn.cursor() as cursor:
-            cursor.execute(query)
-            result = cursor.fetchone()
+        # Pick a random associate
+        result = next(iter(dg.sample("enterprise.associates")), None)
 
         if result:
             # Create username from first name and first character of last name
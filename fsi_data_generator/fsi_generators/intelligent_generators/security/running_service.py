@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from data_generator import DataGenerator, SkipRowGenerationError
 from datetime import datetime, timedelta
 from faker import Faker
@@ -19,6 +20,7 @@ logger = logging.getLogger(__name__)
 prev_services = set()
 
 
+@reads('security.hosts')
 def generate_random_running_service(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random security.running_services record.
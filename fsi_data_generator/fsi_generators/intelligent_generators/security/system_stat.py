@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from data_generator import DataGenerator
 from datetime import datetime, timedelta
 from faker import Faker
@@ -12,6 +13,7 @@ fake = Faker()
 logger = logging.getLogger(__name__)
 
 
+@reads('security.hosts')
 def generate_random_system_stat(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random security.system_stats record.
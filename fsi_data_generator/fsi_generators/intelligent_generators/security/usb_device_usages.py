@@ -1,3 +1,4 @@
+from ...helpers.reads import reads
 from data_generator import DataGenerator
 from datetime import datetime, timedelta
 from typing import Any, Dict
@@ -10,6 +11,7 @@ import sys
 logger = logging.getLogger(__name__)
 
 
+@reads('security.hosts')
 def generate_random_usb_device_usage(id_fields: Dict[str, Any], dg: DataGenerator) -> Dict[str, Any]:
     """
     Generate a random security.usb_device_usage record.
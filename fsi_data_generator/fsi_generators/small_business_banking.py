@@ -1,10 +1,12 @@
 from faker import Faker
 from fsi_data_generator.fsi_generators.helpers.generate_account_number import \
-    fake_account_numbers
-from fsi_data_generator.fsi_generators.helpers.generate_ein import fake_eins
+    account_number_pool
+from fsi_data_generator.fsi_generators.helpers.generate_ein import ein_pool
 from fsi_data_generator.fsi_generators.helpers.generate_product_code import \
-    fake_product_codes
+    product_code_pool
+from fsi_data_generator.fsi_generators.helpers.reads import reads
 from fsi_data_generator.fsi_generators.helpers.text_list import text_list
+from fsi_data_generator.fsi_generators.helpers.unique_generator import unique_generator
 from fsi_data_generator.fsi_text.small_business_banking.small_business_banking__account_signatories__signatory_level import \
     small_business_banking__account_signatories__signatory_level
 from fsi_data_generator.fsi_text.small_business_banking.small_business_banking__accounts__account_type import \
@@ -200,6 +202,11 @@ fake = Faker()
 
 
 def small_business_banking(dg):
+    def product_codes_needed():
+        # Credit line numbers, loan numbers and product codes are drawn from the same pool, like they used to.
+        # Passed to take uncalled, so the row counts are only summed when the pool is built or runs out
+        return sum(dg.row_count(f'small_business_banking.{table}') for table in ('credit_lines', 'loans', 'products'))
+
     return [
         ('small_business_banking\\.suspicious_activity_reports', '^law_enforcement_contact_name$',
          text_list(small_business_banking__suspicious_activity_reports__law_enforcement_contact_name)),
@@ -238,29 +245,36 @@ def small_business_banking(dg):
         ('small_business_banking\\.loan_fair_lending', '^denial_reason_4$',
          text_list(small_business_banking__loan_fair_lending__denial_reason_4)),
         ('small_business_banking\\.credit_lines', '^credit_line_number$',
-         lambda a, b, c: 'CL' + fake.unique.random_element(tuple(fake_product_codes))),
+         unique_generator(lambda a, b, c: 'CL' + product_code_pool.take(product_codes_needed))),
         ('small_business_banking\\.loans', '^loan_number$',
-         lambda a, b, c: 'LN' + fake.unique.random_element(tuple(fake_product_codes))),
+         unique_generator(lambda a, b, c: 'LN' + product_code_pool.take(product_codes_needed))),
         ('small_business_banking\\.products', '^product_code$',
-         lambda a, b, c: fake.unique.random_element(tuple(fake_product_codes))),
+         unique_generator(lambda a, b, c: product_code_pool.take(product_codes_needed))),
         ('small_business_banking\\.accounts', '^account_number$',
-         lambda a, b, c: fake.unique.random_element(tuple(fake_account_numbers))),
+         unique_generator(
+             lambda a, b, c: account_number_pool.take(lambda: dg.row_count('small_business_banking.accounts')))),
         ('small_business_banking\\.businesses', '^tax_id$',
-         lambda a, b, c: fake.unique.random_element(tuple(fake_eins))),
+         unique_generator(lambda a, b, c: ein_pool.take(lambda: dg.row_count('small_business_banking.businesses')))),
         ('small_business_banking\\.business_card_users', '^merchant_category_restrictions$',
          text_list(small_business_banking__business_card_users__merchant_category_restrictions)),
         ('small_business_banking\\.suspicious_activity_reports', '^supporting_documentation$',
          text_list(small_business_banking__suspicious_activity_reports__supporting_documentation)),
         ('small_business_banking\\.business_card_accounts', '^card_account_id$',
-         lambda a, b, c: fake.unique.random_element(tuple(dg.inserted_pks['credit_cards.card_accounts']))),
+         unique_generator(reads('credit_cards.card_accounts')(
+             lambda a, b, c: fake.unique.random_element(tuple(dg.inserted_pks['credit_cards.card_accounts']))))),
         ('small_business_banking\\.loan_collateral', '^consumer_lending_collateral_id$',
-         lambda a, b, c: fake.unique.random_element(tuple(dg.inserted_pks['small_business_banking\\.collateral']))),
+         unique_generator(reads('small_business_banking.collateral')(
+             lambda a, b, c: fake.unique.random_element(
+                 tuple(dg.inserted_pks['small_business_banking\\.collateral']))))),
         ('small_business_banking\\.business_card_users', '^enterprise_party_id$',
-         lambda a, b, c: fake.unique.random_element(tuple(dg.inserted_pks['enterprise.parties']))),
+         unique_generator(reads('enterprise.parties')(
+             lambda a, b, c: fake.unique.random_element(tuple(dg.inserted_pks['enterprise.parties']))))),
         ('small_business_banking\\.business_owners', '^enterprise_party_id$',
-         lambda a, b, c: fake.unique.random_element(tuple(dg.inserted_pks['enterprise.parties']))),
+         unique_generator(reads('enterprise.parties')(
+             lambda a, b, c: fake.unique.random_element(tuple(dg.inserted_pks['enterprise.parties']))))),
         ('small_business_banking\\.account_signatories', '^enterprise_party_id$',
-         lambda a, b, c: fake.unique.random_element(tuple(dg.inserted_pks['enterprise.parties']))),
+         unique_generator(reads('enterprise.parties')(
+             lambda a, b, c: fake.unique.random_element(tuple(dg.inserted_pks['enterprise.parties']))))),
         ('small_business_banking\\.suspicious_activity_reports', '^other_description$',
          text_list(small_business_banking__suspicious_activity_reports__other_description)),
         ('small_business_banking\\.suspicious_activity_reports', '^suspicious_activity_description$',
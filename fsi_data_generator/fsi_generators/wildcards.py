@@ -1,23 +1,35 @@
 from faker import Faker
-from fsi_data_generator.fsi_generators.helpers.generate_leis import \
-    generate_leis
+from fsi_data_generator.fsi_generators.helpers.generate_leis import lei_pool
 from fsi_data_generator.fsi_generators.helpers.generate_permission_name import \
     generate_all_permission_names
 from fsi_data_generator.fsi_generators.helpers.text_list import text_list
+from fsi_data_generator.fsi_generators.helpers.unique_generator import unique_generator
+from fsi_data_generator.fsi_generators.helpers.value_pool import ValuePool
 from fsi_data_generator.fsi_text.wildcards.____frequency_point_in_time import \
     ____frequency_point_in_time
 
 fake = Faker()
 fake_ca = Faker('en_CA')
 
-fake_leis = generate_leis()
-three_word_strings = [" ".join((fake.word(), fake.word(), fake.word())) for _ in range(10000)]
-three_word_strings.append('')
-three_word_tuple = tuple(three_word_strings)
+# Distinct three word strings, see ValuePool
+three_word_pool = ValuePool(lambda: " ".join((fake.word(), fake.word(), fake.word())), name='three_word_strings',
+                            size=10000)
+
+
+def __getattr__(name):
+    # Keeps the pools that used to be built at import available under their old names, built on first lookup
+    if name == 'fake_leis':
+        return list(lei_pool.ensure(10000))
+    if name == 'three_word_strings':
+        return list(three_word_pool.ensure(10000)) + ['']
+    if name == 'three_word_tuple':
+        return tuple(three_word_pool.ensure(10000)) + ('',)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 wildcards = [
     ('.*', '^permission_name$',
-     lambda a, b, c: fake.unique.random_element(tuple(generate_all_permission_names()))),
+     unique_generator(lambda a, b, c: fake.unique.random_element(tuple(generate_all_permission_names())))),
     ('.*', '^entity_type$', text_list(
         ["customer", "borrower", "business", "vendor", "employee", "branch", "department", "subsidiary",
          "supplier",
@@ -1,6 +1,6 @@
 from decimal import Decimal
 from dotenv import load_dotenv
-from fsi_data_generator.banking_generators import custom_generators
+from fsi_data_generator.banking_generators import custom_generators, table_generators
 from psycopg2._psycopg import register_type
 from psycopg2.extensions import register_adapter
 from psycopg2.extras import RealDictCursor
@@ -72,8 +72,24 @@ def execute_sql_scripts(conn, directory_path):
     logger.debug(f"Executed {executed_count} SQL script files from {directory_path}")
 
 
-def generate_banking_data():
-    """Run a DataGenerator with the retail financial services database."""
+def generate_banking_data(workers=None, loader=None, output_dir=None, scale=None, conn_params=None):
+    """
+    Run a DataGenerator with the retail financial services database.
+
+    Args:
+        workers (int, optional): Number of tables generated concurrently. Defaults to the WORKERS
+                                 environment variable or 1.
+        loader (str, optional): Loader writing the batches, 'insert' or 'copy' into the database, or 'parquet',
+                                'csv' or 'tsv' files. Defaults to the LOADER environment variable or 'insert'.
+        output_dir (str, optional): Directory of the files written by the file loaders. Defaults to the
+                                    OUTPUT_DIR environment variable or 'output'.
+        scale (float, optional): Multiplier of the row counts. Defaults to the SCALE environment variable or 0.1.
+        conn_params (dict, optional): Connection parameters overriding the ones from the environment, e.g. the
+                                      database or a psycopg2 connection_factory.
+
+    Returns:
+        DataGenerator: The generator that ran, with its timing statistics, or None if the run failed
+    """
 
     conn_params = {
         "host": os.environ.get("DB_HOST", "localhost"),
@@ -81,7 +97,8 @@ def generate_banking_data():
         "user": os.environ.get("DB_USER", "postgres"),
         "password": os.environ.get("DB_PASSWORD", "password"),
         "port": os.environ.get("DB_PORT", "5432"),
-        "cursor_factory": RealDictCursor
+        "cursor_factory": RealDictCursor,
+        **(conn_params or {})
     }
 
     # Read the environment variable and split it into a list
@@ -96,6 +113,38 @@ def generate_banking_data():
     # Generate the list of tuples
     exclude_tables = [(table.replace('.', '\\.'), '.*') for table in tables if table]
 
+    # Loader used to write batches ('insert' or 'copy'), optionally overridden for specific tables, or a file
+    # sink ('parquet', 'csv' or 'tsv') writing every table to OUTPUT_DIR instead of the database
+    loader = loader or os.getenv('LOADER', 'insert')
+    output_dir = output_dir or os.getenv('OUTPUT_DIR', 'output')
+    copy_tables = os.getenv('COPY_TABLES', '') if loader in ('insert', 'copy') else ''
+    table_loaders = [('^' + table.strip().replace('.', '\\.') + '$', 'copy') for table in copy_tables.split(',')
+                     if table.strip()]
+
+    # Number of tables generated concurrently, each on its own connection
+    workers = workers or int(os.getenv('WORKERS', '1'))
+
+    # The largest tables can have their rows sharded across processes
+    processes = int(os.getenv('PROCESSES', '1'))
+    process_tables = os.getenv('PROCESS_TABLES', 'consumer_banking.transactions,credit_cards.transactions,'
+                                                 'security.network_events,consumer_lending.payment_schedules')
+    process_tables = ['^' + table.strip().replace('.', '\\.') + '$' for table in process_tables.split(',')
+                      if table.strip()]
+
+    # Same SEED, same data, for the same number of processes and a single worker (see DataGenerator)
+    seed = os.getenv('SEED') or None
+
+    # Parent rows kept in memory for dg.lookup / dg.lookup_rows
+    row_cache_size = int(os.getenv('ROW_CACHE_SIZE', '100000'))
+    row_cache_spill = os.getenv('ROW_CACHE_SPILL', 'false').lower() in ('true', 'yes', 't', 'y')
+
+    # Generate balances, transactions and transaction balances as one vectorized time series per account
+    account_time_series = os.getenv('ACCOUNT_TIME_SERIES', 'false').lower() in ('true', 'yes', 't', 'y')
+
+    # Report the time spent per table, generator function, query and flush, optionally as a Chrome trace
+    profile = os.getenv('PROFILE', 'false').lower() in ('true', 'yes', 't', 'y')
+    profile_trace = os.getenv('PROFILE_TRACE') or None
+
     # Get the SQL file path from the environment variable
     sql_file_path = os.environ.get("MODEL_FILE")
     if not sql_file_path or not os.path.isfile(sql_file_path):
@@ -149,12 +198,25 @@ def generate_banking_data():
             conn_params=conn_params,
             exclude_schemas=exclude_schemas,
             exclusions=exclude_tables,
-            dbml=dbml
+            dbml=dbml,
+            loader=loader,
+            table_loaders=table_loaders,
+            output_dir=output_dir,
+            workers=workers,
+            processes=processes,
+            process_tables=process_tables,
+            seed=seed,
+            row_cache_size=row_cache_size,
+            row_cache_spill=row_cache_spill,
+            profile=profile,
+            profile_trace=profile_trace
         )
         generator.custom_generators = custom_generators(generator)
+        if account_time_series:
+            generator.table_generators = table_generators()
 
         # Step 3: Generate data
-        scale = float(os.environ.get("SCALE", .1))
+        scale = scale or float(os.environ.get("SCALE", .1))
 
         # For consumer_banking.products, we want to ensure exactly 9 rows regardless of scale
         # If scale is 0.1, then we'd set it to 9/0.1 = 90 to achieve 9 rows after scaling
@@ -412,6 +474,7 @@ def generate_banking_data():
             cve_manager.process_cves(csv_file=True, import_db=True, **conn_params)
 
         print("\nDataGenerator completed successfully!")
+        return generator
 
     except Exception as e:
         logger.error(f"Error during data generation: {e}")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Measure how long importing the data generator takes, using `python -X importtime`, and fail if it exceeds a budget
+or pulls in a dependency that should only be loaded on first use.
+
+Usage:
+    python import_time_check.py [module ...] [--budget SECONDS] [--top N] [--repeat N]
+
+Each module is imported --repeat times and the fastest run is reported, to keep noise out of the budget check.
+"""
+from dotenv import load_dotenv
+
+import argparse
+import os
+import subprocess
+import sys
+
+load_dotenv()
+
+# Only needed for vector matching, LLM text or cycle reporting, so never loaded at import time
+LAZY_MODULES = ['torch', 'sentence_transformers', 'transformers', 'anthropic', 'networkx']
+
+
+def measure_import(module):
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Returns:
+        tuple: (seconds spent importing the module, {module name: cumulative seconds} for every module loaded)
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    timings = {}
+    total = 0.0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        seconds = int(cumulative) / 1e6
+        timings[name.strip()] = seconds
+        if name.rstrip() == f" {module}":
+            total = seconds
+    return total, timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check the import time of the data generator against a budget')
+    parser.add_argument('modules', nargs='*', default=['fsi_data_generator'], help='Modules to import')
+    parser.add_argument('--budget', type=float, default=float(os.environ.get('IMPORT_TIME_BUDGET', '1.0')),
+                        help='Maximum seconds per module (default IMPORT_TIME_BUDGET or 1.0)')
+    parser.add_argument('--top', type=int, default=15, help='Number of slowest imports to list')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of imports per module, the fastest is kept')
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.modules:
+        total, timings = min((measure_import(module) for _ in range(max(1, args.repeat))), key=lambda run: run[0])
+        print(f"{module}: {total:.3f}s (budget {args.budget:.3f}s)")
+        for name, seconds in sorted(timings.items(), key=lambda item: -item[1])[:args.top]:
+            print(f"  {seconds:8.3f}s  {name}")
+
+        eager = [name for name in LAZY_MODULES if name in timings]
+        if eager:
+            print(f"  FAIL: {', '.join(eager)} imported eagerly")
+            failed = True
+        if total > args.budget:
+            print(f"  FAIL: over budget by {total - args.budget:.3f}s")
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Anthropic messages API, answering the text pool prompts of generate_unique_json_array with
+numbered placeholder elements, so that cold runs work offline and the LLM prefetch can be exercised without a key.
+
+Usage:
+    python llm_stub_server.py [--port 8765] [--latency SECONDS] [--error-rate FRACTION]
+
+then run the generator with ANTHROPIC_BASE_URL=http://localhost:8765 (any ANTHROPIC_API_KEY is accepted).
+--latency delays every answer and --error-rate answers a fraction of the requests with 529 Overloaded, to see the
+effect of concurrency and retries.
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import argparse
+import json
+import random
+import re
+import time
+
+COLUMN = re.compile(r'suitable for the column: (\S+?)\.?\s*$', re.MULTILINE)
+REQUESTED = re.compile(r'I requested (\d+) NEW')
+EXISTING = re.compile(r'I already have (\d+) elements')
+
+
+def placeholder_elements(prompt):
+    """The elements answering a prompt: '<Column> <n>', numbered after the elements it already has."""
+    column = COLUMN.search(prompt)
+    requested = REQUESTED.search(prompt)
+    existing = EXISTING.search(prompt)
+    label = column.group(1).split('.')[-1].replace('_', ' ').title() if column else 'Text'
+    first = int(existing.group(1)) + 1 if existing else 1
+    count = int(requested.group(1)) if requested else 10
+    return [f"{label} {n}" for n in range(first, first + count)]
+
+
+def _prompt_text(body):
+    content = body.get('messages', [{}])[-1].get('content', '')
+    if isinstance(content, list):
+        content = ''.join(block.get('text', '') for block in content if isinstance(block, dict))
+    return content
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    latency = 0.0
+    error_rate = 0.0
+
+    def do_POST(self):
+        if not self.path.rstrip('/').endswith('/v1/messages'):
+            self._send_json(404, {'type': 'error', 'error': {'type': 'not_found_error', 'message': self.path}})
+            return
+        body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+        time.sleep(self.latency)
+        if random.random() < self.error_rate:
+            self._send_json(529, {'type': 'error', 'error': {'type': 'overloaded_error', 'message': 'Overloaded'}})
+            return
+
+        prompt = _prompt_text(body)
+        text = json.dumps(placeholder_elements(prompt))
+        message = {'id': 'msg_stub', 'type': 'message', 'role': 'assistant', 'model': body.get('model', 'stub'),
+                   'content': [], 'stop_reason': None, 'stop_sequence': None,
+                   'usage': {'input_tokens': len(prompt) // 4, 'output_tokens': 0}}
+        if not body.get('stream'):
+            self._send_json(200, {**message, 'content': [{'type': 'text', 'text': text}], 'stop_reason': 'end_turn',
+                                  'usage': {**message['usage'], 'output_tokens': len(text) // 4}})
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.end_headers()
+        events = [
+            ('message_start', {'type': 'message_start', 'message': message}),
+            ('content_block_start', {'type': 'content_block_start', 'index': 0,
+                                     'content_block': {'type': 'text', 'text': ''}}),
+            *(('content_block_delta', {'type': 'content_block_delta', 'index': 0,
+                                       'delta': {'type': 'text_delta', 'text': text[i:i + 200]}})
+              for i in range(0, len(text), 200)),
+            ('content_block_stop', {'type': 'content_block_stop', 'index': 0}),
+            ('message_delta', {'type': 'message_delta', 'delta': {'stop_reason': 'end_turn', 'stop_sequence': None},
+                               'usage': {'output_tokens': len(text) // 4}}),
+            ('message_stop', {'type': 'message_stop'}),
+        ]
+        for event, data in events:
+            self.wfile.write(f"event: {event}\ndata: {json.dumps(data)}\n\n".encode())
+        self.wfile.flush()
+
+    def _send_json(self, status, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve placeholder answers to the LLM text pool prompts')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on')
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds before every answer')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 529')
+    args = parser.parse_args()
+
+    StubHandler.latency = args.latency
+    StubHandler.error_rate = args.error_rate
+    server = ThreadingHTTPServer((args.host, args.port), StubHandler)
+    print(f"Serving the LLM stub on http://{args.host}:{args.port}, set ANTHROPIC_BASE_URL to use it")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
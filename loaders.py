@@ -0,0 +1,512 @@
+from datetime import date, datetime, time, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+from enum import Enum
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import gzip
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+import uuid
+
+logger = logging.getLogger(__name__)
+
+
+class BatchLoader:
+    """
+    Base class for the strategies DataGenerator uses to write a batch of rows to a table.
+
+    A loader receives the batch exactly as it was collected by `DataGenerator._batch_row` and returns
+    the rows needed for primary key capture, together with the names of the columns in those rows.
+    """
+    name = 'base'
+    writes_database = True  # False for loaders writing files, whose rows can't be selected back
+
+    def __init__(self, dg):
+        self.dg = dg
+
+    def load(self, table_key: str, column_names: List[str], rows: List[List[Any]]) -> Tuple[List[str], List[tuple]]:
+        """
+        Write rows to the table.
+
+        Args:
+            table_key (str): The table identifier in the format "schema.table"
+            column_names (list): Column names shared by every row of the batch
+            rows (list): Row values in the same order as column_names
+
+        Returns:
+            tuple: (returned column names, returned rows)
+        """
+        raise NotImplementedError
+
+    def reset(self):
+        """Forget any per-transaction state, called after the connection has been rolled back."""
+        pass
+
+    def begin_shard(self, table_key: str, first_row: int):
+        """Called in a process shard before it loads its rows, first_row being the shard's first row number."""
+        pass
+
+    def close(self):
+        """Release anything held open between batches, called once the loader is no longer used."""
+        pass
+
+
+class InsertLoader(BatchLoader):
+    """Multi-row `INSERT ... VALUES ... RETURNING *`, the original DataGenerator behaviour."""
+    name = 'insert'
+
+    def load(self, table_key, column_names, rows):
+        schema, table = table_key.split('.')
+        columns_str = ", ".join([f'"{col}"' for col in column_names])
+
+        # Construct a multi-row VALUES statement
+        placeholders = "(" + ", ".join(["%s"] * len(column_names)) + ")"
+        placeholders_str = ", ".join([placeholders] * len(rows))
+        all_values = [value for row_values in rows for value in row_values]
+
+        query = f'INSERT INTO "{schema}"."{table}" ({columns_str}) VALUES {placeholders_str} RETURNING *'
+        cursor = self.dg.tuple_cursor
+        cursor.execute(query, all_values)
+        inserted_rows = cursor.fetchall()
+        return [desc.name for desc in cursor.description], inserted_rows
+
+
+class CopyLoader(BatchLoader):
+    """
+    Streams batches through `COPY ... FROM STDIN (FORMAT csv)` and only reads back primary key values.
+
+    Primary keys are resolved without fetching whole rows:
+      * if every PK column is part of the batch, the rows are copied straight into the table and the
+        keys are taken from the batch itself;
+      * if the only missing PK column is a serial (or `GENERATED BY DEFAULT` identity) column, a range of
+        values is pre-allocated with `nextval` and copied along with the batch;
+      * otherwise the batch is copied into a temporary staging table and moved across with
+        `INSERT ... SELECT ... RETURNING <pk>`.
+    """
+    name = 'copy'
+
+    def __init__(self, dg):
+        super().__init__(dg)
+        self._sequences: Dict[str, Optional[str]] = {}
+        self._stages = set()
+
+    def reset(self):
+        # Temporary tables created in a rolled back transaction no longer exist
+        self._stages.clear()
+
+    def load(self, table_key, column_names, rows):
+        pk_columns = self._get_pk_columns(table_key)
+        missing_pk_columns = [col for col in pk_columns if col not in column_names]
+
+        if not missing_pk_columns:
+            self._copy(table_key, column_names, rows)
+            pk_indices = [column_names.index(col) for col in pk_columns]
+            return pk_columns, [tuple(row[i] for i in pk_indices) for row in rows]
+
+        if len(missing_pk_columns) == 1 and len(pk_columns) == 1:
+            sequence = self._get_sequence(table_key, pk_columns[0])
+            if sequence:
+                pk_values = self._allocate_ids(sequence, len(rows))
+                self._copy(table_key, [pk_columns[0]] + list(column_names),
+                           [[pk_value] + list(row) for pk_value, row in zip(pk_values, rows)])
+                return pk_columns, [(pk_value,) for pk_value in pk_values]
+
+        return pk_columns, self._copy_via_stage(table_key, column_names, rows, pk_columns)
+
+    def _copy(self, table_key, column_names, rows, target=None):
+        schema, table = table_key.split('.')
+        target = target or f'"{schema}"."{table}"'
+        columns_str = ", ".join([f'"{col}"' for col in column_names])
+        buffer = io.StringIO(self._encode_rows(table_key, column_names, rows))
+        self.dg.tuple_cursor.copy_expert(f'COPY {target} ({columns_str}) FROM STDIN WITH (FORMAT csv)', buffer)
+
+    def _copy_via_stage(self, table_key, column_names, rows, pk_columns):
+        schema, table = table_key.split('.')
+        columns_str = ", ".join([f'"{col}"' for col in column_names])
+        digest = hashlib.md5(f"{table_key}:{columns_str}".encode()).hexdigest()[:16]
+        stage = f'"_dg_stage_{digest}"'
+
+        cursor = self.dg.tuple_cursor
+        if stage not in self._stages:
+            # CREATE TABLE AS copies column types only, so NOT NULL columns outside the batch don't matter
+            cursor.execute(f'CREATE TEMP TABLE IF NOT EXISTS {stage} AS '
+                           f'SELECT {columns_str} FROM "{schema}"."{table}" WITH NO DATA')
+            self._stages.add(stage)
+
+        self._copy(table_key, column_names, rows, target=stage)
+        returning = ", ".join([f'"{col}"' for col in pk_columns]) if pk_columns else '*'
+        cursor.execute(f'INSERT INTO "{schema}"."{table}" ({columns_str}) '
+                       f'SELECT {columns_str} FROM {stage} RETURNING {returning}')
+        returned_rows = cursor.fetchall()
+        cursor.execute(f'TRUNCATE {stage}')
+        return returned_rows
+
+    def _allocate_ids(self, sequence, count):
+        cursor = self.dg.tuple_cursor
+        cursor.execute('SELECT nextval(%s) FROM generate_series(1, %s)', (sequence, count))
+        return [row[0] for row in cursor.fetchall()]
+
+    def _get_pk_columns(self, table_key):
+        metadata = self.dg.table_metadata.get(table_key)
+        return metadata.pk_columns if metadata else []
+
+    def _get_sequence(self, table_key, column):
+        """Return the sequence backing a serial/identity column, or None if values can't be supplied by COPY."""
+        cache_key = f"{table_key}.{column}"
+        if cache_key not in self._sequences:
+            schema, table = table_key.split('.')
+            cursor = self.dg.tuple_cursor
+            cursor.execute("""
+                SELECT identity_generation, pg_get_serial_sequence(format('%%I.%%I', table_schema, table_name), column_name)
+                FROM information_schema.columns
+                WHERE table_schema = %s AND table_name = %s AND column_name = %s
+            """, (schema, table, column))
+            result = cursor.fetchone()
+            # GENERATED ALWAYS identity columns reject explicit values in COPY
+            if result and result[1] and result[0] != 'ALWAYS':
+                self._sequences[cache_key] = result[1]
+            else:
+                self._sequences[cache_key] = None
+        return self._sequences[cache_key]
+
+    def _encode_rows(self, table_key, column_names, rows):
+        metadata = self.dg.table_metadata.get(table_key)
+        data_types = metadata.data_types if metadata else {}
+        column_types = [data_types.get(col, '').lower() for col in column_names]
+        lines = []
+        for row in rows:
+            lines.append(",".join(_encode_copy_value(value, data_type)
+                                  for value, data_type in zip(row, column_types)))
+        return "\n".join(lines) + "\n"
+
+
+def _encode_copy_value(value, data_type=''):
+    """Encode a Python value as a CSV field for COPY. NULL is an unquoted empty field, everything else is quoted."""
+    if value is None:
+        return ''
+    return '"' + _copy_text(value, data_type).replace('"', '""') + '"'
+
+
+def _copy_text(value, data_type=''):
+    """Text PostgreSQL parses back into the value for a column of the given type."""
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, bool):
+        text = 't' if value else 'f'
+    elif isinstance(value, (datetime, date, time)):
+        text = value.isoformat()
+    elif isinstance(value, timedelta):
+        text = f"{value.days} days {value.seconds} seconds {value.microseconds} microseconds"
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        text = '\\x' + bytes(value).hex()
+    elif isinstance(value, (dict, list, tuple)) and data_type in ('json', 'jsonb'):
+        text = json.dumps(value, default=str)
+    elif isinstance(value, (list, tuple)):
+        text = _encode_array(value)
+    elif isinstance(value, dict):
+        text = json.dumps(value, default=str)
+    elif isinstance(value, Decimal):
+        text = format(value, 'f')
+    else:
+        text = str(value)
+    return text
+
+
+def _encode_array(values: Sequence[Any]) -> str:
+    """Encode a Python sequence as a PostgreSQL array literal."""
+    elements = []
+    for value in values:
+        if value is None:
+            elements.append('NULL')
+        elif isinstance(value, (list, tuple)):
+            elements.append(_encode_array(value))
+        else:
+            if isinstance(value, Enum):
+                value = value.value
+            text = str(value).replace('\\', '\\\\').replace('"', '\\"')
+            elements.append(f'"{text}"')
+    return "{" + ",".join(elements) + "}"
+
+
+class FileSink(BatchLoader):
+    """
+    Base class for loaders writing batches to files under dg.output_dir instead of the database.
+
+    Every table gets a directory named after it, holding part files of at most rows_per_file rows, appended to
+    batch by batch so that memory use doesn't grow with the table. Part files are named after the worker that
+    writes them (0 for the main thread, the shard number in process shards).
+
+    Primary keys are returned like the COPY loader does: taken from the batch when every key column is in it,
+    otherwise allocated here for a serial integer or UUID key. Serial keys continue the table's sequence
+    without advancing it, and process shards start at their first row number so that they never share a key.
+    """
+    name = 'file'
+    writes_database = False
+    extension = ''
+    rows_per_file = 1000000
+
+    def __init__(self, dg):
+        super().__init__(dg)
+        self.directory = dg.output_dir
+        self._parts: Dict[tuple, dict] = {}  # (table_key, column names) -> open part file state
+        self._part_numbers: Dict[str, int] = {}
+        self._next_ids: Dict[str, int] = {}
+        self._id_offsets: Dict[str, int] = {}
+
+    def load(self, table_key, column_names, rows):
+        metadata = self.dg.table_metadata.get(table_key)
+        pk_columns = metadata.pk_columns if metadata else []
+        missing_pk_columns = [col for col in pk_columns if col not in column_names]
+
+        if missing_pk_columns:
+            if len(pk_columns) != 1:
+                raise ValueError(f"Can't allocate the composite primary key {pk_columns} of {table_key}")
+            data_type = (metadata.data_types.get(pk_columns[0]) or '').lower()
+            if data_type == 'uuid':
+                pk_values = [str(uuid.uuid4()) for _ in rows]
+            elif data_type in ('smallint', 'integer', 'bigint'):
+                pk_values = self._allocate_ids(table_key, pk_columns[0], len(rows))
+            else:
+                raise ValueError(f"Can't allocate the {data_type} primary key {pk_columns[0]} of {table_key}")
+            column_names = [pk_columns[0]] + list(column_names)
+            rows = [[pk_value] + list(row) for pk_value, row in zip(pk_values, rows)]
+
+        self._write(table_key, column_names, rows)
+        pk_indices = [column_names.index(col) for col in pk_columns]
+        return pk_columns, [tuple(row[i] for i in pk_indices) for row in rows]
+
+    def begin_shard(self, table_key, first_row):
+        self._id_offsets[table_key] = first_row
+        self._next_ids.pop(table_key, None)
+
+    def close(self):
+        for part in self._parts.values():
+            self._close_part(part)
+        self._parts.clear()
+
+    def _write(self, table_key, column_names, rows):
+        key = (table_key, tuple(column_names))
+        part = self._parts.get(key)
+        if part is not None and part['rows'] >= self.rows_per_file:
+            self._close_part(self._parts.pop(key))
+            part = None
+        if part is None:
+            part = self._parts[key] = self._open_part(table_key, list(column_names), self._next_part_path(table_key))
+        self._write_rows(part, rows)
+        part['rows'] += len(rows)
+
+    def _next_part_path(self, table_key):
+        number = self._part_numbers.get(table_key, 0)
+        self._part_numbers[table_key] = number + 1
+        worker = self.dg._local_worker()
+        directory = os.path.join(self.directory, table_key)
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, f"part-{worker.index if worker else 0:02d}-{number:05d}{self.extension}")
+
+    def _column_types(self, table_key, column_names):
+        metadata = self.dg.table_metadata.get(table_key)
+        data_types = metadata.data_types if metadata else {}
+        return [(data_types.get(col) or '').lower() for col in column_names]
+
+    def _allocate_ids(self, table_key, column, count):
+        if table_key not in self._next_ids:
+            self._next_ids[table_key] = self._first_id(table_key, column) + self._id_offsets.get(table_key, 0)
+        first = self._next_ids[table_key]
+        self._next_ids[table_key] = first + count
+        return list(range(first, first + count))
+
+    def _first_id(self, table_key, column):
+        """Next value of the column's sequence, read without advancing it, and after any key already stored."""
+        schema, table = table_key.split('.')
+        next_id = 1
+        cursor = self.dg.tuple_cursor
+        cursor.execute('SELECT pg_get_serial_sequence(%s, %s)', (f'"{schema}"."{table}"', column))
+        sequence = cursor.fetchone()[0]
+        if sequence:
+            cursor.execute(f'SELECT last_value, is_called FROM {sequence}')
+            last_value, is_called = cursor.fetchone()
+            next_id = last_value + 1 if is_called else last_value
+        pk_store = self.dg.inserted_pks.get(table_key)
+        if pk_store:
+            next_id = max(next_id, max(pk_store) + 1)
+        return next_id
+
+    def _open_part(self, table_key, column_names, path) -> dict:
+        """Open a part file, returning the state _write_rows and _close_part work on."""
+        raise NotImplementedError
+
+    def _write_rows(self, part, rows):
+        raise NotImplementedError
+
+    def _close_part(self, part):
+        part['file'].close()
+        logger.debug(f"Wrote {part['rows']} rows to {part['path']}")
+
+
+class CsvSink(FileSink):
+    """Gzip compressed CSV files with a header line, quoted like the COPY loader's CSV."""
+    name = 'csv'
+    extension = '.csv.gz'
+
+    def _open_part(self, table_key, column_names, path):
+        part = {'path': path, 'rows': 0, 'file': gzip.open(path, 'wt', encoding='utf-8', newline=''),
+                'types': self._column_types(table_key, column_names)}
+        part['file'].write(",".join('"' + col.replace('"', '""') + '"' for col in column_names) + "\n")
+        return part
+
+    def _write_rows(self, part, rows):
+        part['file'].write("".join(",".join(_encode_copy_value(value, data_type)
+                                            for value, data_type in zip(row, part['types'])) + "\n"
+                                   for row in rows))
+
+
+class TsvSink(FileSink):
+    """
+    Tab separated files in the text format of `COPY ... FROM`, plus a copy.sql script in the output directory
+    with a psql `\\copy` command per part file, in the order the tables were generated. The script is started
+    over by the first sink of a run; the sinks of the other workers and of process shards append to it.
+    """
+    name = 'tsv'
+    extension = '.tsv'
+    _script_lock = threading.Lock()
+
+    def __init__(self, dg):
+        super().__init__(dg)
+        self.script = os.path.join(self.directory, 'copy.sql')
+        with self._script_lock:
+            if self.script not in dg.started_outputs:
+                dg.started_outputs.add(self.script)
+                os.makedirs(self.directory, exist_ok=True)
+                open(self.script, 'w', encoding='utf-8').close()
+
+    def _open_part(self, table_key, column_names, path):
+        schema, table = table_key.split('.')
+        columns_str = ", ".join([f'"{col}"' for col in column_names])
+        with open(self.script, 'a', encoding='utf-8') as script:
+            script.write(f"\\copy \"{schema}\".\"{table}\" ({columns_str}) FROM '{os.path.abspath(path)}'\n")
+        return {'path': path, 'rows': 0, 'file': open(path, 'w', encoding='utf-8', newline=''),
+                'types': self._column_types(table_key, column_names)}
+
+    def _write_rows(self, part, rows):
+        part['file'].write("".join("\t".join(_encode_text_value(value, data_type)
+                                             for value, data_type in zip(row, part['types'])) + "\n"
+                                   for row in rows))
+
+
+class ParquetSink(FileSink):
+    """
+    Parquet files written with pyarrow, one row group per row_group_size rows, typed from the column types.
+    Numerics are decimals of the column's precision and scale, rounded like PostgreSQL rounds them; numerics
+    without a precision, enums, arrays, JSON and other types without a natural Arrow type are written as their
+    PostgreSQL text.
+    """
+    name = 'parquet'
+    extension = '.parquet'
+    row_group_size = 50000
+
+    def __init__(self, dg):
+        super().__init__(dg)
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ValueError("The parquet loader requires pyarrow, install it with `pip install pyarrow`")
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+
+    def _arrow_type(self, data_type, precision=None, scale=None):
+        pa = self.pa
+        if data_type in ('smallint', 'integer', 'bigint'):
+            return pa.int64()
+        if data_type in ('numeric', 'decimal'):
+            if precision is None or precision > 76:
+                return pa.string()
+            decimal_type = pa.decimal128 if precision <= 38 else pa.decimal256
+            return decimal_type(precision, scale or 0)
+        if data_type in ('real', 'double precision', 'money'):
+            return pa.float64()
+        if data_type == 'boolean':
+            return pa.bool_()
+        if data_type == 'date':
+            return pa.date32()
+        if data_type == 'timestamp with time zone':
+            return pa.timestamp('us', tz='UTC')
+        if data_type == 'timestamp without time zone':
+            return pa.timestamp('us')
+        if data_type == 'bytea':
+            return pa.binary()
+        return pa.string()
+
+    def _open_part(self, table_key, column_names, path):
+        # column -> (precision, scale) of its numeric type
+        numeric = {info[0]: (info[5], info[6]) for info in self.dg.table_columns.get(table_key, ())}
+        types = [self._arrow_type(data_type, *numeric.get(col, (None, None)))
+                 for col, data_type in zip(column_names, self._column_types(table_key, column_names))]
+        schema = self.pa.schema([self.pa.field(col, arrow_type) for col, arrow_type in zip(column_names, types)])
+        return {'path': path, 'rows': 0, 'file': self.pq.ParquetWriter(path, schema), 'schema': schema,
+                'types': self._column_types(table_key, column_names), 'buffer': []}
+
+    def _write_rows(self, part, rows):
+        part['buffer'].extend(rows)
+        if len(part['buffer']) >= self.row_group_size:
+            self._write_row_group(part)
+
+    def _write_row_group(self, part):
+        rows, part['buffer'] = part['buffer'], []
+        if not rows:
+            return
+        arrays = []
+        for i, (field, data_type) in enumerate(zip(part['schema'], part['types'])):
+            values = [row[i] for row in rows]
+            if self.pa.types.is_string(field.type):
+                values = [None if value is None else _copy_text(value, data_type) for value in values]
+            elif self.pa.types.is_floating(field.type):
+                values = [None if value is None else float(value) for value in values]
+            elif self.pa.types.is_decimal(field.type):
+                quantum = Decimal(1).scaleb(-field.type.scale)
+                values = [None if value is None else Decimal(_copy_text(value)).quantize(quantum, ROUND_HALF_UP)
+                          for value in values]
+            arrays.append(self.pa.array(values, type=field.type))
+        part['file'].write_table(self.pa.Table.from_arrays(arrays, schema=part['schema']))
+
+    def _close_part(self, part):
+        self._write_row_group(part)
+        super()._close_part(part)
+
+
+def _encode_text_value(value, data_type=''):
+    """Encode a Python value as a field of COPY's text format, NULL being \\N."""
+    if value is None:
+        return '\\N'
+    text = _copy_text(value, data_type)
+    return text.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+
+LOADERS = {
+    InsertLoader.name: InsertLoader,
+    CopyLoader.name: CopyLoader,
+    CsvSink.name: CsvSink,
+    TsvSink.name: TsvSink,
+    ParquetSink.name: ParquetSink,
+}
+
+
+def create_loader(name: str, dg) -> BatchLoader:
+    """
+    Instantiate a loader by name.
+
+    Args:
+        name (str): One of the keys of LOADERS ('insert', 'copy', or the file sinks 'csv', 'tsv', 'parquet')
+        dg: DataGenerator instance the loader writes for
+
+    Returns:
+        BatchLoader: The loader instance
+    """
+    try:
+        return LOADERS[name.lower()](dg)
+    except KeyError:
+        raise ValueError(f"Unknown loader '{name}', expected one of {sorted(LOADERS)}")
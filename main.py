@@ -1,5 +1,17 @@
 from fsi_data_generator import generate_banking_data
 
+import argparse
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Generate the financial services demo data')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Number of tables generated concurrently (default WORKERS or 1)')
+    parser.add_argument('--loader', choices=['insert', 'copy', 'parquet', 'csv', 'tsv'], default=None,
+                        help='Write batches into the database (insert, copy) or to files under --output-dir '
+                             '(parquet, csv, tsv) (default LOADER or insert)')
+    parser.add_argument('--output-dir', default=None,
+                        help='Directory the file loaders write to (default OUTPUT_DIR or output)')
+    args = parser.parse_args()
+
     # Call the generate_banking_data function
-    generate_banking_data()
+    generate_banking_data(workers=args.workers, loader=args.loader, output_dir=args.output_dir)
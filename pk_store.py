@@ -0,0 +1,277 @@
+from array import array
+from samplers import AliasSampler
+from typing import Any, Iterable, List, Optional, Sequence
+
+import logging
+import numpy as np
+import os
+import random
+import tempfile
+import uuid
+
+logger = logging.getLogger(__name__)
+
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+
+class _KeyColumn:
+    """
+    Storage for the values of one primary key column.
+
+    Integer keys live in an `array('q')`, UUID keys in a packed bytearray of 16 bytes per key, anything else in a
+    plain list. Fixed width columns can be spilled to a memory-mapped file once they grow past a threshold.
+    """
+
+    def __init__(self, data_type: Optional[str] = None):
+        self.kind = None  # 'int', 'uuid' or 'object', decided by the first value
+        self.data_type = (data_type or '').lower()
+        self.uuid_as_str = False
+        self.values = None
+        self.spilled = None  # np.memmap of values moved to disk
+        self.spill_file = None
+        self.spilled_len = 0
+
+    def __len__(self):
+        return self.spilled_len + self._tail_len()
+
+    def _tail_len(self):
+        if self.values is None:
+            return 0
+        if self.kind == 'uuid':
+            return len(self.values) // 16
+        return len(self.values)
+
+    def _init_kind(self, value):
+        if isinstance(value, int) and not isinstance(value, bool) and INT64_MIN <= value <= INT64_MAX:
+            self.kind = 'int'
+            self.values = array('q')
+        elif isinstance(value, uuid.UUID) or (self.data_type == 'uuid' and isinstance(value, str)):
+            self.kind = 'uuid'
+            self.uuid_as_str = isinstance(value, str)
+            self.values = bytearray()
+        else:
+            self.kind = 'object'
+            self.values = []
+
+    def _to_object(self):
+        """Fall back to a list once a value doesn't fit the packed representation."""
+        current = list(self)
+        self.kind = 'object'
+        self.values = current
+        self.spilled = None
+        self.spilled_len = 0
+        self._remove_spill_file()
+
+    def append(self, value):
+        if self.kind is None:
+            self._init_kind(value)
+
+        if self.kind == 'int':
+            if isinstance(value, int) and not isinstance(value, bool) and INT64_MIN <= value <= INT64_MAX:
+                self.values.append(value)
+                return
+            self._to_object()
+        elif self.kind == 'uuid':
+            try:
+                self.values += (value if isinstance(value, uuid.UUID) else uuid.UUID(value)).bytes
+                return
+            except (TypeError, ValueError, AttributeError):
+                self._to_object()
+
+        self.values.append(value)
+
+    def get(self, index):
+        if index < self.spilled_len:
+            raw = self.spilled[index]
+        else:
+            index -= self.spilled_len
+            if self.kind == 'uuid':
+                raw = bytes(self.values[index * 16:(index + 1) * 16])
+            else:
+                return self.values[index]
+        return self._decode(raw)
+
+    def _decode(self, raw):
+        if self.kind == 'int':
+            return int(raw)
+        if self.kind == 'uuid':
+            value = uuid.UUID(bytes=bytes(raw))
+            return str(value) if self.uuid_as_str else value
+        return raw
+
+    def take(self, indices: np.ndarray) -> List[Any]:
+        """Gather many values at once; vectorized for integer keys."""
+        if self.kind == 'int' and not self.spilled_len:
+            buffer = np.frombuffer(self.values, dtype=np.int64) if len(self.values) else np.empty(0, np.int64)
+            return buffer[indices].tolist()
+        return [self.get(int(i)) for i in indices]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.get(i)
+
+    def spill(self, directory=None):
+        """Move the in-memory values of a fixed width column into a memory-mapped file."""
+        if self.kind not in ('int', 'uuid') or not self._tail_len():
+            return False
+
+        if self.kind == 'int':
+            tail = np.frombuffer(self.values, dtype=np.int64)
+            dtype, shape = np.int64, lambda n: (n,)
+        else:
+            tail = np.frombuffer(bytes(self.values), dtype=np.uint8).reshape(-1, 16)
+            dtype, shape = np.uint8, lambda n: (n, 16)
+
+        if self.spill_file is None:
+            fd, self.spill_file = tempfile.mkstemp(prefix='dg_pks_', suffix='.bin', dir=directory)
+            os.close(fd)
+
+        with open(self.spill_file, 'ab') as f:
+            f.write(tail.tobytes())
+
+        self.spilled_len += len(tail)
+        self.spilled = np.memmap(self.spill_file, dtype=dtype, mode='r', shape=shape(self.spilled_len))
+        self.values = array('q') if self.kind == 'int' else bytearray()
+        return True
+
+    def _remove_spill_file(self):
+        if self.spill_file and os.path.exists(self.spill_file):
+            try:
+                os.remove(self.spill_file)
+            except OSError as e:
+                logger.debug(f"Could not remove PK spill file {self.spill_file}: {e}")
+        self.spill_file = None
+
+    def close(self):
+        self.spilled = None
+        self._remove_spill_file()
+
+
+class PrimaryKeyStore:
+    """
+    Compact, columnar store of the primary keys inserted into one table.
+
+    Single-column keys are stored in one typed column; composite keys are stored as a struct of arrays (one
+    column per key part) and read back as tuples. The store behaves like a read-only sequence, so existing code
+    that does `random.choice(store)`, `list(store)` or `store[i]` keeps working, and adds O(1) uniform and
+    weighted sampling plus a vectorized `sample(k)`.
+
+    Args:
+        table_key (str): The table identifier in the format "schema.table"
+        data_types (list, optional): information_schema data type of each key column, used to pack UUIDs
+        spill_threshold (int, optional): Spill fixed width columns to disk once this many keys are in memory
+        spill_dir (str, optional): Directory for spill files. Defaults to the system temp directory.
+    """
+
+    def __init__(self, table_key: str, data_types: Optional[Sequence[str]] = None,
+                 spill_threshold: Optional[int] = None, spill_dir: Optional[str] = None):
+        self.table_key = table_key
+        self.data_types = list(data_types) if data_types else None
+        self.columns: Optional[List[_KeyColumn]] = None
+        self.composite = False
+        self.spill_threshold = spill_threshold
+        self.spill_dir = spill_dir
+        self._sampler: Optional[AliasSampler] = None
+
+    def _init_columns(self, value):
+        self.composite = isinstance(value, tuple)
+        width = len(value) if self.composite else 1
+        types = self.data_types if self.data_types and len(self.data_types) == width else [None] * width
+        self.columns = [_KeyColumn(data_type) for data_type in types]
+
+    def append(self, value):
+        """Add one key: a scalar, or a tuple for composite keys."""
+        if self.columns is None:
+            self._init_columns(value)
+
+        if self.composite:
+            for column, part in zip(self.columns, value):
+                column.append(part)
+        else:
+            self.columns[0].append(value)
+
+        if self._sampler is not None:
+            logger.debug(f"Clearing PK sampling weights for {self.table_key} after append")
+            self._sampler = None
+
+        if self.spill_threshold and self.columns[0]._tail_len() >= self.spill_threshold:
+            for column in self.columns:
+                column.spill(self.spill_dir)
+
+    def extend(self, values: Iterable):
+        for value in values:
+            self.append(value)
+
+    def __len__(self):
+        return len(self.columns[0]) if self.columns else 0
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError(f"PK index {index} out of range for {self.table_key}")
+        if self.composite:
+            return tuple(column.get(index) for column in self.columns)
+        return self.columns[0].get(index)
+
+    def __iter__(self):
+        if not self.columns:
+            return iter(())
+        if self.composite:
+            return zip(*self.columns)
+        return iter(self.columns[0])
+
+    def __contains__(self, value):
+        return any(item == value for item in self)
+
+    def __repr__(self):
+        kinds = [column.kind for column in self.columns] if self.columns else []
+        return f"PrimaryKeyStore({self.table_key!r}, {len(self)} keys, kinds={kinds})"
+
+    def set_weights(self, weights: Optional[Sequence[float]]):
+        """
+        Use per-key weights for `choice` and `sample`. Pass None to go back to uniform sampling.
+        Weights are cleared by the next append since the alias table covers a fixed set of keys.
+        """
+        if weights is None:
+            self._sampler = None
+            return
+        if len(weights) != len(self):
+            raise ValueError(f"Number of weights ({len(weights)}) must match the number of keys ({len(self)})")
+        self._sampler = AliasSampler(weights)
+
+    def choice(self, rng=random):
+        """Return one key, uniformly or using the weights from `set_weights`, in O(1)."""
+        length = len(self)
+        if not length:
+            raise IndexError(f"Cannot choose from an empty PK store for {self.table_key}")
+        if self._sampler is not None:
+            return self[self._sampler.sample_index(rng)]
+        return self[int(rng.random() * length)]
+
+    def sample(self, k: int, rng: np.random.Generator = None) -> List[Any]:
+        """Return k keys drawn with replacement, generating the indices in one vectorized call."""
+        length = len(self)
+        if not length:
+            raise IndexError(f"Cannot sample from an empty PK store for {self.table_key}")
+        if self._sampler is not None:
+            indices = self._sampler.sample_indices(k, rng)
+        else:
+            rng = rng or np.random.default_rng(random.getrandbits(64))
+            indices = rng.integers(0, length, size=k)
+
+        if self.composite:
+            return list(zip(*(column.take(indices) for column in self.columns)))
+        return self.columns[0].take(indices)
+
+    def close(self):
+        """Release spill files."""
+        for column in self.columns or []:
+            column.close()
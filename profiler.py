@@ -0,0 +1,256 @@
+from contextlib import nullcontext
+from functools import wraps
+from typing import Dict, List, Optional
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_DISABLED = nullcontext()
+
+
+class _Span:
+    __slots__ = ('profiler', 'category', 'name', 'start')
+
+    def __init__(self, profiler, category, name):
+        self.profiler = profiler
+        self.category = category
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.category, self.name, self.start, time.perf_counter())
+        return False
+
+
+class Profiler:
+    """
+    Opt-in wall time and call count accounting of named spans, grouped by category: tables, custom generator
+    functions, queries issued while generating and batch flushes (see DataGenerator.profiler).
+
+    Spans nest, so a table's time includes the generators, queries and flushes run for it. Every thread accounts
+    into its own totals, merged when reporting, so spans cost one dictionary update when enabled and nothing when
+    disabled: span() returns a shared no-op context manager and wrap() the function itself.
+
+    With trace enabled every span is also kept as a complete event of the Chrome trace format, written by
+    write_trace and readable by chrome://tracing, Perfetto and Speedscope.
+
+    Args:
+        enabled (bool): Account spans at all
+        trace (bool): Keep every span as a trace event too
+        max_trace_events (int): Trace events kept, later spans are still accounted but not traced
+    """
+
+    def __init__(self, enabled=False, trace=False, max_trace_events=1000000):
+        self.enabled = enabled
+        self.trace = enabled and trace
+        self.max_trace_events = max_trace_events
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._threads: List[tuple] = []  # (totals, events) of every thread that recorded a span
+        self._origin = time.perf_counter()
+        self._dropped_events = 0
+
+    def _thread_state(self):
+        state = getattr(self._local, 'state', None)
+        if state is None:
+            state = self._local.state = ({}, [])
+            with self._lock:
+                self._threads.append(state)
+        return state
+
+    def span(self, category, name):
+        """Context manager accounting the wall time of its block to (category, name)."""
+        if not self.enabled:
+            return _DISABLED
+        return _Span(self, category, name)
+
+    def wrap(self, category, name, func):
+        """func, accounting the wall time of every call to (category, name) when enabled."""
+        if not self.enabled or func is None:
+            return func
+
+        @wraps(func)
+        def profiled(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(category, name, start, time.perf_counter())
+
+        return profiled
+
+    def record(self, category, name, start, end):
+        """Account one span given its perf_counter start and end."""
+        totals, events = self._thread_state()
+        duration = end - start
+        stats = totals.get((category, name))
+        if stats is None:
+            totals[(category, name)] = [1, duration, duration]
+        else:
+            stats[0] += 1
+            stats[1] += duration
+            if duration > stats[2]:
+                stats[2] = duration
+        if self.trace:
+            if len(events) < self.max_trace_events:
+                events.append((category, name, start - self._origin, duration, os.getpid(),
+                               threading.get_ident()))
+            else:
+                self._dropped_events += 1
+
+    def totals(self) -> Dict[tuple, list]:
+        """(category, name) -> [calls, total seconds, max seconds], over all threads."""
+        merged = {}
+        with self._lock:
+            threads = list(self._threads)
+        for totals, _ in threads:
+            for key, (calls, total, longest) in list(totals.items()):
+                stats = merged.setdefault(key, [0, 0.0, 0.0])
+                stats[0] += calls
+                stats[1] += total
+                stats[2] = max(stats[2], longest)
+        return merged
+
+    def report(self, top=25) -> str:
+        """
+        Text report of the spans with the most total time, per category.
+
+        Args:
+            top (int): Spans listed per category
+
+        Returns:
+            str: The report, empty when nothing was recorded
+        """
+        totals = self.totals()
+        if not totals:
+            return ''
+        lines = []
+        for category in sorted({category for category, _ in totals},
+                               key=lambda c: -sum(s[1] for (cat, _), s in totals.items() if cat == c)):
+            spans = sorted(((stats, name) for (cat, name), stats in totals.items() if cat == category),
+                           key=lambda item: -item[0][1])
+            lines.append(f"{category}: {len(spans)} spans, {sum(stats[1] for stats, _ in spans):.2f} seconds")
+            lines.append(f"  {'total s':>10} {'calls':>10} {'mean ms':>10} {'max ms':>10}  name")
+            for (calls, total, longest), name in spans[:top]:
+                lines.append(f"  {total:10.3f} {calls:10d} {total / calls * 1000:10.3f} {longest * 1000:10.3f}  "
+                             f"{name}")
+            if len(spans) > top:
+                lines.append(f"  ... {len(spans) - top} more")
+        return "\n".join(lines)
+
+    def write_trace(self, path):
+        """Write the trace events as Chrome trace format JSON."""
+        with self._lock:
+            threads = list(self._threads)
+        events = [{'name': name, 'cat': category, 'ph': 'X', 'ts': round(start * 1e6, 3),
+                   'dur': round(duration * 1e6, 3), 'pid': pid, 'tid': tid}
+                  for _, thread_events in threads
+                  for category, name, start, duration, pid, tid in thread_events]
+        events.sort(key=lambda event: event['ts'])
+        with open(path, 'w') as file:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, file)
+        if self._dropped_events:
+            logger.warning(f"Trace truncated to {self.max_trace_events} events, {self._dropped_events} dropped")
+        logger.info(f"Wrote {len(events)} trace events to {path}")
+
+    def reset(self):
+        """Forget everything recorded, e.g. the state a forked process inherited from its parent."""
+        with self._lock:
+            self._threads = []
+            self._local = threading.local()
+            self._dropped_events = 0
+
+    def export(self) -> Optional[dict]:
+        """What this process recorded, for merge in another process, or None when disabled."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            threads = list(self._threads)
+        return {'totals': list(self.totals().items()),
+                'events': [event for _, thread_events in threads for event in thread_events]}
+
+    def merge(self, exported):
+        """Add what another process recorded, see export."""
+        if not exported or not self.enabled:
+            return
+        totals, events = self._thread_state()
+        for key, (calls, total, longest) in exported['totals']:
+            stats = totals.setdefault(tuple(key), [0, 0.0, 0.0])
+            stats[0] += calls
+            stats[1] += total
+            stats[2] = max(stats[2], longest)
+        if self.trace:
+            events.extend(tuple(event) for event in exported['events'])
+
+    def connection_factory(self, base=None):
+        """
+        A psycopg2 connection class whose cursors account every query they run to the 'query' category, named
+        after the statement with its whitespace collapsed.
+
+        Args:
+            base (type, optional): Connection class to extend. Defaults to psycopg2.extensions.connection.
+        """
+        from psycopg2 import extensions
+
+        profiler = self
+        cursor_classes = {}
+
+        def profiled_cursor(cursor_factory):
+            if cursor_factory not in cursor_classes:
+                class ProfiledCursor(cursor_factory):
+                    def execute(self, query, params=None):
+                        with profiler.span('query', _statement_name(query)):
+                            return super().execute(query, params)
+
+                    def executemany(self, query, params_list):
+                        with profiler.span('query', _statement_name(query)):
+                            return super().executemany(query, params_list)
+
+                    def copy_expert(self, sql, file, size=8192):
+                        with profiler.span('query', _statement_name(sql)):
+                            return super().copy_expert(sql, file, size)
+
+                cursor_classes[cursor_factory] = ProfiledCursor
+            return cursor_classes[cursor_factory]
+
+        class ProfiledConnection(base or extensions.connection):
+            def cursor(self, *args, **kwargs):
+                kwargs['cursor_factory'] = profiled_cursor(kwargs.get('cursor_factory') or self.cursor_factory or
+                                                           extensions.cursor)
+                return super().cursor(*args, **kwargs)
+
+        return ProfiledConnection
+
+
+def _statement_name(query, limit=120):
+    """
+    The statement text with collapsed whitespace and literals replaced by ?, truncated, so that the same query is
+    accounted once whatever values were formatted into it.
+    """
+    text = query.decode(errors='replace') if isinstance(query, bytes) else str(query)
+    text = re.sub(r"'(?:[^']|'')*'", '?', text)
+    text = re.sub(r'\b\d+(\.\d+)?\b', '?', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text if len(text) <= limit else text[:limit] + '...'
+
+
+def generator_name(func, table_key=None, column=None):
+    """
+    Name of a custom generator for profiling: the function random_record calls, or the generator itself, with
+    the column it generates when it's a lambda.
+    """
+    target = getattr(func, 'target', func)
+    name = f"{getattr(target, '__module__', None) or ''}.{getattr(target, '__qualname__', repr(target))}"
+    name = name.removeprefix('fsi_data_generator.fsi_generators.').lstrip('.')
+    if '<lambda>' in name and table_key:
+        name += f" [{table_key}.{column}]"
+    return name
@@ -0,0 +1,615 @@
+from bisect import bisect_right
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import ROUND_HALF_UP, Decimal
+from fsi_data_generator.fsi_generators.helpers.random_streams import current_random
+from itertools import accumulate, product
+from loaders import _copy_text
+from psycopg2 import Error, extras
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from zoneinfo import ZoneInfo
+
+import json
+import logging
+import os
+import pickle
+import sqlite3
+import tempfile
+import threading
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Predicate values of these types in `sample` are alternatives (SQL IN)
+_IN_TYPES = (list, tuple, set, frozenset)
+
+_INTEGER_TYPES = ('smallint', 'integer', 'bigint')
+_TEXT_TYPES = ('text', 'character varying', 'citext', 'uuid', 'USER-DEFINED')
+_TRUE_TEXT = ('t', 'true', 'y', 'yes', 'on', '1')
+
+
+def _normalizer(data_type: str, max_length=None, scale=None, timezone=None) -> Optional[Callable[[Any], Any]]:
+    """
+    Function turning a generated value into the value psycopg2 reads back from a column of data_type, by
+    parsing the text the COPY loader writes for it. None for types whose database value it can't reproduce
+    (intervals, arrays, network types, ...), and for timestamptz when the session time zone is unknown.
+    """
+    if data_type in _INTEGER_TYPES:
+        return lambda value: int(_copy_text(value))
+    if data_type in ('numeric', 'decimal'):
+        quantum = Decimal(1).scaleb(-int(scale)) if scale is not None else None
+
+        def numeric(value):
+            number = Decimal(_copy_text(value))
+            return number.quantize(quantum, rounding=ROUND_HALF_UP) if quantum is not None else number
+        return numeric
+    if data_type == 'real':
+        return lambda value: float(str(np.float32(_copy_text(value))))
+    if data_type == 'double precision':
+        return lambda value: float(_copy_text(value))
+    if data_type == 'boolean':
+        return lambda value: value if isinstance(value, bool) else _copy_text(value).strip().lower() in _TRUE_TEXT
+    if data_type in _TEXT_TYPES:
+        return _copy_text
+    if data_type == 'character':
+        return lambda value: _copy_text(value).ljust(max_length or 1)
+    if data_type == 'date':
+        return lambda value: date.fromisoformat(_copy_text(value)[:10])
+    if data_type == 'timestamp without time zone':
+        return lambda value: datetime.fromisoformat(_copy_text(value)).replace(tzinfo=None)
+    if data_type == 'timestamp with time zone' and timezone is not None:
+        def timestamptz(value):
+            parsed = datetime.fromisoformat(_copy_text(value))
+            return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone)
+        return timestamptz
+    if data_type in ('json', 'jsonb'):
+        return lambda value: json.loads(value if isinstance(value, str) else _copy_text(value, data_type))
+    return None
+
+
+def _value_of(row: Dict[str, Any], column):
+    """Value of an index column in a row; indexes over several columns are keyed by a tuple of names."""
+    if isinstance(column, tuple):
+        return tuple(row.get(col) for col in column)
+    return row.get(column)
+
+
+def _where_clause(columns: Sequence[str], values: Sequence) -> tuple:
+    """SQL WHERE clause and parameters matching each column to its value; a list of values matches any of them."""
+    conditions, params = [], []
+    for column, value in zip(columns, values):
+        if value is None:
+            conditions.append(f'"{column}" IS NULL')
+        elif isinstance(value, _IN_TYPES):
+            conditions.append(f'"{column}" IN %s')
+            params.append(tuple(value))
+        else:
+            conditions.append(f'"{column}" = %s')
+            params.append(value)
+    return (f" WHERE {' AND '.join(conditions)}" if conditions else ""), tuple(params)
+
+
+def _shuffled_indices(n: int, rng):
+    """Yield the numbers 0..n-1 in random order, lazily: a Fisher-Yates shuffle that only stores swapped slots."""
+    swapped = {}
+    for i in range(n):
+        j = rng.randrange(i, n)
+        yield swapped.get(j, j)
+        swapped[j] = swapped.get(i, i)
+
+
+class _TableRows:
+    """Cached rows of one table: an LRU of primary key -> row plus the secondary indexes built on it."""
+
+    def __init__(self, pk_columns: Sequence[str]):
+        self.pk_columns = list(pk_columns)
+        self.rows: OrderedDict = OrderedDict()  # pk -> row dict, least recently used first
+        # column (a tuple of columns for multi-column indexes) -> value -> pks, in insertion order
+        self.indexes: Dict[Any, Dict[Any, List[Any]]] = {}
+        self.indexed: Dict[Any, set] = {}  # column -> the pks in its index, so a row is never indexed twice
+        # column -> values whose pk list is known to hold every row, or None when every value is complete
+        self.complete: Dict[Any, Optional[set]] = {}
+        self.generated = 0  # Rows put from this run's batches
+        self.dropped = 0  # Rows evicted without a spill file
+        self.generated_only: Optional[bool] = None  # Whether every row in the table was put from a batch
+        self.uncached: set = set()  # Generated columns left out of cached rows, read from the database instead
+
+    def pk_of(self, row: Dict[str, Any]):
+        if len(self.pk_columns) == 1:
+            return row.get(self.pk_columns[0])
+        return tuple(row.get(col) for col in self.pk_columns)
+
+
+class RowContextCache:
+    """
+    Generated column values of the rows inserted in this run, so generators can read their parent rows from
+    memory instead of selecting them back.
+
+    Rows are keyed by primary key and kept per table in an LRU bounded by max_rows. Evicted rows are written
+    to an SQLite spill file when spill is set and dropped otherwise. Lookups that miss, and lookups of rows not
+    produced in this run (e.g. reference data loaded by SQL), fall back to the database on the calling
+    thread's connection. Tables generated into a file sink have no rows in the database: the cache holds all of
+    them (DataGenerator always spills for file sinks) and never falls back.
+
+    `lookup_rows` answers "all rows where column = value" from an index built on first use. An index value is
+    complete once its primary key list is known to hold every matching row; evicting a row doesn't change that
+    since its key stays in the index. Incomplete values are selected once and kept up to date from then on.
+
+    `sample` draws random rows, optionally matching a predicate, from the primary key store of the table or
+    from an index over the predicate columns, instead of sorting the table with `ORDER BY RANDOM()` on every
+    draw. Indexes hold a key per row, so predicates should use low-cardinality columns like status or type.
+
+    Rows only reach the cache once their batch is flushed, like they only reach the database. Values returned
+    by the loader take precedence. Columns it doesn't return (the COPY loader only returns keys) hold the
+    generated values converted to what the database would return for the column type: numerics rounded to their
+    scale, reals to single precision, timestamps parsed, char(n) padded and so on. Columns of types that can't be
+    reproduced this way (intervals, arrays, network types, ...) are left out, and rows are read from the
+    database when a caller needs them; file sink tables keep them as generated. Returned rows are shared and
+    must not be modified; tables updated in place must call `invalidate`.
+
+    Until then, rows waiting in DataGenerator.batch_data are visible to `lookup_rows` through a pending rows
+    overlay, so a generator reading earlier rows of its own table (e.g. the latest balance of an account) sees
+    them whatever the batch size. The overlay is indexed on the columns generators query: an index is built
+    from the batch on first use, updated by `add_pending` and emptied when the batch is flushed. Pending rows
+    only hold the generated values, not database defaults or serial keys.
+
+    Args:
+        dg (DataGenerator): The generator, for table metadata and the per-thread connection
+        max_rows (int, optional): Rows kept in memory per table. Default is 100000.
+        spill (bool, optional): Spill evicted rows to disk instead of dropping them. Default is False.
+        spill_dir (str, optional): Directory for the spill file. Defaults to the system temp directory.
+    """
+
+    def __init__(self, dg, max_rows: int = 100000, spill: bool = False, spill_dir: Optional[str] = None):
+        self.dg = dg
+        self.max_rows = max(1, int(max_rows))
+        self.spill = spill
+        self.spill_dir = spill_dir
+        self.tables: Dict[str, _TableRows] = {}
+        self.stats = {'hits': 0, 'misses': 0, 'db_queries': 0, 'spilled': 0, 'samples': 0, 'pending_hits': 0}
+        # table_key -> column -> value -> rows of the unflushed batch, see pending_rows
+        self.pending: Dict[str, Dict[str, Dict[Any, List[Dict[str, Any]]]]] = {}
+        self._spill_conn = None
+        self._spill_file = None
+        self._lock = threading.RLock()
+        # (table_key, batch columns, returned columns) -> (position, column, normalizer) of the generated columns
+        self._batch_normalizers: Dict[tuple, List[tuple]] = {}
+        self._timezone = None
+        self._timezone_read = False
+
+    def _record(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def _authoritative(self, table_key, table) -> bool:
+        """
+        Whether the cache holds every row of a table: it was generated in this run into a file sink, so the
+        database has none of its rows to read back.
+        """
+        return table.generated > 0 and not self.dg.writes_database(table_key)
+
+    def _table(self, table_key: str) -> Optional[_TableRows]:
+        table = self.tables.get(table_key)
+        if table is None:
+            metadata = self.dg.table_metadata.get(table_key)
+            if not metadata or not metadata.pk_columns:
+                return None
+            table = self.tables[table_key] = _TableRows(metadata.pk_columns)
+        return table
+
+    def put_batch(self, table_key: str, column_names: Sequence[str], rows: Sequence[Sequence],
+                  returned_columns: Sequence[str], returned_rows: Sequence[Sequence]):
+        """
+        Cache a flushed batch: the generated values, completed with whatever the loader returned (database
+        defaults, serial keys). Returned rows are matched to the batch by position.
+        """
+        with self._lock:
+            self.clear_pending(table_key)
+            table = self._table(table_key)
+            if table is None:
+                return
+            if len(returned_rows) == len(rows):
+                normalizers = self._normalizers(table_key, table, column_names, returned_columns)
+                # Rows of file sinks can't be read back, so values that can't be normalized are kept as generated
+                in_files = not self.dg.writes_database(table_key)
+                for values, returned in zip(rows, returned_rows):
+                    row = dict(zip(returned_columns, returned))
+                    for position, column, normalize in normalizers:
+                        value = values[position]
+                        try:
+                            row[column] = value if value is None or normalize is None else normalize(value)
+                        except (ValueError, TypeError, ArithmeticError):
+                            if in_files:
+                                row[column] = value
+                            else:
+                                table.uncached.add(column)
+                    self._put(table_key, table, row)
+            else:
+                for returned in returned_rows:
+                    self._put(table_key, table, dict(zip(returned_columns, returned)))
+            table.generated += len(returned_rows)
+
+    def _normalizers(self, table_key, table, column_names, returned_columns):
+        """
+        The generated columns of a batch to cache, with the normalizer of their values, see _normalizer; None for
+        columns kept as generated, since the file sink they go to leaves no database to read them from.
+        """
+        key = (table_key, tuple(column_names), tuple(returned_columns))
+        normalizers = self._batch_normalizers.get(key)
+        if normalizers is None:
+            types = {info[0]: info for info in self.dg.table_columns.get(table_key, ())}
+            normalizers = []
+            for position, column in enumerate(column_names):
+                if column in returned_columns:
+                    continue
+                _, data_type, _, _, max_length, _, scale = types.get(column) or (column,) + (None,) * 6
+                timezone = self._session_timezone() if data_type == 'timestamp with time zone' else None
+                normalize = _normalizer(data_type, max_length, scale, timezone)
+                if normalize is not None or not self.dg.writes_database(table_key):
+                    normalizers.append((position, column, normalize))
+                else:
+                    table.uncached.add(column)
+            self._batch_normalizers[key] = normalizers
+        return normalizers
+
+    def _session_timezone(self):
+        """Time zone the database reads timestamptz values without an offset in, or None if it is unknown."""
+        if not self._timezone_read:
+            self._timezone_read = True
+            try:
+                with self.dg.conn.cursor() as cursor:
+                    cursor.execute('SHOW TimeZone')
+                    self._timezone = ZoneInfo(cursor.fetchone()[0])
+            except (Error, AttributeError, KeyError, ValueError) as e:
+                logger.debug(f"Not caching generated timestamptz values, unknown session time zone: {e}")
+        return self._timezone
+
+    def _put(self, table_key, table, row):
+        pk = table.pk_of(row)
+        if pk is None:
+            return
+        known = pk in table.rows
+        table.rows[pk] = row
+        table.rows.move_to_end(pk)
+        if not known:
+            for column, index in table.indexes.items():
+                # Rows read back after an eviction are indexed already
+                if pk not in table.indexed[column]:
+                    table.indexed[column].add(pk)
+                    index.setdefault(_value_of(row, column), []).append(pk)
+
+        while len(table.rows) > self.max_rows:
+            evicted_pk, evicted = table.rows.popitem(last=False)
+            if self.spill:
+                self._spill_row(table_key, evicted_pk, evicted)
+            else:
+                table.dropped += 1
+
+    def get(self, table_key: str, pk) -> Optional[Dict[str, Any]]:
+        """The cached row with the given primary key (a tuple for composite keys), without a database fallback."""
+        with self._lock:
+            table = self.tables.get(table_key)
+            if table is None:
+                return None
+            row = table.rows.get(pk)
+            if row is not None:
+                table.rows.move_to_end(pk)
+                return row
+            row = self._unspill_row(table_key, pk)
+            if row is not None:
+                self._put(table_key, table, row)
+            return row
+
+    def lookup(self, table_key: str, pk, columns: Optional[Sequence[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        The row of table_key with the given primary key, from memory or else from the database.
+
+        Args:
+            table_key (str): The table identifier in the format "schema.table"
+            pk: Primary key value, a tuple for composite keys
+            columns (list, optional): Columns the caller needs; a cached row missing one of them (e.g. a default
+                                      not returned by the COPY loader) is read from the database instead. Without
+                                      columns, rows missing a generated column left out of the cache are. Rows
+                                      of tables written to a file sink are never read from the database.
+
+        Returns:
+            dict or None: Column name -> value, or None if the row doesn't exist
+        """
+        row = self.get(table_key, pk)
+        table = self._table(table_key)
+        needed = columns or (table.uncached if table is not None else ())
+        if row is not None and all(col in row for col in needed):
+            self._record('hits')
+            return row
+
+        self._record('misses')
+        if table is None or self._authoritative(table_key, table):
+            return row
+        pk_values = pk if len(table.pk_columns) > 1 else (pk,)
+        rows = self._select(table_key, table.pk_columns, pk_values)
+        return rows[0] if rows else None
+
+    def lookup_rows(self, table_key: str, column: str, value, pending: bool = True) -> List[Dict[str, Any]]:
+        """
+        All rows of table_key where column = value, in insertion order.
+
+        Args:
+            table_key (str): The table identifier in the format "schema.table"
+            column (str): Column to match
+            value: Value to match
+            pending (bool, optional): Include rows batched but not flushed yet, after the others. Default is True.
+
+        Returns:
+            list: Rows as dicts (empty if there are none)
+        """
+        rows = self._flushed_rows(table_key, column, value)
+        if pending:
+            rows += self.pending_rows(table_key, column, value)
+        return rows
+
+    def pending_rows(self, table_key: str, column: str, value) -> List[Dict[str, Any]]:
+        """Rows of table_key where column = value that are batched but not flushed yet, in batch order."""
+        with self._lock:
+            indexes = self.pending.setdefault(table_key, {})
+            if column not in indexes:
+                index = indexes[column] = {}
+                batch = self.dg.batch_data.get(table_key)
+                for values in batch['rows'] if batch else ():
+                    row = dict(zip(batch['column_names'], values))
+                    index.setdefault(row.get(column), []).append(row)
+            rows = list(indexes[column].get(value, ()))
+            if rows:
+                self.stats['pending_hits'] += 1
+        return rows
+
+    def add_pending(self, table_key: str, column_names: Sequence[str], values: Sequence):
+        """Index a row just added to the batch of table_key, if pending rows of the table were queried."""
+        indexes = self.pending.get(table_key)
+        if not indexes:
+            return
+        row = dict(zip(column_names, values))
+        with self._lock:
+            for column, index in indexes.items():
+                index.setdefault(row.get(column), []).append(row)
+
+    def clear_pending(self, table_key: str):
+        """Forget the pending rows of a batch that was flushed or dropped; the indexed columns stay indexed."""
+        with self._lock:
+            for index in self.pending.get(table_key, {}).values():
+                index.clear()
+
+    def _flushed_rows(self, table_key, column, value):
+        with self._lock:
+            table = self._table(table_key)
+            if table is None:
+                return self._select(table_key, [column], (value,))
+            if column not in table.indexes:
+                self._build_index(table_key, table, column)
+
+            complete = table.complete[column]
+            if complete is None or value in complete:
+                rows = [self.get(table_key, pk) for pk in table.indexes[column].get(value, ())]
+                # Rows evicted without a spill file, or missing an uncached column, are read back below
+                if all(row is not None and table.uncached.issubset(row) for row in rows):
+                    self.stats['hits'] += 1
+                    return rows
+
+        self._record('misses')
+        rows = self._select(table_key, [column], (value,))
+        with self._lock:
+            table.indexes[column][value] = [table.pk_of(row) for row in rows]
+            table.indexed[column].update(table.indexes[column][value])
+            if table.complete[column] is not None:
+                table.complete[column].add(value)
+        return rows
+
+    def sample(self, table_key: str, k: int = 1, where: Optional[Dict[str, Any]] = None,
+               predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+               columns: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Up to k distinct random rows of table_key, the in-memory equivalent of
+        `SELECT * FROM table WHERE ... ORDER BY RANDOM() LIMIT k`.
+
+        Without a predicate, keys are drawn from the table's primary key store when every row of the table was
+        generated in this run, and otherwise from a list of its keys selected once. With `where`, keys are drawn
+        from an index over its columns, built on first use. Rows come from `lookup`. Draws come from
+        current_random(), so seeded runs pick the same rows.
+
+        Args:
+            table_key (str): The table identifier in the format "schema.table"
+            k (int, optional): Number of rows. Default is 1.
+            where (dict, optional): Column -> required value; a list, tuple or set of values matches any of them
+            predicate (callable, optional): Further condition on the row dict that can't be indexed (e.g. a date
+                                            range), checked on each drawn row
+            columns (list, optional): Columns the caller needs, see lookup
+
+        Returns:
+            list: Row dicts in random order, fewer than k if fewer rows match
+        """
+        with self._lock:
+            self.stats['samples'] += 1
+            table = self._table(table_key)
+            if table is not None:
+                pools = self._sample_pools(table_key, table, where or {})
+        if table is None:
+            return self._select_random(table_key, k, where or {}, predicate)
+
+        ends = list(accumulate(len(pool) for pool in pools))
+        rows = []
+        for index in _shuffled_indices(ends[-1] if ends else 0, current_random()):
+            pool_index = bisect_right(ends, index)
+            offset = index - (ends[pool_index - 1] if pool_index else 0)
+            row = self.lookup(table_key, pools[pool_index][offset], columns)
+            # Keys of batches that were rolled back have no row
+            if row is not None and (predicate is None or predicate(row)):
+                rows.append(row)
+                if len(rows) >= k:
+                    break
+        return rows
+
+    def _sample_pools(self, table_key, table, where):
+        """Sequences of primary keys that together hold exactly the rows matching where."""
+        if not where:
+            pk_store = self.dg.inserted_pks.get(table_key)
+            if table.generated_only is None:
+                table.generated_only = self._authoritative(table_key, table) or \
+                    self._count(table_key) == table.generated
+            if pk_store and table.generated_only:
+                return [pk_store]
+            return [self._keys(table_key, table, (), ())]
+
+        names = tuple(sorted(where))
+        alternatives = [where[name] if isinstance(where[name], _IN_TYPES) else (where[name],) for name in names]
+        column = names[0] if len(names) == 1 else names
+        return [self._keys(table_key, table, column, values[0] if len(names) == 1 else values)
+                for values in product(*alternatives)]
+
+    def _keys(self, table_key, table, column, value) -> List[Any]:
+        """The complete primary key list of the rows where column = value, selecting the keys if needed."""
+        if column not in table.indexes:
+            self._build_index(table_key, table, column)
+        complete = table.complete[column]
+        if complete is None or value in complete:
+            return table.indexes[column].setdefault(value, [])
+
+        names, values = (column, value) if isinstance(column, tuple) else ((column,), (value,))
+        schema, table_name = table_key.split('.')
+        clause, params = _where_clause(names, values)
+        key_columns = ", ".join(f'"{col}"' for col in table.pk_columns)
+        self._record('db_queries')
+        with self.dg.conn.cursor(cursor_factory=extras.RealDictCursor) as cursor:
+            cursor.execute(f'SELECT {key_columns} FROM "{schema}"."{table_name}"{clause}', params)
+            pks = [table.pk_of(row) for row in cursor.fetchall()]
+
+        table.indexes[column][value] = pks
+        table.indexed[column].update(pks)
+        if complete is not None:
+            complete.add(value)
+        return pks
+
+    def _select_random(self, table_key, k, where, predicate):
+        """`sample` for tables without a primary key, which can only be sampled by the database."""
+        schema, table_name = table_key.split('.')
+        names = list(where)
+        clause, params = _where_clause(names, [where[name] for name in names])
+        limit = "" if predicate else f" LIMIT {int(k)}"
+        self._record('db_queries')
+        with self.dg.conn.cursor(cursor_factory=extras.RealDictCursor) as cursor:
+            cursor.execute(f'SELECT * FROM "{schema}"."{table_name}"{clause} ORDER BY RANDOM(){limit}', params)
+            rows = [dict(row) for row in cursor.fetchall()]
+        if predicate:
+            rows = [row for row in rows if predicate(row)]
+        return rows[:k]
+
+    def _build_index(self, table_key, table, column):
+        index, indexed = {}, set()
+        for pk, row in self._all_rows(table_key, table):
+            index.setdefault(_value_of(row, column), []).append(pk)
+            indexed.add(pk)
+        table.indexes[column] = index
+        table.indexed[column] = indexed
+
+        # Every value is served from memory only if every row of the table went through the cache
+        complete = self._authoritative(table_key, table) or \
+            (not table.dropped and self._count(table_key) == table.generated)
+        table.complete[column] = None if complete else set()
+        logger.debug(f"Indexed {table_key} on {column or 'its keys'} over {len(table.rows)} cached rows "
+                     f"({'complete' if table.complete[column] is None else 'filled on demand'})")
+
+    def invalidate(self, table_key: str, pk=None):
+        """Forget a row updated in place, or every row of the table when pk is None."""
+        with self._lock:
+            table = self.tables.get(table_key)
+            if table is None:
+                return
+            if pk is None:
+                self.tables.pop(table_key)
+                self._delete_spilled(table_key)
+                return
+            row = table.rows.pop(pk, None) or self._unspill_row(table_key, pk)
+            # The updated row is indexed under its new values when it is put again
+            for indexed in table.indexed.values():
+                indexed.discard(pk)
+            for column, complete in table.complete.items():
+                if complete is None:
+                    table.complete[column] = set(table.indexes[column])
+                if row is not None:
+                    table.complete[column].discard(_value_of(row, column))
+
+    def detach(self):
+        """Stop using the spill file, in a forked process that shares it with its parent."""
+        self._spill_conn = None
+        self._spill_file = None
+        self.spill = False
+        self._lock = threading.RLock()
+
+    def close(self):
+        if self._spill_conn is not None:
+            self._spill_conn.close()
+            self._spill_conn = None
+        self.pending.clear()
+        if self._spill_file and os.path.exists(self._spill_file):
+            try:
+                os.remove(self._spill_file)
+            except OSError as e:
+                logger.debug(f"Could not remove row cache spill file {self._spill_file}: {e}")
+        self._spill_file = None
+        self.tables.clear()
+
+    def _select(self, table_key, columns, values):
+        """Read matching rows on the calling thread's connection and cache them."""
+        schema, table_name = table_key.split('.')
+        clause, params = _where_clause(columns, values)
+        self._record('db_queries')
+        with self.dg.conn.cursor(cursor_factory=extras.RealDictCursor) as cursor:
+            cursor.execute(f'SELECT * FROM "{schema}"."{table_name}"{clause}', params)
+            rows = [dict(row) for row in cursor.fetchall()]
+
+        with self._lock:
+            table = self._table(table_key)
+            if table is not None:
+                for row in rows:
+                    self._put(table_key, table, row)
+        return rows
+
+    def _count(self, table_key):
+        schema, table_name = table_key.split('.')
+        self._record('db_queries')
+        with self.dg.conn.cursor(cursor_factory=extras.RealDictCursor) as cursor:
+            cursor.execute(f'SELECT count(*) AS n FROM "{schema}"."{table_name}"')
+            return cursor.fetchone()['n']
+
+    def _all_rows(self, table_key, table):
+        if self._spill_conn is not None:
+            for pk, row in self._spill_conn.execute('SELECT pk, row FROM rows WHERE table_key = ?', (table_key,)):
+                yield pickle.loads(pk), pickle.loads(row)
+        yield from table.rows.items()
+
+    def _spill_row(self, table_key, pk, row):
+        if self._spill_conn is None:
+            fd, self._spill_file = tempfile.mkstemp(prefix='dg_rows_', suffix='.sqlite', dir=self.spill_dir)
+            os.close(fd)
+            self._spill_conn = sqlite3.connect(self._spill_file, check_same_thread=False)
+            self._spill_conn.execute('PRAGMA journal_mode = OFF')
+            self._spill_conn.execute('PRAGMA synchronous = OFF')
+            self._spill_conn.execute(
+                'CREATE TABLE rows (table_key TEXT, pk BLOB, row BLOB, PRIMARY KEY (table_key, pk))')
+        self._spill_conn.execute('INSERT OR REPLACE INTO rows VALUES (?, ?, ?)',
+                                 (table_key, pickle.dumps(pk), pickle.dumps(row)))
+        self.stats['spilled'] += 1
+
+    def _unspill_row(self, table_key, pk):
+        if self._spill_conn is None:
+            return None
+        key = (table_key, pickle.dumps(pk))
+        found = self._spill_conn.execute('SELECT row FROM rows WHERE table_key = ? AND pk = ?', key).fetchone()
+        if found is None:
+            return None
+        # Back in memory now, so it is spilled again when it gets evicted
+        self._spill_conn.execute('DELETE FROM rows WHERE table_key = ? AND pk = ?', key)
+        return pickle.loads(found[0])
+
+    def _delete_spilled(self, table_key):
+        if self._spill_conn is not None:
+            self._spill_conn.execute('DELETE FROM rows WHERE table_key = ?', (table_key,))
@@ -0,0 +1,61 @@
+from typing import Sequence
+
+import numpy as np
+import random
+
+
+class AliasSampler:
+    """
+    Walker/Vose alias table for O(1) weighted sampling of indices 0..n-1.
+
+    The table is built once in O(n); each draw then costs one uniform index and one uniform float,
+    independent of the number of weights.
+    """
+
+    def __init__(self, weights: Sequence[float]):
+        n = len(weights)
+        if n == 0:
+            raise ValueError("AliasSampler needs at least one weight")
+        total = float(sum(weights))
+        if total <= 0 or any(w < 0 for w in weights):
+            raise ValueError("Weights must be non-negative and sum to a positive value")
+
+        scaled = [w * n / total for w in weights]
+        prob = [0.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            s = small.pop()
+            lg = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = lg
+            scaled[lg] = scaled[lg] + scaled[s] - 1.0
+            (small if scaled[lg] < 1.0 else large).append(lg)
+
+        # Whatever is left over (including floating point residue) always keeps its own column
+        for i in small + large:
+            prob[i] = 1.0
+
+        self.n = n
+        self.prob = prob
+        self.alias = alias
+        self._np_prob = np.asarray(prob, dtype=np.float64)
+        self._np_alias = np.asarray(alias, dtype=np.int64)
+
+    def __len__(self):
+        return self.n
+
+    def sample_index(self, rng=random) -> int:
+        """Draw one index using `rng` (anything with random() like the random module or random.Random)."""
+        u = rng.random() * self.n
+        i = int(u)
+        return i if (u - i) < self.prob[i] else self.alias[i]
+
+    def sample_indices(self, k: int, rng: np.random.Generator = None) -> np.ndarray:
+        """Draw k indices at once as an int64 NumPy array, using a Generator, a RandomState or np.random."""
+        rng = rng or np.random.default_rng(random.getrandbits(64))
+        columns = rng.integers(0, self.n, size=k) if hasattr(rng, 'integers') else rng.randint(0, self.n, size=k)
+        keep = rng.random(size=k) < self._np_prob[columns]
+        return np.where(keep, columns, self._np_alias[columns])
@@ -0,0 +1,68 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+class TableMetadata:
+    """
+    Catalog information for one table, collected once by `DataGenerator.organize_tables_and_columns`
+    so that nothing needs to go back to information_schema while rows are being generated.
+
+    Attributes:
+        table_key (str): The table identifier in the format "schema.table"
+        columns (list): Column names in ordinal order, i.e. the order of a `RETURNING *` tuple
+        data_types (dict): Column name -> information_schema data_type
+        pk_columns (list): Primary key column names in key order (empty if the table has no PK)
+        pk_indices (list): Position of each PK column in a `RETURNING *` tuple
+    """
+
+    def __init__(self, table_key: str):
+        self.table_key = table_key
+        self.columns: List[str] = []
+        self.data_types: Dict[str, str] = {}
+        self.pk_columns: List[str] = []
+        self.pk_indices: List[int] = []
+        self._positions: Dict[Tuple[str, ...], Optional[List[int]]] = {}
+
+    def add_column(self, column_name: str, data_type: str):
+        self.columns.append(column_name)
+        self.data_types[column_name] = data_type
+
+    def set_primary_key(self, pk_columns: Sequence[str]):
+        self.pk_columns = list(pk_columns)
+        self.pk_indices = [self.columns.index(col) for col in self.pk_columns if col in self.columns]
+        self._positions.clear()
+
+    def pk_positions(self, column_names: Optional[Sequence[str]] = None) -> Optional[List[int]]:
+        """
+        Positions of the primary key columns in a returned row.
+
+        Args:
+            column_names (list, optional): Names of the columns in the returned row. Defaults to all columns
+                                           in ordinal order (`RETURNING *`).
+
+        Returns:
+            list or None: Indices of the PK values, or None if a PK column is missing from the row
+        """
+        if column_names is None:
+            return self.pk_indices if len(self.pk_indices) == len(self.pk_columns) else None
+
+        key = tuple(column_names)
+        if key not in self._positions:
+            if all(col in key for col in self.pk_columns):
+                self._positions[key] = [key.index(col) for col in self.pk_columns]
+            else:
+                self._positions[key] = None
+        return self._positions[key]
+
+    def primary_key_value(self, row: Sequence, column_names: Optional[Sequence[str]] = None):
+        """
+        Extract the primary key from a returned row.
+
+        Returns:
+            The single PK value, a tuple for composite keys, or None if the row doesn't contain the key
+        """
+        positions = self.pk_positions(column_names)
+        if not positions or max(positions) >= len(row):
+            return None
+        if len(positions) == 1:
+            return row[positions[0]]
+        return tuple(row[i] for i in positions)
@@ -0,0 +1,22 @@
+import os
+import sys
+
+# The engine modules (data_generator, loaders, samplers, ...) live at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Importing the package first resolves the circular import between data_generator and the generators
+import fsi_data_generator  # noqa: E402, F401
+
+from data_generator import DataGenerator  # noqa: E402
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture
+def dg():
+    """A DataGenerator without a database or metadata; tests set the attributes the code under test reads."""
+    dg = object.__new__(DataGenerator)
+    dg.table_generator_patterns = []
+    dg.table_loader_patterns = []
+    dg.default_loader = 'insert'
+    return dg
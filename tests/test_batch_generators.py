@@ -0,0 +1,84 @@
+from data_generator import TablePlan
+from faker.providers.internet import _IPv4Constants
+from fsi_data_generator.fsi_generators.helpers import random_record
+from fsi_data_generator.fsi_generators.helpers.random_streams import RandomStreams
+from fsi_data_generator.fsi_generators.intelligent_generators.enterprise.address import (
+    generate_random_address, generate_random_addresses)
+from fsi_data_generator.fsi_generators.intelligent_generators.security.network_event import (
+    generate_random_network_event, generate_random_network_events)
+
+import ipaddress
+import pytest
+
+GENERATORS = [(generate_random_network_event, generate_random_network_events),
+              (generate_random_address, generate_random_addresses)]
+
+
+def _columns(rows):
+    return {column: [row[column] for row in rows] for column in rows[0]}
+
+
+@pytest.mark.parametrize('fn, generate_batch', GENERATORS)
+def test_batches_have_the_columns_and_types_of_rows(fn, generate_batch):
+    rows = _columns([fn({}, None) for _ in range(200)])
+    batch = generate_batch([{} for _ in range(200)], None, 200)
+
+    assert set(batch) == set(rows)
+    for column, values in batch.items():
+        assert len(values) == 200
+        row_types = {type(value) for value in rows[column] if value is not None}
+        batch_types = {type(value) for value in values if value is not None}
+        assert batch_types <= row_types or not row_types, column
+
+
+def _check_network_event(event):
+    assert event['bytes_sent'] + event['bytes_received'] == event['length']
+    assert event['log_message'].startswith(f"{event['protocol']} connection from {event['source_ip']}:")
+    assert (event['tcp_flag'] is None) == (event['protocol'] != 'TCP')
+
+
+def test_network_events_are_consistent_in_both_forms():
+    for _ in range(200):
+        _check_network_event(generate_random_network_event({}, None))
+    batch = generate_random_network_events([{} for _ in range(200)], None, 200)
+    for i in range(200):
+        _check_network_event({column: values[i] for column, values in batch.items()})
+
+
+def _ip_counts(addresses):
+    addresses = [ipaddress.IPv4Address(address) for address in addresses]
+    return (sum(any(address in network for network in _IPv4Constants._excluded_networks) for address in addresses),
+            sum(address.is_private for address in addresses))
+
+
+def test_network_event_ips_follow_faker_in_both_forms():
+    rows = [generate_random_network_event({}, None) for _ in range(10000)]
+    batch = generate_random_network_events([{} for _ in range(10000)], None, 10000)
+    # Special networks never, private ranges (about 0.5% of the addresses) sometimes
+    for addresses in ([row['source_ip'] for row in rows] + [row['dest_ip'] for row in rows],
+                      batch['source_ip'] + batch['dest_ip']):
+        excluded, private = _ip_counts(addresses)
+        assert excluded == 0 and 20 < private < 200
+
+
+def _plan(generator, block_fill):
+    plan = TablePlan('security.network_events', valid_columns={'protocol', 'status', 'length'},
+                     auto_gen_cols=set())
+    plan.custom_slots = [(column, 'text', 'YES', None, generator) for column in ('protocol', 'status', 'length')]
+    if block_fill:
+        plan.block_fills = [(['protocol', 'status', 'length'], generator.fill_rows, None)]
+    return plan
+
+
+def _generate(dg, block_fill, seed=5):
+    plan = _plan(random_record(None, generate_random_network_event), block_fill)
+    with RandomStreams(seed).activate('security.network_events', 0):
+        filled = dg._fill_columns(plan, 50)
+        return [dg._generate_row(plan, filled, row) for row in range(50)]
+
+
+def test_block_filled_rows_go_through_the_row_path(dg):
+    batched, by_row = _generate(dg, block_fill=True), _generate(dg, block_fill=False)
+    assert [names for names, _ in batched] == [names for names, _ in by_row]
+    assert all(len(values) == 3 for _, values in batched)
+    assert _generate(dg, block_fill=True) == batched
@@ -0,0 +1,55 @@
+from datetime import datetime, timezone
+from fsi_data_generator.fsi_generators.helpers import generate_account_time_series
+from fsi_data_generator.fsi_generators.intelligent_generators.consumer_banking.account_time_series import \
+    _load_accounts
+from types import SimpleNamespace
+
+import numpy as np
+
+
+def test_no_accounts_gives_empty_columns():
+    transactions, balances = generate_account_time_series([], [], [], 10, 10, np.random.RandomState(1))
+    assert all(len(column) == 0 for column in transactions.values())
+    assert all(len(column) == 0 for column in balances.values())
+    assert set(transactions) == {'account_index', 'time', 'amount', 'credit', 'balance_after'}
+    assert set(balances) == {'account_index', 'time', 'amount', 'opening'}
+
+
+def test_balances_follow_transactions():
+    start = np.array([0.0, 1e6, 2e6])
+    transactions, balances = generate_account_time_series(['checking', 'savings', 'checking'], start, start + 3e7,
+                                                          500, 20, np.random.RandomState(7))
+    assert len(transactions['time']) == 500
+    assert len(balances['time']) == 20
+    assert np.all(transactions['balance_after'] >= 0)
+    assert balances['opening'].sum() == 3
+
+    # Each balance after a transaction is the previous balance plus the signed amount
+    signed = np.where(transactions['credit'], transactions['amount'], -transactions['amount'])
+    same_account = transactions['account_index'][1:] == transactions['account_index'][:-1]
+    steps = np.round(transactions['balance_after'][1:] - transactions['balance_after'][:-1], 2)
+    assert np.array_equal(steps[same_account], np.round(signed[1:][same_account], 2))
+
+
+def test_accounts_are_read_from_the_row_cache_up_to_the_run_start():
+    run_started = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    opened = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    rows = {
+        ('consumer_banking.accounts', 1): {'consumer_banking_account_id': 1, 'consumer_banking_product_id': 7,
+                                           'opened_date': opened, 'status': 'ACTIVE', 'status_update_date_time': None,
+                                           'currency_code': 'EUR'},
+        ('consumer_banking.accounts', 2): {'consumer_banking_account_id': 2, 'consumer_banking_product_id': None,
+                                           'opened_date': opened, 'status': 'CLOSED',
+                                           'status_update_date_time': datetime(2024, 6, 1, tzinfo=timezone.utc),
+                                           'currency_code': None},
+        ('consumer_banking.products', 7): {'product_type': 'SAVINGS'},
+    }
+    # No connection: the accounts and products come from the cache
+    dg = SimpleNamespace(inserted_pks={'consumer_banking.accounts': [2, 1]}, run_started=run_started, conn=None,
+                         lookup=lambda table_key, pk, columns=None: rows.get((table_key, pk)))
+
+    accounts = _load_accounts(dg)
+    assert accounts['id'].tolist() == [2, 1]
+    assert accounts['product_type'].tolist() == ['CHECKING', 'SAVINGS']
+    assert accounts['currency'].tolist() == ['USD', 'EUR']
+    assert accounts['end'].tolist() == [datetime(2024, 6, 1, tzinfo=timezone.utc).timestamp(), run_started.timestamp()]
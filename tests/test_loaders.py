@@ -0,0 +1,101 @@
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from loaders import CopyLoader, CsvSink, ParquetSink, TsvSink, _encode_copy_value
+from table_metadata import TableMetadata
+from types import SimpleNamespace
+
+import gzip
+import os
+import pytest
+
+COLUMNS = [('id', 'integer', None, 'NO', None, 32, 0), ('amount', 'numeric', None, 'YES', None, 12, 2),
+           ('ratio', 'numeric', None, 'YES', None, None, None), ('name', 'text', None, 'YES', None, None, None)]
+ROWS = [[1, 10.005, 0.5, 'a\tb'], [2, Decimal('3'), None, None]]
+
+
+def _generator(output_dir):
+    metadata = TableMetadata('bank.accounts')
+    for column, data_type, *_ in COLUMNS:
+        metadata.add_column(column, data_type)
+    metadata.set_primary_key(['id'])
+    return SimpleNamespace(output_dir=str(output_dir), table_metadata={'bank.accounts': metadata},
+                           table_columns={'bank.accounts': COLUMNS}, started_outputs=set(), inserted_pks={},
+                           _local_worker=lambda: None)
+
+
+def _load(sink):
+    returned = sink.load('bank.accounts', [column[0] for column in COLUMNS], ROWS)
+    sink.close()
+    return returned
+
+
+def test_tsv_sink_starts_the_copy_script_over(tmp_path):
+    (tmp_path / 'copy.sql').write_text("\\copy stale FROM 'old.tsv'\n")
+    dg = _generator(tmp_path)
+    assert _load(TsvSink(dg)) == (['id'], [(1,), (2,)])
+    # A second worker's sink in the same run appends
+    _load(TsvSink(dg))
+
+    script = (tmp_path / 'copy.sql').read_text().splitlines()
+    assert len(script) == 2 and all(line.startswith('\\copy "bank"."accounts"') for line in script)
+    part = script[0].rsplit("'", 2)[1]
+    assert open(part).read() == "1\t10.005\t0.5\ta\\tb\n2\t3\t\\N\t\\N\n"
+
+
+def test_csv_sink_writes_a_header_and_rows(tmp_path):
+    _load(CsvSink(_generator(tmp_path)))
+    part = os.path.join(tmp_path, 'bank.accounts', os.listdir(tmp_path / 'bank.accounts')[0])
+    with gzip.open(part, 'rt') as file:
+        assert file.readline() == '"id","amount","ratio","name"\n'
+        assert len(file.readlines()) == 2
+
+
+def test_parquet_sink_keeps_numerics_exact(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    pa = pytest.importorskip('pyarrow')
+    _load(ParquetSink(_generator(tmp_path)))
+    table = pq.read_table(tmp_path / 'bank.accounts')
+
+    assert table.schema.field('amount').type == pa.decimal128(12, 2)
+    assert table.schema.field('ratio').type == pa.string()
+    assert table.column('amount').to_pylist() == [Decimal('10.01'), Decimal('3.00')]
+    assert table.column('ratio').to_pylist() == ['0.5', None]
+
+
+class _Status(Enum):
+    OPEN = 'open'
+
+
+class _RecordingCursor:
+    def __init__(self):
+        self.copies = []
+
+    def copy_expert(self, sql, buffer):
+        self.copies.append((sql, buffer.read()))
+
+
+@pytest.mark.parametrize('value, data_type, encoded', [
+    (None, 'text', ''),
+    ('say "hi", twice', 'text', '"say ""hi"", twice"'),
+    (True, 'boolean', '"t"'),
+    (_Status.OPEN, 'USER-DEFINED', '"open"'),
+    (Decimal('1E+2'), 'numeric', '"100"'),
+    (date(2024, 2, 29), 'date', '"2024-02-29"'),
+    (datetime(2024, 2, 29, 1, 2, 3), 'timestamp without time zone', '"2024-02-29T01:02:03"'),
+    (['a', 'b c'], 'ARRAY', '"{""a"",""b c""}"'),
+    (['a', 'b'], 'jsonb', '"[""a"", ""b""]"'),
+])
+def test_copy_encodes_values_as_csv_fields(value, data_type, encoded):
+    assert _encode_copy_value(value, data_type) == encoded
+
+
+def test_copy_loader_takes_the_keys_from_the_batch(tmp_path):
+    dg = _generator(tmp_path)
+    dg.tuple_cursor = _RecordingCursor()
+    columns, keys = CopyLoader(dg).load('bank.accounts', [column[0] for column in COLUMNS], ROWS)
+
+    assert (columns, keys) == (['id'], [(1,), (2,)])
+    sql, data = dg.tuple_cursor.copies[0]
+    assert sql == 'COPY "bank"."accounts" ("id", "amount", "ratio", "name") FROM STDIN WITH (FORMAT csv)'
+    assert data == '"1","10.005","0.5","a\tb"\n"2","3",,\n'
@@ -0,0 +1,45 @@
+from concurrent.futures import ThreadPoolExecutor
+from data_generator import _install_faker_unique_lock
+from faker import Faker
+from fsi_data_generator.fsi_generators.helpers import random_record, reads, text_list
+
+import logging
+import re
+
+
+@reads('consumer_banking.accounts')
+def _account_statement(_id_fields, dg):
+    return {'account': dg.lookup(*_ACCOUNT)}
+
+
+_ACCOUNT = ('consumer_banking.accounts', 1)
+
+
+def _configure(dg, custom_generators):
+    dg.table_reads = {}
+    dg.table_columns = {'consumer_banking.accounts': [], 'consumer_banking.statements': [],
+                        'enterprise.parties': []}
+    dg.column_order = {'consumer_banking.statements': ['account', 'kind', 'party']}
+    dg.custom_generator_patterns = [(re.compile(table), re.compile(column), generator)
+                                    for table, column, generator in custom_generators]
+
+
+def test_table_reads_are_declared_or_else_found_in_generator_code(dg, caplog):
+    _configure(dg, [
+        ('consumer_banking\\.statements', '^account$', random_record(None, _account_statement)),
+        ('consumer_banking\\.statements', '^kind$', text_list(['a', 'b'])),
+        ('.*', '^party$', lambda a, b, c: dg.inserted_pks['enterprise.parties'][0]),
+    ])
+    with caplog.at_level(logging.WARNING, logger='data_generator'):
+        assert dg._table_reads('consumer_banking.statements') == {'consumer_banking.accounts', 'enterprise.parties'}
+    assert len(caplog.records) == 1 and 'enterprise.parties' in caplog.text
+    assert dg._table_reads('consumer_banking.accounts') == set()
+
+
+def test_faker_unique_is_unique_across_threads():
+    _install_faker_unique_lock()
+    _install_faker_unique_lock()
+    fake = Faker()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        values = list(executor.map(lambda _: fake.unique.random_int(0, 9999), range(4000)))
+    assert len(set(values)) == 4000
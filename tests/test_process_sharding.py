@@ -0,0 +1,43 @@
+from data_generator import TablePlan
+from fsi_data_generator.fsi_generators.helpers import random_record, text_list, unique_generator, unique_list
+from fsi_data_generator.fsi_generators.intelligent_generators.enterprise import generate_random_party
+from fsi_data_generator.fsi_generators.intelligent_generators.security import generate_random_network_event
+
+import multiprocessing
+import pytest
+import re
+
+
+def test_unique_generators_are_marked():
+    assert unique_list(['a', 'b']).unique
+    assert unique_generator(lambda a, b, c: None).unique
+    assert random_record(None, generate_random_party).unique
+    assert not hasattr(text_list(['a', 'b']), 'unique')
+    assert not hasattr(random_record(None, generate_random_network_event), 'unique')
+
+
+@pytest.fixture
+def dg(dg):
+    dg.processes = 4
+    dg.process_table_patterns = [re.compile('^s\\.t$')]
+    dg.batch_size = 100
+    return dg
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason='sharding needs fork')
+def test_tables_with_unique_generators_are_not_sharded(dg):
+    plan = TablePlan('s.t', {'a', 'b'}, set())
+    plan.custom_slots.append(('a', 'text', 'NO', None, text_list(['x', 'y'])))
+    assert dg._get_process_count('s.t', 1000, plan) == 4
+
+    plan.custom_slots.append(('b', 'text', 'NO', None, unique_list(list(range(1000)))))
+    assert dg._get_process_count('s.t', 1000, plan) == 1
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason='sharding needs fork')
+def test_tables_written_to_file_sinks_are_not_sharded(dg):
+    plan = TablePlan('s.t', {'a'}, set())
+    assert dg._get_process_count('s.t', 1000, plan) == 4
+
+    dg.table_loader_patterns = [(re.compile('^s\\.t$'), 'parquet')]
+    assert dg._get_process_count('s.t', 1000, plan) == 1
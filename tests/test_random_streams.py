@@ -0,0 +1,56 @@
+from faker import Faker
+from fsi_data_generator.fsi_generators.helpers.random_streams import (RandomStreams, StreamRandom, current_numpy,
+                                                                     current_random)
+
+import random
+import threading
+
+
+def draw(streams, *names):
+    fake = Faker()
+    fake.random = StreamRandom()
+    with streams.activate(*names):
+        return current_random().randint(0, 10 ** 9), current_numpy().randint(0, 10 ** 9), fake.name()
+
+
+def test_same_seed_same_draws():
+    assert draw(RandomStreams(42), 'schema.table', 3) == draw(RandomStreams(42), 'schema.table', 3)
+
+
+def test_numeric_string_seed_matches_int_seed():
+    assert RandomStreams('42').derive('schema.table', 0) == RandomStreams(42).derive('schema.table', 0)
+    assert RandomStreams(' 42 ').seed == 42
+    assert RandomStreams('forty-two').seed == 'forty-two'
+
+
+def test_streams_are_independent():
+    streams = RandomStreams(42)
+    assert draw(streams, 'schema.table', 0) != draw(streams, 'schema.table', 1)
+    assert draw(streams, 'schema.table', 0) != draw(streams, 'schema.other', 0)
+
+
+def test_stream_is_per_thread():
+    streams = RandomStreams(42)
+    expected = draw(streams, 'schema.table', 0)
+    results = []
+
+    def worker():
+        with streams.activate('schema.other', 0):
+            results.append(draw(streams, 'schema.table', 0))
+            # Nested activation is restored on exit
+            results.append(current_random() is not random)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    assert results == [expected, True]
+    assert current_random() is random
+
+
+def test_random_module_is_left_alone():
+    random.seed(1)
+    expected = random.random()
+    random.seed(1)
+    with RandomStreams(42).activate('schema.table', 0):
+        assert random.random() == expected
+        assert type(Faker().random) is random.Random
@@ -0,0 +1,26 @@
+from fsi_data_generator.fsi_generators.helpers.response_store import ResponseStore
+
+
+def test_offsets_are_not_trusted_after_another_process_compacts(tmp_path):
+    path = str(tmp_path / 'responses.jsonl')
+    writer = ResponseStore(path)
+    for i in range(20):
+        writer[f'key {i}'] = [f'value {i}']
+        writer['grown'] = [f'grown {i}']
+    reader = ResponseStore(path)
+    reader._refresh()
+
+    # Compaction moves every segment, the reader's index still has the old offsets
+    writer.compact()
+    assert reader._load('grown') == [f'grown {i}' for i in range(20)]
+    assert reader['key 7'] == ['value 7']
+
+
+def test_appends_of_other_stores_are_seen(tmp_path):
+    path = str(tmp_path / 'responses.jsonl')
+    first, second = ResponseStore(path), ResponseStore(path)
+    first['names'] = ['a', 'b']
+    second['names'] = ['b', 'c']
+    assert ResponseStore(path)['names'] == ['a', 'b', 'c']
+    del second['names']
+    assert 'names' not in ResponseStore(path)
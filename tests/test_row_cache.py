@@ -0,0 +1,102 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from row_cache import RowContextCache
+from types import SimpleNamespace
+
+import enum
+
+COLUMNS = [
+    ('id', 'integer', None, 'NO', None, 32, 0),
+    ('amount', 'numeric', None, 'YES', None, 12, 2),
+    ('rate', 'real', None, 'YES', None, 24, None),
+    ('code', 'character', None, 'YES', 4, None, None),
+    ('status', 'USER-DEFINED', None, 'YES', None, None, None),
+    ('opened', 'timestamp without time zone', None, 'YES', None, None, None),
+    ('born', 'date', None, 'YES', None, None, None),
+    ('active', 'boolean', None, 'YES', None, None, None),
+    ('extra', 'jsonb', None, 'YES', None, None, None),
+    ('term', 'interval', None, 'YES', None, None, None),
+]
+
+
+class Status(enum.Enum):
+    OPEN = 'open'
+
+
+def _cache(in_files=False, **options):
+    # No connection: any fallback to the database fails the test
+    dg = SimpleNamespace(table_metadata={'bank.accounts': SimpleNamespace(pk_columns=['id'])},
+                         table_columns={'bank.accounts': COLUMNS}, batch_data={}, inserted_pks={}, conn=None,
+                         writes_database=lambda table_key: not in_files)
+    return RowContextCache(dg, **options)
+
+
+def _put(cache, rows):
+    names = [column[0] for column in COLUMNS]
+    cache.put_batch('bank.accounts', names, rows, ['id'], [(row[0],) for row in rows])
+
+
+def test_generated_values_are_cached_as_the_database_returns_them():
+    cache = _cache()
+    _put(cache, [(1, 10.005, 0.1, 'AB', Status.OPEN, date(2024, 1, 2), datetime(2024, 1, 2, 3, 4), 1,
+                  {'a': [1, 2]}, timedelta(days=3))])
+
+    row = cache.get('bank.accounts', 1)
+    assert row['amount'] == Decimal('10.01')
+    assert row['rate'] == 0.1 and isinstance(row['rate'], float)
+    assert row['code'] == 'AB  '
+    assert row['status'] == 'open'
+    assert row['opened'] == datetime(2024, 1, 2)
+    assert row['born'] == date(2024, 1, 2)
+    assert row['active'] is True
+    assert row['extra'] == {'a': [1, 2]}
+
+
+def test_columns_that_cannot_be_normalized_are_left_out():
+    cache = _cache()
+    _put(cache, [(1, 'not a number', 0.5, 'AB', 'open', None, None, True, None, timedelta(days=3))])
+
+    row = cache.get('bank.accounts', 1)
+    assert 'term' not in row and 'amount' not in row
+    assert row['opened'] is None
+    assert cache.tables['bank.accounts'].uncached == {'term', 'amount'}
+
+
+def test_stats_are_counted_across_threads():
+    cache = _cache()
+    _put(cache, [(pk, 1, 1, 'A', 'open', None, None, True, None, None) for pk in range(10)])
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(lambda i: cache.lookup('bank.accounts', i % 10, ['id', 'rate']), range(4000)))
+    assert cache.stats['hits'] == 4000
+
+
+def _row(pk, status='open'):
+    return (pk, 1, 1, 'A', status, None, None, True, None, timedelta(days=pk))
+
+
+def test_file_sink_tables_are_served_from_the_cache_only():
+    cache = _cache(in_files=True, max_rows=5, spill=True)
+    _put(cache, [_row(pk, 'open' if pk % 3 else 'closed') for pk in range(20)])
+
+    closed = cache.lookup_rows('bank.accounts', 'status', 'closed')
+    assert [row['id'] for row in closed] == [0, 3, 6, 9, 12, 15, 18]
+    assert closed[1]['term'] == timedelta(days=3)
+    assert cache.lookup_rows('bank.accounts', 'status', 'frozen') == []
+    assert sorted(row['id'] for row in cache.sample('bank.accounts', k=20)) == list(range(20))
+    assert {row['status'] for row in cache.sample('bank.accounts', k=3, where={'status': 'open'})} == {'open'}
+    assert cache.lookup('bank.accounts', 99) is None
+    assert cache.stats['db_queries'] == 0
+    cache.close()
+
+
+def test_rows_read_back_after_eviction_are_indexed_once():
+    cache = _cache(in_files=True, max_rows=2, spill=True)
+    _put(cache, [_row(pk) for pk in range(4)])
+    cache.lookup_rows('bank.accounts', 'status', 'open')
+    for _ in range(3):
+        for pk in range(4):
+            cache.get('bank.accounts', pk)
+    assert cache.tables['bank.accounts'].indexes['status']['open'] == [0, 1, 2, 3]
+    cache.close()
@@ -0,0 +1,55 @@
+from data_generator import TablePlan
+from fsi_data_generator.fsi_generators.helpers import unique_list
+from fsi_data_generator.fsi_generators.helpers.random_streams import RandomStreams
+
+
+def test_blocks_never_repeat_a_value():
+    generator = unique_list(list(range(1000)))
+    drawn = []
+    streams = RandomStreams(7)
+    for block in range(10):
+        with streams.activate('s.t', block):
+            drawn += generator.fill_column(100)
+    assert sorted(drawn) == list(range(1000))
+
+
+def test_blocks_and_rows_share_the_pool():
+    generator = unique_list(list(range(50)))
+    drawn = generator.fill_column(40) + [generator(None, None, None) for _ in range(10)]
+    assert sorted(drawn) == list(range(50))
+    assert generator.fill_column(0) == []
+
+
+def test_same_seed_draws_the_same_block():
+    blocks = []
+    for _ in range(2):
+        generator = unique_list(list(range(100)))
+        with RandomStreams(3).activate('s.t', 0):
+            blocks.append(generator.fill_column(20))
+    assert blocks[0] == blocks[1]
+
+
+def _set_code_on_even_rows(row_values, _table_key, _column):
+    if row_values['n'] % 2 == 0:
+        row_values['code'] = -row_values['n']
+    return row_values['n']
+
+
+def test_values_of_rows_that_did_not_take_them_are_released(dg):
+    codes = unique_list(list(range(20)))
+    rows = iter(range(10))
+    plan = TablePlan('s.t', valid_columns={'n', 'other', 'code'}, auto_gen_cols=set())
+    plan.custom_slots = [('n', 'integer', 'NO', None, lambda *_: next(rows)),
+                         ('other', 'integer', 'NO', None, _set_code_on_even_rows),
+                         ('code', 'integer', 'NO', None, codes)]
+    plan.block_fills = [(['code'], lambda n: {'code': codes.fill_column(n)}, codes.release)]
+
+    filled = dg._fill_columns(plan, 10)
+    taken = [set() for _ in range(10)]
+    generated = [dict(zip(*dg._generate_row(plan, filled, row, taken[row]))) for row in range(10)]
+    dg._release_unused(plan, filled, taken)
+
+    assert [row['code'] for row in generated if row['n'] % 2 == 0] == [0, -2, -4, -6, -8]
+    # The 5 values drawn for the even rows are back in the pool
+    kept = [row['code'] for row in generated if row['n'] % 2]
+    assert sorted(kept + codes.fill_column(15)) == list(range(20))
@@ -0,0 +1,41 @@
+from concurrent.futures import ThreadPoolExecutor
+from faker.exceptions import UniquenessException
+from types import SimpleNamespace
+from unique_registry import UniqueRegistry
+
+import pytest
+
+
+def _registry(backend='set'):
+    return UniqueRegistry(SimpleNamespace(conn=None, table_metadata={}), backend=backend)
+
+
+@pytest.mark.parametrize('backend', ['set', 'bloom'])
+def test_values_are_reserved_once(backend):
+    registry = _registry(backend)
+    assert registry.reserve('s.t.name', 'a')
+    assert not registry.reserve('s.t.name', 'a')
+    assert 'a' in registry.taken('s.t.name') and ('s.t.name', 'a') in registry
+    assert registry.stats['s.t.name']['collisions'] == 1
+
+
+def test_fallbacks_are_counted_across_threads():
+    registry = _registry()
+    registry.reserve('s.t.name', 'same')
+
+    def draw(_):
+        return registry.unique('s.t.name', lambda: 'same', max_attempts=1000,
+                               fallback=lambda value, n: f"{value} {n + 1}")
+
+    with ThreadPoolExecutor(8) as executor:
+        values = list(executor.map(draw, range(400)))
+    assert len(set(values)) == 400
+    assert registry.stats['s.t.name']['fallbacks'] == 400
+
+
+def test_unique_fails_once_the_fallbacks_are_taken():
+    registry = _registry()
+    registry.seed('s.t.name', ['x'] + [f"x {n}" for n in range(2, 4)])
+    with pytest.raises(UniquenessException):
+        registry.unique('s.t.name', lambda: 'x', max_attempts=2, fallback=lambda value, n: f"{value} {n + 1}")
+    assert registry.stats['s.t.name']['failures'] == 1
@@ -0,0 +1,18 @@
+from fsi_data_generator.fsi_generators.helpers.value_pool import ValuePool
+
+import itertools
+
+
+def test_expected_count_is_only_computed_when_the_pool_grows():
+    counter = itertools.count()
+    calls = []
+
+    def expected():
+        calls.append(1)
+        return 50
+
+    pool = ValuePool(lambda: next(counter), size=10)
+    values = [pool.take(expected) for _ in range(60)]
+    assert values == list(range(60))
+    # Once to build the 50 expected values, once more when they ran out
+    assert len(calls) == 2 and len(pool) == 75
@@ -0,0 +1,219 @@
+from faker.exceptions import UniquenessException
+from typing import Any, Callable, Dict, Optional
+
+import hashlib
+import logging
+import math
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """
+    Scalable Bloom filter of hashable values: a chain of filters, each twice the capacity and half the error
+    rate of the previous one, so that the overall false positive rate stays below error_rate however many
+    values are added.
+
+    Args:
+        capacity (int, optional): Values of the first filter. Default is 100000.
+        error_rate (float, optional): False positive rate. Default is 1e-4.
+    """
+
+    def __init__(self, capacity: int = 100000, error_rate: float = 1e-4):
+        self.capacity = max(1, int(capacity))
+        self.error_rate = error_rate
+        self.filters = []  # [bits, size in bits, hash count, capacity, count]
+        self._add_filter(self.capacity, error_rate / 2)
+
+    def _add_filter(self, capacity, error_rate):
+        size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        hashes = max(1, round(size / capacity * math.log(2)))
+        self.filters.append([bytearray((size + 7) // 8), size, hashes, capacity, 0])
+
+    @staticmethod
+    def _hashes(value):
+        digest = hashlib.blake2b(repr(value).encode(), digest_size=16).digest()
+        return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+
+    def __contains__(self, value):
+        h1, h2 = self._hashes(value)
+        for bits, size, hashes, _, _ in self.filters:
+            if all(bits[position >> 3] & (1 << (position & 7))
+                   for position in ((h1 + i * h2) % size for i in range(hashes))):
+                return True
+        return False
+
+    def add(self, value):
+        """Add a value, which must not be in the filter already (see __contains__)."""
+        current = self.filters[-1]
+        if current[4] >= current[3]:
+            self._add_filter(current[3] * 2, self.error_rate / 2 ** (len(self.filters) + 1))
+            current = self.filters[-1]
+        bits, size, hashes, _, _ = current
+        h1, h2 = self._hashes(value)
+        for i in range(hashes):
+            position = (h1 + i * h2) % size
+            bits[position >> 3] |= 1 << (position & 7)
+        current[4] += 1
+
+    def __len__(self):
+        return sum(current[4] for current in self.filters)
+
+    @property
+    def nbytes(self):
+        return sum(len(current[0]) for current in self.filters)
+
+
+class UniqueRegistry:
+    """
+    Values already taken per "schema.table.column" (or any other key), so that generators produce unique
+    natural keys and names by checking one set instead of selecting the table for every row, or relying on
+    the unbounded `fake.unique` sets that only fail once a provider is exhausted.
+
+    The values of a key are seeded once, on its first use, with the distinct values of the column in the
+    database when the key names a table column, and every value reserved from then on is added. A generator
+    calls `reserve` with a candidate, or `unique` with a function drawing candidates:
+
+        name = dg.unique_values.unique('enterprise.parties.name', fake.company,
+                                       fallback=lambda value, n: f"{value} {n + 1}")
+
+    With backend 'bloom' the values are kept in a Bloom filter of a few bits per value instead of a set: a
+    false positive only costs another draw, never a duplicate. Values reserved in forked process shards stay
+    in the shard.
+
+    Args:
+        dg (DataGenerator): The generator, for table metadata and the per-thread connection
+        backend (str, optional): 'set' or 'bloom'. Default is 'set'.
+        bloom_error_rate (float, optional): False positive rate of the Bloom filters. Default is 1e-4.
+    """
+
+    def __init__(self, dg, backend: str = 'set', bloom_error_rate: float = 1e-4):
+        if backend not in ('set', 'bloom'):
+            raise ValueError(f"Unknown unique values backend '{backend}', expected 'set' or 'bloom'")
+        self.dg = dg
+        self.backend = backend
+        self.bloom_error_rate = bloom_error_rate
+        self.values: Dict[str, Any] = {}  # key -> set or BloomFilter
+        # key -> {'seeded', 'reserved', 'collisions', 'draws', 'fallbacks', 'failures'}
+        self.stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.RLock()
+
+    def _values(self, key):
+        values = self.values.get(key)
+        if values is None:
+            with self._lock:
+                values = self.values.get(key)
+                if values is None:
+                    seed = self._select_existing(key)
+                    values = BloomFilter(max(100000, 2 * len(seed)), self.bloom_error_rate) \
+                        if self.backend == 'bloom' else set()
+                    for value in seed:
+                        if value not in values:
+                            values.add(value)
+                    self.stats[key] = {'seeded': len(seed), 'reserved': 0, 'collisions': 0, 'draws': 0,
+                                       'fallbacks': 0, 'failures': 0}
+                    self.values[key] = values
+        return values
+
+    def _select_existing(self, key):
+        """Distinct values of the column a key names, [] when it doesn't name one."""
+        parts = key.split('.')
+        if len(parts) != 3 or self.dg.conn is None:
+            return []
+        table_key, column = f"{parts[0]}.{parts[1]}", parts[2]
+        metadata = self.dg.table_metadata.get(table_key)
+        if metadata is None or column not in metadata.columns:
+            return []
+        try:
+            self.dg.tuple_cursor.execute(f'SELECT DISTINCT "{column}" FROM "{parts[0]}"."{parts[1]}" '
+                                         f'WHERE "{column}" IS NOT NULL')
+            existing = [row[0] for row in self.dg.tuple_cursor.fetchall()]
+        except Exception as e:
+            logger.warning(f"Could not seed the unique values of {key}: {e}")
+            return []
+        logger.debug(f"Seeded {len(existing)} unique values of {key}")
+        return existing
+
+    def seed(self, key: str, values):
+        """Mark values as taken without counting them as reserved, e.g. values generated in bulk elsewhere."""
+        taken = self._values(key)
+        with self._lock:
+            for value in values:
+                if value not in taken:
+                    taken.add(value)
+                    self.stats[key]['seeded'] += 1
+
+    def reserve(self, key: str, value) -> bool:
+        """
+        Take a value if nobody has yet.
+
+        Returns:
+            bool: True if the value was free and is now taken, False on a collision
+        """
+        taken = self._values(key)
+        with self._lock:
+            if value in taken:
+                self.stats[key]['collisions'] += 1
+                return False
+            taken.add(value)
+            self.stats[key]['reserved'] += 1
+            return True
+
+    def taken(self, key: str):
+        """The values taken for a key (a set or BloomFilter), to filter candidates with `in` before reserving one."""
+        return self._values(key)
+
+    def __contains__(self, item):
+        key, value = item
+        return value in self._values(key)
+
+    def unique(self, key: str, fn: Callable, *args, max_attempts: int = 100,
+               fallback: Optional[Callable[[Any, int], Any]] = None, **kwargs):
+        """
+        Draw values with fn(*args, **kwargs) until one is free, and reserve it.
+
+        Args:
+            key (str): The key, usually "schema.table.column"
+            fn (callable): Draws a candidate value
+            max_attempts (int, optional): Draws before giving up, or moving on to the fallback. Default is 100.
+            fallback (callable, optional): (last value drawn, attempt) -> candidate, tried max_attempts times
+                                           after fn, e.g. adding a numeric suffix
+
+        Returns:
+            The reserved value
+
+        Raises:
+            UniquenessException: If no free value was found
+        """
+        self._values(key)
+        value = None
+        for _ in range(max_attempts):
+            value = fn(*args, **kwargs)
+            with self._lock:
+                self.stats[key]['draws'] += 1
+            if self.reserve(key, value):
+                return value
+        if fallback is not None:
+            for attempt in range(1, max_attempts + 1):
+                candidate = fallback(value, attempt)
+                with self._lock:
+                    if self.reserve(key, candidate):
+                        self.stats[key]['fallbacks'] += 1
+                        return candidate
+        with self._lock:
+            self.stats[key]['failures'] += 1
+        raise UniquenessException(f"No unique value of {key} found in {max_attempts} attempts")
+
+    def report(self) -> str:
+        """One line per key: values seeded and reserved, collisions, draws of `unique` and fallbacks used."""
+        lines = []
+        with self._lock:
+            stats = {key: dict(key_stats) for key, key_stats in self.stats.items()}
+        for key, key_stats in sorted(stats.items()):
+            reserved = key_stats['reserved']
+            rate = key_stats['collisions'] / reserved if reserved else 0.0
+            lines.append(f"{key}: {key_stats['seeded']} seeded, {reserved} reserved, {key_stats['collisions']} "
+                         f"collisions ({rate:.2f} per value), {key_stats['draws']} draws, "
+                         f"{key_stats['fallbacks']} fallbacks, {key_stats['failures']} failures")
+        return "\n".join(lines)